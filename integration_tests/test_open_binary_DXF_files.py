@@ -51,3 +51,20 @@ def test_open_R12():
     assert 'Model' in doc.layouts, 'Model space not found'
     assert 'Layout1' in doc.layouts, 'Paper space not found'
     assert doc.dxfversion == 'AC1009'
+
+
+@pytest.mark.parametrize('name', [
+    'bin_dxf_r12.dxf', 'bin_dxf_r13.dxf', 'bin_dxf_r14.dxf',
+    'bin_dxf_r2000.dxf',
+])
+def test_binary_tag_compiler(name):
+    from ezdxf.lldxf.tagger import (
+        binary_tag_compiler, binary_tags_loader, tag_compiler,
+    )
+    filename = os.path.join(BASEDIR, DATADIR, name)
+    with open(filename, 'rb') as fp:
+        data = fp.read()
+    expected = list(tag_compiler(binary_tags_loader(data)))
+    tags = list(binary_tag_compiler(data))
+    assert tags == expected
+    assert [type(tag) for tag in tags] == [type(tag) for tag in expected]
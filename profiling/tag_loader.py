@@ -2,7 +2,8 @@
 #  License: MIT License
 import os
 import time
-from ezdxf.lldxf.tagger import ascii_tags_loader
+import mmap
+from ezdxf.lldxf.tagger import ascii_tags_loader, ascii_bytes_tags_loader
 from ezdxf.recover import bytes_loader, synced_bytes_loader
 from ezdxf import EZDXF_TEST_FILES
 
@@ -14,6 +15,12 @@ def load_ascii():
         list(ascii_tags_loader(fp))
 
 
+def load_mmap():
+    with open(BIG_FILE, 'rb') as fp, \
+            mmap.mmap(fp.fileno(), 0, access=mmap.ACCESS_READ) as data:
+        list(ascii_bytes_tags_loader(data))
+
+
 def load_bytes():
     with open(BIG_FILE, 'rb') as fp:
         list(bytes_loader(fp))
@@ -37,5 +44,6 @@ def run(func):
 
 if __name__ == '__main__':
     print_result(run(load_ascii), 'ascii_tags_loader()')
+    print_result(run(load_mmap), 'ascii_bytes_tags_loader() - mmap')
     print_result(run(load_bytes), 'bytes_loader()')
     print_result(run(load_synced_bytes), 'synced_bytes_loader()')
@@ -9,11 +9,13 @@ from ezdxf.lldxf import const, validator
 from ezdxf.entities import factory, DXFEntity
 from ezdxf.math import NULLVEC
 from ezdxf.sections.table import table_key
+from ezdxf.stats import DXFTypeTimer
 
 if TYPE_CHECKING:
     from ezdxf.eztypes import (
         DXFEntity, Drawing, DXFGraphic, BlocksSection, EntityDB,
     )
+    from ezdxf.stats import Stage
 
 __all__ = ['Auditor', 'AuditError', 'audit']
 
@@ -177,12 +179,15 @@ class Auditor:
         """
         self.errors = [err for err in self.errors if err.code in codes]
 
-    def run(self) -> List[ErrorEntry]:
+    def run(self, stage: 'Stage' = None) -> List[ErrorEntry]:
+        """ Run the audit process, the optional :class:`~ezdxf.stats.Stage`
+        object `stage` collects the audit time per DXF type.
+        """
         # Check database integrity:
         self.doc.entitydb.audit(self)
         self.check_root_dict()
         self.check_tables()
-        self.audit_all_database_entities()
+        self.audit_all_database_entities(stage)
         self.doc.groups.audit(self)
         self.check_block_reference_cycles()
         self.doc.layouts.audit(self)
@@ -247,7 +252,7 @@ class Auditor:
         fix_table_head(table_section.dimstyles)
         fix_table_head(table_section.block_records)
 
-    def audit_all_database_entities(self) -> None:
+    def audit_all_database_entities(self, stage: 'Stage' = None) -> None:
         """ Audit all entities stored in the entity database. """
         # Destruction of entities can occur while auditing.
         # Best practice to delete entities is to move them into the trashcan:
@@ -258,9 +263,17 @@ class Auditor:
         # Auditor.app_post_audit_job() with a callable object or
         # function as argument.
         self._post_audit_jobs = []
-        for entity in db.values():
-            if entity.is_alive:
-                entity.audit(self)
+        if stage is None:
+            for entity in db.values():
+                if entity.is_alive:
+                    entity.audit(self)
+        else:
+            timer = DXFTypeTimer(stage)
+            for entity in db.values():
+                if entity.is_alive:
+                    timer.next(entity.dxftype())
+                    entity.audit(self)
+            timer.flush()
         db.locked = False
         self.empty_trashcan()
         self.exec_post_audit_jobs()
@@ -0,0 +1,512 @@
+# Copyright (c) 2020, Manfred Moitzi
+# License: MIT License
+"""
+Bounding boxes of DXF graphical entities in WCS.
+
+Two calculation modes are supported:
+
+    - fast: curved geometry like the bulges of polylines, ellipses and splines
+      is bounded by the control vertices of the curves and the bounding box of
+      block references is the transformed bounding box of the block
+      definition, the result can be a little bit larger than the real
+      geometry
+    - tight: curved geometry is bounded by exact extreme points or by
+      flattening, block references are processed entity by entity if the
+      transformation does not preserve axis aligned boxes
+
+The extents of text entities are estimated for both modes, because font
+metrics are not available.
+
+The bounding boxes are cached per entity and per block definition. The cache
+of an entity is invalidated by changing a DXF attribute, by transformation and
+by adding or removing entities to/from a block definition. The invalidation
+propagates to the owner of the entity, e.g. from ATTRIB to INSERT and from a
+block entity to the block definition. Changes of geometry not stored as DXF
+attributes, like the vertices of LWPOLYLINE or the control points of SPLINE,
+require a call of :func:`invalidate`.
+
+"""
+from typing import TYPE_CHECKING, Iterable, Callable, Dict, Optional, Tuple
+import math
+from ezdxf.math import (
+    Vector, BoundingBox, OCS, Matrix44, NULLVEC, Z_AXIS, ConstructionEllipse,
+)
+from ezdxf.render.path import Path, Command
+
+if TYPE_CHECKING:
+    from ezdxf.eztypes import DXFGraphic, DXFEntity, BlockRecord, BaseLayout
+
+__all__ = ['extents', 'multi_extents', 'layout_extents', 'invalidate']
+
+# Estimated average character width relative to the text height:
+CHAR_WIDTH_FACTOR = 0.8
+# Estimated MTEXT line distance relative to the char height:
+MTEXT_LINE_SPACING = 5.0 / 3.0
+# Max. flattening distance of curves in tight mode relative to the size of the
+# fast bounding box:
+TIGHT_TOLERANCE = 1e-4
+
+# DXF types which depend on block definitions:
+BLOCK_REFERENCES = {'INSERT', 'DIMENSION', 'ARC_DIMENSION',
+                    'LARGE_RADIAL_DIMENSION'}
+
+# Incremented by each invalidation of the cached extents of a block
+# definition, the cached extents of block references are only valid for the
+# generation of their calculation:
+_generation = 0
+
+Box = Tuple[Vector, Vector]
+
+
+class _Link:
+    """ Cache entry of linked entities like VERTEX, which do not store their
+    own bounding box, but have to propagate the invalidation to the linking
+    entity, the DXF owner of a VERTEX is the layout and not the POLYLINE.
+    """
+    __slots__ = ('entity',)
+
+    def __init__(self, entity: 'DXFEntity'):
+        self.entity = entity
+
+
+def extents(entity: 'DXFGraphic', fast: bool = True) -> BoundingBox:
+    """ Returns the WCS bounding box of `entity` as
+    :class:`~ezdxf.math.BoundingBox`, the bounding box has no data
+    (:attr:`~ezdxf.math.BoundingBox.has_data` is ``False``) for entities
+    without geometry and for infinite entities like XLINE and RAY.
+
+    Args:
+        entity: DXF graphical entity
+        fast: ``True`` for fast but maybe larger bounding boxes of curves and
+            block references, ``False`` for tight bounding boxes
+
+    """
+    return _bounding_box(_extents(entity, fast))
+
+
+def multi_extents(entities: Iterable['DXFGraphic'],
+                  fast: bool = True) -> BoundingBox:
+    """ Returns the WCS bounding box of all `entities` as
+    :class:`~ezdxf.math.BoundingBox`.
+    """
+    return _bounding_box(_union(_extents(e, fast) for e in entities))
+
+
+def layout_extents(layout: 'BaseLayout', fast: bool = True) -> BoundingBox:
+    """ Returns the WCS bounding box of all entities of `layout` as
+    :class:`~ezdxf.math.BoundingBox`, the result is cached by the
+    BLOCK_RECORD of the layout.
+    """
+    return _bounding_box(_block_record_extents(layout.block_record, fast))
+
+
+def invalidate(entity: 'DXFEntity') -> None:
+    """ Invalidate the cached bounding box of `entity` and of the owners of
+    `entity`.
+    """
+    global _generation
+    while entity is not None:
+        cache = getattr(entity, '_bbox_cache', None)
+        if cache is None:
+            return
+        entity._bbox_cache = None
+        if isinstance(cache, _Link):
+            entity = cache.entity
+            continue
+        if entity.dxftype() == 'BLOCK_RECORD':
+            # layouts can not be referenced by block references:
+            if entity.is_block_layout:
+                _generation += 1
+            return
+        doc = entity.doc
+        owner = entity.dxf.owner
+        if doc is None or owner is None:
+            return
+        entity = doc.entitydb.get(owner)
+
+
+def _bounding_box(box: Optional[Box]) -> BoundingBox:
+    bbox = BoundingBox()
+    if box is not None:
+        bbox.extmin, bbox.extmax = box
+    return bbox
+
+
+def _box(vertices: Iterable[Vector]) -> Optional[Box]:
+    vertices = list(vertices)
+    if not vertices:
+        return None
+    bbox = BoundingBox(vertices)
+    return bbox.extmin, bbox.extmax
+
+
+def _union(boxes: Iterable[Optional[Box]]) -> Optional[Box]:
+    x1 = y1 = z1 = math.inf
+    x2 = y2 = z2 = -math.inf
+    has_data = False
+    for box in boxes:
+        if box is None:
+            continue
+        has_data = True
+        (bx1, by1, bz1), (bx2, by2, bz2) = box
+        x1 = min(x1, bx1)
+        y1 = min(y1, by1)
+        z1 = min(z1, bz1)
+        x2 = max(x2, bx2)
+        y2 = max(y2, by2)
+        z2 = max(z2, bz2)
+    if has_data:
+        return Vector(x1, y1, z1), Vector(x2, y2, z2)
+    return None
+
+
+def _cached(entity: 'DXFEntity', fast: bool) -> Tuple[bool, Optional[Box]]:
+    cache = entity._bbox_cache
+    if cache is None or isinstance(cache, _Link):
+        return False, None
+    box, tight, generation = cache
+    if generation is not None and generation != _generation:
+        return False, None
+    if tight or fast:
+        return True, box
+    return False, None
+
+
+def _store(entity: 'DXFEntity', box: Optional[Box], fast: bool,
+           depends_on_blocks: bool) -> None:
+    generation = _generation if depends_on_blocks else None
+    entity._bbox_cache = (box, not fast, generation)
+
+
+def _extents(entity: 'DXFGraphic', fast: bool) -> Optional[Box]:
+    found, box = _cached(entity, fast)
+    if found:
+        return box
+    dxftype = entity.dxftype()
+    func = _EXTENTS.get(dxftype)
+    if func is None:
+        box = _box(_vertices(entity, fast))
+    else:
+        box = func(entity, fast)
+    _store(entity, box, fast, dxftype in BLOCK_REFERENCES)
+    return box
+
+
+def _block_record_extents(block_record: 'BlockRecord',
+                          fast: bool) -> Optional[Box]:
+    found, box = _cached(block_record, fast)
+    if found:
+        return box
+    entities = list(block_record.entity_space)
+    box = _union(_extents(e, fast) for e in entities)
+    depends_on_blocks = any(e.dxftype() in BLOCK_REFERENCES for e in entities)
+    _store(block_record, box, fast, depends_on_blocks)
+    return box
+
+
+def _tolerance(vertices: Iterable[Vector]) -> Tuple[list, float]:
+    vertices = list(vertices)
+    if not vertices:
+        return vertices, 0.0
+    bbox = BoundingBox(vertices)
+    return vertices, max(bbox.size.magnitude * TIGHT_TOLERANCE, 1e-12)
+
+
+def _path_vertices(path: Path, fast: bool) -> Iterable[Vector]:
+    vertices, distance = _tolerance(path.control_vertices())
+    if fast or not any(cmd.type == Command.CURVE_TO for cmd in path):
+        return vertices
+    return path.flattening(distance)
+
+
+# Vertices of entities, the bounding box of all vertices is the bounding box
+# of the entity:
+
+def _line(entity, fast: bool) -> Iterable[Vector]:
+    return Vector(entity.dxf.start), Vector(entity.dxf.end)
+
+
+def _point(entity, fast: bool) -> Iterable[Vector]:
+    return Vector(entity.dxf.location),
+
+
+def _circle(entity, fast: bool) -> Iterable[Vector]:
+    dxf = entity.dxf
+    radius = abs(dxf.radius)
+    center = entity.ocs().to_wcs(dxf.center)
+    # extents of a circle in a plane with normal vector n:
+    # radius * sqrt(1 - n[i]^2) for each axis i
+    n = Vector(dxf.extrusion).normalize()
+    delta = Vector(
+        radius * math.sqrt(max(0.0, 1.0 - n.x * n.x)),
+        radius * math.sqrt(max(0.0, 1.0 - n.y * n.y)),
+        radius * math.sqrt(max(0.0, 1.0 - n.z * n.z)),
+    )
+    return center - delta, center + delta
+
+
+def _arc(entity, fast: bool) -> Iterable[Vector]:
+    dxf = entity.dxf
+    if not fast and not Vector(dxf.extrusion).isclose(Z_AXIS):
+        return _ellipse_extreme_vertices(ConstructionEllipse.from_arc(
+            dxf.center, dxf.radius, dxf.extrusion, dxf.start_angle,
+            dxf.end_angle))
+    box2d = entity.construction_tool().bounding_box
+    z = Vector(entity.dxf.center).z
+    (x1, y1), (x2, y2) = box2d.extmin, box2d.extmax
+    return entity.ocs().points_to_wcs([
+        Vector(x1, y1, z), Vector(x2, y1, z),
+        Vector(x2, y2, z), Vector(x1, y2, z),
+    ])
+
+
+def _ellipse(entity, fast: bool) -> Iterable[Vector]:
+    if fast:
+        return Path.from_ellipse(entity).control_vertices()
+    return _ellipse_extreme_vertices(entity.construction_tool())
+
+
+def _ellipse_extreme_vertices(e: ConstructionEllipse) -> Iterable[Vector]:
+    start = e.start_param % math.tau
+    end = e.end_param % math.tau
+    if math.isclose(start, end):
+        end = start + math.tau
+    elif end < start:
+        end += math.tau
+    params = [start, end]
+    # extreme points of each axis: p(t) = center + major*cos(t) + minor*sin(t)
+    for a, b in zip(e.major_axis, e.minor_axis):
+        t = math.atan2(b, a) % math.tau
+        for param in (t, t + math.pi, t + math.tau, t + math.pi + math.tau):
+            if start <= param <= end:
+                params.append(param)
+    return e.vertices(params)
+
+
+def _lwpolyline(entity, fast: bool) -> Iterable[Vector]:
+    return _path_vertices(Path.from_lwpolyline(entity), fast)
+
+
+def _polyline(entity, fast: bool) -> Iterable[Vector]:
+    # propagate the cache invalidation from VERTEX to POLYLINE:
+    link = _Link(entity)
+    for vertex in entity.vertices:
+        vertex._bbox_cache = link
+    if entity.is_2d_polyline:
+        return _path_vertices(Path.from_polyline(entity), fast)
+    return (Vector(vertex.dxf.location) for vertex in entity.vertices)
+
+
+def _spline(entity, fast: bool) -> Iterable[Vector]:
+    if entity.control_point_count():
+        vertices, distance = _tolerance(Vector.generate(entity.control_points))
+        if fast:
+            return vertices
+        return entity.flattening(distance)
+    return Vector.generate(entity.fit_points)
+
+
+def _solid(entity, fast: bool) -> Iterable[Vector]:
+    return entity.wcs_vertices()
+
+
+def _mesh(entity, fast: bool) -> Iterable[Vector]:
+    return Vector.generate(entity.vertices)
+
+
+def _text(entity, fast: bool) -> Iterable[Vector]:
+    dxf = entity.dxf
+    height = dxf.height
+    width = len(entity.plain_text()) * height * dxf.width * CHAR_WIDTH_FACTOR
+    halign = dxf.get('halign', 0)
+    valign = dxf.get('valign', 0)
+    insert = Vector(dxf.insert)
+    if halign in (3, 5):  # ALIGNED, FIT
+        align_point = Vector(dxf.get('align_point', insert))
+        direction = align_point - insert
+        if direction.is_null:
+            direction = Vector.from_deg_angle(dxf.rotation)
+        else:
+            width = direction.magnitude
+        origin = insert
+        x1, x2 = 0.0, width
+        y1, y2 = 0.0, height
+    else:
+        direction = Vector.from_deg_angle(dxf.rotation)
+        origin = insert if halign == 0 and valign == 0 else \
+            Vector(dxf.get('align_point', insert))
+        x1 = (0.0, -width / 2.0, -width, 0.0, -width / 2.0, 0.0)[halign]
+        x2 = x1 + width
+        if halign == 4:  # MIDDLE
+            y1 = -height / 2.0
+        else:
+            y1 = (0.0, 0.0, -height / 2.0, -height)[valign]
+        y2 = y1 + height
+    ux = direction.normalize()
+    uy = ux.orthogonal()
+    ocs = entity.ocs()
+    return ocs.points_to_wcs(
+        origin + ux * x + uy * y
+        for x, y in ((x1, y1), (x2, y1), (x2, y2), (x1, y2))
+    )
+
+
+def _mtext(entity, fast: bool) -> Iterable[Vector]:
+    dxf = entity.dxf
+    height = dxf.char_height
+    lines = entity.plain_text(split=True) or ['']
+    width = dxf.get('width', 0.0)
+    if not width:
+        width = max(len(line) for line in lines) * height * CHAR_WIDTH_FACTOR
+    total_height = height * (1.0 + (len(lines) - 1) * MTEXT_LINE_SPACING *
+                             dxf.get('line_spacing_factor', 1.0))
+    attachment_point = dxf.get('attachment_point', 1) - 1
+    col, row = attachment_point % 3, attachment_point // 3
+    x1 = (0.0, -width / 2.0, -width)[col]
+    y1 = (-total_height, -total_height / 2.0, 0.0)[row]
+    x2 = x1 + width
+    y2 = y1 + total_height
+    extrusion = Vector(dxf.get('extrusion', Z_AXIS))
+    if dxf.hasattr('text_direction'):
+        ux = Vector(dxf.text_direction).normalize()
+    else:
+        ux = OCS(extrusion).to_wcs(
+            Vector.from_deg_angle(dxf.get('rotation', 0.0)))
+    uy = extrusion.normalize().cross(ux).normalize()
+    insert = Vector(dxf.insert)
+    return (
+        insert + ux * x + uy * y
+        for x, y in ((x1, y1), (x2, y1), (x2, y2), (x1, y2))
+    )
+
+
+def _insertion_point(entity, fast: bool) -> Iterable[Vector]:
+    return entity.ocs().to_wcs(entity.dxf.insert),
+
+
+def _hatch(entity, fast: bool) -> Iterable[Vector]:
+    ocs = entity.ocs()
+    elevation = Vector(entity.dxf.elevation).z
+    for boundary in entity.paths:
+        path = Path.from_hatch_boundary_path(boundary, ocs, elevation)
+        yield from _path_vertices(path, fast)
+
+
+def _image(entity, fast: bool) -> Iterable[Vector]:
+    return entity.boundary_path_wcs()
+
+
+def _viewport(entity, fast: bool) -> Iterable[Vector]:
+    dxf = entity.dxf
+    center = Vector(dxf.center)
+    delta = Vector(dxf.width / 2.0, dxf.height / 2.0, 0)
+    return center - delta, center + delta
+
+
+def _infinite(entity, fast: bool) -> Iterable[Vector]:
+    return tuple()
+
+
+def _virtual_entities_vertices(entity, fast: bool) -> Iterable[Vector]:
+    if not hasattr(entity, 'virtual_entities'):
+        return
+    for e in entity.virtual_entities():
+        box = _extents(e, fast)
+        if box is not None:
+            yield from box
+
+
+def _vertices(entity: 'DXFGraphic', fast: bool) -> Iterable[Vector]:
+    func = _VERTICES.get(entity.dxftype(), _virtual_entities_vertices)
+    return func(entity, fast)
+
+
+# Bounding boxes of block references:
+
+def _box_corners(box: Box) -> Iterable[Vector]:
+    (x1, y1, z1), (x2, y2, z2) = box
+    for x in (x1, x2):
+        for y in (y1, y2):
+            for z in (z1, z2):
+                yield Vector(x, y, z)
+
+
+def _is_axis_aligned(m: Matrix44) -> bool:
+    # transformation of axis aligned boxes into axis aligned boxes:
+    for row in range(3):
+        if sum(1 for v in m.get_row(row)[:3] if abs(v) > 1e-12) > 1:
+            return False
+    return True
+
+
+def _insert(entity, fast: bool) -> Optional[Box]:
+    if entity.mcount > 1:
+        inserts = list(entity.multi_insert())
+    else:
+        inserts = [entity]
+    block_layout = entity.block()
+    block_box = None
+    if block_layout is not None:
+        block_box = _block_record_extents(block_layout.block_record, fast)
+
+    boxes = []
+    for insert in inserts:
+        if block_box is not None:
+            m = insert.matrix44()
+            if fast or _is_axis_aligned(m):
+                boxes.append(_box(m.transform_vertices(_box_corners(block_box))))
+            else:
+                boxes.extend(
+                    _extents(e, fast) for e in insert.virtual_entities()
+                    if e.dxftype() != 'ATTDEF'
+                )
+        boxes.extend(_extents(attrib, fast) for attrib in insert.attribs)
+    return _union(boxes)
+
+
+def _dimension(entity, fast: bool) -> Optional[Box]:
+    block_layout = entity.get_geometry_block()
+    if block_layout is None:
+        return None
+    box = _block_record_extents(block_layout.block_record, fast)
+    if box is None:
+        return None
+    offset = Vector(entity.dxf.get('insert', NULLVEC))
+    extmin, extmax = box
+    return extmin + offset, extmax + offset
+
+
+_VERTICES: Dict[str, Callable[['DXFGraphic', bool], Iterable[Vector]]] = {
+    'LINE': _line,
+    'POINT': _point,
+    'CIRCLE': _circle,
+    'ARC': _arc,
+    'ELLIPSE': _ellipse,
+    'LWPOLYLINE': _lwpolyline,
+    'POLYLINE': _polyline,
+    'SPLINE': _spline,
+    'HELIX': _spline,
+    'SOLID': _solid,
+    'TRACE': _solid,
+    '3DFACE': _solid,
+    'MESH': _mesh,
+    'TEXT': _text,
+    'ATTRIB': _text,
+    'ATTDEF': _text,
+    'MTEXT': _mtext,
+    'SHAPE': _insertion_point,
+    'TOLERANCE': _insertion_point,
+    'HATCH': _hatch,
+    'IMAGE': _image,
+    'WIPEOUT': _image,
+    'VIEWPORT': _viewport,
+    'XLINE': _infinite,
+    'RAY': _infinite,
+}
+
+_EXTENTS: Dict[str, Callable[['DXFGraphic', bool], Optional[Box]]] = {
+    'INSERT': _insert,
+    'DIMENSION': _dimension,
+    'ARC_DIMENSION': _dimension,
+    'LARGE_RADIAL_DIMENSION': _dimension,
+}
@@ -0,0 +1,283 @@
+# Copyright (c) 2020, Manfred Moitzi
+# License: MIT License
+"""
+Columnar (struct-of-arrays) view of DXF attributes.
+
+The DXF attributes of a sequence of entities are extracted into typed
+:class:`array.array` objects, which can be shared with NumPy without copying
+by :func:`numpy.frombuffer` or :func:`numpy.asarray`.
+
+"""
+from typing import TYPE_CHECKING, Iterable, List, Dict, Tuple, Any
+from array import array
+from ezdxf.lldxf.attributes import XType
+from ezdxf.lldxf.const import DXFAttributeError, DXFValueError
+from ezdxf.lldxf import types
+from ezdxf.math import Vector
+
+if TYPE_CHECKING:
+    from ezdxf.eztypes import DXFEntity, DXFAttr
+
+__all__ = ['Columns', 'POINT', 'FLOAT', 'INT', 'INT64', 'CATEGORY']
+
+# Column types:
+POINT = 'point'  # float64, 3 values (x, y, z) per entity
+FLOAT = 'float'  # float64
+INT = 'int'  # int32
+INT64 = 'int64'  # int64
+CATEGORY = 'category'  # int32 index into the list of categories
+
+TYPECODES = {
+    POINT: 'd',
+    FLOAT: 'd',
+    INT: 'i',
+    INT64: 'q',
+    CATEGORY: 'i',
+}
+NAN = float('nan')
+NAN_POINT = (NAN, NAN, NAN)
+
+
+def column_type(attrib_def: 'DXFAttr') -> str:
+    """ Returns the column type for the DXF attribute definition
+    `attrib_def`.
+    """
+    code = attrib_def.code
+    if attrib_def.xtype in (XType.point2d, XType.point3d, XType.any_point) \
+            or types.is_point_code(code):
+        return POINT
+    if code in types.DOUBLE:
+        return FLOAT
+    if code in types.INT64:
+        return INT64
+    if types.TYPE_TABLE.get(code) is int:
+        return INT
+    return CATEGORY
+
+
+def _is_equal(a: Any, b: Any) -> bool:
+    # NaN values of unset attributes are equal
+    return a == b or (a != a and b != b)
+
+
+class Columns:
+    """ Columnar view of the DXF attributes `names` of `entities`, all DXF
+    attributes are extracted in a single pass.
+
+    Each DXF attribute is stored as :class:`array.array` in a column
+    type depending on the DXF group code of the attribute:
+
+        - ``'point'``: float64 array of interleaved x, y, z coordinates, 3
+          values per entity
+        - ``'float'``: float64 array
+        - ``'int'``: int32 array
+        - ``'int64'``: int64 array
+        - ``'category'``: int32 array of codes for string values like the
+          layer name, the code is the index into the list of
+          :attr:`categories` of the attribute
+
+    Unset DXF attributes are replaced by their DXF default values, if no DXF
+    default value exist by NaN for floats and points, by 0 for integers and
+    by an empty string for categories.
+
+    Args:
+        entities: iterable of DXF entities
+        names: DXF attribute names like ``'start'``, ``'layer'`` or
+            ``'color'``
+
+    Raises:
+        DXFAttributeError: an entity does not support a DXF attribute or
+            a DXF attribute is not storable in a column
+
+    """
+
+    def __init__(self, entities: Iterable['DXFEntity'], names: Iterable[str]):
+        self.entities: List['DXFEntity'] = list(entities)
+        self.names: Tuple[str, ...] = tuple(names)
+        self.types: Dict[str, str] = dict()
+        self.columns: Dict[str, array] = dict()
+        # Categories of string columns, the column stores the index into
+        # this list:
+        self.categories: Dict[str, List[str]] = dict()
+        self._original: Dict[str, array] = dict()
+        if self.entities:
+            self._setup_columns(self.entities[0])
+            self._extract()
+
+    def _setup_columns(self, entity: 'DXFEntity') -> None:
+        dxfattribs = entity.dxf.dxfattribs
+        for name in self.names:
+            attrib_def = dxfattribs.get(name)
+            if attrib_def is None:
+                raise DXFAttributeError(
+                    f'Invalid DXF attribute "{name}" for entity '
+                    f'{entity.dxftype()}')
+            if attrib_def.xtype == XType.callback:
+                raise DXFAttributeError(
+                    f'Callback attribute "{name}" is not supported.')
+            type_ = column_type(attrib_def)
+            self.types[name] = type_
+            self.columns[name] = array(TYPECODES[type_])
+            if type_ == CATEGORY:
+                self.categories[name] = []
+
+    def _extract(self) -> None:
+        columns = []
+        for name in self.names:
+            type_ = self.types[name]
+            column = self.columns[name]
+            if type_ == POINT:
+                append = _point_appender(column)
+                default = NAN_POINT
+            elif type_ == CATEGORY:
+                append = _category_appender(column, self.categories[name])
+                default = ''
+            else:
+                append = column.append
+                default = NAN if type_ == FLOAT else 0
+            columns.append((name, append, default))
+
+        # DXF default values of unset attributes by entity class:
+        defaults: Dict[Tuple[type, str], Any] = dict()
+        for entity in self.entities:
+            dxf = entity.dxf
+            for name, append, default in columns:
+                value = dxf.get(name)
+                if value is None:
+                    key = (entity.__class__, name)
+                    if key in defaults:
+                        value = defaults[key]
+                    else:
+                        # raises DXFAttributeError for unsupported attributes:
+                        value = dxf.get_default(name)
+                        if value is None:
+                            value = default
+                        defaults[key] = value
+                append(value)
+        self._original = {
+            name: array(column.typecode, column)
+            for name, column in self.columns.items()
+        }
+
+    def __len__(self) -> int:
+        """ Returns the count of entities. """
+        return len(self.entities)
+
+    def __contains__(self, name: str) -> bool:
+        """ Returns ``True`` if DXF attribute `name` is a column. """
+        return name in self.columns
+
+    def __getitem__(self, name: str) -> array:
+        """ Returns the column of DXF attribute `name` as
+        :class:`array.array`.
+        """
+        return self.columns[name]
+
+    def values(self, name: str) -> List:
+        """ Returns the values of the column `name` as list, points as
+        (x, y, z) tuples and categories as strings.
+        """
+        column = self.columns[name]
+        type_ = self.types[name]
+        if type_ == POINT:
+            return [tuple(column[i:i + 3]) for i in range(0, len(column), 3)]
+        if type_ == CATEGORY:
+            categories = self.categories[name]
+            return [categories[code] for code in column]
+        return list(column)
+
+    def category_code(self, name: str, value: str) -> int:
+        """ Returns the code of the string `value` for the category column
+        `name`, adds `value` as new category if required.
+        """
+        categories = self.categories[name]
+        try:
+            return categories.index(value)
+        except ValueError:
+            categories.append(value)
+            return len(categories) - 1
+
+    def write_back(self, names: Iterable[str] = None) -> int:
+        """ Write the modified values of the columns `names` back to the
+        entities, writes all columns if `names` is ``None``. Only changed
+        values are written and the DXF attributes are validated.
+        Returns the count of changed values.
+
+        Raises:
+            DXFValueError: invalid column size or invalid category code
+
+        """
+        count = 0
+        for name in (self.names if names is None else names):
+            column = self.columns[name]
+            type_ = self.types[name]
+            size = 3 if type_ == POINT else 1
+            if len(column) != len(self.entities) * size:
+                raise DXFValueError(f'Invalid size of column "{name}".')
+            original = self._original[name]
+            if column == original:  # fast check without NaN values
+                continue
+            if type_ == POINT:
+                count += self._write_back_points(name, column, original)
+            else:
+                for index, (value, old) in enumerate(zip(column, original)):
+                    if value == old or _is_equal(value, old):
+                        continue
+                    if type_ == CATEGORY:
+                        value = self._category(name, value)
+                    self.entities[index].dxf.set(name, value)
+                    count += 1
+            self._original[name] = array(column.typecode, column)
+        return count
+
+    def _write_back_points(self, name: str, column: array,
+                           original: array) -> int:
+        count = 0
+        for index, entity in enumerate(self.entities):
+            start = index * 3
+            if column[start] == original[start] and \
+                    column[start + 1] == original[start + 1] and \
+                    column[start + 2] == original[start + 2]:
+                continue
+            value = column[start:start + 3]
+            if all(_is_equal(a, b) for a, b in
+                   zip(value, original[start:start + 3])):
+                continue
+            value = tuple(value)
+            if entity.dxf.dxfattribs.get(name).xtype == XType.point2d:
+                value = value[:2]
+            entity.dxf.set(name, value)
+            count += 1
+        return count
+
+    def _category(self, name: str, code: int) -> str:
+        categories = self.categories[name]
+        if 0 <= code < len(categories):
+            return categories[code]
+        raise DXFValueError(f'Invalid category code {code} in column "{name}".')
+
+
+def _point_appender(column: array):
+    extend = column.extend
+
+    def append(value) -> None:
+        # 2D points are stored as 3D points:
+        if type(value) is not Vector:
+            value = Vector(value)
+        extend(value.xyz)
+
+    return append
+
+
+def _category_appender(column: array, categories: List[str]):
+    codes: Dict[str, int] = dict()
+
+    def append(value: str) -> None:
+        code = codes.get(value)
+        if code is None:
+            code = len(categories)
+            codes[value] = code
+            categories.append(value)
+        column.append(code)
+
+    return append
@@ -0,0 +1,236 @@
+# Copyright (c) 2020, Manfred Moitzi
+# License: MIT License
+"""
+Persistent cache of loaded DXF documents.
+
+A cache entry is a pickled :class:`~ezdxf.document.Drawing`, the name of the
+entry is the hash of the file content, the `ezdxf` version and the loading
+arguments. A small reference file, keyed by the absolute path, the size and
+the modification time of the DXF file, stores the name of the entry, which
+avoids hashing the file content, if the DXF file is unchanged.
+
+"""
+from typing import TYPE_CHECKING, Optional, Dict, Iterable
+import os
+import hashlib
+import mmap
+import pickle
+import tempfile
+import logging
+import gc
+from contextlib import contextmanager
+
+import ezdxf
+from ezdxf.stats import Stats
+
+if TYPE_CHECKING:
+    from ezdxf.eztypes import Drawing
+
+__all__ = ['DocumentCache']
+
+logger = logging.getLogger('ezdxf')
+
+ENTRY_EXT = '.pickle'
+REF_EXT = '.ref'
+# Global options which change the loaded document:
+LOADING_OPTIONS = [
+    'filter_invalid_xdata_group_codes', 'load_proxy_graphics', 'lazy_loading',
+]
+
+
+class DocumentCache:
+    """ Persistent cache of loaded DXF documents, stored in the directory
+    `directory`. A cache hit restores the :class:`~ezdxf.document.Drawing`
+    from a pickled snapshot and skips the whole loading process.
+
+    The cache is size-bounded, if the total size of all snapshots exceeds
+    `max_size` in bytes, the least recently used snapshots are removed.
+
+    .. warning::
+
+        Unpickling data from an untrusted source is unsafe, use only cache
+        directories, which are not writable by untrusted users!
+
+    Args:
+        directory: cache directory, will be created if not exist
+        max_size: max. size of all stored snapshots in bytes
+
+    """
+
+    def __init__(self, directory: str, max_size: int = 2 ** 30):
+        self.directory = str(directory)
+        self.max_size = int(max_size)
+        self.hits = 0
+        self.misses = 0
+        os.makedirs(self.directory, exist_ok=True)
+
+    def readfile(self, filename: str, **kwargs) -> 'Drawing':
+        """ Returns the cached document `filename` or loads the document by
+        :func:`ezdxf.readfile` and stores a snapshot in the cache. All
+        keyword arguments are passed to :func:`ezdxf.readfile`.
+
+        """
+        filename = str(filename)
+        params = _loading_params(kwargs)
+        ref_name = self._ref_name(filename, params)
+        entry_name = self._read_ref(ref_name)
+        doc = self._load_entry(entry_name) if entry_name else None
+        if doc is None:
+            entry_name = _content_hash(filename, params)
+            doc = self._load_entry(entry_name)
+            if doc is None:
+                self.misses += 1
+                doc = ezdxf.readfile(filename, **kwargs)
+                self._store_entry(entry_name, doc)
+            self._write_ref(ref_name, entry_name)
+        doc.filename = filename
+        return doc
+
+    def clear(self) -> None:
+        """ Remove all cache entries. """
+        for name in os.listdir(self.directory):
+            if name.endswith(ENTRY_EXT) or name.endswith(REF_EXT):
+                _remove(self._path(name))
+
+    @property
+    def size(self) -> int:
+        """ Returns the total size of all stored snapshots in bytes. """
+        return sum(os.path.getsize(path) for path in self._entries())
+
+    def _path(self, name: str) -> str:
+        return os.path.join(self.directory, name)
+
+    def _entries(self) -> Iterable[str]:
+        for name in os.listdir(self.directory):
+            if name.endswith(ENTRY_EXT):
+                yield self._path(name)
+
+    def _ref_name(self, filename: str, params: str) -> str:
+        stat = os.stat(filename)
+        key = f'{os.path.abspath(filename)}|{stat.st_size}|' \
+              f'{stat.st_mtime_ns}|{params}'
+        return hashlib.sha1(key.encode('utf8')).hexdigest() + REF_EXT
+
+    def _read_ref(self, ref_name: str) -> Optional[str]:
+        try:
+            with open(self._path(ref_name), 'rt') as fp:
+                return fp.read().strip()
+        except IOError:
+            return None
+
+    def _write_ref(self, ref_name: str, entry_name: str) -> None:
+        self._write(ref_name, entry_name.encode())
+
+    def _load_entry(self, entry_name: str) -> Optional['Drawing']:
+        path = self._path(entry_name + ENTRY_EXT)
+        stats = Stats()
+        try:
+            with open(path, 'rb') as fp, _disabled_gc(), \
+                    stats.timer('load.cache'):
+                doc = pickle.load(fp)
+        except IOError:
+            return None
+        except Exception as e:  # corrupted or outdated snapshot
+            logger.warning(f'Removed invalid cache entry "{path}": {str(e)}')
+            _remove(path)
+            return None
+        # Update the modification time for the LRU eviction:
+        os.utime(path)
+        self.hits += 1
+        doc.stats = stats
+        return doc
+
+    def _store_entry(self, entry_name: str, doc: 'Drawing') -> None:
+        with _disabled_gc():
+            data = pickle.dumps(doc, protocol=pickle.HIGHEST_PROTOCOL)
+        if len(data) > self.max_size:
+            return
+        self._write(entry_name + ENTRY_EXT, data)
+        self._evict()
+
+    def _write(self, name: str, data: bytes) -> None:
+        # Write a temp file and replace the target file, because other
+        # processes could access the cache at the same time:
+        fd, tmp_path = tempfile.mkstemp(dir=self.directory, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'wb') as fp:
+                fp.write(data)
+            os.replace(tmp_path, self._path(name))
+        except IOError:
+            _remove(tmp_path)
+            raise
+
+    def _evict(self) -> None:
+        """ Remove least recently used entries until the total size of all
+        entries is below `max_size`, and remove all references to not
+        existing entries.
+        """
+        entries = []
+        total_size = 0
+        for path in self._entries():
+            try:
+                stat = os.stat(path)
+            except IOError:
+                continue
+            entries.append((stat.st_mtime_ns, stat.st_size, path))
+            total_size += stat.st_size
+        if total_size <= self.max_size:
+            return
+        entries.sort()
+        for _, size, path in entries:
+            _remove(path)
+            total_size -= size
+            if total_size <= self.max_size:
+                break
+        existing = set(os.path.basename(path) for path in self._entries())
+        for name in os.listdir(self.directory):
+            if name.endswith(REF_EXT):
+                entry_name = self._read_ref(name)
+                if entry_name is None or \
+                        (entry_name + ENTRY_EXT) not in existing:
+                    _remove(self._path(name))
+
+
+def _loading_params(kwargs: Dict) -> str:
+    """ Returns all parameters which change the loaded document as string. """
+    params = dict(kwargs)
+    params.pop('workers', None)  # does not change the loaded document
+    # Normalize the filter names like the load filter matches them:
+    if params.get('types') is not None:
+        params['types'] = sorted(set(name.upper() for name in params['types']))
+    for key in ('layers', 'layouts'):
+        if params.get(key) is not None:
+            params[key] = sorted(set(name.lower() for name in params[key]))
+    for name in LOADING_OPTIONS:
+        params[name] = getattr(ezdxf.options, name)
+    params['version'] = ezdxf.__version__
+    return repr(sorted(params.items()))
+
+
+def _content_hash(filename: str, params: str) -> str:
+    sha = hashlib.sha256(params.encode('utf8'))
+    with open(filename, 'rb') as fp:
+        if os.fstat(fp.fileno()).st_size:
+            with mmap.mmap(fp.fileno(), 0, access=mmap.ACCESS_READ) as data:
+                sha.update(data)
+    return sha.hexdigest()
+
+
+@contextmanager
+def _disabled_gc():
+    # The garbage collector is triggered very often by creating the huge
+    # count of objects at unpickling, but there is nothing to collect:
+    enabled = gc.isenabled()
+    gc.disable()
+    try:
+        yield
+    finally:
+        if enabled:
+            gc.enable()
+
+
+def _remove(path: str) -> None:
+    try:
+        os.remove(path)
+    except IOError:
+        pass
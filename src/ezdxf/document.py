@@ -2,7 +2,7 @@
 # License: MIT License
 from typing import (
     TYPE_CHECKING, TextIO, BinaryIO, Iterable, Union, Tuple, Callable,
-    cast, Optional, List,
+    cast, Optional, List, Dict,
 )
 from datetime import datetime
 import io
@@ -23,6 +23,7 @@ from ezdxf.layouts.layouts import Layouts
 from ezdxf.tools.codepage import tocodepage, toencoding
 from ezdxf.tools.juliandate import juliandate
 from ezdxf.options import options
+from ezdxf.stats import Stats
 
 from ezdxf.tools import guid
 from ezdxf.query import EntityQuery
@@ -44,6 +45,9 @@ from ezdxf.entities.mline import MLineStyleCollection
 
 logger = logging.getLogger('ezdxf')
 
+# Size of the write buffer in characters (ASCII DXF) or bytes (Binary DXF)
+WRITE_BUFFER_SIZE = 1 << 20
+
 if TYPE_CHECKING:
     from ezdxf.eztypes import (
         DXFTag, Table, ViewportTable, VPort, Dictionary, Layout,
@@ -102,6 +106,9 @@ class Drawing:
         # Some fixes can't be applied while the DXF document is not fully
         # initialized, store this fixes as callable object:
         self._post_init_commands: List[Callable] = []
+
+        # Timing statistics of the loading, auditing and export stages:
+        self.stats = Stats()
         # Don't create any new entities here:
         # New created handles could collide with handles loaded from DXF file.
         assert len(self.entitydb) == 0
@@ -276,8 +283,10 @@ class Drawing:
 
         """
         from .lldxf.tagger import tag_compiler
-        tag_loader = tag_compiler(tag_loader)
         doc = cls()
+        timed = doc.stats.timed
+        tag_loader = timed('load.compiling', tag_compiler(
+            timed('load.tagging', tag_loader)))
         doc._load(tag_loader)
         return doc
 
@@ -288,10 +297,27 @@ class Drawing:
         doc._load(tagger=compiled_tags)
         return doc
 
+    @classmethod
+    def from_section_dict(cls, sections: loader.SectionDict,
+                          stats: Stats = None) -> 'Drawing':
+        """ Create new drawing from a section dict, created by the DXF
+        structure loader. The optional `stats` object contains the statistics
+        of the structure loading stage. (internal API)
+        """
+        if 'THUMBNAILIMAGE' in sections:
+            del sections['THUMBNAILIMAGE']
+        doc = cls()
+        if stats is not None:
+            doc.stats = stats
+        doc._load_section_dict(sections)
+        return doc
+
     def _load(self, tagger: Optional[Iterable['DXFTag']]) -> None:
         # 1st Loading stage: load complete DXF entity structure
         self.is_loading = True
-        sections = loader.load_dxf_structure(tagger)
+        with self.stats.timer('load.structure') as stage:
+            sections = loader.load_dxf_structure(tagger)
+            loader.count_structure(sections, stage)
         if 'THUMBNAILIMAGE' in sections:
             del sections['THUMBNAILIMAGE']
         self._load_section_dict(sections)
@@ -321,23 +347,33 @@ class Drawing:
         self.entitydb.handles.reset(seed)
 
         # Store all necessary DXF entities in the entity database:
-        loader.load_and_bind_dxf_content(sections, self)
+        stats = self.stats
+        loader.load_and_bind_dxf_content(
+            sections, self, lazy=options.lazy_loading, stats=stats)
 
         # End of 1. loading stage, all entities of the DXF file are
         # stored in the entity database.
 
         # Create sections:
         self.classes = ClassesSection(self, sections.get('CLASSES', None))
-        self.tables = TablesSection(self, sections.get('TABLES', None))
+        with stats.timer('load.tables') as stage:
+            stage.entities += _section_size(sections, 'TABLES')
+            self.tables = TablesSection(self, sections.get('TABLES', None))
 
         # Create *Model_Space and *Paper_Space BLOCK_RECORDS
         # BlockSection setup takes care about the rest:
         self._create_required_block_records()
 
         # At this point all table entries are required:
-        self.blocks = BlocksSection(self, sections.get('BLOCKS', None))
-        self.entities = EntitySection(self, sections.get('ENTITIES', None))
-        self.objects = ObjectsSection(self, sections.get('OBJECTS', None))
+        with stats.timer('load.blocks') as stage:
+            stage.entities += _section_size(sections, 'BLOCKS')
+            self.blocks = BlocksSection(self, sections.get('BLOCKS', None))
+        with stats.timer('load.entities') as stage:
+            stage.entities += _section_size(sections, 'ENTITIES')
+            self.entities = EntitySection(self, sections.get('ENTITIES', None))
+        with stats.timer('load.objects') as stage:
+            stage.entities += _section_size(sections, 'OBJECTS')
+            self.objects = ObjectsSection(self, sections.get('OBJECTS', None))
 
         # only DXF R2013+
         self.acdsdata = AcDsDataSection(self, sections.get('ACDSDATA', None))
@@ -348,7 +384,8 @@ class Drawing:
                 self.stored_sections.append(StoredSection(data))
 
         # Objects section is not initialized!
-        self._2nd_loading_stage()
+        with stats.timer('load.2nd_stage') as stage:
+            stage.entities += self._2nd_loading_stage()
 
         # DXF version upgrades:
         if self.dxfversion < DXF12:
@@ -369,25 +406,44 @@ class Drawing:
         self.objects.setup_objects_management_tables(self.rootdict)
 
         # Setup modelspace- and paperspace layouts:
-        self.layouts = Layouts.load(self)
+        with stats.timer('load.layouts') as stage:
+            self.layouts = Layouts.load(self)
+            stage.entities += len(self.layouts)
 
         # Additional work is common to the new and load process:
         self.is_loading = False
         self._finalize_setup()
 
-    def _2nd_loading_stage(self):
-        """ Load additional resources from entity database into DXF entities.
+    def _2nd_loading_stage(self) -> int:
+        """ Load additional resources from entity database into DXF entities,
+        returns the count of processed entities.
 
         e.g. convert handles into DXFEntity() objects
 
         """
         db = self.entitydb
-        for entity in db.values():
+        count = 0
+        # Not loaded entities (lazy loading mode) execute the post_load_hook()
+        # at loading:
+        for entity in db.loaded_entities():
+            count += 1
             # The post_load_hook() can return a callable, which should be
             # executed, when the DXF document is fully initialized.
             cmd = entity.post_load_hook(self)
             if cmd is not None:
                 self._post_init_commands.append(cmd)
+        return count
+
+    def add_post_init_command(self, cmd: Callable) -> None:
+        """ Execute callable `cmd` when the DXF document is fully initialized,
+        or immediately if the DXF document is already initialized.
+        (internal API)
+        """
+        commands = getattr(self, '_post_init_commands', None)
+        if commands is None:
+            cmd()
+        else:
+            commands.append(cmd)
 
     def create_all_arrow_blocks(self):
         """ For upgrading DXF R12/13/14 files to R2000, it is necessary to
@@ -495,19 +551,25 @@ class Drawing:
         self._update_header_vars()
         self._update_metadata()
 
+        precision = options.float_precision
         if fmt.startswith('asc'):
             tagwriter = TagWriter(stream, write_handles=handles,
-                                  dxfversion=dxfversion)
+                                  dxfversion=dxfversion,
+                                  buffer_size=WRITE_BUFFER_SIZE,
+                                  precision=precision)
         elif fmt.startswith('bin'):
             tagwriter = BinaryTagWriter(
                 stream, write_handles=handles, dxfversion=dxfversion,
                 encoding=self.output_encoding,
+                buffer_size=WRITE_BUFFER_SIZE,
+                precision=precision,
             )
             tagwriter.write_signature()
         else:
             raise ValueError(f"Unknown output format: '{fmt}'.")
 
         self.export_sections(tagwriter)
+        tagwriter.flush()
 
     def encode_base64(self) -> bytes:
         """ Returns DXF document as base64 encoded binary data. """
@@ -521,14 +583,21 @@ class Drawing:
     def export_sections(self, tagwriter: 'TagWriter') -> None:
         """ DXF export sections. (internal API) """
         dxfversion = tagwriter.dxfversion
-        self.header.export_dxf(tagwriter)
+        timer = self.stats.timer
+        with timer('export.header'):
+            self.header.export_dxf(tagwriter)
         if dxfversion > DXF12:
-            self.classes.export_dxf(tagwriter)
-        self.tables.export_dxf(tagwriter)
-        self.blocks.export_dxf(tagwriter)
-        self.entities.export_dxf(tagwriter)
+            with timer('export.classes'):
+                self.classes.export_dxf(tagwriter)
+        with timer('export.tables'):
+            self.tables.export_dxf(tagwriter)
+        with timer('export.blocks'):
+            self.blocks.export_dxf(tagwriter)
+        with timer('export.entities'):
+            self.entities.export_dxf(tagwriter)
         if dxfversion > DXF12:
-            self.objects.export_dxf(tagwriter)
+            with timer('export.objects'):
+                self.objects.export_dxf(tagwriter)
         if self.acdsdata.is_valid:
             self.acdsdata.export_dxf(tagwriter)
         for section in self.stored_sections:
@@ -699,7 +768,7 @@ class Drawing:
             :ref:`entity query string` and :ref:`entity queries`
 
         """
-        return EntityQuery(self.chain_layouts_and_blocks(), query)
+        return EntityQuery(self.chain_layouts_and_blocks(), query, entitydb=self.entitydb)
 
     def groupby(self, dxfattrib="", key=None) -> dict:
         """ Groups DXF entities of all layouts and blocks (excluding the
@@ -902,7 +971,8 @@ class Drawing:
         """
         from ezdxf.audit.auditor import Auditor
         auditor = Auditor(self)
-        auditor.run()
+        with self.stats.timer('audit') as stage:
+            auditor.run(stage)
         return auditor
 
     def validate(self, print_report=True) -> bool:
@@ -939,3 +1009,8 @@ class Drawing:
         vport.dxf.center = center
         vport.dxf.height = height
         return vport
+
+
+def _section_size(sections: Dict, name: str) -> int:
+    # Count of entities in section `name`, includes the SECTION entity:
+    return len(sections.get(name, ()))
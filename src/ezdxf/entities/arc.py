@@ -96,9 +96,10 @@ class Arc(Circle):
 
         """
         ocs = OCSTransform(self.dxf.extrusion, m)
-        super().transform(m)
+        self._transform_circle(ocs)
         self.dxf.start_angle = ocs.transform_deg_angle(self.dxf.start_angle)
         self.dxf.end_angle = ocs.transform_deg_angle(self.dxf.end_angle)
+        self.post_transform(m)
         return self
 
     def construction_tool(self) -> ConstructionArc:
@@ -1,6 +1,6 @@
 # Copyright (c) 2019-2020, Manfred Moitzi
 # License: MIT License
-from typing import TYPE_CHECKING, Optional
+from typing import TYPE_CHECKING, Optional, Iterable, List
 import logging
 from ezdxf.lldxf import validator
 from ezdxf.lldxf.attributes import (
@@ -22,6 +22,8 @@ if TYPE_CHECKING:
         TagWriter, DXFNamespace, Block, EndBlk, DXFGraphic,
         EntitySpace, BlockLayout,
     )
+    from ezdxf.spatial import SpatialIndex
+    from ezdxf.lldxf.loader import LazyEntity
 
 __all__ = ['BlockRecord']
 
@@ -68,6 +70,8 @@ class BlockRecord(DXFEntity):
     DXFTYPE = 'BLOCK_RECORD'
     DXFATTRIBS = DXFAttributes(base_class, acdb_symbol_table_record,
                                acdb_blockrec)
+    # Cached extents of the block definition, see ezdxf.bbox (internal API)
+    _bbox_cache = None
 
     def __init__(self):
         from ezdxf.entitydb import EntitySpace
@@ -79,6 +83,8 @@ class BlockRecord(DXFEntity):
         self.endblk: Optional[EndBlk] = None
         # stores also the block layout structure
         self.block_layout: Optional[BlockLayout] = None
+        # optional spatial index of the entity space
+        self.spatial_index: Optional['SpatialIndex'] = None
 
     def set_block(self, block: 'Block', endblk: 'EndBlk'):
         self.block = block
@@ -195,6 +201,58 @@ class BlockRecord(DXFEntity):
         else:
             logger.debug('Unexpected entity {}'.format(entity))
         self.entity_space.add(entity)
+        if self.spatial_index is not None:
+            self.spatial_index.add(entity)
+        self._invalidate_bbox()
+
+    def add_entities(self, entities: Iterable['DXFGraphic']) -> None:
+        """ Add multiple existing DXF entities to BLOCK_RECORD in one step.
+
+        Args:
+            entities: iterable of :class:`DXFGraphic`
+
+        """
+        entities = list(entities)
+        owner = self.dxf.handle
+        paperspace = int(self.is_any_paperspace)
+        for entity in entities:
+            if not hasattr(entity, 'set_owner'):
+                logger.debug('Unexpected entity {}'.format(entity))
+                continue
+            dxf = entity.dxf
+            if dxf.owner != owner or dxf.get('paperspace', 0) != paperspace:
+                entity.set_owner(owner, paperspace=paperspace)
+        self.entity_space.extend(entities)
+        if self.spatial_index is not None:
+            for entity in entities:
+                self.spatial_index.add(entity)
+        self._invalidate_bbox()
+
+    def _invalidate_bbox(self) -> None:
+        # Invalidate the cached extents of the block definition, see ezdxf.bbox:
+        if self._bbox_cache is not None:
+            from ezdxf.bbox import invalidate
+            invalidate(self)
+
+    def add_lazy_entities(self, entities: Iterable['LazyEntity']) -> None:
+        """ Add not loaded entities to BLOCK_RECORD, the entities are loaded
+        at the first access of the entity space. (internal API)
+
+        Args:
+            entities: iterable of :class:`~ezdxf.lldxf.loader.LazyEntity`
+
+        """
+        entities = list(entities)
+        if len(entities) == 0:
+            return
+        # assign layout, the owner tags are set at loading:
+        owner = self.dxf.handle
+        paperspace = int(self.is_any_paperspace)
+        for lazy_entity in entities:
+            lazy_entity.owner = owner
+            lazy_entity.paperspace = paperspace
+        self.entity_space.set_loader(
+            LazyEntityLoader(entities), pending=entities)
 
     def unlink_entity(self, entity: 'DXFGraphic') -> None:
         """ Unlink `entity` from BLOCK_RECORD.
@@ -207,9 +265,15 @@ class BlockRecord(DXFEntity):
 
         """
         if entity.is_alive:
-            self.entity_space.remove(entity)
+            self._remove_entity(entity)
             entity.set_owner(None)
 
+    def _remove_entity(self, entity: 'DXFGraphic') -> None:
+        self.entity_space.remove(entity)
+        if self.spatial_index is not None:
+            self.spatial_index.remove(entity)
+        self._invalidate_bbox()
+
     def delete_entity(self, entity: 'DXFGraphic') -> None:
         """ Delete `entity` from BLOCK_RECORD entity space and drawing database.
 
@@ -217,5 +281,27 @@ class BlockRecord(DXFEntity):
             entity: :class:`DXFGraphic`
 
         """
-        self.unlink_entity(entity)  # 1. unlink from entity space
+        if entity.is_alive:
+            # 1. remove from entity space, resetting the owner is not
+            # required and would update the database index of a deleted
+            # entity, the index entries are removed by purging the database
+            self._remove_entity(entity)
         entity.destroy()
+
+
+class LazyEntityLoader:
+    """ Loader of the not loaded entities of an entity space, a class and not
+    a closure, because a document with not loaded entities has to be
+    picklable for the :class:`~ezdxf.doccache.DocumentCache`.
+    (internal class)
+    """
+    __slots__ = ('entities',)
+
+    def __init__(self, entities: List['LazyEntity']):
+        self.entities = entities
+
+    def __call__(self) -> Iterable['DXFGraphic']:
+        for lazy_entity in self.entities:
+            entity = lazy_entity.load()
+            if entity.is_alive:
+                yield entity
@@ -105,7 +105,14 @@ class Circle(DXFGraphic):
         .. versionadded:: 0.13
 
         """
-        ocs = OCSTransform(self.dxf.extrusion, m)
+        self._transform_circle(OCSTransform(self.dxf.extrusion, m))
+        self.post_transform(m)
+        return self
+
+    def _transform_circle(self, ocs: OCSTransform) -> None:
+        # Transforms the CIRCLE attributes without calling the post_transform()
+        # hook, which is called once by the transform() method of the
+        # actual entity.
         dxf = self.dxf
         if ocs.scale_uniform:
             dxf.extrusion = ocs.new_extrusion
@@ -125,8 +132,6 @@ class Circle(DXFGraphic):
                 'CIRCLE/ARC does not support non uniform scaling'
             )
 
-        return self
-
     def translate(self, dx: float, dy: float, dz: float) -> 'Circle':
         """ Optimized CIRCLE/ARC translation about `dx` in x-axis, `dy` in
         y-axis and `dz` in z-axis, returns `self` (floating interface).
@@ -137,6 +142,7 @@ class Circle(DXFGraphic):
         ocs = self.ocs()
         self.dxf.center = ocs.from_wcs(
             Vector(dx, dy, dz) + ocs.to_wcs(self.dxf.center))
+        self.post_transform(Matrix44.translate(dx, dy, dz))
         return self
 
     def to_ellipse(self, replace=True) -> 'Ellipse':
@@ -627,6 +627,7 @@ class Dimension(DXFGraphic, OverrideMixin):
             transform_if_exist(vertex_name, m.transform)
 
         dxf.extrusion = ocs.new_extrusion
+        self.post_transform(m)
         return self
 
     def virtual_entities(self) -> Iterable['DXFGraphic']:
@@ -727,6 +728,7 @@ class ArcDimension(Dimension):
         for vertex_name in ('leader_point1', 'leader_point2'):
             transform_if_exist(vertex_name, m.transform)
 
+        self.post_transform(m)
         return self
 
 
@@ -787,6 +789,7 @@ class RadialDimensionLarge(Dimension):
         for vertex_name in ('chord_point', 'override_center', 'Jog_point'):
             transform_if_exist(vertex_name, m.transform)
 
+        self.post_transform(m)
         return self
 
 
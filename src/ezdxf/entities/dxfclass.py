@@ -1,7 +1,7 @@
 # Copyright (c) 2019 Manfred Moitzi
 # License: MIT License
 from typing import TYPE_CHECKING, Tuple
-from .dxfentity import DXFEntity, SubclassProcessor, DXFNamespace
+from .dxfentity import DXFEntity, SubclassProcessor, new_namespace
 from ezdxf.lldxf.attributes import DXFAttr, DXFAttributes, DefSubclass
 from ezdxf.lldxf.const import DXF2004, DXF2000
 from .factory import register_entity
@@ -72,7 +72,7 @@ class DXFClass(DXFEntity):
         """ Called by load constructor. CLASS is special. """
         if tags:
             # do not process base class!!!
-            self.dxf = DXFNamespace(entity=self)
+            self.dxf = new_namespace(self)
             processor = SubclassProcessor(tags)
             processor.load_dxfattribs_into_namespace(self.dxf, class_def)
 
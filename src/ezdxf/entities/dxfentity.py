@@ -28,7 +28,7 @@ from ezdxf.lldxf.attributes import DXFAttr, DXFAttributes, DefSubclass
 from ezdxf.tools import set_flag_state
 from . import factory
 from .appdata import AppData, Reactors
-from .dxfns import DXFNamespace, SubclassProcessor
+from .dxfns import DXFNamespace, SubclassProcessor, new_namespace
 from .xdata import XData, EmbeddedObjects
 from .xdict import ExtensionDict
 
@@ -69,12 +69,16 @@ class DXFEntity:
     # an existing object in the dxf namespace.
     DEFAULT_ATTRIBS: Dict = {}
     MIN_DXF_VERSION_FOR_EXPORT = const.DXF12
+    # Use a compact slotted DXF namespace if enabled by
+    # options.compact_namespace, requires that only DXF attributes defined
+    # in DXFATTRIBS are stored in the DXF namespace:
+    COMPACT_NAMESPACE = True
 
     def __init__(self):
         """ Default constructor. (internal API)"""
         # Public attributes for package users
         self.doc: Optional[Drawing] = None
-        self.dxf: DXFNamespace = DXFNamespace(entity=self)
+        self.dxf: DXFNamespace = new_namespace(self)
 
         # None public attributes for package users
         # create extended data only if needed:
@@ -200,7 +204,7 @@ class DXFEntity:
     def load_dxf_attribs(
             self, processor: SubclassProcessor = None) -> DXFNamespace:
         """ Load DXF attributes into DXF namespace. """
-        return DXFNamespace(processor, self)
+        return new_namespace(self, processor)
 
     def post_load_hook(self, doc: 'Drawing') -> Optional[Callable]:
         """ The 2nd loading stage when loading DXF documents from an external
@@ -800,6 +804,8 @@ class DXFEntity:
 @factory.set_default_class
 class DXFTagStorage(DXFEntity):
     """ Just store all the tags as they are. (internal class) """
+    # stores the undefined DXF attribute 'paperspace':
+    COMPACT_NAMESPACE = False
 
     def __init__(self):
         """ Default constructor """
@@ -842,10 +848,11 @@ class DXFTagStorage(DXFEntity):
         self.DXFTYPE = self.base_class[0].value
         try:
             acdb_entity = tags.get_subclass('AcDbEntity')
-            self.dxf.__dict__['paperspace'] = acdb_entity.get_first_value(67, 0)
+            paperspace = acdb_entity.get_first_value(67, 0)
         except const.DXFKeyError:
             # just fake it
-            self.dxf.__dict__['paperspace'] = 0
+            paperspace = 0
+        self.dxf.unprotected_update({'paperspace': paperspace})
 
     def export_entity(self, tagwriter: 'TagWriter') -> None:
         """ Write subclass tags as they are. """
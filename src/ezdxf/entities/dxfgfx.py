@@ -141,6 +141,8 @@ class DXFGraphic(DXFEntity):
     DXFTYPE = 'DXFGFX'
     DEFAULT_ATTRIBS = {'layer': '0'}
     DXFATTRIBS = DXFAttributes(base_class, acdb_entity)
+    # Cached bounding box, see ezdxf.bbox (internal API)
+    _bbox_cache = None
 
     def load_dxf_attribs(self,
                          processor: SubclassProcessor = None) -> 'DXFNamespace':
@@ -423,6 +425,21 @@ class DXFGraphic(DXFEntity):
         """
         raise NotImplementedError()
 
+    def post_transform(self, m: 'Matrix44') -> None:
+        """ Post processing of an inplace transformation, called by all
+        :meth:`transform` implementations, invalidates the cached bounding box
+        and updates the spatial index of the owner layout. (internal API)
+        """
+        if self._bbox_cache is not None:
+            from ezdxf.bbox import invalidate
+            invalidate(self)
+        if self.doc is None:
+            return
+        owner = self.doc.entitydb.get(self.dxf.owner)
+        spatial_index = getattr(owner, 'spatial_index', None)
+        if spatial_index is not None:
+            spatial_index.update(self)
+
     def translate(self, dx: float, dy: float, dz: float) -> 'DXFGraphic':
         """ Translate entity inplace about `dx` in x-axis, `dy` in y-axis and
         `dz` in z-axis, returns `self` (floating interface).
@@ -1,7 +1,8 @@
 # Copyright (c) 2020, Manfred Moitzi
 # License: MIT License
-from typing import Any, Optional, Union, Iterable, List, TYPE_CHECKING
+from typing import Any, Optional, Union, Iterable, List, Dict, TYPE_CHECKING
 import logging
+from sys import intern
 from ezdxf import options
 from ezdxf.lldxf import const
 from ezdxf.lldxf.attributes import XType, DXFAttributes, DefSubclass, DXFAttr
@@ -13,7 +14,10 @@ logger = logging.getLogger('ezdxf')
 if TYPE_CHECKING:
     from ezdxf.eztypes import ExtendedTags, DXFEntity, TagWriter
 
-__all__ = ['DXFNamespace', 'SubclassProcessor']
+__all__ = [
+    'DXFNamespaceBase', 'DXFNamespace', 'SubclassProcessor', 'new_namespace',
+    'compact_namespace_class',
+]
 
 ERR_INVALID_DXF_ATTRIB = 'Invalid DXF attribute "{}" for entity {}'
 ERR_DXF_ATTRIB_NOT_EXITS = 'DXF attribute "{}" does not exist'
@@ -30,18 +34,32 @@ SETTER_EVENTS = {
     'dimstyle': 'on_dimstyle_change',
 }
 
+# DXF attributes stored in the secondary indexes of the entity database,
+# changing this attributes updates the index entries of the entity:
+INDEXED_ATTRIBS = {'layer', 'owner'}
 
-class DXFNamespace:
-    """ :class:`DXFNamespace` manages all named DXF attributes of an entity.
+# DXF attributes with a small count of distinct values, the values are
+# interned to share the string objects between all entities:
+INTERNED_ATTRIBS = {'layer', 'linetype', 'style', 'dimstyle'}
 
-    The DXFNamespace.__dict__ is used as DXF attribute storage, therefore only
-    valid Python names can be used as attrib name.
+# Marker for not existing DXF attributes
+_MISSING = object()
+
+
+class DXFNamespaceBase:
+    """ :class:`DXFNamespaceBase` manages all named DXF attributes of an
+    entity, the storage of the DXF attributes is implemented by the
+    subclasses :class:`DXFNamespace` and the compact namespaces created by
+    :func:`compact_namespace_class`.
+
+    Only valid Python names can be used as attrib name.
 
     The namespace can only contain immutable objects: string, int, float, bool,
     Vector. Because of the immutability, copy and deepcopy are the same.
 
     (internal class)
     """
+    __slots__ = ()
 
     def __init__(self, processor: 'SubclassProcessor' = None,
                  entity: 'DXFEntity' = None):
@@ -55,23 +73,60 @@ class DXFNamespace:
             owner = base_class_.get_first_value(330, None)
             self.rewire(entity, handle, owner)
         else:
-            self.reset_handles()
             self.rewire(entity)
+            self.reset_handles()
 
     def copy(self, entity: 'DXFEntity'):
         namespace = self.__class__()
-        for k, v in self.__dict__.items():
-            namespace.__dict__[k] = v
+        namespace.unprotected_update(self.all_existing_dxf_attribs())
         namespace.rewire(entity)
         return namespace
 
     def __deepcopy__(self, memodict: dict = None):
         return self.copy(self._entity)
 
+    def __getstate__(self) -> dict:
+        state = self.all_existing_dxf_attribs()
+        state['_entity'] = self._entity
+        return state
+
+    def __setstate__(self, state: dict) -> None:
+        """ Restore namespace at unpickling, bypasses :meth:`__setattr__` and
+        avoids calling :meth:`__getattr__` for not existing attributes.
+        """
+        self.unprotected_update(state)
+
+    # Storage interface, implemented by the subclasses:
+
+    def _raw(self, key: str, default: Any = None) -> Any:
+        """ Returns the stored value of `key` or `default`. """
+        raise NotImplementedError
+
+    def _set_raw(self, key: str, value: Any) -> None:
+        """ Store `value` for `key` without validation. """
+        raise NotImplementedError
+
+    def _del_raw(self, key: str) -> bool:
+        """ Delete `key`, returns ``False`` if `key` does not exist. """
+        raise NotImplementedError
+
+    def all_existing_dxf_attribs(self) -> dict:
+        """ Returns all existing DXF attributes, except DXFEntity parent link.
+        """
+        raise NotImplementedError
+
+    def unprotected_update(self, dxfattribs: dict) -> None:
+        """ Update DXF attributes without validation and without triggering
+        any events, all values have to be valid and of the correct type.
+        (internal API)
+        """
+        for key, value in dxfattribs.items():
+            self._set_raw(key, value)
+
     def reset_handles(self):
         """ Reset handle and owner to None. """
-        self.__dict__['handle'] = None
-        self.__dict__['owner'] = None
+        self._set_raw('handle', None)
+        self._set_raw('owner', None)
 
     def rewire(self, entity: 'DXFEntity', handle: str = None,
                owner: str = None) -> None:
@@ -84,11 +139,11 @@ class DXFNamespace:
 
         """
         # bypass __setattr__()
-        self.__dict__['_entity'] = entity
+        self._set_raw('_entity', entity)
         if handle is not None:
-            self.__dict__['handle'] = handle
+            self._set_raw('handle', handle)
         if owner is not None:
-            self.__dict__['owner'] = owner
+            self._set_raw('owner', owner)
 
     def __getattr__(self, key: str) -> Any:
         """ Called if DXF attribute `key` does not exist, returns the DXF
@@ -116,6 +171,16 @@ class DXFNamespace:
             DXFAttributeError: attribute `key` is not supported
 
         """
+        self._set_attrib(key, value)
+        if key in INDEXED_ATTRIBS:
+            self._update_index()
+        self._invalidate_bbox()
+
+    def _set_attrib(self, key: str, value: Any) -> None:
+        # Set DXF attribute `key` to `value` without updating the entity
+        # database index and the cached bounding box, the loading process
+        # uses this method directly, because a loaded entity is not indexed
+        # and has no bounding box yet.
 
         def entity() -> str:
             # DXFNamespace is maybe not assigned to the entity yet:
@@ -128,6 +193,8 @@ class DXFNamespace:
 
         def check(value):
             value = cast_value(attrib_def.code, value)
+            if key in INTERNED_ATTRIBS and type(value) is str:
+                value = intern(value)
             if not attrib_def.is_valid_value(value):
                 if attrib_def.fixer:
                     value = attrib_def.fixer(value)
@@ -147,7 +214,7 @@ class DXFNamespace:
             if attrib_def.xtype == XType.callback:
                 attrib_def.set_callback_value(self._entity, value)
             else:
-                self.__dict__[key] = check(value)
+                self._set_raw(key, check(value))
         else:
             raise const.DXFAttributeError(
                 ERR_INVALID_DXF_ATTRIB.format(key, self.dxftype))
@@ -164,11 +231,28 @@ class DXFNamespace:
             DXFAttributeError: attribute `key` does not exist
 
         """
-        if self.hasattr(key):
-            del self.__dict__[key]
+        if self._del_raw(key):
+            if key in INDEXED_ATTRIBS:
+                self._update_index()
+            self._invalidate_bbox()
         else:
             raise const.DXFAttributeError(ERR_DXF_ATTRIB_NOT_EXITS.format(key))
 
+    def _update_index(self) -> None:
+        # Update the secondary indexes of the entity database, unbound
+        # entities are not indexed:
+        doc = getattr(self._entity, 'doc', None)
+        if doc is not None:
+            doc.entitydb.update_index(self._entity)
+
+    def _invalidate_bbox(self) -> None:
+        # Invalidate the cached bounding box of the entity, see ezdxf.bbox,
+        # virtual entities can also have a cached bounding box:
+        entity = self._entity
+        if getattr(entity, '_bbox_cache', None) is not None:
+            from ezdxf.bbox import invalidate
+            invalidate(entity)
+
     def get(self, key: str, default: Any = None) -> Any:
         """ Returns value of DXF attribute `key` or the given `default` value
         not DXF default value for unset attributes.
@@ -177,10 +261,11 @@ class DXFNamespace:
             DXFAttributeError: attribute `key` is not supported
 
         """
-        # callback values should not exist as attribute in __dict__
-        if self.hasattr(key):
+        # callback values should not exist as stored attribute
+        value = self._raw(key, _MISSING)
+        if value is not _MISSING:
             # do not return the DXF default value
-            return self.__dict__[key]
+            return value
         attrib_def: Optional['DXFAttr'] = self.dxfattribs.get(key)
         if attrib_def:
             if attrib_def.xtype == XType.callback:
@@ -205,19 +290,13 @@ class DXFNamespace:
         """
         self.__setattr__(key, value)
 
-    def all_existing_dxf_attribs(self) -> dict:
-        """ Returns all existing DXF attributes, except DXFEntity parent link.
-        """
-        attribs = dict(self.__dict__)
-        del attribs['_entity']
-        return attribs
-
     def discard(self, key: str) -> None:
         """ Delete DXF attribute `key` silently without any exception. """
-        try:
-            del self.__dict__[key]
-        except KeyError:
-            pass
+        if not self._del_raw(key):
+            return
+        if key in INDEXED_ATTRIBS:
+            self._update_index()
+        self._invalidate_bbox()
 
     def is_supported(self, key: str) -> bool:
         """ Returns True if DXF attribute `key` is supported else False.
@@ -230,7 +309,7 @@ class DXFNamespace:
 
     def hasattr(self, key: str) -> bool:
         """ Returns True if attribute `key` really exists else False. """
-        return key in self.__dict__
+        return self._raw(key, _MISSING) is not _MISSING
 
     @property
     def dxftype(self) -> str:
@@ -314,6 +393,144 @@ class DXFNamespace:
                 ERR_INVALID_DXF_ATTRIB.format(name, self.dxftype))
 
 
+class DXFNamespace(DXFNamespaceBase):
+    """ The default DXF namespace, the instance ``__dict__`` is used as DXF
+    attribute storage.
+
+    (internal class)
+    """
+
+    def _raw(self, key: str, default: Any = None) -> Any:
+        return self.__dict__.get(key, default)
+
+    def _set_raw(self, key: str, value: Any) -> None:
+        self.__dict__[key] = value
+
+    def _del_raw(self, key: str) -> bool:
+        try:
+            del self.__dict__[key]
+        except KeyError:
+            return False
+        return True
+
+    def all_existing_dxf_attribs(self) -> dict:
+        attribs = dict(self.__dict__)
+        del attribs['_entity']
+        return attribs
+
+    def unprotected_update(self, dxfattribs: dict) -> None:
+        self.__dict__.update(dxfattribs)
+
+
+class CompactDXFNamespace(DXFNamespaceBase):
+    """ Base class of the compact DXF namespaces created by
+    :func:`compact_namespace_class`, the DXF attributes are stored in slots,
+    one slot for each DXF attribute of the DXF attribute definition.
+
+    (internal class)
+    """
+    __slots__ = ('_entity',)
+    # Slot descriptors of the DXF attributes:
+    _SLOTS: Dict[str, Any] = dict()
+    # Entity class of the DXF attribute definition, required for pickling:
+    _ENTITY_CLASS = None
+
+    def __reduce__(self):
+        return compact_namespace, (self._ENTITY_CLASS,), self.__getstate__()
+
+    def _raw(self, key: str, default: Any = None) -> Any:
+        slot = self._SLOTS.get(key)
+        if slot is not None:
+            try:
+                return slot.__get__(self)
+            except AttributeError:  # unset slot
+                pass
+        return default
+
+    def _set_raw(self, key: str, value: Any) -> None:
+        try:
+            object.__setattr__(self, key, value)
+        except AttributeError:
+            raise const.DXFAttributeError(
+                ERR_INVALID_DXF_ATTRIB.format(key, self.dxftype))
+
+    def _del_raw(self, key: str) -> bool:
+        if key not in self._SLOTS:
+            return False
+        try:
+            object.__delattr__(self, key)
+        except AttributeError:  # unset slot
+            return False
+        return True
+
+    def all_existing_dxf_attribs(self) -> dict:
+        attribs = dict()
+        for key, slot in self._SLOTS.items():
+            try:
+                attribs[key] = slot.__get__(self)
+            except AttributeError:  # unset slot
+                pass
+        return attribs
+
+
+_COMPACT_CLASSES: Dict[type, Optional[type]] = dict()
+
+
+def compact_namespace_class(entity_class: type) -> Optional[type]:
+    """ Returns the compact DXF namespace class for the DXF entity class
+    `entity_class`, the class is created at the first request and has a slot
+    for each DXF attribute of the DXF attribute definition
+    :attr:`entity_class.DXFATTRIBS`. Returns ``None`` if a compact namespace
+    is not possible, because a DXF attribute name collides with a method
+    name.
+
+    """
+    try:
+        return _COMPACT_CLASSES[entity_class]
+    except KeyError:
+        pass
+    names = ['handle', 'owner']
+    for name, attrib in entity_class.DXFATTRIBS.items():
+        if attrib.xtype != XType.callback and name not in names:
+            names.append(name)
+    if any(hasattr(CompactDXFNamespace, name) for name in names):
+        namespace_class = None
+    else:
+        namespace_class = type(
+            entity_class.__name__ + 'Namespace',
+            (CompactDXFNamespace,),
+            {'__slots__': tuple(names), '_ENTITY_CLASS': entity_class},
+        )
+        namespace_class._SLOTS = {
+            name: namespace_class.__dict__[name] for name in names
+        }
+    _COMPACT_CLASSES[entity_class] = namespace_class
+    return namespace_class
+
+
+def compact_namespace(entity_class: type) -> DXFNamespaceBase:
+    """ Returns an empty compact DXF namespace for `entity_class`, used for
+    unpickling. (internal API)
+    """
+    namespace_class = compact_namespace_class(entity_class)
+    namespace = namespace_class.__new__(namespace_class)
+    namespace._set_raw('_entity', None)
+    return namespace
+
+
+def new_namespace(entity: 'DXFEntity',
+                  processor: 'SubclassProcessor' = None) -> DXFNamespaceBase:
+    """ Returns a new DXF namespace for `entity`, creates a compact slotted
+    namespace if the option :attr:`ezdxf.options.compact_namespace` is
+    ``True``.
+    """
+    namespace_class = DXFNamespace
+    if options.compact_namespace and entity.COMPACT_NAMESPACE:
+        namespace_class = compact_namespace_class(entity.__class__) or \
+                          DXFNamespace
+    return namespace_class(processor, entity)
+
+
 BASE_CLASS_CODES = {0, 5, 102, 330}
 
 
@@ -441,7 +658,7 @@ class SubclassProcessor:
             if attrib is not None:
                 if (attrib.xtype != XType.callback) or (
                         attrib.setter is not None):
-                    dxf.set(attrib.name, value)
+                    dxf._set_attrib(attrib.name, value)
 
                 if len(doublets) and replace_attrib(code):
                     continue
@@ -159,15 +159,15 @@ class Ellipse(DXFGraphic):
         yield from self.construction_tool().vertices(params)
 
     def flattening(self, distance: float, segments: int = 8) -> Iterable[Vector]:
-        """ Adaptive recursive flattening. The argument `segments` is the
-        minimum count of approximation segments, if the distance from the center
-        of the approximation segment to the curve is bigger than `distance` the
-        segment will be subdivided. Returns a closed polygon for a full ellipse:
+        """ Adaptive flattening. The argument `segments` is the minimum count
+        of approximation segments, if the maximum distance from the curve to
+        an approximation segment is bigger than `distance` the segment will be
+        subdivided. Returns a closed polygon for a full ellipse:
         start vertex == end vertex.
 
         Args:
-            distance: maximum distance from the projected curve point onto the
-                segment chord.
+            distance: maximum distance from the curve to the approximation
+                segment
             segments: minimum segment count
 
         .. versionadded:: 0.15
@@ -213,6 +213,7 @@ class Ellipse(DXFGraphic):
         e = self.construction_tool()
         e.transform(m)
         self.update_dxf_attribs(e.dxfattribs())
+        self.post_transform(m)
         return self
 
     def translate(self, dx: float, dy: float, dz: float) -> 'Ellipse':
@@ -223,6 +224,7 @@ class Ellipse(DXFGraphic):
 
         """
         self.dxf.center = Vector(dx, dy, dz) + self.dxf.center
+        self.post_transform(Matrix44.translate(dx, dy, dz))
         return self
 
     def to_spline(self, replace=True) -> 'Spline':
@@ -1,13 +1,14 @@
 # Copyright (c) 2019-2020, Manfred Moitzi
 # License: MIT License
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Iterable, List, Dict
 
 if TYPE_CHECKING:
     from ezdxf.eztypes import Drawing, DXFEntity, ExtendedTags
 
 __all__ = [
     'register_entity', 'ENTITY_CLASSES', 'replace_entity',
-    'new', 'cls', 'is_bound', 'create_db_entry', 'load', 'bind'
+    'new', 'cls', 'is_bound', 'create_db_entry', 'load', 'bind',
+    'new_entities', 'bind_entities',
 ]
 # Stores all registered classes:
 ENTITY_CLASSES = {}
@@ -47,6 +48,32 @@ def new(dxftype: str, dxfattribs: dict = None,
     return entity.cast() if hasattr(entity, 'cast') else entity
 
 
+def new_entities(dxftype: str, dxfattribs: dict,
+                 unchecked_dxfattribs: Iterable[Dict],
+                 doc: 'Drawing' = None) -> List['DXFEntity']:
+    """ Create multiple new entities of the same DXF type, one entity for each
+    item of `unchecked_dxfattribs`. All entities share the DXF attributes
+    `dxfattribs`, which are validated only once. The individual DXF
+    attributes of `unchecked_dxfattribs` are not validated and have to be
+    valid and of the correct type, e.g. :class:`~ezdxf.math.Vector` for
+    points.
+
+    """
+    # Validation of the shared DXF attributes by creating a prototype:
+    prototype = new(dxftype, dxfattribs, doc)
+    shared = prototype.dxf.all_existing_dxf_attribs()
+    entity_class = prototype.__class__
+    entities = []
+    for attribs in unchecked_dxfattribs:
+        entity = entity_class()
+        entity.doc = doc
+        dxf = entity.dxf
+        dxf.unprotected_update(shared)
+        dxf.unprotected_update(attribs)
+        entities.append(entity)
+    return entities
+
+
 def create_db_entry(dxftype, dxfattribs: dict, doc: 'Drawing') -> 'DXFEntity':
     entity = new(dxftype=dxftype, dxfattribs=dxfattribs)
     bind(entity, doc)
@@ -81,6 +108,20 @@ def bind(entity: 'DXFEntity', doc: 'Drawing') -> None:
         entity.post_bind_hook()
 
 
+def bind_entities(entities: Iterable['DXFEntity'], doc: 'Drawing') -> None:
+    """ Bind multiple `entities` to the DXF document `doc` in one step, same
+    as :func:`bind` for each entity.
+    """
+    entities = list(entities)
+    for entity in entities:
+        assert entity.is_alive, 'Can not bind destroyed entity.'
+        entity.doc = doc
+    doc.entitydb.add_entities(entities)
+    if not doc.is_loading:
+        for entity in entities:
+            entity.post_bind_hook()
+
+
 def unbind(entity: 'DXFEntity'):
     """ Unbind `entity` from document and layout, but does not destroy the
     entity.
@@ -642,6 +642,7 @@ class Hatch(DXFGraphic):
             x=0, y=0)
         dxf.extrusion = ocs.new_extrusion
         # todo scale pattern
+        self.post_transform(m)
         return self
 
     def associate(self, path: TPath, entities: Iterable['DXFEntity']):
@@ -663,11 +664,42 @@ class Hatch(DXFGraphic):
 
 
 class BoundaryPaths:
+    """ Copies of boundary paths share the path data (copy-on-write), a
+    private deep copy is created at the first access or modification of the
+    path data.
+    """
+
     def __init__(self, paths: List[TPath] = None):
-        self.paths: List[TPath] = paths or []
+        self._paths: List[TPath] = paths or []
+        self._shared = False
+
+    @property
+    def paths(self) -> List[TPath]:
+        """ List of boundary paths, returns a private copy if the path data is
+        shared with other boundary paths.
+        """
+        if self._shared:
+            self._paths = copy.deepcopy(self._paths)
+            self._shared = False
+        return self._paths
+
+    @paths.setter
+    def paths(self, paths: List[TPath]) -> None:
+        self._paths = paths
+        self._shared = False
+
+    def __copy__(self) -> 'BoundaryPaths':
+        return self.__deepcopy__()
+
+    def __deepcopy__(self, memodict: dict = None) -> 'BoundaryPaths':
+        paths = self.__class__.__new__(self.__class__)
+        paths._paths = self._paths
+        paths._shared = True
+        self._shared = True
+        return paths
 
     def __len__(self):
-        return len(self.paths)
+        return len(self._paths)
 
     def __getitem__(self, item):
         return self.paths[item]
@@ -772,8 +804,8 @@ class BoundaryPaths:
         return new_path
 
     def export_dxf(self, tagwriter: 'TagWriter') -> None:
-        tagwriter.write_tag2(91, len(self.paths))
-        for path in self.paths:
+        tagwriter.write_tag2(91, len(self._paths))
+        for path in self._paths:
             path.export_dxf(tagwriter)
 
     def transform(self, ocs: OCSTransform, elevation: float = 0) -> None:
@@ -86,10 +86,11 @@ class Helix(Spline):
         .. versionadded:: 0.13
 
         """
-        super().transform(m)
+        self._transform_spline(m)
         self.dxf.axis_base_point = m.transform(self.dxf.axis_base_point)
         self.dxf.axis_vector = m.transform_direction(self.dxf.axis_vector)
         self.dxf.start_point = m.transform(self.dxf.start_point)
         self.dxf.radius = m.transform_direction(
             (self.dxf.radius, 0, 0)).magnitude
+        self.post_transform(m)
         return self
@@ -414,6 +414,7 @@ class Insert(LinkedEntities):
 
         for attrib in self.attribs:
             attrib.transform(m)
+        self.post_transform(m)
         return self
 
     def translate(self, dx: float, dy: float, dz: float) -> 'Insert':
@@ -428,6 +429,7 @@ class Insert(LinkedEntities):
             Vector(dx, dy, dz) + ocs.to_wcs(self.dxf.insert))
         for attrib in self.attribs:
             attrib.translate(dx, dy, dz)
+        self.post_transform(Matrix44.translate(dx, dy, dz))
         return self
 
     def matrix44(self) -> Matrix44:
@@ -217,6 +217,7 @@ class Leader(DXFGraphic, OverrideMixin):
                                                         m)  # ???
         self.dxf.horizontal_direction = m.transform_direction(
             self.dxf.horizontal_direction)
+        self.post_transform(m)
         return self
 
     def virtual_entities(self) -> Iterable['DXFGraphic']:
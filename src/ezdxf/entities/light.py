@@ -119,4 +119,5 @@ class Light(DXFGraphic):
         """
         self.dxf.location = m.transform(self.dxf.location)
         self.dxf.target = m.transform(self.dxf.target)
+        self.post_transform(m)
         return self
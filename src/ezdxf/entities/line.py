@@ -67,6 +67,7 @@ class Line(DXFGraphic):
         self.dxf.start = start
         self.dxf.end = end
         transform_thickness_and_extrusion_without_ocs(self, m)
+        self.post_transform(m)
         return self
 
     def translate(self, dx: float, dy: float, dz: float) -> 'Line':
@@ -79,4 +80,5 @@ class Line(DXFGraphic):
         vec = Vector(dx, dy, dz)
         self.dxf.start = vec + self.dxf.start
         self.dxf.end = vec + self.dxf.end
+        self.post_transform(Matrix44.translate(dx, dy, dz))
         return self
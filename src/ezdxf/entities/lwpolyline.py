@@ -4,7 +4,8 @@ from typing import TYPE_CHECKING, Tuple, Sequence, Iterable, cast, List, Union
 import array
 import copy
 from contextlib import contextmanager
-from ezdxf.math import Vector, Matrix44, Z_AXIS
+from itertools import repeat
+from ezdxf.math import Vector, VectorArray, Matrix44, Z_AXIS
 from ezdxf.math.transformtools import OCSTransform, NonUniformScalingError
 from ezdxf.lldxf import validator
 from ezdxf.lldxf.attributes import (
@@ -333,20 +334,26 @@ class LWPolyline(DXFGraphic):
                 '2D POLYLINE with arcs does not support non uniform scaling')
             # Parent function has to catch this Exception and explode this
             # LWPOLYLINE into LINE and ELLIPSE entities.
-        vertices = list(ocs.transform_vertex(v) for v in self.vertices_in_ocs())
-        lwpoints = [(v[0], v[1], p[2], p[3], p[4]) for v, p in
-                    zip(vertices, self.lwpoints)]
-        self.set_points(lwpoints)
+        values = self.lwpoints.values
+        count = len(self.lwpoints)
+        elevation = self.get_dxf_attrib('elevation', default=0.)
+        # Transform all vertices at once, the start- and end width and the
+        # bulge values are not changed by an uniform scaling:
+        vertices = ocs.transform_array(VectorArray.from_xyz(
+            values[0::5], values[1::5], repeat(elevation, count)))
+        values[0::5] = vertices.x
+        values[1::5] = vertices.y
 
         # All new OCS vertices must have the same z-axis, which is the elevation
         # of the polyline:
-        if vertices:
-            dxf.elevation = vertices[0][2]
+        if count:
+            dxf.elevation = vertices.values[2]
 
         if dxf.hasattr('thickness'):
             dxf.thickness = ocs.transform_length(
                 (0, 0, dxf.thickness), reflection=dxf.thickness)
         dxf.extrusion = ocs.new_extrusion
+        self.post_transform(m)
         return self
 
     def virtual_entities(self) -> Iterable[Union['Line', 'Arc']]:
@@ -375,7 +382,7 @@ class LWPolyline(DXFGraphic):
 
 
 class LWPolylinePoints(VertexArray):
-    __slots__ = ('values',)
+    __slots__ = ()
     VERTEX_CODE = 10
     START_WIDTH_CODE = 40
     END_WIDTH_CODE = 41
@@ -386,31 +393,33 @@ class LWPolylinePoints(VertexArray):
     def from_tags(cls, tags: Tags) -> Tuple['LWPolylinePoints', Tags]:
         """ Setup point array from tags. """
 
-        def get_vertex() -> LWPointType:
-            point.append(attribs.get(cls.START_WIDTH_CODE, 0))
-            point.append(attribs.get(cls.END_WIDTH_CODE, 0))
-            point.append(attribs.get(cls.BULGE_CODE, 0))
-            return tuple(point)
-
         unprocessed_tags = Tags()
-        data = []
+        data = array.array('d')
+        extend = data.extend
+        frombytes = data.frombytes
         point = None
-        attribs = {}
+        start_width = end_width = bulge = 0.
         for tag in tags:
-            if tag.code in LWPOINTCODES:
-                if tag.code == 10:
-                    if point is not None:
-                        data.extend(get_vertex())
-                    # just use x- and  y-axis
-                    point = list(tag.value[0:2])
-                    attribs = {}
-                else:
-                    attribs[tag.code] = tag.value
-            else:
+            code = tag.code
+            if code == 10:
+                if point is not None:
+                    extend((start_width, end_width, bulge))
+                # just use x- and y-axis, copies the packed values of the
+                # DXFVertex directly:
+                point = tag.packed_value[0:2]
+                frombytes(point.cast('B'))
+                start_width = end_width = bulge = 0.
+            elif code == 40:
+                start_width = tag.value
+            elif code == 41:
+                end_width = tag.value
+            elif code == 42:
+                bulge = tag.value
+            elif code not in LWPOINTCODES:
                 unprocessed_tags.append(tag)
         if point is not None:
-            data.extend(get_vertex())
-        return cls(data=data), unprocessed_tags
+            extend((start_width, end_width, bulge))
+        return cls.from_array(data), unprocessed_tags
 
     def append(self, point: Sequence[float],
                format: str = DEFAULT_FORMAT) -> None:
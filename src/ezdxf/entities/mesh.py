@@ -123,7 +123,7 @@ def face_to_array(face: Sequence[int]) -> array.array:
 
 def create_vertex_array(tags: 'Tags', start_index: int) -> 'VertexArray':
     vertex_tags = tags.collect_consecutive_tags(codes=(10,), start=start_index)
-    return VertexArray(data=chain.from_iterable(t.value for t in vertex_tags))
+    return VertexArray.from_tags(vertex_tags)
 
 
 def create_face_list(tags: 'Tags', start_index: int) -> 'FaceList':
@@ -353,6 +353,7 @@ class Mesh(DXFGraphic):
 
         """
         self._vertices.transform(m)
+        self.post_transform(m)
         return self
 
 
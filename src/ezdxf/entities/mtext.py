@@ -421,6 +421,7 @@ class MText(DXFGraphic):
         dxf.insert = m.transform(dxf.insert)
         dxf.text_direction = new_text_direction
         dxf.extrusion = new_extrusion
+        self.post_transform(m)
         return self
 
     def plain_text(self, split=False) -> Union[List[str], str]:
@@ -89,6 +89,7 @@ class Point(DXFGraphic):
         self.dxf.location = m.transform(self.dxf.location)
         transform_thickness_and_extrusion_without_ocs(self, m)
         # ignore dxf.angle!
+        self.post_transform(m)
         return self
 
     def translate(self, dx: float, dy: float, dz: float) -> 'Point':
@@ -99,6 +100,7 @@ class Point(DXFGraphic):
 
         """
         self.dxf.location = Vector(dx, dy, dz) + self.dxf.location
+        self.post_transform(Matrix44.translate(dx, dy, dz))
         return self
 
     def virtual_entities(self, pdsize: float = 1,
@@ -467,6 +467,7 @@ class Polyline(LinkedEntities):
         else:
             for vertex in self.vertices:
                 vertex.transform(m)
+        self.post_transform(m)
         return self
 
     def explode(self, target_layout: 'BaseLayout' = None) -> 'EntityQuery':
@@ -1034,6 +1035,7 @@ class DXFVertex(DXFGraphic):
         if self.is_face_record:
             return self
         self.dxf.location = m.transform(self.dxf.location)
+        self.post_transform(m)
         return self
 
     def format(self, format='xyz') -> Sequence:
@@ -100,4 +100,5 @@ class Shape(DXFGraphic):
                 (0, 0, dxf.thickness), reflection=dxf.thickness)
 
         dxf.extrusion = ocs.new_extrusion
+        self.post_transform(m)
         return self
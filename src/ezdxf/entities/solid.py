@@ -100,6 +100,7 @@ class Solid(_Base):
             dxf.thickness = ocs.transform_length(
                 (0, 0, dxf.thickness), reflection=dxf.thickness)
         dxf.extrusion = ocs.new_extrusion
+        self.post_transform(m)
         return self
 
     def wcs_vertices(self, close: bool = False) -> List[Vector]:
@@ -212,6 +213,7 @@ class Face3d(_Base):
         # 3DFACE is a real 3d entity
         dxf.vtx0, dxf.vtx1, dxf.vtx2, dxf.vtx3 = m.transform_vertices(
             (dxf.vtx0, dxf.vtx1, dxf.vtx2, dxf.vtx3))
+        self.post_transform(m)
         return self
 
     def wcs_vertices(self, close: bool = False) -> List[Vector]:
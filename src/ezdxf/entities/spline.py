@@ -117,9 +117,8 @@ class Spline(DXFGraphic):
         return dxf
 
     def load_spline_data(self, spline_tags: 'Tags') -> None:
-        self.control_points = (value for code, value in spline_tags if
-                               code == 10)
-        self.fit_points = (value for code, value in spline_tags if code == 11)
+        self._control_points = VertexArray.from_tags(spline_tags, code=10)
+        self._fit_points = VertexArray.from_tags(spline_tags, code=11)
         self.knots = (value for code, value in spline_tags if code == 40)
         self.weights = (value for code, value in spline_tags if code == 41)
         spline_tags.remove_tags(codes=REMOVE_CODES)
@@ -272,14 +271,14 @@ class Spline(DXFGraphic):
 
     def flattening(self, distance: float,
                    segments: int = 4) -> Iterable[Vector]:
-        """ Adaptive recursive flattening. The argument `segments` is the
-        minimum count of approximation segments between two knots, if the
-        distance from the center of the approximation segment to the curve is
-        bigger than `distance` the segment will be subdivided.
+        """ Adaptive flattening. The argument `segments` is the minimum count
+        of approximation segments between two knots, if the maximum distance
+        from the curve to an approximation segment is bigger than `distance`
+        the segment will be subdivided.
 
         Args:
-            distance: maximum distance from the projected curve point onto the
-                segment chord.
+            distance: maximum distance from the curve to the approximation
+                segment
             segments: minimum segment count between two knots
 
         .. versionadded:: 0.15
@@ -416,6 +415,14 @@ class Spline(DXFGraphic):
         .. versionadded:: 0.13
 
         """
+        self._transform_spline(m)
+        self.post_transform(m)
+        return self
+
+    def _transform_spline(self, m: 'Matrix44') -> None:
+        # Transforms the SPLINE attributes without calling the
+        # post_transform() hook, which is called once by the transform()
+        # method of the actual entity.
         self._control_points.transform(m)
         self._fit_points.transform(m)
         # Transform optional attributes if they exist
@@ -423,5 +430,3 @@ class Spline(DXFGraphic):
         for name in ('start_tangent', 'end_tangent', 'extrusion'):
             if dxf.hasattr(name):
                 dxf.set(name, m.transform_direction(dxf.get(name)))
-
-        return self
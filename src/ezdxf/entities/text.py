@@ -302,6 +302,7 @@ class Text(DXFGraphic):
             dxf.thickness = ocs.transform_length((0, 0, dxf.thickness),
                                                  reflection=dxf.thickness)
         dxf.extrusion = ocs.new_extrusion
+        self.post_transform(m)
         return self
 
     def translate(self, dx: float, dy: float, dz: float) -> 'Text':
@@ -318,6 +319,7 @@ class Text(DXFGraphic):
         dxf.insert = ocs.from_wcs(vec + ocs.to_wcs(dxf.insert))
         if dxf.hasattr('align_point'):
             dxf.align_point = ocs.from_wcs(vec + ocs.to_wcs(dxf.align_point))
+        self.post_transform(Matrix44.translate(dx, dy, dz))
         return self
 
     def remove_dependencies(self, other: 'Drawing' = None) -> None:
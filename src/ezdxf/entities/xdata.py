@@ -2,6 +2,7 @@
 # License: MIT License
 from typing import TYPE_CHECKING, List, Iterable, Tuple
 from collections import OrderedDict
+import copy
 from ezdxf.lldxf.types import dxftag
 from ezdxf.lldxf.tags import Tags
 from ezdxf.lldxf.const import XDATA_MARKER, DXFValueError
@@ -22,16 +23,41 @@ __all__ = ['XData', 'EmbeddedObjects']
 
 
 class XData:
+    """ Copies of XDATA share the tag data (copy-on-write), a private deep copy
+    is created at the first access or modification of the tag data.
+    """
+
     def __init__(self, xdata: List[Tags] = None):
-        self.data = OrderedDict()
+        self._data = OrderedDict()
+        self._shared = False
         for data in (xdata or []):
             self._add(data)
 
+    @property
+    def data(self) -> 'OrderedDict[str, Tags]':
+        """ XDATA tags by APPID, returns a private copy if the tag data is
+        shared with other XDATA objects.
+        """
+        if self._shared:
+            self._data = copy.deepcopy(self._data)
+            self._shared = False
+        return self._data
+
+    def __copy__(self) -> 'XData':
+        return self.__deepcopy__()
+
+    def __deepcopy__(self, memodict: dict = None) -> 'XData':
+        xdata = self.__class__.__new__(self.__class__)
+        xdata._data = self._data
+        xdata._shared = True
+        self._shared = True
+        return xdata
+
     def __len__(self):
-        return len(self.data)
+        return len(self._data)
 
     def __contains__(self, appid: str) -> bool:
-        return appid in self.data
+        return appid in self._data
 
     def _add(self, tags: Tags) -> None:
         tags = Tags(tags)
@@ -58,7 +84,7 @@ class XData:
             del self.data[appid]
 
     def export_dxf(self, tagwriter: 'TagWriter') -> None:
-        for appid, tags in self.data.items():
+        for appid, tags in self._data.items():
             if options.filter_invalid_xdata_group_codes:
                 tags = list(filter_invalid_xdata_group_codes(tags))
             tagwriter.write_tags(tags)
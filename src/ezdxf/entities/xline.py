@@ -56,6 +56,7 @@ class XLine(DXFGraphic):
         self.dxf.start = m.transform(self.dxf.start)
         self.dxf.unit_vector = m.transform_direction(
             self.dxf.unit_vector).normalize()
+        self.post_transform(m)
         return self
 
     def translate(self, dx: float, dy: float, dz: float) -> 'XLine':
@@ -66,6 +67,7 @@ class XLine(DXFGraphic):
 
         """
         self.dxf.start = Vector(dx, dy, dz) + self.dxf.start
+        self.post_transform(Matrix44.translate(dx, dy, dz))
         return self
 
 
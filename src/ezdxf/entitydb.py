@@ -1,7 +1,10 @@
 # Copyright (c) 2019-2020, Manfred Moitzi
 # License: MIT License
-from typing import Optional, Iterable, Tuple, TYPE_CHECKING, Dict, Set
+from typing import (
+    Optional, Iterable, Tuple, TYPE_CHECKING, Dict, Set, List, Callable,
+)
 from contextlib import contextmanager
+from itertools import islice
 from ezdxf.tools.handle import HandleGenerator
 from ezdxf.lldxf.types import is_valid_handle
 from ezdxf.entities.dxfentity import DXFEntity
@@ -12,11 +15,90 @@ from ezdxf.entities import factory
 
 if TYPE_CHECKING:
     from ezdxf.eztypes import TagWriter
+    from ezdxf.lldxf.loader import LazyEntity
 
 DATABASE_EXCLUDE = {
     'SECTION', 'ENDSEC', 'EOF', 'TABLE', 'ENDTAB', 'CLASS', 'ACDSRECORD',
     'ACDSSCHEMA'
 }
+IndexKeys = Tuple[str, Optional[str], Optional[str]]
+
+
+class EntityDBIndex:
+    """ Secondary indexes of the entity database for the DXF type, the layer
+    and the owner handle of the entities. Each index maps the index key to a
+    dict of handle/entity pairs, which preserves the insertion order.
+
+    The layer index is case sensitive, the layer key is the value returned
+    by :code:`entity.dxf.get('layer')`, entities without layer attribute or
+    without a layer value are not stored in the layer index.
+
+    Not loaded entities are stored as :class:`~ezdxf.lldxf.loader.LazyEntity`
+    objects with the index keys of the raw tags. (internal class)
+
+    """
+
+    def __init__(self):
+        self.dxftypes: Dict[str, Dict[str, DXFEntity]] = dict()
+        self.layers: Dict[str, Dict[str, DXFEntity]] = dict()
+        self.owners: Dict[str, Dict[str, DXFEntity]] = dict()
+        # Stores the current index keys of all indexed entities:
+        self._keys: Dict[str, IndexKeys] = dict()
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def __contains__(self, handle: str) -> bool:
+        return handle in self._keys
+
+    def add(self, handle: str, entity: DXFEntity,
+            keys: IndexKeys = None) -> None:
+        """ Add or update the index entries of `entity`, the index `keys` are
+        required for not loaded entities.
+        """
+        if handle in self._keys:
+            self.remove(handle)
+        if keys is None:
+            dxf = entity.dxf
+            keys = (
+                entity.dxftype(),
+                dxf.get('layer') if dxf.is_supported('layer') else None,
+                dxf.get('owner'),
+            )
+        self._keys[handle] = keys
+        dxftype, layer, owner = keys
+        _add(self.dxftypes, dxftype, handle, entity)
+        if layer is not None:
+            _add(self.layers, layer, handle, entity)
+        if owner is not None:
+            _add(self.owners, owner, handle, entity)
+
+    def remove(self, handle: str) -> None:
+        """ Remove the index entries of `handle`. """
+        keys = self._keys.pop(handle, None)
+        if keys is None:
+            return
+        dxftype, layer, owner = keys
+        _remove(self.dxftypes, dxftype, handle)
+        if layer is not None:
+            _remove(self.layers, layer, handle)
+        if owner is not None:
+            _remove(self.owners, owner, handle)
+
+
+def _add(index: Dict, key: str, handle: str, entity: DXFEntity) -> None:
+    bucket = index.get(key)
+    if bucket is None:
+        index[key] = {handle: entity}
+    else:
+        bucket[handle] = entity
+
+
+def _remove(index: Dict, key: str, handle: str) -> None:
+    bucket = index[key]
+    del bucket[handle]
+    if not bucket:
+        del index[key]
 
 
 class EntityDB:
@@ -26,13 +108,17 @@ class EntityDB:
     DXFEntity or inherited types, this entities are stored in the
     DXF document database, database-key is the `handle` as string.
 
+    In lazy loading mode the database stores also not loaded entities as
+    :class:`~ezdxf.lldxf.loader.LazyEntity` objects, these entities are
+    loaded at the first access by handle and when iterating the database.
+
     """
 
     class Trashcan:
         """ Store handles to entities which should be deleted later. """
 
         def __init__(self, db: 'EntityDB'):
-            self._database = db._database
+            self._db = db
             self._handles: Set[str] = set()
 
         def add(self, handle: str):
@@ -45,27 +131,35 @@ class EntityDB:
             """ Remove handles in trashcan from database and destroy entities if
             still alive.
             """
-            db = self._database
+            db = self._db
+            database = db._database
             for handle in self._handles:
-                entity = db.get(handle)
+                entity = database.get(handle)
                 if entity and entity.is_alive:
                     entity.destroy()
 
-                if handle in db:
-                    del db[handle]
+                if handle in database:
+                    db._remove(handle)
 
             self._handles.clear()
 
     def __init__(self):
         self._database: Dict[str, DXFEntity] = {}
+        # Not loaded entities, key is the handle of the main entity or the
+        # handle of a linked entity:
+        self._lazy_entities: Dict[str, 'LazyEntity'] = {}
         # DXF handles of entities to delete later:
         self.handles = HandleGenerator()
         self.locked: bool = False  # used only for debugging
+        # Optional secondary indexes:
+        self._index: Optional[EntityDBIndex] = None
 
     def __getitem__(self, handle: str) -> DXFEntity:
         """ Get entity by `handle`, does not filter destroyed entities nor
         entities in the trashcan.
         """
+        if handle in self._lazy_entities:
+            self._lazy_entities[handle].load()
         return self._database[handle]
 
     def __setitem__(self, handle: str, entity: DXFEntity) -> None:
@@ -79,6 +173,8 @@ class EntityDB:
         if handle == '0' or not is_valid_handle(handle):
             raise ValueError(f'Invalid handle {handle}.')
         self._database[handle] = entity
+        if self._index is not None:
+            self._index.add(handle, entity)
 
     def __delitem__(self, handle: str) -> None:
         """ Delete entity by `handle`. Removes entity only from database, does
@@ -86,18 +182,28 @@ class EntityDB:
         """
         if self.locked:
             raise DXFInternalEzdxfError('Locked entity database.')
+        if handle in self._lazy_entities:
+            self._lazy_entities[handle].load()
+        self._remove(handle)
+
+    def _remove(self, handle: str) -> None:
+        # Remove `handle` from the underlying data structure and from the
+        # secondary indexes, all removals of database entries have to use
+        # this method to keep the indexes in sync:
         del self._database[handle]
+        if self._index is not None:
+            self._index.remove(handle)
 
     def __contains__(self, handle: str) -> bool:
         """ ``True`` if database contains `handle`. """
         if handle is None:
             return False
         assert isinstance(handle, str), type(handle)
-        return handle in self._database
+        return handle in self._database or handle in self._lazy_entities
 
     def __len__(self) -> int:
-        """ Count of database items. """
-        return len(self._database)
+        """ Count of database items, not loaded entities included. """
+        return len(self._database) + len(self._lazy_entities)
 
     def __iter__(self) -> Iterable[str]:
         """ Iterable of all handles, does filter destroyed entities but not
@@ -109,13 +215,16 @@ class EntityDB:
         """ Returns entity for `handle` or ``None`` if no entry exist, does
         not filter destroyed entities.
         """
+        if handle in self._lazy_entities:
+            self._lazy_entities[handle].load()
         return self._database.get(handle)
 
     def next_handle(self) -> str:
         """ Returns next unique handle."""
         while True:
             handle = self.handles.next()
-            if handle not in self._database:
+            if handle not in self._database and \
+                    handle not in self._lazy_entities:
                 return handle
 
     def keys(self) -> Iterable[str]:
@@ -130,13 +239,51 @@ class EntityDB:
 
     def items(self) -> Iterable[Tuple[str, DXFEntity]]:
         """ Iterable of all (handle, entities) pairs, does filter destroyed
-        entities.
+        entities. Loads all not loaded entities.
         """
+        self.load_lazy_entities()
         return (
             (handle, entity) for handle, entity in self._database.items()
             if entity.is_alive
         )
 
+    def loaded_entities(self) -> List[DXFEntity]:
+        """ Returns all loaded entities as list, does filter destroyed
+        entities, but does not load the not loaded entities. (internal API)
+        """
+        return [entity for entity in self._database.values() if
+                entity.is_alive]
+
+    def add_lazy_entity(self, lazy_entity: 'LazyEntity') -> None:
+        """ Add a not loaded entity, the entity will be loaded at the first
+        access. (internal API)
+        """
+        for handle in lazy_entity.handles():
+            self._lazy_entities[handle] = lazy_entity
+        if self._index is not None:
+            self._index_lazy_entity(lazy_entity)
+
+    def _index_lazy_entity(self, lazy_entity: 'LazyEntity') -> None:
+        # Not loaded entities are indexed by the keys of the raw tags, the
+        # index entries are replaced by loading the entities:
+        index = self._index
+        for handle, keys in lazy_entity.index_keys():
+            index.add(handle, lazy_entity, keys)  # type: ignore
+
+    def discard_lazy_entity(self, lazy_entity: 'LazyEntity') -> None:
+        """ Remove a not loaded entity from the database, called before
+        loading the entity. (internal API)
+        """
+        for handle in lazy_entity.handles():
+            self._lazy_entities.pop(handle, None)
+
+    def load_lazy_entities(self) -> None:
+        """ Load all not loaded entities. """
+        lazy_entities = self._lazy_entities
+        while lazy_entities:
+            # The loading process removes the handles of the loaded entities:
+            next(iter(lazy_entities.values())).load()
+
     def add(self, entity: DXFEntity) -> None:
         """ Add `entity` to database, assigns a new handle to the `entity`
         if :attr:`entity.dxf.handle` is ``None``. Adding the same entity
@@ -159,6 +306,28 @@ class EntityDB:
         if isinstance(entity, LinkedEntities):
             entity.add_sub_entities_to_entitydb(self)
 
+    def add_entities(self, entities: Iterable[DXFEntity]) -> None:
+        """ Add multiple `entities` to database, same as :meth:`add` for
+        each entity, but new handles are assigned in one step without
+        validation. (internal API)
+        """
+        if self.locked:
+            raise DXFInternalEzdxfError('Locked entity database.')
+        database = self._database
+        index = self._index
+        for entity in entities:
+            if entity.dxf.handle is not None or \
+                    entity.dxftype() in DATABASE_EXCLUDE or \
+                    isinstance(entity, LinkedEntities) or \
+                    entity.extension_dict is not None:
+                self.add(entity)
+                continue
+            handle = self.next_handle()
+            entity.dxf.rewire(entity, handle=handle)
+            database[handle] = entity
+            if index is not None:
+                index.add(handle, entity)
+
     def delete_entity(self, entity: DXFEntity) -> None:
         """ Remove `entity` from database and destroy the `entity`. """
         if entity.is_alive:
@@ -173,7 +342,7 @@ class EntityDB:
 
             handle = entity.dxf.handle
             try:
-                del self._database[handle]
+                self._remove(handle)
                 entity.dxf.handle = None
             except KeyError:
                 pass
@@ -274,11 +443,123 @@ class EntityDB:
             if not entity.is_alive
         ]
         for handle in dead_handles:
-            del db[handle]
+            self._remove(handle)
 
     def dxf_types_in_use(self) -> Set[str]:
+        if self._index is not None:
+            return _alive_keys(self._index.dxftypes)
         return set(entity.dxftype() for entity in self.values())
 
+    @property
+    def has_index(self) -> bool:
+        """ ``True`` if the secondary indexes for DXF type, layer and owner
+        exist.
+        """
+        return self._index is not None
+
+    def create_index(self) -> None:
+        """ Create the secondary indexes for the DXF type, the layer and the
+        owner handle of all entities. The indexes are updated automatically
+        by adding and removing entities and by changing the DXF attributes
+        `layer` and `owner`. Not loaded entities are indexed without loading.
+        """
+        index = EntityDBIndex()
+        for handle, entity in self._database.items():
+            if entity is not None and entity.is_alive:
+                index.add(handle, entity)
+        self._index = index
+        # dict.fromkeys() preserves the order of the unique lazy entities:
+        for lazy_entity in dict.fromkeys(self._lazy_entities.values()):
+            self._index_lazy_entity(lazy_entity)
+
+    def drop_index(self) -> None:
+        """ Remove the secondary indexes. """
+        self._index = None
+
+    def update_index(self, entity: DXFEntity) -> None:
+        """ Update the index entries of `entity`, called by changing an
+        indexed DXF attribute. (internal API)
+        """
+        index = self._index
+        if index is not None:
+            handle = entity.dxf.handle
+            if handle in index:
+                index.add(handle, entity)
+
+    def index_size(self, index: str, key: Optional[str]) -> int:
+        """ Returns the count of entries for `key` in the secondary index
+        `index` ("dxftype", "layer" or "owner"), includes destroyed entities,
+        returns -1 if no indexes exist. (internal API)
+        """
+        if self._index is None:
+            return -1
+        bucket = getattr(self._index, index + 's').get(key)
+        return 0 if bucket is None else len(bucket)
+
+    def by_dxftype(self, dxftype: str) -> List[DXFEntity]:
+        """ Returns all entities of type `dxftype`, uses the secondary
+        indexes if available and loads only the returned entities.
+        """
+        if self._index is None:
+            return [e for e in self.values() if e.dxftype() == dxftype]
+        return self._alive(self._index.dxftypes.get(dxftype))
+
+    def by_layer(self, layer: str) -> List[DXFEntity]:
+        """ Returns all entities on layer `layer`, the layer name is case
+        sensitive, uses the secondary indexes if available and loads only
+        the returned entities.
+        """
+        if self._index is None:
+            return [e for e in self.values() if _layer(e) == layer]
+        return self._alive(self._index.layers.get(layer))
+
+    def by_owner(self, owner: str) -> List[DXFEntity]:
+        """ Returns all entities owned by handle `owner`, uses the secondary
+        indexes if available and loads only the returned entities.
+        """
+        if self._index is None:
+            return [e for e in self.values() if e.dxf.get('owner') == owner]
+        return self._alive(self._index.owners.get(owner))
+
+    def layers_in_use(self) -> Set[str]:
+        """ Returns the names of all layers used by entities, uses the
+        secondary indexes if available.
+        """
+        if self._index is None:
+            return set(_layer(e) for e in self.values()) - {None}
+        return _alive_keys(self._index.layers)
+
+    def _alive(self, bucket: Optional[Dict[str, DXFEntity]]
+               ) -> List[DXFEntity]:
+        # Returns the alive entities of an index bucket, loads the not loaded
+        # entities of the bucket:
+        if bucket is None:
+            return []
+        entities = []
+        # Loading replaces the index entries, iterate a copy of the bucket:
+        for handle, entity in list(bucket.items()):
+            if not isinstance(entity, DXFEntity):  # LazyEntity
+                entity.load()
+                entity = self._database.get(handle)
+                if entity is None:
+                    continue
+            if entity.is_alive:
+                entities.append(entity)
+        return entities
+
+
+def _alive_keys(index: Dict[str, Dict[str, DXFEntity]]) -> Set[str]:
+    # Not loaded entities (LazyEntity) are alive:
+    return set(
+        key for key, bucket in index.items()
+        if any(getattr(e, 'is_alive', True) for e in bucket.values())
+    )
+
+
+def _layer(entity: DXFEntity) -> Optional[str]:
+    dxf = entity.dxf
+    return dxf.get('layer') if dxf.is_supported('layer') else None
+
 
 class EntitySpace:
     """
@@ -289,15 +570,139 @@ class EntitySpace:
     layout and :class:`~ezdxf.layouts.BlockLayout` objects have an
     :class:`EntitySpace` container to store their entities.
 
+    The entities are stored in an insertion ordered dict keyed by the object
+    id, which provides constant time membership tests and removal. The list
+    for indexed access is created on demand, removed entities remain as
+    tombstones in this list until more than half of the list are tombstones
+    or until an indexed access requires a compacted list. Destroyed entities
+    are removed by a complete iteration or by :meth:`purge`.
+
     """
 
     def __init__(self, entities=None):
-        entities = entities or []
-        self.entities = list(e for e in entities if e.is_alive)
+        self._entities: Dict[int, DXFEntity] = dict()
+        # Ordered list of the entities for indexed access, None if not
+        # created, removed entities remain as tombstones in this list:
+        self._list: Optional[List[DXFEntity]] = None
+        # Index of the first entity in _list, all entries before are
+        # tombstones:
+        self._start = 0
+        # Object ids of the tombstones in _list after _start:
+        self._tombstones: Set[int] = set()
+        # Handle index, created by the first call of has_handle():
+        self._handles: Optional[Dict[str, DXFEntity]] = None
+        # Loader for not loaded entities in lazy loading mode:
+        self._loader: Optional[Callable[[], Iterable[DXFEntity]]] = None
+        # Not loaded entities of the loader as LazyEntity objects:
+        self._pending: Optional[List['LazyEntity']] = None
+        if entities is not None:
+            self._entities = {id(e): e for e in entities if e.is_alive}
+
+    def _load(self) -> None:
+        if self._loader is not None:
+            loader = self._loader
+            self._loader = None
+            self._pending = None
+            for entity in loader():
+                self._store(entity)
+
+    def _invalidate(self) -> None:
+        # The list is created again by the next access:
+        self._list = None
+        self._start = 0
+        self._tombstones = set()
+
+    def _ordered(self) -> List[DXFEntity]:
+        # Returns the list of the entities without tombstones:
+        self._load()
+        if self._list is None or self._start or self._tombstones:
+            self._list = list(self._entities.values())
+            self._start = 0
+            self._tombstones = set()
+        return self._list
+
+    @property
+    def entities(self) -> List[DXFEntity]:
+        """ Entity list, loads all not loaded entities at the first access.
+        The returned list is read only, use :meth:`add` and :meth:`remove` to
+        change the content of the entity space.
+        """
+        return self._ordered()
+
+    @entities.setter
+    def entities(self, entities: List[DXFEntity]) -> None:
+        self._loader = None
+        self._pending = None
+        self._entities = {id(e): e for e in entities}
+        self._invalidate()
+        self._handles = None
+
+    def set_loader(self, loader: Callable[[], Iterable[DXFEntity]],
+                   pending: List['LazyEntity'] = None) -> None:
+        """ Set `loader` for not loaded entities, `loader` is called at the
+        first access of the entity space and the returned entities are
+        appended to the entity space. The optional `pending` list contains
+        the not loaded entities of the `loader` as
+        :class:`~ezdxf.lldxf.loader.LazyEntity` objects in loading order,
+        which is required by :meth:`select`. (internal API)
+        """
+        assert self._loader is None, 'Entity loader already set.'
+        self._loader = loader
+        self._pending = pending
 
     def __iter__(self) -> Iterable['DXFEntity']:
         """ Iterable of all entities, filters destroyed entities. """
-        return (e for e in self.entities if e.is_alive)
+        self._load()
+        if self._list is None:
+            self._ordered()
+        tombstones = self._tombstones
+        destroyed = []
+        # Tombstones are skipped without compacting the list:
+        for entity in islice(self._list, self._start, None):
+            if tombstones and id(entity) in tombstones:
+                continue
+            if entity.is_alive:
+                yield entity
+            else:
+                destroyed.append(entity)
+        if destroyed:  # lazy compaction after a complete iteration
+            for entity in destroyed:
+                self._discard(entity)
+
+    def __contains__(self, entity: 'DXFEntity') -> bool:
+        """ ``True`` if `entity` is present, does filter destroyed entities.
+        """
+        self._load()
+        return id(entity) in self._entities and entity.is_alive
+
+    def select(self, entities: Iterable['DXFEntity']
+               ) -> Optional[List['DXFEntity']]:
+        """ Returns the entities of `entities` stored in the entity space in
+        the order of the entity space, does filter destroyed entities and
+        does not load the not loaded entities of the entity space. Returns
+        ``None`` if the selection is not possible without loading the entity
+        space. (internal API)
+        """
+        if self._loader is not None and self._pending is None:
+            return None
+        keys = set(id(e) for e in entities)
+        selection = [
+            e for e in self._entities.values() if id(e) in keys and e.is_alive
+        ]
+        if self._loader is not None:
+            for lazy_entity in self._pending:
+                # The selected entities are already loaded:
+                if lazy_entity.is_loaded:
+                    entity = lazy_entity.load()
+                    if id(entity) in keys and entity.is_alive:
+                        selection.append(entity)
+        return selection
+
+    def loaded_entities(self) -> List['DXFEntity']:
+        """ Returns all loaded entities as list, does filter destroyed
+        entities, but does not load the not loaded entities. (internal API)
+        """
+        return [e for e in self._entities.values() if e.is_alive]
 
     def __getitem__(self, index) -> 'DXFEntity':
         """ Get entity at index `item`
@@ -309,31 +714,97 @@ class EntitySpace:
         ``List[DXFEntity]``. Does not filter destroyed entities.
 
         """
-        return self.entities[index]
+        self._load()
+        if self._start and not self._tombstones and isinstance(index, int):
+            # Removed entities at the start of the list do not require a
+            # compacted list, like a loop of remove(space[0]) calls:
+            entities = self._list
+            if index >= 0:
+                index += self._start
+            elif index < self._start - len(entities):
+                raise IndexError('list index out of range')
+            return entities[index]
+        return self._ordered()[index]
 
     def __len__(self) -> int:
         """ Count of entities inluding destroyed entities. """
-        return len(self.entities)
+        self._load()
+        return len(self._entities)
 
     def has_handle(self, handle: str) -> bool:
         """ ``True`` if `handle` is present, does filter destroyed entities. """
         assert isinstance(handle, str), type(handle)
-        return any(e.dxf.handle == handle for e in self)
+        self._load()
+        if self._handles is None:
+            self._handles = {
+                e.dxf.handle: e for e in self._entities.values()
+            }
+        entity = self._handles.get(handle)
+        return entity is not None and entity.is_alive and \
+            entity.dxf.handle == handle
 
     def purge(self):
         """ Remove all destroyed entities from entity space. """
         self.entities = list(self)
 
+    def _store(self, entity: 'DXFEntity') -> None:
+        key = id(entity)
+        if key in self._entities:
+            return
+        self._entities[key] = entity
+        if key in self._tombstones:  # tombstone of a re-added entity
+            self._invalidate()
+        if self._list is not None:
+            self._list.append(entity)
+        if self._handles is not None:
+            self._handles[entity.dxf.handle] = entity
+
+    def _discard(self, entity: 'DXFEntity') -> None:
+        if self._entities.pop(id(entity), None) is None:
+            return
+        if self._list is not None:
+            self._bury(entity)
+        # Destroyed entities have no handle, the remaining index entries are
+        # ignored by has_handle():
+        if self._handles is not None and entity.is_alive:
+            handle = entity.dxf.handle
+            if self._handles.get(handle) is entity:
+                del self._handles[handle]
+
+    def _bury(self, entity: 'DXFEntity') -> None:
+        # The removed `entity` remains as tombstone in the list:
+        entities = self._list
+        tombstones = self._tombstones
+        tombstones.add(id(entity))
+        # Tombstones at the start and at the end of the list are removed
+        # from the tombstone set:
+        start = self._start
+        while start < len(entities) and id(entities[start]) in tombstones:
+            tombstones.discard(id(entities[start]))
+            start += 1
+        while len(entities) > start and id(entities[-1]) in tombstones:
+            tombstones.discard(id(entities.pop()))
+        if start == len(entities):
+            entities.clear()
+            start = 0
+        self._start = start
+        if (start + len(tombstones)) * 2 > len(entities):
+            self._invalidate()
+
     def add(self, entity: 'DXFEntity') -> None:
         """ Add `entity`. """
         assert isinstance(entity, DXFEntity), type(entity)
         assert entity.is_alive, 'Can not store destroyed entities'
-        self.entities.append(entity)
+        self._load()
+        self._store(entity)
 
     def extend(self, entities: Iterable['DXFEntity']) -> None:
         """ Add multiple `entities`."""
+        self._load()
         for entity in entities:
-            self.add(entity)
+            assert isinstance(entity, DXFEntity), type(entity)
+            assert entity.is_alive, 'Can not store destroyed entities'
+            self._store(entity)
 
     def export_dxf(self, tagwriter: 'TagWriter') -> None:
         """ Export all entities into DXF file by `tagwriter`.
@@ -344,8 +815,13 @@ class EntitySpace:
             entity.export_dxf(tagwriter)
 
     def remove(self, entity: 'DXFEntity') -> None:
-        """ Remove `entity`. """
-        self.entities.remove(entity)
+        """ Remove `entity`, raises :class:`ValueError` if `entity` is not
+        present.
+        """
+        self._load()
+        if id(entity) not in self._entities:
+            raise ValueError('Entity not in entity space.')
+        self._discard(entity)
 
     def clear(self) -> None:
         """ Remove all entities. """
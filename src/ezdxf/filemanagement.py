@@ -1,14 +1,16 @@
 # Copyright (C) 2018-2020, Manfred Moitzi
 # License: MIT License
-from typing import TextIO, TYPE_CHECKING, Union, Sequence
+from typing import TextIO, TYPE_CHECKING, Union, Sequence, Iterable
 import base64
 import io
+import mmap
 from ezdxf.tools.standards import setup_drawing
 from ezdxf.lldxf.const import DXF2013
 from ezdxf.document import Drawing
 
 if TYPE_CHECKING:
     from ezdxf.eztypes import DXFInfo
+    from ezdxf.doccache import DocumentCache
 
 
 def new(dxfversion: str = DXF2013,
@@ -94,17 +96,58 @@ def read(stream: TextIO) -> 'Drawing':
 
 
 def readfile(filename: str, encoding: str = None,
-             errors: str = 'surrogateescape') -> 'Drawing':
+             errors: str = 'surrogateescape', workers: int = 1,
+             types: Iterable[str] = None, layers: Iterable[str] = None,
+             layouts: Iterable[str] = None,
+             cache: 'DocumentCache' = None) -> 'Drawing':
     """  Read the DXF document `filename` from the file-system.
 
     This is the preferred method to load existing ASCII or Binary DXF files,
     the required text encoding will be detected automatically and decoding
     errors will be ignored.
 
+    ASCII DXF files are loaded from a memory mapped file, the tag values are
+    split directly from the mapped bytes and only string values are decoded,
+    which is faster and requires less memory than reading from a text stream.
+    Binary DXF files are also loaded from a memory mapped file, the numeric
+    values are decoded directly from the mapped bytes.
+
     Override encoding detection by setting argument `encoding` to the
     estimated encoding. (use Python encoding names like in the :func:`open`
     function).
 
+    Set argument `workers` > 1 to load the entities of the ENTITIES and BLOCKS
+    section of large ASCII DXF files by multiple worker processes, the result
+    is the same document as by loading in a single process. Binary DXF files
+    are always loaded in a single process. Requires the usual guard
+    :code:`if __name__ == '__main__':` for the main module on platforms which
+    start new processes by "spawn" like Windows and macOS.
+
+    The arguments `types`, `layers` and `layouts` filter the DXF entities of
+    the ENTITIES and BLOCKS section before loading, e.g. load only LWPOLYLINE
+    and HATCH entities from the layers "WALLS" and "FLOORS" from the
+    modelspace::
+
+        doc = ezdxf.readfile(
+            'plan.dxf',
+            types=['LWPOLYLINE', 'HATCH'],
+            layers=['WALLS', 'FLOORS'],
+            layouts=['Model'],
+        )
+
+    The resources of the document (TABLES and OBJECTS section) are always
+    loaded, the content of block definitions is loaded only if the block is
+    referenced by a loaded entity like INSERT or DIMENSION. VIEWPORT entities
+    of loaded layouts are always loaded. The filtering is done in the main
+    process, the argument `workers` is ignored if any filter is set.
+
+    Set argument `cache` to a :class:`~ezdxf.doccache.DocumentCache` object to
+    restore unchanged documents from a persistent cache instead of loading
+    them from the DXF file::
+
+        cache = DocumentCache('/var/cache/dxf', max_size=4 * 2**30)
+        doc = ezdxf.readfile('base_plan.dxf', cache=cache)
+
     If this function struggles to load the DXF document and raises a
     :class:`DXFStructureError` exception, try the :func:`ezdxf.recover.readfile`
     function to load this corrupt DXF document.
@@ -119,6 +162,18 @@ def readfile(filename: str, encoding: str = None,
             - "ignore" to use the replacement char U+FFFD "\ufffd" for invalid data
             - "strict" to raise an :class:`UnicodeDecodeError` exception for invalid data
 
+        workers: count of worker processes to load ASCII DXF files, ``1`` for
+            loading in the main process (default), ``0`` or ``None`` for the
+            count of CPUs
+        types: load only entities of the given DXF types, e.g. ["LINE"],
+            ``None`` for all types
+        layers: load only entities on the given layers (case insensitive),
+            ``None`` for all layers
+        layouts: load only entities of the given layouts, the modelspace is
+            "Model" (case insensitive), ``None`` for all layouts
+        cache: :class:`~ezdxf.doccache.DocumentCache` object or ``None`` to
+            disable caching (default)
+
     Raises:
         IOError: not a DXF file or file does not exist
         DXFStructureError: for invalid or corrupted DXF structures
@@ -132,26 +187,61 @@ def readfile(filename: str, encoding: str = None,
     """
     from ezdxf.lldxf.validator import is_dxf_file, is_binary_dxf_file
     from ezdxf.tools.codepage import is_supported_encoding
-    from ezdxf.lldxf.tagger import binary_tags_loader
+    from ezdxf.lldxf.tagger import (
+        binary_tag_compiler, ascii_bytes_tags_loader, tag_compiler,
+    )
+    from ezdxf.lldxf.loader import (
+        load_dxf_structure, filter_dxf_entities, count_structure,
+    )
+    from ezdxf.stats import Stats
 
     filename = str(filename)
+    if cache is not None:
+        return cache.readfile(
+            filename, encoding=encoding, errors=errors, workers=workers,
+            types=types, layers=layers, layouts=layouts)
+
+    load_filter = types is not None or layers is not None or \
+        layouts is not None
+    stats = Stats()
     if is_binary_dxf_file(filename):
-        with open(filename, 'rb') as fp:
-            data = fp.read()
-            loader = binary_tags_loader(data, errors=errors)
-            return Drawing.load(loader)
-
-    if not is_dxf_file(filename):
-        raise IOError(f"File '{filename}' is not a DXF file.")
-
-    info = dxf_file_info(filename)
-    if encoding is not None:
-        # override default encodings if absolute necessary
-        info.encoding = encoding
-    with open(filename, mode='rt', encoding=info.encoding,
-              errors=errors) as fp:
-        doc = read(fp)
-
+        with open(filename, mode='rb') as fp, \
+                mmap.mmap(fp.fileno(), 0, access=mmap.ACCESS_READ) as data, \
+                stats.timer('load.structure') as stage:
+            sections = load_dxf_structure(stats.timed(
+                'load.tagging', binary_tag_compiler(data, errors=errors)))
+            count_structure(sections, stage)
+        encoding = None
+    else:
+        if not is_dxf_file(filename):
+            raise IOError(f"File '{filename}' is not a DXF file.")
+
+        info = dxf_file_info(filename)
+        if encoding is not None:
+            # override default encodings if absolute necessary
+            info.encoding = encoding
+        with stats.timer('load.structure') as stage:
+            if workers == 1 or load_filter:
+                with open(filename, mode='rb') as fp, \
+                        mmap.mmap(fp.fileno(), 0,
+                                  access=mmap.ACCESS_READ) as data:
+                    loader = ascii_bytes_tags_loader(
+                        data, encoding=info.encoding, errors=errors)
+                    tags = tag_compiler(stats.timed('load.tagging', loader))
+                    sections = load_dxf_structure(
+                        stats.timed('load.compiling', tags))
+            else:
+                from ezdxf.lldxf.parallel import load_parallel_dxf_structure
+                sections = load_parallel_dxf_structure(
+                    filename, encoding=info.encoding, errors=errors,
+                    workers=workers)
+            count_structure(sections, stage)
+
+    if load_filter:
+        with stats.timer('load.filter'):
+            filter_dxf_entities(sections, types=types, layers=layers,
+                                layouts=layouts)
+    doc = Drawing.from_section_dict(sections, stats=stats)
     doc.filename = filename
     if encoding is not None and is_supported_encoding(encoding):
         # store overridden encoding if supported by AutoCAD, else default
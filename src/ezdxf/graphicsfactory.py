@@ -1,6 +1,6 @@
 # Copyright (c) 2013-2020, Manfred Moitzi
 # License: MIT License
-from typing import TYPE_CHECKING, Iterable, Sequence, Dict, Tuple, cast
+from typing import TYPE_CHECKING, Iterable, Sequence, Dict, Tuple, List, cast
 import math
 import logging
 
@@ -51,9 +51,27 @@ class CreatorInterface:
         self.add_entity(entity)
         return entity
 
+    def new_entities(self, type_: str, dxfattribs: Dict,
+                     unchecked_dxfattribs: Iterable[Dict]
+                     ) -> List['DXFGraphic']:
+        """
+        Create multiple entities of the same DXF type, but does not add the
+        entities to the entity database nor to the entity space, see
+        :meth:`add_entities`. The shared DXF attributes `dxfattribs` are
+        validated only once, the individual DXF attributes of
+        `unchecked_dxfattribs` are not validated. (internal API)
+
+        """
+        return factory.new_entities(
+            type_, dxfattribs, unchecked_dxfattribs, self.doc)
+
     def add_entity(self, entity: 'DXFGraphic') -> None:
         pass
 
+    def add_entities(self, entities: Iterable['DXFGraphic']) -> None:
+        for entity in entities:
+            self.add_entity(entity)
+
     def add_point(self, location: 'Vertex', dxfattribs: Dict = None) -> 'Point':
         """
         Add a :class:`~ezdxf.entities.Point` entity at `location`.
@@ -83,6 +101,50 @@ class CreatorInterface:
         dxfattribs['end'] = Vector(end)
         return self.new_entity('LINE', dxfattribs)
 
+    def add_points(self, locations: Iterable['Vertex'],
+                   dxfattribs: Dict = None) -> List['Point']:
+        """
+        Add multiple :class:`~ezdxf.entities.Point` entities at `locations`
+        in one step, all points share the same `dxfattribs`. This method is
+        much faster than calling :meth:`add_point` for each location.
+
+        Args:
+            locations: iterable of 2D/3D points in :ref:`WCS`, a NumPy array
+                of shape (n, 2) or (n, 3) is also supported
+            dxfattribs: additional DXF attributes for all points
+
+        """
+        points = self.new_entities('POINT', dict(dxfattribs or {}), (
+            {'location': location} for location in Vector.generate(locations)
+        ))
+        self.add_entities(points)
+        return points
+
+    def add_lines(self, starts: Iterable['Vertex'], ends: Iterable['Vertex'],
+                  dxfattribs: Dict = None) -> List['Line']:
+        """
+        Add multiple :class:`~ezdxf.entities.Line` entities in one step, the
+        lines are defined by pairs of `starts` and `ends` points, all lines
+        share the same `dxfattribs`. This method is much faster than calling
+        :meth:`add_line` for each line.
+
+        Args:
+            starts: iterable of 2D/3D start points in :ref:`WCS`, a NumPy array
+                of shape (n, 2) or (n, 3) is also supported
+            ends: iterable of 2D/3D end points in :ref:`WCS`
+            dxfattribs: additional DXF attributes for all lines
+
+        """
+        starts = Vector.list(starts)
+        ends = Vector.list(ends)
+        if len(starts) != len(ends):
+            raise DXFValueError('Count of start and end points does not match.')
+        lines = self.new_entities('LINE', dict(dxfattribs or {}), (
+            {'start': start, 'end': end} for start, end in zip(starts, ends)
+        ))
+        self.add_entities(lines)
+        return lines
+
     def add_circle(self, center: 'Vertex', radius: float,
                    dxfattribs: Dict = None) -> 'Circle':
         """
@@ -502,6 +564,36 @@ class CreatorInterface:
         lwpolyline.closed = closed
         return lwpolyline
 
+    def add_lwpolylines(self, polylines: Iterable[Iterable['Vertex']],
+                        format: str = 'xyseb',
+                        dxfattribs: Dict = None) -> List['LWPolyline']:
+        """
+        Add multiple 2D polylines as :class:`~ezdxf.entities.LWPolyline`
+        entities in one step, all polylines share the same `dxfattribs`. This
+        method is much faster than calling :meth:`add_lwpolyline` for each
+        polyline. (requires DXF R2000)
+
+        Args:
+            polylines: iterable of polyline points, each item is an iterable of
+                (x, y, [start_width, [end_width, [bulge]]]) tuples or a NumPy
+                array, see :meth:`add_lwpolyline`
+            format: user defined point format, default is ``"xyseb"``
+            dxfattribs: additional DXF attributes for all polylines
+
+        """
+        if self.dxfversion < DXF2000:
+            raise DXFVersionError('LWPOLYLINE requires DXF R2000')
+        dxfattribs = dict(dxfattribs or {})
+        closed = dxfattribs.pop('closed', False)
+        polylines = list(polylines)
+        lwpolylines: List['LWPolyline'] = self.new_entities(
+            'LWPOLYLINE', dxfattribs, ({} for _ in polylines))
+        for lwpolyline, points in zip(lwpolylines, polylines):
+            lwpolyline.set_points(points, format=format)
+            lwpolyline.closed = closed
+        self.add_entities(lwpolylines)
+        return lwpolylines
+
     def add_mtext(self, text: str, dxfattribs: Dict = None) -> 'MText':
         """
         Add a multiline text entity with automatic text wrapping at boundaries
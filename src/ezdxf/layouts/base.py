@@ -1,15 +1,17 @@
 # Created: 2019-02-18
 # Copyright (c) 2019-2020, Manfred Moitzi
 # License: MIT License
-from typing import TYPE_CHECKING, Iterable
+from typing import TYPE_CHECKING, Iterable, Optional, List
 from ezdxf.entities import factory
 from ezdxf.lldxf.const import (
     DXFValueError, DXFStructureError, LATEST_DXF_VERSION, DXFTypeError,
 )
 from ezdxf.query import EntityQuery
 from ezdxf.groupby import groupby
+from ezdxf.columns import Columns
 from ezdxf.entitydb import EntityDB, EntitySpace
 from ezdxf.graphicsfactory import CreatorInterface
+from ezdxf.spatial import SpatialIndex
 
 if TYPE_CHECKING:
     from ezdxf.eztypes import (
@@ -59,7 +61,10 @@ class _AbstractLayout(CreatorInterface):
         Get all DXF entities matching the :ref:`entity query string`.
 
         """
-        return EntityQuery(iter(self), query)
+        doc = self.doc
+        # The query planner selects the entities from the entity space without
+        # loading all not loaded entities:
+        return EntityQuery(self.entity_space, query, entitydb=doc.entitydb if doc else None)
 
     def groupby(self, dxfattrib: str = "", key: 'KeyFunc' = None) -> dict:
         """
@@ -76,6 +81,20 @@ class _AbstractLayout(CreatorInterface):
         """
         return groupby(iter(self), dxfattrib, key)
 
+    def columns(self, names: Iterable[str]) -> Columns:
+        """
+        Returns a columnar view of the DXF attributes `names` of all entities
+        in this layout as :class:`~ezdxf.columns.Columns` object. All entities
+        have to support the requested DXF attributes, use :meth:`query` to
+        select suitable entities.
+
+        Args:
+            names: DXF attribute names like ``'start'``, ``'layer'`` or
+                ``'color'``
+
+        """
+        return Columns(iter(self), names)
+
     def destroy(self):
         pass
 
@@ -160,6 +179,26 @@ class BaseLayout(_AbstractLayout):
         else:
             return block_record.new_extension_dict()
 
+    @property
+    def spatial_index(self) -> Optional[SpatialIndex]:
+        """ Returns the assigned :class:`~ezdxf.spatial.SpatialIndex` or
+        ``None``.
+        """
+        return self.block_record.spatial_index
+
+    def create_spatial_index(self) -> SpatialIndex:
+        """ Create and assign a new :class:`~ezdxf.spatial.SpatialIndex` of
+        all entities in this layout, the spatial index is updated automatically
+        by adding, removing and transforming entities of this layout.
+        """
+        spatial_index = SpatialIndex(self)
+        self.block_record.spatial_index = spatial_index
+        return spatial_index
+
+    def drop_spatial_index(self) -> None:
+        """ Remove the assigned :class:`~ezdxf.spatial.SpatialIndex`. """
+        self.block_record.spatial_index = None
+
     def add_entity(self, entity: 'DXFGraphic') -> None:
         """ Add an existing :class:`DXFGraphic` entity to a layout, but be sure
         to unlink (:meth:`~BaseLayout.unlink_entity`) entity from the previous
@@ -177,6 +216,37 @@ class BaseLayout(_AbstractLayout):
             )
         self.block_record.add_entity(entity)
 
+    def new_entities(self, type_: str, dxfattribs: dict,
+                     unchecked_dxfattribs: Iterable[dict]
+                     ) -> List['DXFGraphic']:
+        # Assign the owner in advance, to avoid setting the owner of each
+        # entity in add_entities():
+        block_record = self.block_record
+        dxfattribs = dict(dxfattribs)
+        dxfattribs['owner'] = block_record.dxf.handle
+        if block_record.is_any_paperspace:
+            dxfattribs['paperspace'] = 1
+        return super().new_entities(type_, dxfattribs, unchecked_dxfattribs)
+
+    def add_entities(self, entities: Iterable['DXFGraphic']) -> None:
+        """ Add multiple existing :class:`DXFGraphic` entities to a layout in
+        one step, same restrictions as for :meth:`add_entity`.
+        """
+        entities = list(entities)
+        doc = self.doc
+        # bind virtual entities to the DXF document:
+        factory.bind_entities(
+            (e for e in entities if e.dxf.handle is None), doc)
+        entitydb = doc.entitydb
+        for entity in entities:
+            handle = entity.dxf.handle
+            if handle is None or handle not in entitydb:
+                raise DXFStructureError(
+                    'Adding entities from a different DXF drawing is not '
+                    'supported.'
+                )
+        self.block_record.add_entities(entities)
+
     def add_foreign_entity(self, entity: 'DXFGraphic', copy=True) -> None:
         """
         Add a foreign DXF entity to a layout, this foreign entity could be from
@@ -314,6 +384,9 @@ class VirtualLayout(_AbstractLayout):
     def add_entity(self, entity: 'DXFGraphic') -> None:
         self.entity_space.add(entity)
 
+    def add_entities(self, entities: Iterable['DXFGraphic']) -> None:
+        self.entity_space.extend(entities)
+
     def new_entity(self, type_: str, dxfattribs: dict) -> 'DXFGraphic':
         entity = factory.new(type_, dxfattribs=dxfattribs)
         self.entity_space.add(entity)
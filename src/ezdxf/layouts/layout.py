@@ -131,7 +131,8 @@ class Layout(BaseLayout):
         """
         layout_key = self.layout_key
         paperspace = 0 if self.is_modelspace else 1
-        for entity in self:
+        # Not loaded entities get the correct owner tags at loading:
+        for entity in self.entity_space.loaded_entities():
             if entity.dxf.owner != layout_key:
                 entity.dxf.owner = layout_key
             if entity.dxf.paperspace != paperspace:
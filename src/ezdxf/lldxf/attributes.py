@@ -188,6 +188,10 @@ class DXFAttributes:
     def __contains__(self, name: str) -> bool:
         return name in self._attribs
 
+    def items(self) -> Iterable[Tuple[str, DXFAttr]]:
+        """ Returns all (name, DXFAttr) pairs. """
+        return self._attribs.items()
+
     def get(self, key: str) -> Optional[DXFAttr]:
         return self._attribs.get(key)
 
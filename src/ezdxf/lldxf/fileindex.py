@@ -1,11 +1,28 @@
 # Copyright (c) 2020, Manfred Moitzi
 # License: MIT License
-from typing import Tuple, List, Iterable
+from typing import Tuple, List, Iterable, Dict, Optional, TYPE_CHECKING
 from collections import namedtuple
+from itertools import chain
+import io
+import os
+import json
+import tempfile
 from .const import DXFStructureError
+from .extendedtags import ExtendedTags
+from .tags import group_tags
+from .tagger import ascii_bytes_tags_loader, tag_compiler
+from .validator import is_binary_dxf_file
 from ezdxf.tools.codepage import toencoding
 
+if TYPE_CHECKING:
+    from ezdxf.eztypes import DXFEntity
+
 IndexEntry = namedtuple('IndexEntry', field_names='code value location line')
+EntityLocation = namedtuple('EntityLocation',
+                            field_names='offset length dxftype layer')
+
+# Increase this version if the sidecar file format changes:
+SIDECAR_VERSION = 1
 
 
 class FileStructure:
@@ -149,3 +166,311 @@ def load(filename: str) -> FileStructure:
         file_structure.encoding = 'utf-8'
     file_structure.index = index
     return file_structure
+
+
+# Linked entities following a main entity, the index entry of the main entity
+# includes all linked entities:
+LINKED_ENTITIES = {
+    b'POLYLINE': {b'VERTEX', b'SEQEND'},
+    b'INSERT': {b'ATTRIB', b'SEQEND'},
+}
+
+
+class EntityIndex:
+    """
+    Random access index of all DXF entities of an ASCII DXF file, maps the
+    entity handle to an :class:`EntityLocation` tuple:
+
+        - offset: file location of the (0, DXFTYPE) tag as int
+        - length: size of the entity in bytes
+        - dxftype: DXF type as string
+        - layer: layer name as string, empty string if the entity has no
+          layer attribute
+
+    The entries of POLYLINE and INSERT entities include all following VERTEX
+    or ATTRIB entities and the SEQEND entity, the linked entities have also
+    their own index entries.
+
+    """
+
+    def __init__(self, filename: str):
+        # stores the file system name of the DXF document.
+        self.filename = filename
+        # DXF version if header variable $ACADVER is present, default is DXFR12
+        self.version = 'AC1009'
+        # Python encoding required to read the DXF document as text file.
+        self.encoding = 'cp1252'
+        self.locations: Dict[str, EntityLocation] = dict()
+
+    def __len__(self) -> int:
+        return len(self.locations)
+
+    def __contains__(self, handle: str) -> bool:
+        return handle in self.locations
+
+    def get(self, handle: str) -> EntityLocation:
+        """ Returns the :class:`EntityLocation` of entity `handle`.
+
+        Raises:
+            KeyError: entity `handle` does not exist
+
+        """
+        return self.locations[handle]
+
+    def handles(self, dxftype: str = None, layer: str = None) -> List[str]:
+        """ Returns the handles of all entities matching `dxftype` and
+        `layer`, ``None`` matches all DXF types or layers. The layer names
+        are case insensitive.
+        """
+        if layer is not None:
+            layer = layer.lower()
+        return [
+            handle for handle, location in self.locations.items()
+            if (dxftype is None or location.dxftype == dxftype) and
+               (layer is None or location.layer.lower() == layer)
+        ]
+
+    def read_tags(self, handle: str,
+                  errors: str = 'surrogateescape') -> ExtendedTags:
+        """ Returns the DXF tags of entity `handle` as :class:`ExtendedTags`
+        loaded directly from the DXF file.
+        """
+        return next(self.read_tags_many([handle], errors))
+
+    def read_tags_many(self, handles: Iterable[str],
+                       errors: str = 'surrogateescape'
+                       ) -> Iterable[ExtendedTags]:
+        """ Returns the DXF tags of all entities `handles` as
+        :class:`ExtendedTags`, the tags of linked entities like VERTEX or
+        ATTRIB are included. The file is opened only once and the result has
+        the same order as `handles`.
+        """
+        locations = self.locations
+        with open(self.filename, mode='rb') as fp:
+            for handle in handles:
+                location = locations[handle]
+                fp.seek(location.offset)
+                data = fp.read(location.length)
+                yield from _extended_tags(data, self.encoding, errors)
+
+    def load_entity(self, handle: str) -> 'DXFEntity':
+        """ Returns entity `handle` loaded directly from the DXF file, linked
+        entities like VERTEX or ATTRIB are also loaded and linked to the
+        main entity.
+
+        The loaded entities are virtual entities without a valid document
+        assigned, like entities loaded by the :mod:`~ezdxf.addons.iterdxf`
+        add-on.
+
+        """
+        return next(self.load_entities([handle]))
+
+    def load_entities(self, handles: Iterable[str]) -> Iterable['DXFEntity']:
+        """ Returns all entities `handles` loaded directly from the DXF file,
+        see :meth:`load_entity`.
+        """
+        from ezdxf.entities import factory
+        from ezdxf.entities.subentity import entity_linker
+        linker = entity_linker()
+        main_entity = None
+        for tags in self.read_tags_many(handles):
+            entity = factory.load(tags)
+            if not linker(entity):
+                if main_entity is not None:
+                    yield main_entity
+                main_entity = entity
+        if main_entity is not None:
+            yield main_entity
+
+    def save(self, sidecar: str) -> None:
+        """ Store index as sidecar file `sidecar`. The sidecar file is only
+        valid as long as the size and the modification time of the DXF file
+        do not change.
+        """
+        stat = os.stat(self.filename)
+        data = {
+            'sidecar_version': SIDECAR_VERSION,
+            'size': stat.st_size,
+            'mtime': stat.st_mtime_ns,
+            'version': self.version,
+            'encoding': self.encoding,
+            'entities': [
+                (handle, *location) for handle, location in
+                self.locations.items()
+            ],
+        }
+        directory = os.path.dirname(os.path.abspath(sidecar))
+        fd, tmp_path = tempfile.mkstemp(dir=directory, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'wt', encoding='utf8') as fp:
+                json.dump(data, fp, separators=(',', ':'))
+            os.replace(tmp_path, sidecar)
+        except IOError:
+            os.remove(tmp_path)
+            raise
+
+
+def _extended_tags(data: bytes, encoding: str,
+                   errors: str) -> Iterable[ExtendedTags]:
+    # Same tag loader and tag compiler as readfile(), the DXF file is an
+    # untrusted external source. The data of POLYLINE and INSERT entities
+    # includes the linked entities:
+    tags = tag_compiler(iter(ascii_bytes_tags_loader(
+        io.BytesIO(data), encoding=encoding, errors=errors)))
+    for entity in group_tags(tags):
+        yield ExtendedTags(entity)
+
+
+def build_entity_index(filename: str) -> EntityIndex:
+    """
+    Build the :class:`EntityIndex` for the ASCII DXF file `filename` by a
+    single pass over the file.
+
+    Args:
+        filename: file system file name
+
+    Raises:
+        DXFStructureError: Invalid or incomplete DXF file, Binary DXF file.
+
+    """
+    if is_binary_dxf_file(filename):
+        raise DXFStructureError('Binary DXF files are not supported.')
+    entity_index = EntityIndex(filename)
+    raw_locations = []
+    group_codes: Dict[bytes, int] = dict()
+    location = 0
+    line = 1
+    eof = False
+    header_var = b''
+    start = 0
+    dxftype = b''
+    handle: Optional[bytes] = None
+    layer = b''
+    main_index = -1  # index of the main entity of linked entities
+    linked_types = set()
+
+    def store_entity():
+        nonlocal main_index, linked_types
+        if main_index != -1:
+            if dxftype in linked_types:
+                # extend the main entity to include this linked entity:
+                main = raw_locations[main_index]
+                raw_locations[main_index] = (
+                    main[0], main[1], location - main[1], main[3], main[4])
+                if dxftype == b'SEQEND':
+                    main_index = -1
+            else:
+                main_index = -1
+        if handle is not None:
+            if dxftype in LINKED_ENTITIES:
+                main_index = len(raw_locations)
+                linked_types = LINKED_ENTITIES[dxftype]
+            raw_locations.append(
+                (handle, start, location - start, dxftype, layer))
+
+    with open(filename, mode='rb') as fp:
+        lines = iter(fp)
+        first_line = next(lines, b'')
+        if b'\n' not in first_line and b'\r' in first_line:
+            # CR-only line endings, see ascii_bytes_tags_loader():
+            lines = (line + b'\r' for line in first_line.split(b'\r'))
+        else:
+            lines = chain((first_line,), lines)
+        for code_line, value_line in zip(lines, lines):
+            code = group_codes.get(code_line)
+            if code is None:
+                try:
+                    code = int(code_line)
+                except ValueError:
+                    raise DXFStructureError(
+                        f'Invalid group code in line {line}')
+                group_codes[code_line] = code
+            value = value_line.rstrip(b'\r\n')
+            if code == 0:
+                store_entity()
+                start = location
+                dxftype = value
+                handle = None
+                layer = b''
+                if value == b'EOF':
+                    eof = True
+                    break
+            elif dxftype == b'SECTION':
+                # The HEADER section is stored as part of the SECTION entity:
+                if code == 9:
+                    header_var = value
+                elif header_var:
+                    if header_var == b'$ACADVER':
+                        entity_index.version = value.decode()
+                    elif header_var == b'$DWGCODEPAGE':
+                        entity_index.encoding = toencoding(value.decode())
+                    header_var = b''
+            elif code == 5 or (code == 105 and dxftype == b'DIMSTYLE'):
+                if handle is None:
+                    handle = value
+            elif code == 8:
+                if not layer:
+                    layer = value
+            location += len(code_line) + len(value_line)
+            line += 2
+    if not eof:
+        raise DXFStructureError(f'Unexpected end of file.')
+
+    if entity_index.version >= 'AC1021':  # R2007 and later
+        entity_index.encoding = 'utf-8'
+    encoding = entity_index.encoding
+    entity_index.locations = {
+        handle.decode(): EntityLocation(
+            offset, length, dxftype.decode(),
+            layer.decode(encoding, errors='surrogateescape'))
+        for handle, offset, length, dxftype, layer in raw_locations
+    }
+    return entity_index
+
+
+def load_entity_index(filename: str, sidecar: str = None) -> EntityIndex:
+    """
+    Returns the :class:`EntityIndex` for the ASCII DXF file `filename`.
+
+    If a `sidecar` file name is given, the index is loaded from the sidecar
+    file, if the sidecar file exists and matches the size and the
+    modification time of the DXF file, otherwise the index is built and
+    stored in the sidecar file.
+
+    Args:
+        filename: file system file name
+        sidecar: file system name of the sidecar file or ``None``
+
+    Raises:
+        DXFStructureError: Invalid or incomplete DXF file, Binary DXF file.
+
+    """
+    filename = str(filename)
+    if sidecar is None:
+        return build_entity_index(filename)
+    entity_index = _load_sidecar(filename, str(sidecar))
+    if entity_index is None:
+        entity_index = build_entity_index(filename)
+        entity_index.save(str(sidecar))
+    return entity_index
+
+
+def _load_sidecar(filename: str, sidecar: str) -> Optional[EntityIndex]:
+    try:
+        with open(sidecar, 'rt', encoding='utf8') as fp:
+            data = json.load(fp)
+    except (IOError, ValueError):
+        return None
+    stat = os.stat(filename)
+    if data.get('sidecar_version') != SIDECAR_VERSION or \
+            data.get('size') != stat.st_size or \
+            data.get('mtime') != stat.st_mtime_ns:
+        return None
+    entity_index = EntityIndex(filename)
+    entity_index.version = data['version']
+    entity_index.encoding = data['encoding']
+    entity_index.locations = {
+        handle: EntityLocation(offset, length, dxftype, layer)
+        for handle, offset, length, dxftype, layer in data['entities']
+    }
+    return entity_index
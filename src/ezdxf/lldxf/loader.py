@@ -1,16 +1,19 @@
 # Copyright (c) 2018-2020, Manfred Moitzi
 # License: MIT License
 import logging
-from typing import Dict, Iterable, List, Union, TYPE_CHECKING
+from typing import (
+    Dict, Iterable, List, Union, Optional, Tuple, TYPE_CHECKING,
+)
 from collections import OrderedDict
 
-from .const import DXFStructureError
+from .const import DXFStructureError, DXFValueError
 from .tags import group_tags, DXFTag, Tags
 from .extendedtags import ExtendedTags
-from ezdxf.entities import factory
+from ezdxf.entities import factory, entity_linker
 
 if TYPE_CHECKING:
     from ezdxf.eztypes import DXFEntity, Drawing
+    from ezdxf.stats import Stage, Stats
 
 logger = logging.getLogger('ezdxf')
 SectionDict = Dict[str, List[Union[Tags, ExtendedTags]]]
@@ -127,18 +130,508 @@ def load_dxf_structure(tagger: Iterable[DXFTag],
     return sections
 
 
-def load_dxf_entities(entities: Iterable[Tags]) -> Iterable['DXFEntity']:
+def load_dxf_entities(entities: Iterable[Union[Tags, 'DXFEntity']]
+                      ) -> Iterable['DXFEntity']:
     for entity in entities:
-        yield factory.load(ExtendedTags(entity))
+        if isinstance(entity, Tags):
+            yield factory.load(ExtendedTags(entity))
+        else:  # already loaded by multi-process loading
+            yield entity
 
 
-def load_and_bind_dxf_content(sections: Dict, doc: 'Drawing') -> None:
+def load_and_bind_dxf_content(sections: Dict, doc: 'Drawing',
+                              lazy: bool = False,
+                              stats: 'Stats' = None) -> None:
+    """ Load and bind the DXF entities of all sections.
+
+    If `lazy` is ``True``, the graphical entities of the ENTITIES and BLOCKS
+    section are not loaded, but replaced by :class:`LazyEntity` objects, which
+    store the raw tags until the first access. The SECTION, BLOCK and ENDBLK
+    structure entities are always loaded.
+
+    The optional :class:`~ezdxf.stats.Stats` object `stats` collects the
+    loading time per DXF type in stage "load.factory" and the binding time
+    per DXF type in stage "load.bind", not for lazy loaded entities.
+
+    """
+    from ezdxf.stats import Stats, DXFTypeTimer
+    if stats is None:
+        stats = Stats()
     # HEADER has no database entries.
     for name in ['TABLES', 'CLASSES', 'ENTITIES', 'BLOCKS', 'OBJECTS']:
         if name in sections:
             section = sections[name]
-            for index, entity in enumerate(load_dxf_entities(section)):
-                # Replace Tags() by DXFEntity() objects
-                section[index] = entity
-                # Bind entities to the DXF document:
-                factory.bind(entity, doc)
+            if lazy and name in LAZY_SECTIONS:
+                with stats.timer('load.factory'):
+                    sections[name] = list(load_lazy_dxf_entities(section, doc))
+                continue
+            with stats.timer('load.factory') as stage:
+                timer = DXFTypeTimer(stage)
+                for index, entity in enumerate(section):
+                    # Entities loaded by multi-process loading are DXFEntity()
+                    # objects:
+                    if isinstance(entity, Tags):
+                        timer.next(entity[0].value)
+                        # Replace Tags() by DXFEntity() objects
+                        section[index] = factory.load(ExtendedTags(entity))
+                timer.flush()
+            with stats.timer('load.bind') as stage:
+                timer = DXFTypeTimer(stage)
+                for entity in section:
+                    timer.next(entity.dxftype())
+                    # Bind entities to the DXF document:
+                    factory.bind(entity, doc)
+                timer.flush()
+
+
+def count_structure(sections: Dict, stage: 'Stage') -> None:
+    """ Add the count of entities and tags of all `sections` to the
+    :class:`~ezdxf.stats.Stage` object `stage`.
+    """
+    for section in sections.values():
+        stage.entities += len(section)
+        stage.tags += sum(
+            len(tags) for tags in section if isinstance(tags, Tags))
+
+
+LAZY_SECTIONS = {'ENTITIES', 'BLOCKS'}
+# Structure entities, which are always loaded:
+EAGER_DXF_TYPES = {'SECTION', 'BLOCK', 'ENDBLK'}
+# Linked entities: INSERT -> ATTRIB; POLYLINE -> VERTEX
+LINKED_ENTITIES = {
+    'INSERT': 'ATTRIB',
+    'POLYLINE': 'VERTEX',
+}
+
+
+def load_lazy_dxf_entities(entities: Iterable[Tags], doc: 'Drawing'
+                           ) -> Iterable[Union['DXFEntity', 'LazyEntity']]:
+    """ Yields loaded and bound structure entities and :class:`LazyEntity`
+    objects for all other entities. A :class:`LazyEntity` contains the main
+    entity and all linked entities (ATTRIB, VERTEX, SEQEND and attached MTEXT),
+    therefore the linking process has to be done at loading the
+    :class:`LazyEntity`.
+
+    """
+    for group in group_linked_entities(entities):
+        tags = group[0]
+        if not isinstance(tags, Tags):
+            # Entities already loaded by multi-process loading, are not
+            # replaced by LazyEntity objects:
+            factory.bind(tags, doc)
+            yield tags
+        elif tags.dxftype() in EAGER_DXF_TYPES:
+            entity = factory.load(ExtendedTags(tags))
+            factory.bind(entity, doc)
+            yield entity
+        else:
+            yield LazyEntity(group, doc)
+
+
+def group_linked_entities(entities: Iterable[Tags]) -> Iterable[List[Tags]]:
+    """ Yields groups of DXF entities, each group is a list of the main entity
+    and all linked entities (ATTRIB, VERTEX, SEQEND and attached MTEXT).
+    Structure entities (SECTION, BLOCK, ENDBLK) and already loaded
+    :class:`DXFEntity` objects are yielded as single entity groups.
+
+    """
+    group: List[Tags] = []
+    expected_dxftype = ''
+    for tags in entities:
+        if not isinstance(tags, Tags):  # already loaded DXF entity
+            if group:
+                yield group
+                group = []
+            yield [tags]
+            continue
+        dxftype = tags.dxftype()
+        if expected_dxftype:
+            group.append(tags)
+            if dxftype == 'SEQEND':
+                expected_dxftype = ''
+            elif dxftype != expected_dxftype:
+                raise DXFStructureError(
+                    f"Expected DXF entity {dxftype} or SEQEND")
+            continue
+        if dxftype == 'MTEXT' and group and _get_handle(tags) is None:
+            # Attached MTEXT entity, linked to the preceding entity:
+            group.append(tags)
+            continue
+        if group:
+            yield group
+            group = []
+        if dxftype in EAGER_DXF_TYPES:
+            yield [tags]
+            continue
+        group.append(tags)
+        if dxftype in LINKED_ENTITIES:
+            # INSERT without following ATTRIB entities: attribs_follow == 0
+            if dxftype != 'INSERT' or tags.get_first_value(66, 0):
+                expected_dxftype = LINKED_ENTITIES[dxftype]
+    if group:
+        yield group
+
+
+def _scan_layer_and_owner(tags: Tags) -> Tuple[Optional[str], Optional[str]]:
+    """ Returns the layer and the owner handle from raw tags, ignores the
+    content of app data and stops scanning at the end of the AcDbEntity
+    subclass.
+    """
+    layer = owner = None
+    subclass = 0
+    app_data = False
+    for code, value in tags:
+        if app_data:
+            app_data = not (code == 102 and value == '}')
+        elif code == 102:
+            app_data = True
+        elif code == 100:
+            subclass += 1
+            if subclass > 1:
+                break
+        elif code == 8:
+            layer = value
+        elif code == 330 and subclass == 0:
+            owner = value
+        elif code == 1001:
+            break
+    return layer, owner
+
+
+def _get_handle(tags: Tags) -> Optional[str]:
+    try:
+        return tags.get_handle()
+    except DXFValueError:
+        return None
+
+
+# DXF entities which reference a block definition by name (2, name):
+BLOCK_REFERENCES = {
+    'INSERT', 'DIMENSION', 'ARC_DIMENSION', 'LARGE_RADIAL_DIMENSION',
+    'ACAD_TABLE',
+}
+MODEL_SPACE_KEY = '*model_space'
+PAPER_SPACE_KEY = '*paper_space'
+
+
+def filter_dxf_entities(sections: SectionDict,
+                        types: Iterable[str] = None,
+                        layers: Iterable[str] = None,
+                        layouts: Iterable[str] = None) -> None:
+    """ Removes all DXF entities which do not match the given filters from the
+    ENTITIES section and from the paperspace layouts stored in the BLOCKS
+    section. The filtering is done at the tag level before loading the DXF
+    entities, the section dict `sections` is modified in place.
+
+    The content of a block definition is kept only if the block is referenced
+    by a kept entity (INSERT, DIMENSION, ACAD_TABLE) or by nested block
+    references, the content of all other block definitions is removed, but the
+    empty block definitions remain. VIEWPORT entities of the kept layouts are
+    always kept. The TABLES and OBJECTS section are not filtered.
+
+    Args:
+        sections: section dict created by :func:`load_dxf_structure`
+        types: DXF types to keep, ``None`` to keep all DXF types
+        layers: layer names to keep (case insensitive), ``None`` to keep all
+            layers
+        layouts: layout names to keep (case insensitive), ``None`` to keep all
+            layouts, the name of the modelspace is "Model"
+
+    """
+    entity_filter = _EntityFilter(sections, types, layers, layouts)
+    if 'ENTITIES' in sections:
+        sections['ENTITIES'] = entity_filter.filter_entities(
+            sections['ENTITIES'])
+    if 'BLOCKS' in sections:
+        sections['BLOCKS'] = entity_filter.filter_blocks(sections['BLOCKS'])
+
+
+class _EntityFilter:
+    def __init__(self, sections: SectionDict, types: Iterable[str] = None,
+                 layers: Iterable[str] = None, layouts: Iterable[str] = None):
+        self.types = None if types is None else \
+            set(dxftype.upper() for dxftype in types)
+        self.layers = None if layers is None else \
+            set(layer.lower() for layer in layers)
+        # The keys of the modelspace and the active paperspace are the names of
+        # their block records, if the handles are not available (DXF R12):
+        self.msp_key = MODEL_SPACE_KEY
+        self.psp_key = PAPER_SPACE_KEY
+        for tags in sections.get('TABLES', []):
+            if tags.dxftype() == 'BLOCK_RECORD':
+                name = tags.get_first_value(2, '').lower()
+                if name == MODEL_SPACE_KEY:
+                    self.msp_key = _get_handle(tags)
+                elif name == PAPER_SPACE_KEY:
+                    self.psp_key = _get_handle(tags)
+        self.layout_keys = None
+        if layouts is not None:
+            self.layout_keys = self._get_layout_keys(sections, layouts)
+        self.block_names = set()  # referenced block names
+
+    def _get_layout_keys(self, sections: SectionDict,
+                         layouts: Iterable[str]) -> set:
+        names = set(name.lower() for name in layouts)
+        keys = set()
+        found_layout_objects = False
+        for tags in sections.get('OBJECTS', []):
+            if tags.dxftype() == 'LAYOUT':
+                found_layout_objects = True
+                layout = ExtendedTags(tags).get_subclass('AcDbLayout')
+                if layout.get_first_value(1, '').lower() in names:
+                    keys.add(layout.get_first_value(330, None))
+        if not found_layout_objects:
+            # DXF R12 has only the modelspace and one paperspace layout:
+            if 'model' in names:
+                keys.add(self.msp_key)
+            if names - {'model'}:
+                keys.add(self.psp_key)
+        return keys
+
+    def is_kept(self, tags: Tags) -> bool:
+        dxftype = tags.dxftype()
+        if dxftype != 'VIEWPORT':
+            if self.types is not None and dxftype not in self.types:
+                return False
+            if self.layers is not None and \
+                    tags.get_first_value(8, '0').lower() not in self.layers:
+                return False
+        return True
+
+    def layout_key(self, tags: Tags) -> str:
+        """ Returns the layout key of an entity of the ENTITIES section. """
+        # Same logic as EntitySection._build(), higher priority for the owner
+        # handle, the paperspace flag as fallback:
+        owner = _get_owner(tags)
+        if owner == self.msp_key or owner == self.psp_key:
+            return owner
+        return self.psp_key if tags.get_first_value(67, 0) else self.msp_key
+
+    def add_block_reference(self, tags: Tags) -> None:
+        if tags.dxftype() in BLOCK_REFERENCES:
+            name = tags.get_first_value(2, None)
+            if name:
+                self.block_names.add(name.lower())
+
+    def filter_entities(self, entities: List[Tags]) -> List[Tags]:
+        section = []
+        layout_keys = self.layout_keys
+        for group in group_linked_entities(entities):
+            tags = group[0]
+            dxftype = tags.dxftype()
+            if dxftype != 'SECTION':
+                if layout_keys is not None and \
+                        self.layout_key(tags) not in layout_keys:
+                    continue
+                if not self.is_kept(tags):
+                    continue
+                self.add_block_reference(tags)
+            section.extend(group)
+        return section
+
+    def filter_blocks(self, entities: List[Tags]) -> List[Tags]:
+        section_head = entities[:1]
+        blocks = list(_split_blocks(entities[1:]))
+        # Filter content of paperspace layouts:
+        layout_keys = self.layout_keys
+        regular_blocks = []
+        for block, content, endblk in blocks:
+            name = block.get_first_value(2, '').lower()
+            if name.startswith(MODEL_SPACE_KEY) or \
+                    name.startswith(PAPER_SPACE_KEY):
+                # The block record handle is the owner of the BLOCK entity:
+                key = _get_owner(block) or name
+                if layout_keys is not None and key not in layout_keys:
+                    content.clear()
+                    continue
+                kept_content = []
+                for group in content:
+                    if self.is_kept(group[0]):
+                        self.add_block_reference(group[0])
+                        kept_content.append(group)
+                content[:] = kept_content
+            else:
+                regular_blocks.append((name, content))
+
+        # Keep only the content of referenced blocks, block references in the
+        # content of block definitions add more referenced blocks:
+        kept_blocks = set()
+        while True:
+            count = len(kept_blocks)
+            for name, content in regular_blocks:
+                if name in self.block_names and name not in kept_blocks:
+                    kept_blocks.add(name)
+                    for group in content:
+                        self.add_block_reference(group[0])
+            if count == len(kept_blocks):
+                break
+        for name, content in regular_blocks:
+            if name not in kept_blocks:
+                content.clear()
+
+        section = section_head
+        for block, content, endblk in blocks:
+            section.append(block)
+            for group in content:
+                section.extend(group)
+            if endblk is not None:
+                section.append(endblk)
+        return section
+
+
+def _split_blocks(entities: Iterable[Tags]):
+    """ Yields (BLOCK, content, ENDBLK) tuples, the content is a list of
+    linked entity groups.
+    """
+    block = None
+    content = []
+    for group in group_linked_entities(entities):
+        tags = group[0]
+        dxftype = tags.dxftype()
+        if dxftype == 'BLOCK':
+            if block is not None:
+                raise DXFStructureError('Missing ENDBLK entity.')
+            block = tags
+            content = []
+        elif dxftype == 'ENDBLK':
+            if block is None:
+                raise DXFStructureError('Found ENDBLK without BLOCK entity.')
+            yield block, content, tags
+            block = None
+        elif block is None:
+            raise DXFStructureError('Found DXF entity outside of a BLOCK.')
+        else:
+            content.append(group)
+    if block is not None:
+        yield block, content, None
+
+
+def _get_owner(tags: Tags) -> Optional[str]:
+    """ Returns the owner handle (330, handle) of the base class, ignores the
+    handles of the persistent reactors in the app data section.
+    """
+    app_data = False
+    for code, value in tags:
+        if code == 102:
+            app_data = value.startswith('{')
+        elif code == 330 and not app_data:
+            return value
+        elif code == 100:  # end of base class
+            break
+    return None
+
+
+class LazyEntity:
+    """ Stores the raw tags of a not loaded DXF entity and the raw tags of its
+    linked entities. The entity is loaded and bound to the DXF document at
+    the first call of :meth:`load`, this happens at the first access of the
+    entity by a layout, an entity query or a handle lookup in the entity
+    database. (internal class)
+
+    """
+    __slots__ = ('_tags', '_entity', 'doc', 'handle', 'owner', 'paperspace')
+
+    def __init__(self, tags: List[Tags], doc: 'Drawing'):
+        for entity_tags in tags:
+            if _get_handle(entity_tags) is None:
+                # DXF R12 without handles: assign the handle at grouping time
+                # like binding a loaded entity, because not loaded entities
+                # are registered and indexed by their handles:
+                entity_tags.insert(1, DXFTag(5, doc.entitydb.next_handle()))
+        self._tags: Optional[List[Tags]] = tags
+        self._entity: Optional['DXFEntity'] = None
+        self.doc = doc
+        main_entity = tags[0]
+        self.handle: Optional[str] = _get_handle(main_entity)
+        self.owner: Optional[str] = None
+        self.paperspace: int = 0
+        self._scan_base_attribs(main_entity)
+        doc.entitydb.add_lazy_entity(self)
+
+    def _scan_base_attribs(self, tags: Tags) -> None:
+        """ Get owner handle and paperspace flag from raw tags, ignores the
+        content of app data and stops scanning at the end of the AcDbEntity
+        subclass.
+        """
+        subclass = 0
+        app_data = False
+        for code, value in tags:
+            if app_data:
+                app_data = not (code == 102 and value == '}')
+            elif code == 102:
+                app_data = True
+            elif code == 100:
+                subclass += 1
+                if subclass > 1:
+                    return
+            elif code == 330 and subclass == 0:
+                self.owner = value
+            elif code == 67:
+                self.paperspace = value
+            elif code == 1001:
+                return
+
+    def handles(self) -> Iterable[str]:
+        """ Yields the handles of the main entity and all linked entities. """
+        if self._tags is not None:
+            for tags in self._tags:
+                handle = _get_handle(tags)
+                if handle is not None:
+                    yield handle
+
+    def index_keys(self) -> Iterable[Tuple[str, Tuple[str, Optional[str],
+                                                       Optional[str]]]]:
+        """ Yields the handle and the secondary index keys (DXF type, layer,
+        owner) of the main entity and all linked entities, without loading
+        the entities. (internal API)
+        """
+        if self._tags is None:
+            return
+        for tags in self._tags:
+            handle = _get_handle(tags)
+            if handle is None:
+                continue
+            layer, owner = _scan_layer_and_owner(tags)
+            if self.owner is not None:
+                # Linked entities have the same owner as the main entity:
+                owner = self.owner
+            yield handle, (tags.dxftype(), layer, owner)
+
+    @property
+    def is_loaded(self) -> bool:
+        return self._tags is None
+
+    def load(self) -> 'DXFEntity':
+        """ Returns the main entity, loads and binds the main entity and all
+        linked entities at the first call.
+        """
+        if self._tags is None:
+            return self._entity
+
+        doc = self.doc
+        db = doc.entitydb
+        db.discard_lazy_entity(self)
+        entities = [factory.load(ExtendedTags(tags)) for tags in self._tags]
+        self._tags = None
+        for entity in entities:
+            # Bind entities like in the 1st loading stage, without calling the
+            # post_bind_hook():
+            entity.doc = doc
+            db.add(entity)
+        linked_entities = entity_linker()
+        for entity in entities:
+            linked_entities(entity)
+        main_entity = entities[0]
+        # The owner handle and paperspace flag are set by the owner layout:
+        if self.owner is not None and hasattr(main_entity, 'set_owner'):
+            main_entity.set_owner(self.owner, paperspace=self.paperspace)
+
+        # 2nd loading stage for lazy loaded entities:
+        for entity in entities:
+            if entity.is_alive:
+                cmd = entity.post_load_hook(doc)
+                if cmd is not None:
+                    doc.add_post_init_command(cmd)
+        self._entity = main_entity
+        self.doc = None
+        return main_entity
@@ -9,7 +9,7 @@ from .const import DXFTypeError, DXFIndexError, DXFValueError
 from .tags import Tags
 from ezdxf.tools.indexing import Index
 from ezdxf.lldxf.tagwriter import TagWriter
-from ezdxf.math import UCS, Matrix44
+from ezdxf.math import UCS, Matrix44, VectorArray
 
 
 class TagList:
@@ -55,17 +55,39 @@ class TagArray(TagList):
 
 
 class VertexArray:
-    """ Store vertices in an ``array.array('d')``. Vertex size is defined by class variable ``VERTEX_SIZE``. """
+    """ Store vertices in an ``array.array('d')``. Vertex size is defined by class variable ``VERTEX_SIZE``.
+
+    Copies share the vertex data (copy-on-write), a private copy of the
+    ``array.array('d')`` is created at the first access of the
+    :attr:`values` attribute or at the first modification.
+
+    """
     #: Defines the vertex size
     VERTEX_SIZE = 3  # set to 2 for 2d points
-    __slots__ = ('values',)
+    __slots__ = ('_values', '_shared')
 
     def __init__(self, data: Iterable = None):
-        self.values = array('d', data or [])
+        self._values = array('d', data or [])
+        self._shared = False
+
+    @property
+    def values(self) -> array:
+        """ Vertex data as ``array.array('d')``, returns a private copy if the
+        data is shared with other vertex arrays.
+        """
+        if self._shared:
+            self._values = array('d', self._values)
+            self._shared = False
+        return self._values
+
+    @values.setter
+    def values(self, values: array) -> None:
+        self._values = values
+        self._shared = False
 
     def __len__(self) -> int:
         """ Count of vertices. """
-        return len(self.values) // self.VERTEX_SIZE
+        return len(self._values) // self.VERTEX_SIZE
 
     def __getitem__(self, index: int):
         """ Get vertex at `index`, extended slicing supported. """
@@ -97,7 +119,7 @@ class VertexArray:
     def __iter__(self) -> Iterable[Sequence[float]]:
         """ Returns iterable of vertices. """
         size = self.VERTEX_SIZE
-        values = self.values
+        values = self._values
         index = 0
         len_array = len(values)
         while index < len_array:
@@ -123,8 +145,21 @@ class VertexArray:
             _insert(pos, value)
 
     def clone(self) -> 'VertexArray':
-        """ Returns a deep copy. """
-        return self.__class__(data=self.values)
+        """ Returns a copy, which shares the vertex data until the first
+        modification of the copy or the source.
+        """
+        obj = self.__class__.__new__(self.__class__)
+        obj._values = self._values
+        obj._shared = True
+        self._shared = True
+        return obj
+
+    def __copy__(self) -> 'VertexArray':
+        return self.clone()
+
+    def __deepcopy__(self, memodict: dict = None) -> 'VertexArray':
+        # vertex data contains only floats and is copied on write
+        return self.clone()
 
     @classmethod
     def from_tags(cls, tags: Iterable[DXFTag], code: int = 10) -> 'VertexArray':
@@ -136,11 +171,27 @@ class VertexArray:
             code: group code to collect
 
         """
+        size = cls.VERTEX_SIZE
         vertices = array('d')
         for tag in tags:
             if tag.code == code:
-                vertices.extend(tag.value)
-        return cls(data=vertices)
+                # Copy the packed values of the DXFVertex directly, this
+                # avoids the conversion into a tuple by DXFVertex.value:
+                value = tag.packed_value
+                if len(value) == size:
+                    vertices.frombytes(value.cast('B'))
+                else:  # 2D point in 3D array or vice versa
+                    vertices.extend((tuple(value) + (0., 0.))[:size])
+        return cls.from_array(vertices)
+
+    @classmethod
+    def from_array(cls, vertices: array) -> 'VertexArray':
+        """ Returns a new object, which adopts the ``array('d')`` `vertices`
+        without copying.
+        """
+        obj = cls()
+        obj.values = vertices
+        return obj
 
     def _index(self, item) -> int:
         return Index(self).index(item, error=DXFIndexError)
@@ -151,7 +202,7 @@ class VertexArray:
     def _get_point(self, index: int) -> Sequence[float]:
         size = self.VERTEX_SIZE
         index = index * size
-        return tuple(self.values[index:index + size])
+        return tuple(self._values[index:index + size])
 
     def _get_points(self, indices) -> Iterable:
         for index in indices:
@@ -174,12 +225,12 @@ class VertexArray:
     def _del_points(self, indices: Iterable[int]) -> None:
         del_flags = set(indices)
         size = self.VERTEX_SIZE
-        survivors = array('d', (v for i, v in enumerate(self.values) if (i // size) not in del_flags))
+        survivors = array('d', (v for i, v in enumerate(self._values) if (i // size) not in del_flags))
         self.values = survivors
 
     def export_dxf(self, tagwriter: 'TagWriter', code=10):
         delta = 0
-        for c in self.values:
+        for c in self._values:
             tagwriter.write_tag2(code + delta, c)
             delta += 10
             if delta > 20:
@@ -198,7 +249,10 @@ class VertexArray:
 
     def clear(self) -> None:
         """ Delete all vertices. """
-        del self.values[:]
+        if self._shared:
+            self.values = array('d')
+        else:
+            del self._values[:]
 
     def set(self, points: Iterable[Sequence[float]]) -> None:
         """ Replace all vertices by `points`. """
@@ -211,6 +265,11 @@ class VertexArray:
         .. versionadded:: 0.13
 
         """
+        if self.VERTEX_SIZE == 3:
+            # transform all vertices at once:
+            vertices = VectorArray.from_array(self._values)
+            self.values = m.transform_array(vertices).values
+            return
         values = array('d')
         for vertex in m.transform_vertices(self):
             values.extend(vertex)
@@ -0,0 +1,196 @@
+# Copyright (c) 2020, Manfred Moitzi
+# License: MIT License
+"""
+Multi-process loading of ASCII DXF files.
+
+The content of the ENTITIES and BLOCKS section is split into chunks at DXF
+structure tag (0, ...) boundaries. Each chunk is tagged, compiled and loaded
+into DXF entities by a worker process, the loaded entities are transferred
+back to the main process by pickling. All other sections are loaded in the
+main process. Binding the entities to the document is always done in the main
+process, therefore the resulting document is the same as by serial loading.
+
+"""
+from typing import List, Tuple, Optional, Dict, TYPE_CHECKING
+import io
+import os
+import re
+import mmap
+from itertools import chain
+from concurrent.futures import ProcessPoolExecutor
+
+from ezdxf.entities import factory
+from .const import DXFStructureError
+from .tags import group_tags
+from .extendedtags import ExtendedTags
+from .tagger import ascii_bytes_tags_loader, tag_compiler
+from .loader import load_dxf_structure, SectionDict
+
+if TYPE_CHECKING:
+    from ezdxf.eztypes import DXFEntity
+
+__all__ = ['load_parallel_dxf_structure']
+
+PARALLEL_SECTIONS = ('BLOCKS', 'ENTITIES')
+# Don't split section content into smaller chunks, the overhead of transferring
+# the tasks and results between the processes outweighs the gain:
+MIN_CHUNK_SIZE = 256 * 1024
+CHUNKS_PER_WORKER = 4
+
+Chunk = Tuple[int, int]  # (start, end) offset in file
+
+ENDSEC = re.compile(rb'^[ \t]*0[ \t]*\r?\nENDSEC[ \t]*\r?$', re.MULTILINE)
+
+
+def _section_head(name: str):
+    return re.compile(
+        rb'^[ \t]*0[ \t]*\r?\nSECTION[ \t]*\r?\n[ \t]*2[ \t]*\r?\n' +
+        name.encode() + rb'[ \t]*\r?\n',
+        re.MULTILINE
+    )
+
+
+def find_section_content(data, name: str) -> Optional[Chunk]:
+    """ Returns the (start, end) offsets of the content of section `name`,
+    without the SECTION head and the ENDSEC tag, or ``None`` if the section
+    does not exist.
+
+    """
+    head = _section_head(name).search(data)
+    if head is None:
+        return None
+    start = head.end()
+    endsec = ENDSEC.search(data, start)
+    if endsec is None:
+        raise DXFStructureError(f'{name} section: missing ENDSEC tag.')
+    return start, endsec.start()
+
+
+def split_content(data, start: int, end: int, count: int) -> List[Chunk]:
+    """ Split content `start` to `end` into approx. `count` chunks of equal
+    size, each chunk starts with a DXF structure tag (0, ...).
+
+    Args:
+        data: DXF file content as bytes-like object
+        start: offset of the first tag, has to be the begin of a group code
+            line
+        end: end offset of the content
+        count: count of chunks
+
+    """
+    if count < 2:
+        return [(start, end)]
+    size = (end - start) // count
+    chunks = []
+    chunk_start = start
+    for target in range(start + size, end, size):
+        if target <= chunk_start:
+            continue
+        # Go to the begin of the line:
+        pos = data.rfind(b'\n', chunk_start, target) + 1
+        if pos == 0:
+            pos = chunk_start
+        # Each chunk starts with a group code line, group code lines have an
+        # even line number relative to the chunk start:
+        if data[chunk_start:pos].count(b'\n') & 1:  # skip value line
+            pos = data.find(b'\n', pos, end) + 1
+        # Search next structure tag:
+        while 0 < pos < end:
+            code_end = data.find(b'\n', pos, end)
+            if code_end == -1:
+                pos = end
+                break
+            if data[pos:code_end].strip() == b'0':
+                break
+            # skip group code and value line
+            pos = data.find(b'\n', code_end + 1, end) + 1
+        if pos <= chunk_start or pos >= end:
+            # no structure tag found or value line is the last line
+            break
+        chunks.append((chunk_start, pos))
+        chunk_start = pos
+    chunks.append((chunk_start, end))
+    return chunks
+
+
+def load_chunk(filename: str, chunk: Chunk, encoding: str,
+               errors: str) -> List['DXFEntity']:
+    """ Load the DXF entities of the file `filename` located in the given
+    `chunk`. This function is executed by the worker processes.
+
+    """
+    start, end = chunk
+    with open(filename, mode='rb') as fp, \
+            mmap.mmap(fp.fileno(), 0, access=mmap.ACCESS_READ) as data:
+        stream = io.BytesIO(data[start:end])
+    tags = tag_compiler(ascii_bytes_tags_loader(stream, encoding, errors))
+    return [factory.load(ExtendedTags(entity)) for entity in group_tags(tags)]
+
+
+def _init_worker(state: Dict) -> None:
+    # Processes started by "spawn" do not inherit the global options:
+    from ezdxf import options
+    options.__dict__.update(state)
+
+
+def load_parallel_dxf_structure(filename: str, encoding: str = 'cp1252',
+                                errors: str = 'surrogateescape',
+                                workers: int = None) -> SectionDict:
+    """ Load the DXF structure of the ASCII DXF file `filename` like
+    :func:`~ezdxf.lldxf.loader.load_dxf_structure`, but the entities of the
+    ENTITIES and BLOCKS section are loaded by multiple worker processes.
+    These sections contain already loaded but not bound :class:`DXFEntity`
+    objects, all other sections contain :class:`Tags` objects.
+
+    Args:
+        filename: name of the ASCII DXF file
+        encoding: text encoding of the DXF file
+        errors: specify decoding error handler
+        workers: count of worker processes, ``None`` for the count of CPUs
+
+    """
+    from ezdxf import options
+    with open(filename, mode='rb') as fp, \
+            mmap.mmap(fp.fileno(), 0, access=mmap.ACCESS_READ) as data:
+        contents = dict()
+        for name in PARALLEL_SECTIONS:
+            content = find_section_content(data, name)
+            if content is not None:
+                contents[name] = content
+
+        # Serial loading of all other content:
+        segments = []
+        pos = 0
+        for start, end in sorted(contents.values()):
+            segments.append((pos, start))
+            pos = end
+        segments.append((pos, len(data)))
+        tagger = chain.from_iterable(
+            ascii_bytes_tags_loader(
+                io.BytesIO(data[start:end]), encoding, errors)
+            for start, end in segments
+        )
+        sections = load_dxf_structure(tag_compiler(tagger))
+
+        max_workers = workers or os.cpu_count() or 1
+        tasks = []
+        for name, (start, end) in contents.items():
+            count = min(max_workers * CHUNKS_PER_WORKER,
+                        (end - start) // MIN_CHUNK_SIZE)
+            for chunk in split_content(data, start, end, count):
+                tasks.append((name, chunk))
+
+    with ProcessPoolExecutor(max_workers=max_workers,
+                             initializer=_init_worker,
+                             initargs=(dict(vars(options)),)) as executor:
+        results = executor.map(
+            load_chunk,
+            [filename] * len(tasks),
+            [chunk for _, chunk in tasks],
+            [encoding] * len(tasks),
+            [errors] * len(tasks),
+        )
+        # Results are returned in order of the tasks:
+        for (name, _), entities in zip(tasks, results):
+            sections[name].extend(entities)
+    return sections
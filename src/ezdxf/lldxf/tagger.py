@@ -1,7 +1,11 @@
 # Copyright (c) 2016-2020, Manfred Moitzi
 # License: MIT License
-from typing import Iterable, TextIO, Iterator
+from typing import (
+    Iterable, TextIO, Iterator, BinaryIO, Tuple, Dict, Callable,
+)
 import struct
+from itertools import chain
+from array import array
 from .types import (
     DXFTag, DXFVertex, DXFBinaryTag, BYTES, INT16, INT32, INT64, DOUBLE,
     POINT_CODES, TYPE_TABLE, BINARY_DATA,
@@ -96,6 +100,81 @@ def ascii_tags_loader(stream: TextIO,
             return
 
 
+# Values of this group codes are not decoded by the ascii_bytes_tags_loader():
+_UNDECODED_GROUP_CODES = set(TYPE_TABLE.keys()) | BINARY_DATA
+
+
+def ascii_bytes_tags_loader(stream: BinaryIO, encoding: str = 'utf8',
+                            errors: str = 'surrogateescape',
+                            skip_comments: bool = True) -> Iterable[DXFTag]:
+    """ Yields :class:``DXFTag`` objects from a binary `stream` of an ASCII DXF
+    document (untrusted external source) and does not optimize coordinates.
+    Comment tags (group code == 999) will be skipped if argument
+    `skip_comments` is `True`.
+
+    The only required feature of `stream` is a :meth:`readline` method which
+    returns ``bytes``, this works with binary file streams, :class:`BytesIO`
+    and :class:`mmap.mmap` objects. Supported line endings are "\\n", "\\r\\n"
+    and "\\r". Only the values of string tags are decoded,
+    the values of numeric tags (int, float) and binary data tags are returned
+    as ``bytes`` and have to be converted by the :func:`tag_compiler`, which is
+    possible because :func:`int`, :func:`float` and :func:`unhexlify` accept
+    ``bytes`` as input. ``DXFTag.code`` is always an ``int``.
+
+    Args:
+        stream: binary stream or memory mapped file
+        encoding: text encoding of the DXF document
+        errors: specify decoding error handler
+
+            - "surrogateescape" to preserve possible binary data (default)
+            - "ignore" to use the replacement char U+FFFD: "\ufffd"
+            - "strict" to raise an :class:`UnicodeDecodeError`
+
+        skip_comments: skip comment tags (group code == 999) if `True`
+
+    Raises:
+        DXFStructureError: Found invalid group code.
+        UnicodeDecodeError: if `errors` is "strict" and a decoding error occurs
+
+    """
+    lines = iter(stream.readline, b'')
+    first_line = next(lines, b'')
+    if b'\n' not in first_line and b'\r' in first_line:
+        # readline() splits only at "\n", the first line of a DXF document
+        # with CR-only line endings contains the whole document:
+        lines = iter(first_line.split(b'\r'))
+    else:
+        lines = chain((first_line,), lines)
+    # Values of this group codes are converted by the tag_compiler() directly
+    # from bytes:
+    undecoded = _UNDECODED_GROUP_CODES
+    # Cache for converted group codes, the count of different group code
+    # strings is small:
+    group_codes = {}
+    line = 1
+    for code, value in zip(lines, lines):
+        try:
+            code = group_codes[code]
+        except KeyError:
+            raw_code = code
+            try:
+                code = int(raw_code)
+            except ValueError:
+                raise DXFStructureError(
+                    f'Invalid group code "{raw_code.decode(errors="ignore")}"'
+                    f' at line {line}.')
+            group_codes[raw_code] = code
+        if code != 999 or skip_comments is False:
+            value = value.rstrip(b'\r\n')
+            if code not in undecoded:
+                value = value.decode(encoding, errors=errors)
+            yield DXFTag(code, value)
+        line += 2
+
+
+BINARY_DXF_SENTINEL = b'AutoCAD Binary DXF\r\n\x1a\x00'
+
+
 def binary_tags_loader(data: bytes,
                        errors: str = 'surrogateescape') -> Iterable[DXFTag]:
     """ Yields :class:`DXFTag` or :class:`DXFBinaryTag` objects from binary DXF
@@ -104,7 +183,7 @@ def binary_tags_loader(data: bytes,
     unicode string,``float``, ``int`` or ``bytes`` for binary chunks.
 
     Args:
-        data: binary DXF data
+        data: binary DXF data as ``bytes`` or memory mapped file
         errors: specify decoding error handler
 
             - "surrogateescape" to preserve possible binary data (default)
@@ -117,44 +196,10 @@ def binary_tags_loader(data: bytes,
         UnicodeDecodeError: if `errors` is "strict" and a decoding error occurs
 
     """
-    if data[:22] != b'AutoCAD Binary DXF\r\n\x1a\x00':
+    if data[:22] != BINARY_DXF_SENTINEL:
         raise DXFStructureError('Not a binary DXF data structure.')
 
-    def scan_params():
-        dxfversion = 'AC1009'
-        encoding = 'cp1252'
-        try:
-            # Limit search to first 1024 bytes - an arbitrary number
-            # start index for 1-byte group code
-            start = data.index(b'$ACADVER', 22, 1024) + 10
-        except ValueError:
-            pass  # HEADER var $ACADVER not present
-        else:
-            if data[start] != 65:  # not 'A' = 2-byte group code
-                start += 1
-            dxfversion = data[start:start + 6].decode()
-
-        if dxfversion >= 'AC1021':
-            encoding = 'utf8'
-        else:
-            try:
-                # Limit search to first 1024 bytes - an arbitrary number
-                # start index for 1-byte group code
-                start = data.index(b'$DWGCODEPAGE', 22, 1024) + 14
-            except ValueError:
-                pass  # HEADER var $DWGCODEPAGE not present
-            else:  # name schema is 'ANSI_xxxx'
-                if data[start] != 65:  # not 'A' = 2-byte group code
-                    start += 1
-                end = start + 5
-                while data[end] != 0:
-                    end += 1
-                codepage = data[start: end].decode()
-                encoding = toencoding(codepage)
-
-        return encoding, dxfversion
-
-    encoding, dxfversion = scan_params()
+    encoding, dxfversion = binary_dxf_params(data)
     r12 = dxfversion <= 'AC1009'
     index = 22
     data_length = len(data)
@@ -198,20 +243,169 @@ def binary_tags_loader(data: bytes,
                 index += 1
             else:  # zero terminated string
                 start_index = index
-                end_index = data.index(b'\x00', start_index)
+                end_index = _find_string_end(data, start_index)
                 s = data[start_index:end_index]
                 index = end_index + 1
                 value = s.decode(encoding, errors=errors)
             yield DXFTag(code, value)
 
 
+def binary_dxf_params(data: bytes) -> Tuple[str, str]:
+    """ Returns the text encoding and the DXF version of the binary DXF
+    `data`, searches only the first 1024 bytes.
+
+    """
+    dxfversion = 'AC1009'
+    encoding = 'cp1252'
+    # Limit search to first 1024 bytes - an arbitrary number
+    start = data.find(b'$ACADVER', 22, 1024)
+    if start != -1:  # else HEADER var $ACADVER not present
+        # start index for 1-byte group code
+        start += 10
+        if data[start] != 65:  # not 'A' = 2-byte group code
+            start += 1
+        dxfversion = data[start:start + 6].decode()
+
+    if dxfversion >= 'AC1021':
+        encoding = 'utf8'
+    else:
+        # Limit search to first 1024 bytes - an arbitrary number
+        start = data.find(b'$DWGCODEPAGE', 22, 1024)
+        if start != -1:  # else HEADER var $DWGCODEPAGE not present
+            # start index for 1-byte group code
+            start += 14
+            if data[start] != 65:  # not 'A' = 2-byte group code
+                start += 1
+            # name schema is 'ANSI_xxxx'
+            end = start + 5
+            while data[end] != 0:
+                end += 1
+            codepage = data[start: end].decode()
+            encoding = toencoding(codepage)
+    return encoding, dxfversion
+
+
+def _find_string_end(data: bytes, start: int) -> int:
+    end = data.find(b'\x00', start)
+    if end == -1:
+        raise DXFStructureError(
+            f'Missing string terminator near byte offset: {start}.')
+    return end
+
+
+def _build_binary_value_decoders() -> Dict[int, Tuple[Callable, int]]:
+    decoders = dict()
+    for codes, fmt in [(INT16, '<h'), (INT32, '<i'), (INT64, '<q'),
+                       (DOUBLE, '<d'), (BYTES, '<B')]:
+        decoder = struct.Struct(fmt)
+        for code in codes:
+            decoders[code] = (decoder.unpack_from, decoder.size)
+    return decoders
+
+
+_BINARY_VALUE_DECODERS = _build_binary_value_decoders()
+# 3D point: x-value, y-group code, y-value, z-group code, z-value
+_POINT_3D = struct.Struct('<dHdHd')
+# 2D point: x-value, y-group code, y-value
+_POINT_2D = struct.Struct('<dHd')
+
+
+def binary_tag_compiler(data: bytes,
+                        errors: str = 'surrogateescape') -> Iterable[DXFTag]:
+    """ Yields compiled DXF tags from binary DXF `data` (untrusted external
+    source), the result is the same as from
+    :code:`tag_compiler(binary_tags_loader(data))`, but the tags are decoded
+    directly from `data` without creating intermediate :class:`DXFTag`
+    objects for the coordinate values.
+
+    The `data` can be any object which supports the buffer protocol and a
+    :meth:`find` method, like ``bytes`` or memory mapped files
+    (:class:`mmap.mmap`), the numeric values are decoded by
+    :func:`struct.unpack_from` directly from the buffer without copying.
+
+    Binary DXF files of version R12 and prior, which use 1-byte group codes,
+    are processed by :code:`tag_compiler(binary_tags_loader(data))`.
+
+    Args:
+        data: binary DXF data as ``bytes`` or memory mapped file
+        errors: specify decoding error handler
+
+            - "surrogateescape" to preserve possible binary data (default)
+            - "ignore" to use the replacement char U+FFFD: "\ufffd"
+            - "strict" to raise an :class:`UnicodeDecodeError`
+
+    Raises:
+        DXFStructureError: Not a binary DXF file or invalid DXF structure
+        UnicodeDecodeError: if `errors` is "strict" and a decoding error occurs
+
+    """
+    if data[:22] != BINARY_DXF_SENTINEL:
+        raise DXFStructureError('Not a binary DXF data structure.')
+
+    encoding, dxfversion = binary_dxf_params(data)
+    if dxfversion <= 'AC1009':
+        yield from tag_compiler(binary_tags_loader(data, errors))
+        return
+
+    decoders = _BINARY_VALUE_DECODERS
+    point_codes = POINT_CODES
+    binary_data = BINARY_DATA
+    unpack_code = struct.Struct('<H').unpack_from
+    unpack_3d = _POINT_3D.unpack_from
+    unpack_2d = _POINT_2D.unpack_from
+    size_3d = _POINT_3D.size
+    size_2d = _POINT_2D.size
+    last_3d_point = len(data) - size_3d
+    index = 22
+    data_length = len(data)
+    try:
+        while index < data_length:
+            code = unpack_code(data, index)[0]
+            index += 2
+            if code in point_codes:
+                if index <= last_3d_point:
+                    x, y_code, y, z_code, z = unpack_3d(data, index)
+                else:  # too close to the end of data for a 3D point
+                    x, y_code, y = unpack_2d(data, index)
+                    z_code = None
+                if y_code != code + 10:
+                    raise DXFStructureError(
+                        f"Missing required y coordinate near byte offset: "
+                        f"{index}.")
+                if z_code == code + 20:
+                    index += size_3d
+                    yield DXFVertex(code, (x, y, z))
+                else:
+                    index += size_2d
+                    yield DXFVertex(code, (x, y))
+            elif code in decoders:
+                unpack, size = decoders[code]
+                yield DXFTag(code, unpack(data, index)[0])
+                index += size
+            elif code in binary_data:
+                length = data[index]
+                index += 1
+                yield DXFBinaryTag(code, data[index: index + length])
+                index += length
+            else:  # zero terminated string
+                end = _find_string_end(data, index)
+                value = data[index:end].decode(encoding, errors=errors)
+                index = end + 1
+                if code == 0:
+                    value = value.strip()
+                yield DXFTag(code, value)
+    except struct.error:
+        raise DXFStructureError(
+            f'Unexpected end of binary DXF data near byte offset: {index}.')
+
+
 # invalid point codes if not part of a point started with 1010, 1011, 1012, 1013
 INVALID_POINT_CODES = {1020, 1021, 1022, 1023, 1030, 1031, 1032, 1033}
 
 
 def tag_compiler(tags: Iterator[DXFTag]) -> Iterable[DXFTag]:
-    """ Compiles DXF tag values imported by ascii_tags_loader() into Python
-    types.
+    """ Compiles DXF tag values imported by ascii_tags_loader() or
+    ascii_bytes_tags_loader() into Python types.
 
     Raises DXFStructureError() for invalid float values and invalid coordinate
     values.
@@ -234,7 +428,10 @@ def tag_compiler(tags: Iterator[DXFTag]) -> Iterable[DXFTag]:
     """
 
     def error_msg(tag):
-        return f'Invalid tag (code={tag.code}, value="{tag.value}") ' \
+        value = tag.value
+        if isinstance(value, bytes):
+            value = value.decode(errors='ignore')
+        return f'Invalid tag (code={tag.code}, value="{value}") ' \
                f'near line: {line}.'
 
     undo_tag = None
@@ -249,26 +446,49 @@ def tag_compiler(tags: Iterator[DXFTag]) -> Iterable[DXFTag]:
                 line += 2
             code = x.code
             if code in POINT_CODES:
-                # y-axis is mandatory
-                y = next(tags)
-                line += 2
-                if y.code != code + 10:  # like 20 for base x-code 10
-                    raise DXFStructureError(
-                        f"Missing required y coordinate near line: {line}.")
-                # z-axis just for 3d points
-                z = next(tags)
-                line += 2
-                try:
+                # Batch compilation of consecutive points, like the vertices
+                # of LWPOLYLINE, MESH, SPLINE or HATCH entities: collect the
+                # raw values of all points and convert them at once into an
+                # array('d'), the DXFVertex() objects are views of this array.
+                points = []  # (group code, vertex size)
+                values = []
+                while True:
+                    # y-axis is mandatory
+                    y = next(tags, None)
+                    line += 2
+                    if y is None:
+                        # Incomplete point at EOF: yield the complete points
+                        # of this batch and stop.
+                        x = None
+                        break
+                    if y.code != code + 10:  # like 20 for base x-code 10
+                        raise DXFStructureError(
+                            f"Missing required y coordinate near line: {line}.")
+                    # z-axis just for 3d points
+                    z = next(tags, None)
+                    line += 2
                     # z-axis like (30, 0.0) for base x-code 10
-                    if z.code == code + 20:
-                        point = (float(x.value), float(y.value), float(z.value))
+                    if z is not None and z.code == code + 20:
+                        values.extend((x.value, y.value, z.value))
+                        points.append((code, 3))
+                        x = next(tags, None)
+                        line += 2
                     else:
-                        point = (float(x.value), float(y.value))
-                        undo_tag = z
+                        values.extend((x.value, y.value))
+                        points.append((code, 2))
+                        x = z
+                    if x is None or x.code not in POINT_CODES:
+                        break
+                    code = x.code
+                try:
+                    values = array('d', map(float, values))
                 except ValueError:
                     raise DXFStructureError(
                         f'Invalid floating point values near line: {line}.')
-                yield DXFVertex(code, point)
+                yield from DXFVertex.from_packed_values(values, points)
+                if x is None:
+                    return
+                undo_tag = x
             elif code in BINARY_DATA:
                 # Maybe pre compiled in low level tagger (binary DXF):
                 if isinstance(x, DXFBinaryTag):
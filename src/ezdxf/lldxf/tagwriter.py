@@ -16,20 +16,42 @@ __all__ = [
 ]
 CRLF = b'\r\n'
 
+# Float values of this group codes (coordinates, distances, angles and
+# vectors) are rounded, if the tag writer has a `precision`:
+ROUNDED_CODES = frozenset(
+    list(range(10, 60)) + list(range(110, 150)) + list(range(210, 240)) +
+    list(range(1010, 1060))
+)
+
 
 class TagWriter:
     """
     Writes DXF tags into a stream.
 
+    The output is written unbuffered by default. If `buffer_size` is > 0, the
+    formatted tags are collected in an internal buffer and written to the
+    stream in chunks of at least `buffer_size` characters, which reduces the
+    count of :meth:`stream.write` calls considerably. Call :meth:`flush` to
+    write the remaining buffer content to the stream.
+
     Args:
         stream: text stream
         write_handles: if False don't write handles (5, 105), use only for
             DXF R12 format
+        buffer_size: size of the internal write buffer in characters, 0 for
+            unbuffered output
+        precision: round float values of coordinate and geometry group codes
+            (10-59, 110-149, 210-239 and 1010-1059) to `precision` decimal
+            places, ``None`` for the full float precision, preformatted
+            strings written by :meth:`write_str` like the HEADER variables
+            are never rounded
 
     """
+    _empty = ''
 
     def __init__(self, stream: TextIO, dxfversion=LATEST_DXF_VERSION,
-                 write_handles: bool = True):
+                 write_handles: bool = True, buffer_size: int = 0,
+                 precision: int = None):
         self._stream = stream
         # this are just options for export functions
         self.dxfversion = dxfversion
@@ -37,23 +59,63 @@ class TagWriter:
         # force writing optional values if equal to default value when set
         # True is only used for testing
         self.force_optional = False
+        self.precision = precision
+        self._buffer = []
+        self._buffered_size = 0
+        self._buffer_size = buffer_size
+        if buffer_size > 0:
+            self._write = self._write_buffered
+        else:
+            self._write = stream.write
+
+    def _write_buffered(self, s: Union[str, bytes]) -> None:
+        self._buffer.append(s)
+        self._buffered_size += len(s)
+        if self._buffered_size >= self._buffer_size:
+            self.flush()
+
+    def flush(self) -> None:
+        """ Write buffered content to the stream. """
+        if self._buffer:
+            self._stream.write(self._empty.join(self._buffer))
+            self._buffer.clear()
+        self._buffered_size = 0
 
     def write_tags(self, tags: Union['Tags', 'ExtendedTags']) -> None:
         for tag in tags:
             self.write_tag(tag)
 
     def write_tag(self, tag: DXFTag) -> None:
-        self._stream.write(tag.dxfstr())
+        if self.precision is None or tag.code not in ROUNDED_CODES:
+            self._write(tag.dxfstr())
+        elif isinstance(tag, DXFVertex):
+            self.write_vertex(tag.code, tag.value)
+        elif type(tag.value) is float:
+            self.write_tag2(tag.code, tag.value)
+        else:
+            self._write(tag.dxfstr())
 
     def write_tag2(self, code: int, value: Any) -> None:
-        self._stream.write(TAG_STRING_FORMAT % (code, value))
+        if self.precision is not None and type(value) is float and \
+                code in ROUNDED_CODES:
+            value = round(value, self.precision)
+        self._write(TAG_STRING_FORMAT % (code, value))
 
     def write_vertex(self, code: int, vertex: Iterable[float]) -> None:
-        for index, value in enumerate(vertex):
-            self.write_tag2(code + index * 10, value)
+        precision = self.precision
+        if precision is None or code not in ROUNDED_CODES:
+            self._write(''.join(
+                TAG_STRING_FORMAT % (code + index * 10, value)
+                for index, value in enumerate(vertex)
+            ))
+        else:
+            self._write(''.join(
+                TAG_STRING_FORMAT % (code + index * 10, round(value, precision))
+                for index, value in enumerate(vertex)
+            ))
 
     def write_str(self, s: str) -> None:
-        self._stream.write(s)
+        self._write(s)
 
 
 class BinaryTagWriter(TagWriter):
@@ -85,15 +147,18 @@ class BinaryTagWriter(TagWriter):
 
     """
 
+    _empty = b''
+
     def __init__(self, stream: BinaryIO, dxfversion=LATEST_DXF_VERSION,
-                 write_handles: bool = True, encoding='utf8'):
-        super().__init__(None, dxfversion, write_handles)
-        self._stream = stream
+                 write_handles: bool = True, encoding='utf8',
+                 buffer_size: int = 0, precision: int = None):
+        super().__init__(stream, dxfversion, write_handles, buffer_size,
+                         precision)
         self._encoding = encoding  # output encoding
         self._r12 = self.dxfversion <= 'AC1009'
 
     def write_signature(self) -> None:
-        self._stream.write(b'AutoCAD Binary DXF\r\n\x1a\x00')
+        self._write(b'AutoCAD Binary DXF\r\n\x1a\x00')
 
     def write_tags(self, tags: Union['Tags', 'ExtendedTags']) -> None:
         for tag in tags:
@@ -106,44 +171,54 @@ class BinaryTagWriter(TagWriter):
         else:
             self.write_tag2(tag.code, tag.value)
 
+    def write_vertex(self, code: int, vertex: Iterable[float]) -> None:
+        for index, value in enumerate(vertex):
+            self.write_tag2(code + index * 10, value)
+
     def write_str(self, s: str) -> None:
+        # Preformatted strings are not rounded, like in ASCII DXF files:
         data = s.split('\n')
         for code, value in take2(data):
-            self.write_tag2(int(code), value)
+            self._write_tag2(int(code), value)
+
+    def _group_code(self, code: int) -> bytes:
+        if self._r12:
+            # Special group code handling if DXF R12 and older
+            if code >= 1000:  # extended data
+                # always 2-byte group code for extended data
+                return b'\xff' + code.to_bytes(2, 'little')
+            else:
+                return code.to_bytes(1, 'little')
+        else:  # for R2000+ do not need a leading 0xff in front of extended data
+            return code.to_bytes(2, 'little')
 
     def write_tag2(self, code: int, value: Any) -> None:
+        if self.precision is not None and code in ROUNDED_CODES:
+            value = round(float(value), self.precision)
+        self._write_tag2(code, value)
+
+    def _write_tag2(self, code: int, value: Any) -> None:
         # Binary DXF files do not support comments!
         assert code != 999
         if code in BINARY_DATA:
             self._write_binary_chunks(code, value)
             return
-        stream = self._stream
 
-        # write group code
-        if self._r12:
-            # Special group code handling if DXF R12 and older
-            if code >= 1000:  # extended data
-                stream.write(b'\xff')
-                # always 2-byte group code for extended data
-                stream.write(code.to_bytes(2, 'little'))
-            else:
-                stream.write(code.to_bytes(1, 'little'))
-        else:  # for R2000+ do not need a leading 0xff in front of extended data
-            stream.write(code.to_bytes(2, 'little'))
-        # write tag content
-        if code in BYTES:
-            stream.write(int(value).to_bytes(1, 'little'))
+        # Group code and tag content are written by a single write() call:
+        if code in DOUBLE:
+            data = struct.pack('<d', float(value))
+        elif code in BYTES:
+            data = int(value).to_bytes(1, 'little')
         elif code in INT16:
-            stream.write(int(value).to_bytes(2, 'little', signed=True))
+            data = int(value).to_bytes(2, 'little', signed=True)
         elif code in INT32:
-            stream.write(int(value).to_bytes(4, 'little', signed=True))
+            data = int(value).to_bytes(4, 'little', signed=True)
         elif code in INT64:
-            stream.write(int(value).to_bytes(8, 'little', signed=True))
-        elif code in DOUBLE:
-            stream.write(struct.pack('<d', float(value)))
+            data = int(value).to_bytes(8, 'little', signed=True)
         else:  # write zero terminated string
-            stream.write(str(value).encode(self._encoding, errors='dxfreplace'))
-            stream.write(b'\x00')
+            data = str(value).encode(self._encoding, errors='dxfreplace') + \
+                   b'\x00'
+        self._write(self._group_code(code) + data)
 
     def _write_binary_chunks(self, code: int, data: bytes) -> None:
         # Split binary data into small chunks, 127 bytes is the
@@ -151,21 +226,21 @@ class BinaryTagWriter(TagWriter):
         CHUNK_SIZE = 127
         index = 0
         size = len(data)
-        stream = self._stream
+        write = self._write
 
         while index < size:
             # write group code
             if self._r12 and code >= 1000:  # extended data, just 1004?
-                stream.write(b'\xff')  # extended data marker
+                write(b'\xff')  # extended data marker
             # binary data does not exist in regular R12 entities,
             # only 2-byte group codes required
-            stream.write(code.to_bytes(2, 'little'))
+            write(code.to_bytes(2, 'little'))
 
             # write max CHUNK_SIZE bytes of binary data in one tag
             chunk = data[index: index + CHUNK_SIZE]
             # write actual chunk size
-            stream.write(len(chunk).to_bytes(1, 'little'))
-            stream.write(chunk)
+            write(len(chunk).to_bytes(1, 'little'))
+            write(chunk)
             index += CHUNK_SIZE
 
 
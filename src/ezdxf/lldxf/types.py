@@ -183,6 +183,12 @@ def is_embedded_object_marker(tag: DXFTag) -> bool:
     return tag.code == EMBEDDED_OBJ_MARKER and tag.value == EMBEDDED_OBJ_STR
 
 
+def _readonly_view(values: array) -> memoryview:
+    # memoryview.toreadonly() requires Python 3.8, a view of immutable bytes
+    # is read-only:
+    return memoryview(values.tobytes()).cast('d')
+
+
 class DXFVertex(DXFTag):
     """ Represents a 2D or 3D vertex, stores only the group code of the
     x-component of the vertex, because the y-group-code is x-group-code + 10
@@ -197,7 +203,33 @@ class DXFVertex(DXFTag):
     __slots__ = ()
 
     def __init__(self, code: int, value: Sequence[float]):
-        super(DXFVertex, self).__init__(code, array('d', value))  # type: ignore
+        super(DXFVertex, self).__init__(
+            code, _readonly_view(array('d', value)))  # type: ignore
+
+    @classmethod
+    def from_packed_values(cls, values: array,
+                           points: Iterable[Tuple[int, int]]
+                           ) -> Iterable['DXFVertex']:
+        """ Yields :class:`DXFVertex` objects for packed vertex `values`,
+        `points` defines the group code and the vertex size (2 or 3) for each
+        vertex. The vertices are read-only views of an immutable copy of
+        `values` without copying each vertex. A retained vertex keeps the
+        whole copy alive, the tag compiler packs only the consecutive points
+        of a single entity. (internal API)
+        """
+        new = object.__new__
+        buffer = _readonly_view(values)
+        index = 0
+        for code, size in points:
+            vertex = new(cls)
+            vertex.code = code
+            vertex._value = buffer[index: index + size]
+            yield vertex
+            index += size
+
+    def __reduce__(self):
+        # memoryview objects do not support pickling and deep copying:
+        return self.__class__, (self.code, self.value)
 
     def __str__(self) -> str:
         return str(self.value)
@@ -214,6 +246,15 @@ class DXFVertex(DXFTag):
     def value(self) -> Tuple:
         return tuple(self._value)
 
+    @property
+    def packed_value(self) -> memoryview:
+        """ Returns the vertex components as read-only memoryview of
+        ``double`` values, e.g. to extend an ``array('d')`` by
+        :meth:`array.frombytes` without the conversion into a tuple.
+        (internal API)
+        """
+        return self._value
+
     def dxftags(self) -> Iterable[Tuple]:
         """ Returns all vertex components as single :class:`DXFTag` objects. """
         c = self.code
@@ -4,6 +4,7 @@
 # License: MIT License
 from typing import Union, Sequence
 from .vector import Vector, Vec2, X_AXIS, Y_AXIS, Z_AXIS, NULLVEC
+from .vectorarray import VectorArray
 from .construct2d import (
     is_close_points, closest_point, convex_hull_2d, intersection_line_line_2d,
     distance_point_line_2d, is_point_on_line_2d, is_point_in_polygon_2d,
@@ -21,7 +22,9 @@ from .linalg import (
     gauss_vector_solver, gauss_matrix_solver, freeze_matrix,
     tridiagonal_matrix_solver, tridiagonal_vector_solver, detect_banded_matrix,
     compact_banded_matrix, BandedMatrixLU, banded_matrix,
+    banded_matrix_from_rows,
 )
+from .flattening import adaptive_flattening, bezier_flattening, chord_error
 from .parametrize import estimate_tangents, estimate_end_tangent_magnitude
 from .bspline import (
     fit_points_to_cad_cv, global_bspline_interpolation,
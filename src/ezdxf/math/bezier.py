@@ -2,9 +2,11 @@
 # License: MIT License
 from typing import TYPE_CHECKING, Iterable, Tuple, Sequence
 from functools import lru_cache
+from operator import mul
 import math
 from ezdxf.math import Vector, NULLVEC, Matrix44
 from .construct2d import linspace
+from .flattening import bezier_flattening
 
 if TYPE_CHECKING:
     from ezdxf.eztypes import Vertex
@@ -105,48 +107,20 @@ class Bezier:
 
     def flattening(self, distance: float,
                    segments: int = 4) -> Iterable[Vector]:
-        """ Adaptive recursive flattening. The argument `segments` is the
-        minimum count of approximation segments, if the distance from the center
-        of the approximation segment to the curve is bigger than `distance` the
-        segment will be subdivided.
+        """ Adaptive flattening. The argument `segments` is the minimum count
+        of approximation segments, if the maximum distance from the curve to
+        an approximation segment is bigger than `distance` the segment will be
+        subdivided, see :func:`~ezdxf.math.bezier_flattening`.
 
         Args:
-            distance: maximum distance from the center of the curve (Cn)
-                to the center of the linear (C1) curve between two
-                approximation points to determine if a segment should be
-                subdivided.
+            distance: maximum distance from the curve (Cn) to the linear (C1)
+                approximation segment
             segments: minimum segment count
 
         .. versionadded:: 0.15
 
         """
-
-        def subdiv(start_point, end_point, start_t: float, end_t: float):
-            mid_t = (start_t + end_t) * 0.5
-            mid_point = self.point(mid_t)
-            chk_point = start_point.lerp(end_point)
-            # center point point is faster than projecting mid point onto
-            # vector start -> end:
-            if chk_point.distance(mid_point) < distance:
-                yield end_point
-            else:
-                yield from subdiv(start_point, mid_point, start_t, mid_t)
-                yield from subdiv(mid_point, end_point, mid_t, end_t)
-
-        dt = 1.0 / segments
-        t0 = 0.0
-        start_point = self._defpoints[0]
-        yield start_point
-        while t0 < 1.0:
-            t1 = t0 + dt
-            if math.isclose(t1, 1.0):
-                end_point = self._defpoints[-1]
-                t1 = 1.0
-            else:
-                end_point = self.point(t1)
-            yield from subdiv(start_point, end_point, t0, t1)
-            t0 = t1
-            start_point = end_point
+        return bezier_flattening(self._defpoints, distance, segments)
 
     def params(self, segments: int) -> Iterable[float]:
         """ Yield evenly spaced parameters from 0 to 1 for given segment count. """
@@ -172,8 +146,23 @@ class Bezier:
         """ Yields multiple points for parameters in vector `t` as :class:`Vector` objects.
         Parameters have to be in range [0, 1].
         """
+        # Float arithmetic: creates only one Vector object per point
+        pts = self._defpoints
+        n = len(pts) - 1
+        x = [p.x for p in pts]
+        y = [p.y for p in pts]
+        z = [p.z for p in pts]
         for u in t:
-            yield self.point(u)
+            if u < 0.0 or u > 1.0:
+                raise ValueError('Parameter t not in range [0, 1]')
+            if (1.0 - u) < 5e-6:
+                u = 1.0
+            weights = [bernstein_basis(n, i, u) for i in range(n + 1)]
+            yield Vector(
+                sum(map(mul, weights, x)),
+                sum(map(mul, weights, y)),
+                sum(map(mul, weights, z)),
+            )
 
     def derivative(self, t: float) -> Tuple[Vector, Vector, Vector]:
         """
@@ -7,6 +7,7 @@ from ezdxf.math import (
     Vector, Vec2, tridiagonal_matrix_solver, Matrix44, linspace
 )
 from ezdxf.math.ellipse import ConstructionEllipse
+from ezdxf.math.flattening import bezier_flattening
 
 if TYPE_CHECKING:
     from ezdxf.eztypes import Vertex
@@ -117,54 +118,51 @@ class Bezier4P:
             raise ValueError(segments)
         delta_t = 1. / segments
         yield self._control_points[0]
-        for segment in range(1, segments):
-            yield self._get_curve_point(delta_t * segment)
+        yield from self._get_curve_points(
+            delta_t * segment for segment in range(1, segments))
         yield self._control_points[3]
 
     def flattening(self, distance: float,
                    segments: int = 4) -> Iterable[Union[Vector, Vec2]]:
-        """ Adaptive recursive flattening. The argument `segments` is the
-        minimum count of approximation segments, if the distance from the center
-        of the approximation segment to the curve is bigger than `distance` the
-        segment will be subdivided.
+        """ Adaptive flattening. The argument `segments` is the minimum count
+        of approximation segments, if the maximum distance from the curve to
+        an approximation segment is bigger than `distance` the segment will be
+        subdivided, see :func:`~ezdxf.math.bezier_flattening`.
 
         Args:
-            distance: maximum distance from the center of the cubic (C3)
-                curve to the center of the linear (C1) curve between two
-                approximation points to determine if a segment should be
-                subdivided.
+            distance: maximum distance from the cubic (C3) curve to the
+                linear (C1) approximation segment
             segments: minimum segment count
 
         .. versionadded:: 0.15
 
         """
+        return bezier_flattening(self._control_points, distance, segments)
 
-        def subdiv(start_point, end_point, start_t: float, end_t: float):
-            mid_t = (start_t + end_t) * 0.5
-            mid_point = self._get_curve_point(mid_t)
-            chk_point = start_point.lerp(end_point)
-            # center point point is faster than projecting mid point onto
-            # vector start -> end:
-            if chk_point.distance(mid_point) < distance:
-                yield end_point
-            else:
-                yield from subdiv(start_point, mid_point, start_t, mid_t)
-                yield from subdiv(mid_point, end_point, mid_t, end_t)
-
-        dt = 1.0 / segments
-        t0 = 0.0
-        start_point = self._control_points[0]
-        yield start_point
-        while t0 < 1.0:
-            t1 = t0 + dt
-            if math.isclose(t1, 1.0):
-                end_point = self._control_points[3]
-                t1 = 1.0
-            else:
-                end_point = self._get_curve_point(t1)
-            yield from subdiv(start_point, end_point, t0, t1)
-            t0 = t1
-            start_point = end_point
+    def _get_curve_points(self, params: Iterable[float]
+                          ) -> List[Union[Vector, Vec2]]:
+        # Float arithmetic: creates only one vector object per point
+        b1, b2, b3, b4 = self._control_points
+        x1, x2, x3, x4 = b1.x, b2.x, b3.x, b4.x
+        y1, y2, y3, y4 = b1.y, b2.y, b3.y, b4.y
+        points = []
+        if type(b1) is Vec2:
+            for t in params:
+                a, b, c, d = bernstein3(t)
+                points.append(Vec2(
+                    x1 * a + x2 * b + x3 * c + x4 * d,
+                    y1 * a + y2 * b + y3 * c + y4 * d,
+                ))
+        else:
+            z1, z2, z3, z4 = b1.z, b2.z, b3.z, b4.z
+            for t in params:
+                a, b, c, d = bernstein3(t)
+                points.append(Vector(
+                    x1 * a + x2 * b + x3 * c + x4 * d,
+                    y1 * a + y2 * b + y3 * c + y4 * d,
+                    z1 * a + z2 * b + z3 * c + z4 * d,
+                ))
+        return points
 
     def _get_curve_point(self, t: float) -> Union[Vector, Vec2]:
         b1, b2, b3, b4 = self._control_points
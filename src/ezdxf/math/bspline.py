@@ -17,17 +17,21 @@ https://www.cl.cam.ac.uk/teaching/2000/AGraphHCI/SMEG/node5.html:
 https://books.google.at/books/about/The_NURBS_Book.html?id=7dqY5dyAwWkC&redir_esc=y
 
 """
-from typing import List, Iterable, Sequence, TYPE_CHECKING, Dict, Tuple, Optional, Union
+from typing import (
+    List, Iterable, Sequence, TYPE_CHECKING, Dict, Tuple, Optional, Callable,
+)
 import math
 import bisect
+from functools import lru_cache
+from operator import mul
 from .vector import Vector, NULLVEC
 from .parametrize import create_t_vector, estimate_tangents, estimate_end_tangent_magnitude
 from .linalg import (
-    LUDecomposition, Matrix, BandedMatrixLU, compact_banded_matrix, detect_banded_matrix,
-    quadratic_equation, binomial_coefficient,
+    LUDecomposition, BandedMatrixLU, banded_matrix_from_rows, quadratic_equation,
+    binomial_coefficient,
 )
 from .construct2d import linspace
-from .construct3d import distance_point_line_3d
+from .flattening import bezier_flattening
 from ezdxf.lldxf.const import DXFValueError
 from ezdxf import PYPY
 
@@ -42,6 +46,11 @@ if TYPE_CHECKING:
 USE_BANDED_MATRIX_SOLVER_CPYTHON_LIMIT = 15
 USE_BANDED_MATRIX_SOLVER_PYPY_LIMIT = 60
 
+# Count of cached basis function matrices, see basis_matrix():
+BASIS_MATRIX_CACHE_SIZE = 32
+# Max. segment count of a cached basis function matrix:
+BASIS_MATRIX_CACHE_MAX_SEGMENTS = 4096
+
 __all__ = [
     # High level functions:
     'fit_points_to_cad_cv', 'global_bspline_interpolation',
@@ -449,24 +458,33 @@ def double_knots(n: int, p: int, t: Sequence[float]) -> List[float]:
     return u
 
 
-def _get_best_solver(matrix: Union[List, Matrix], degree: int):
+SparseRow = Tuple[int, List[float]]
+
+
+def _get_best_solver(rows: List[SparseRow]):
     """ Returns best suited linear equation solver depending on matrix
     configuration and python interpreter.
+
+    The square matrix is given by sparse rows as ``(start, values)`` tuples,
+    see :func:`~ezdxf.math.linalg.banded_matrix_from_rows`. Large matrices
+    are built in compact banded form without creating the full matrix.
+
     """
-    A = matrix if isinstance(matrix, Matrix) else Matrix(matrix=matrix)
     if PYPY:
         limit = USE_BANDED_MATRIX_SOLVER_PYPY_LIMIT
     else:
         limit = USE_BANDED_MATRIX_SOLVER_CPYTHON_LIMIT
-    if A.nrows < limit:  # use default equation solver
-        lu = LUDecomposition(A)
+    count = len(rows)
+    if count < limit:  # use default equation solver
+        lu = LUDecomposition(
+            [0.0] * start + values + [0.0] * (count - start - len(values))
+            for start, values in rows
+        )
     else:
         # Theory: band parameters m1, m2 are at maximum degree-1, for
         # B-spline interpolation and approximation:
         # m1 = m2 = degree-1
-        # But the speed gain is not that big and just to be sure:
-        m1, m2 = detect_banded_matrix(A, check_all=False)
-        A = compact_banded_matrix(A, m1, m2)
+        A, m1, m2 = banded_matrix_from_rows(rows)
         lu = BandedMatrixLU(A, m1, m2)
     return lu
 
@@ -495,7 +513,7 @@ def unconstrained_global_bspline_interpolation(
     # Source: http://pages.mtu.edu/~shene/COURSES/cs3621/NOTES/INT-APP/CURVE-INT-global.html
     knots = knots_from_parametrization(len(fit_points) - 1, degree, t_vector, knot_generation_method, constrained=False)
     N = Basis(knots=knots, order=degree + 1, count=len(fit_points))
-    solver = _get_best_solver([N.basis_vector(t) for t in t_vector], degree)
+    solver = _get_best_solver([N.basis_row(t) for t in t_vector])
     control_points = solver.solve_matrix(fit_points)
     return Vector.list(control_points.rows()), knots
 
@@ -535,14 +553,13 @@ def global_bspline_interpolation_end_tangents(
     knots = knots_from_parametrization(n + 2, p, t_vector, knot_generation_method, constrained=True)
 
     N = Basis(knots=knots, order=p + 1, count=n + 3)
-    rows = [N.basis_vector(u) for u in t_vector]
-    spacing = [0.0] * (n + 1)
-    rows.insert(1, [-1.0, +1.0] + spacing)
-    rows.insert(-1, spacing + [-1.0, +1.0])
+    rows = [N.basis_row(u) for u in t_vector]
+    rows.insert(1, (0, [-1.0, +1.0]))
+    rows.insert(-1, (n + 1, [-1.0, +1.0]))
     fit_points.insert(1, start_tangent * (knots[p + 1] / p))
     fit_points.insert(-1, end_tangent * ((1.0 - knots[-(p + 2)]) / p))
 
-    solver = _get_best_solver(rows, degree)
+    solver = _get_best_solver(rows)
     control_points = solver.solve_matrix(fit_points)
     return Vector.list(control_points.rows()), knots
 
@@ -572,10 +589,8 @@ def global_bspline_interpolation_first_derivatives(
 
     def nbasis(t: float):
         span = N.find_span(t)
-        front = span - p
-        back = count + p + 1 - span
         for basis in N.basis_funcs_derivatives(span, t, n=1):
-            yield [0.0] * front + basis + [0.0] * back
+            yield span - p, basis
 
     p = degree
     n = len(fit_points) - 1
@@ -583,14 +598,14 @@ def global_bspline_interpolation_first_derivatives(
     count = len(fit_points) * 2
     N = Basis(knots=knots, order=p + 1, count=count)
     A = [
-        [1.0] + [0.0] * (count - 1),  # Q0
-        [-1.0, +1.0] + [0.0] * (count - 2),  # D0
+        (0, [1.0]),  # Q0
+        (0, [-1.0, +1.0]),  # D0
     ]
     for f in (nbasis(t) for t in t_vector[1:-1]):
         A.extend(f)  # Qi, Di
     # swapped equations!
-    A.append([0.0] * (count - 2) + [-1.0, +1.0])  # Dn
-    A.append([0.0] * (count - 1) + [+1.0])  # Qn
+    A.append((count - 2, [-1.0, +1.0]))  # Dn
+    A.append((count - 1, [+1.0]))  # Qn
 
     # Build right handed matrix B
     B = []
@@ -603,7 +618,7 @@ def global_bspline_interpolation_first_derivatives(
     # modify equation for derivatives D0 and Dn
     B[1] *= knots[p + 1] / p
     B[-2] *= (1.0 - knots[-(p + 2)]) / p
-    solver = _get_best_solver(A, degree)
+    solver = _get_best_solver(A)
     control_points = solver.solve_matrix(B)
     return Vector.list(control_points.rows()), knots
 
@@ -661,6 +676,57 @@ def local_cubic_bspline_interpolation_from_tangents(
     return control_points, knots
 
 
+@lru_cache(maxsize=BASIS_MATRIX_CACHE_SIZE)
+def basis_matrix(knots: Tuple[float, ...], order: int, count: int,
+                 start: float, stop: float, segments: int, n: int = 0
+                 ) -> Tuple[Tuple[int, ...], Tuple[Tuple[Sequence[float], ...], ...]]:
+    """ Returns the basis function matrix of a non-rational B-spline for
+    ``segments + 1`` evenly spaced parameters from `start` to `stop` as tuple
+    ``(spans, rows)``. Row i contains the non-zero basis functions of
+    parameter i and their derivatives up to `n` as ``n + 1`` sequences of
+    `order` values, which are the coefficients of the control points
+    ``spans[i] - order + 1`` to ``spans[i]``.
+
+    The matrices are cached by the arguments, rational B-splines use the
+    non-rational basis functions and apply the weights at evaluation.
+
+    (internal API)
+
+    """
+    return _basis_matrix(
+        Basis(knots, order, count), uniform_params(start, stop, segments), n)
+
+
+def uniform_params(start: float, stop: float, segments: int) -> List[float]:
+    """ Returns ``segments + 1`` evenly spaced parameters from `start` to
+    `stop`, the last parameter is exact `stop`. (internal API)
+    """
+    params = list(linspace(start, stop, segments + 1))
+    if segments > 0:
+        params[-1] = stop
+    return params
+
+
+def _basis_matrix(basis: 'Basis', params: Iterable[float], n: int = 0):
+    # Uncached basis function matrix of the non-rational `basis`.
+    find_span = basis.find_span
+    spans = []
+    rows = []
+    if n == 0:
+        basis_funcs = basis.basis_funcs
+        for u in params:
+            span = find_span(u)
+            spans.append(span)
+            rows.append((basis_funcs(span, u),))
+    else:
+        basis_funcs_derivatives = basis.basis_funcs_derivatives
+        for u in params:
+            span = find_span(u)
+            spans.append(span)
+            rows.append(tuple(basis_funcs_derivatives(span, u, n)))
+    return tuple(spans), tuple(rows)
+
+
 class Basis:
     def __init__(self, knots: Iterable[float], order: int, count: int, weights: Sequence[float] = None):
         self.knots: List[float] = list(knots)
@@ -686,6 +752,14 @@ class Basis:
         basis = self.basis_funcs(span, t)
         return ([0.0] * front) + basis + ([0.0] * back)
 
+    def basis_row(self, t: float) -> Tuple[int, List[float]]:
+        """ Returns the non-zero part of the basis vector as tuple
+        ``(start, basis)``, where `start` is the index of the first basis
+        function.
+        """
+        span = self.find_span(t)
+        return span - self.order + 1, self.basis_funcs(span, t)
+
     def find_span(self, u: float) -> int:
         """ Determine the knot span index. """
         # Linear search is more reliable than binary search of the Algorithm A2.1
@@ -813,6 +887,107 @@ class Basis:
         N = self.basis_funcs(span, u)
         return sum(N[i] * control_points[span - p + i] for i in range(p + 1))
 
+    def evaluate(self, params: Iterable[float],
+                 control_points: Sequence[Vector],
+                 n: int = 0) -> List[List[Vector]]:
+        """ Returns points and derivatives up to `n` for all parameters
+        `params` as list of ``n + 1`` vectors for each parameter.
+
+        The basis function matrix of all parameters is calculated at once,
+        the points and derivatives are evaluated as product of the sparse
+        basis function matrix and the control points.
+
+        """
+        return self.evaluator(control_points, n)(params)
+
+    def evaluate_uniform(self, start: float, stop: float, segments: int,
+                         control_points: Sequence[Vector],
+                         n: int = 0) -> List[List[Vector]]:
+        """ Returns points and derivatives up to `n` for ``segments + 1``
+        evenly spaced parameters from `start` to `stop`, like
+        :meth:`evaluate`.
+
+        The basis function matrix is cached by :func:`basis_matrix` for
+        up to ``BASIS_MATRIX_CACHE_MAX_SEGMENTS`` segments.
+
+        """
+        if segments <= BASIS_MATRIX_CACHE_MAX_SEGMENTS:
+            matrix = basis_matrix(
+                tuple(self.knots), self.order, self.count, start, stop,
+                segments, n)
+        else:
+            matrix = _basis_matrix(
+                Basis(self.knots, self.order, self.count),
+                uniform_params(start, stop, segments), n)
+        return self.matrix_evaluator(control_points)(*matrix)
+
+    def evaluator(self, control_points: Sequence[Vector], n: int = 0
+                  ) -> Callable[[Iterable[float]], List[List[Vector]]]:
+        """ Returns the batch evaluation function of :meth:`evaluate` for
+        the given `control_points`, which evaluates the points and
+        derivatives up to `n` for a list of parameters. The control point
+        coordinates are prepared only once for repeated evaluations.
+        """
+        # Non-rational basis functions, matrix_evaluator() applies the
+        # weights of a rational B-spline:
+        basis = Basis(self.knots, self.order, self.count)
+        evaluate_matrix = self.matrix_evaluator(control_points)
+
+        def evaluate(params: Iterable[float]) -> List[List[Vector]]:
+            return evaluate_matrix(*_basis_matrix(basis, params, n))
+
+        return evaluate
+
+    def matrix_evaluator(self, control_points: Sequence[Vector]
+                         ) -> Callable[..., List[List[Vector]]]:
+        """ Returns the evaluation function of the `control_points` for a
+        basis function matrix ``(spans, rows)`` of :func:`basis_matrix`.
+        """
+        p = self.order - 1
+        order = self.order
+        x = [v.x for v in control_points]
+        y = [v.y for v in control_points]
+        z = [v.z for v in control_points]
+        rational = self.is_rational
+        if rational:
+            # Homogeneous point representation: (x*w, y*w, z*w, w)
+            w = list(self.weights)
+            x = list(map(mul, x, w))
+            y = list(map(mul, y, w))
+            z = list(map(mul, z, w))
+
+        def evaluate(spans: Sequence[int],
+                     rows: Sequence[Sequence[Sequence[float]]]
+                     ) -> List[List[Vector]]:
+            result = []
+            for span, derivatives in zip(spans, rows):
+                start = span - p
+                end = start + order
+                cx = x[start:end]
+                cy = y[start:end]
+                cz = z[start:end]
+                CK = [
+                    Vector(sum(map(mul, N, cx)), sum(map(mul, N, cy)),
+                           sum(map(mul, N, cz)))
+                    for N in derivatives
+                ]
+                if rational:
+                    cw = w[start:end]
+                    wders = [sum(map(mul, N, cw)) for N in derivatives]
+                    if wders[0] == 0.0:
+                        CK = [NULLVEC] * len(CK)
+                    else:
+                        # Source: The NURBS Book: Algorithm A4.2
+                        for k in range(len(CK)):
+                            v = CK[k]
+                            for i in range(1, k + 1):
+                                v -= binomial_coefficient(k, i) * wders[i] * CK[k - i]
+                            CK[k] = v / wders[0]
+                result.append(CK)
+            return result
+
+        return evaluate
+
     def curve_derivatives(self, u: float, control_points: Sequence[Vector], n: int = 1) -> List[Vector]:
         # Source: The NURBS Book: Algorithm A3.2
         p = self.order - 1
@@ -991,47 +1166,48 @@ class BSpline:
 
     def approximate(self, segments: int = 20) -> Iterable[Vector]:
         """ Approximates curve by vertices as :class:`Vector` objects, vertices count = segments + 1. """
-        yield from self.points(self.params(segments))
+        start, stop = self._uniform_range()
+        for points in self.basis.evaluate_uniform(
+                start, stop, segments, self.control_points):
+            yield points[0]
+
+    def _uniform_range(self) -> Tuple[float, float]:
+        # Parameter range of params()
+        return 0.0, self.max_t
 
     def flattening(self, distance: float,
                    segments: int = 4) -> Iterable[Vector]:
-        """ Adaptive recursive flattening. The argument `segments` is the
-        minimum count of approximation segments between two knots, if the
-        distance from the center of the approximation segment to the curve is
-        bigger than `distance` the segment will be subdivided.
+        """ Adaptive flattening. The argument `segments` is the minimum count
+        of approximation segments between two knots, if the maximum distance
+        from the curve to an approximation segment is bigger than `distance`
+        the segment will be subdivided.
+
+        The B-spline is decomposed into Bézier curves, one for each knot span
+        of the valid parameter range from knot[p] to knot[n+1], and each
+        Bézier curve is flattened by :func:`~ezdxf.math.bezier_flattening`.
+        A B-spline segment lies inside the convex hull of its local control
+        points, therefore `distance` is an upper bound of the distance from
+        the curve to the approximation segments.
 
         Args:
-            distance: maximum distance from the projected curve point onto the
-                segment chord.
+            distance: maximum distance from the curve to the approximation
+                segment
             segments: minimum segment count between two knots
 
         .. versionadded:: 0.15
 
         """
-
-        def subdiv(s: Vector, e: Vector, start_t: float, end_t: float):
-            mid_t = (start_t + end_t) * 0.5
-            m = self.point(mid_t)
-            if distance_point_line_3d(m, s, e) < distance:
-                yield e
-            else:
-                yield from subdiv(s, m, start_t, mid_t)
-                yield from subdiv(m, e, mid_t, end_t)
-
-        knots = sorted(set(self.knots()))
-        t = 0.0
-        start_point = self.point(t)
-        yield start_point
-        for t1 in knots[1:]:
-            delta = (t1 - t) / segments
-            while t < t1:
-                next_t = t + delta
-                if math.isclose(next_t, t1):
-                    next_t = t1
-                end_point = self.point(next_t)
-                yield from subdiv(start_point, end_point, t, next_t)
-                t = next_t
-                start_point = end_point
+        first = True
+        for control_points, weights in _bezier_segments(
+                self.knots(), self.degree, self.control_points,
+                self.weights()):
+            vertices = iter(bezier_flattening(
+                control_points, distance, segments, weights=weights))
+            if first:
+                first = False
+            else:  # start vertex is the end vertex of the previous segment
+                next(vertices)
+            yield from vertices
 
     def params(self, segments: int) -> Iterable[float]:
         """ Yield evenly spaced parameters from 0 to max_t for given segment count. """
@@ -1057,8 +1233,13 @@ class BSpline:
             t: parameters in range [0, max_t]
 
         """
-        for u in t:
-            yield self.point(u)
+        for points in self.basis.evaluate(self._clamp_params(t), self.control_points):
+            yield points[0]
+
+    def _clamp_params(self, t: Iterable[float]) -> Iterable[float]:
+        max_t = self.max_t
+        isclose = math.isclose
+        return (max_t if isclose(u, max_t) else u for u in t)
 
     def derivative(self, t: float, n: int = 2) -> List[Vector]:
         """
@@ -1092,8 +1273,7 @@ class BSpline:
             List of n+1 values as :class:`Vector` objects
 
         """
-        for u in t:
-            yield self.derivative(u, n)
+        yield from self.basis.evaluate(self._clamp_params(t), self.control_points, n)
 
     def insert_knot(self, t: float) -> None:
         """
@@ -1265,6 +1445,50 @@ class BSpline:
         return params
 
 
+def _bezier_segments(knots: Sequence[float], p: int,
+                     control_points: Sequence[Vector],
+                     weights: Sequence[float]
+                     ) -> Iterable[Tuple[List[Vector], Optional[List[float]]]]:
+    # Yields the control points and weights of the Bézier curves of the knot
+    # spans in the valid parameter range from knot[p] to knot[n+1], weights
+    # are None for non-rational B-splines. Works for rational and not clamped
+    # B-splines: inserts all knots of the valid range in homogeneous
+    # coordinates until each has the multiplicity p, see "The NURBS Book":
+    # Algorithm A5.1
+    knots = list(knots)
+    if weights:
+        points = [(v.x * w, v.y * w, v.z * w, w)
+                  for v, w in zip(control_points, weights)]
+    else:
+        points = [(v.x, v.y, v.z, 1.0) for v in control_points]
+
+    for u in sorted(set(knots[p: len(points) + 1])):
+        # index of the last knot <= u:
+        k = bisect.bisect_right(knots, u) - 1
+        mult = knots.count(u)
+        for _ in range(p - mult):
+            new_points = []
+            for i in range(k - p + 1, k - mult + 1):
+                a = (u - knots[i]) / (knots[i + p] - knots[i])
+                new_points.append(tuple(
+                    c0 + (c1 - c0) * a for c0, c1 in zip(points[i - 1],
+                                                           points[i])
+                ))
+            points[k - p + 1: k - mult] = new_points
+            knots.insert(k + 1, u)
+            k += 1
+            mult += 1
+
+    for i in range(p, len(points)):
+        if knots[i] < knots[i + 1]:
+            segment = points[i - p: i + 1]
+            if weights:
+                yield [Vector(x / w, y / w, z / w) for x, y, z, w in segment], \
+                      [w for x, y, z, w in segment]
+            else:
+                yield [Vector(x, y, z) for x, y, z, w in segment], None
+
+
 def subdivide_params(p: List[float]) -> Iterable[float]:
     for i in range(len(p) - 1):
         yield p[i]
@@ -1292,6 +1516,9 @@ class BSplineU(BSpline):
         for i in range(segments + 1):
             yield base + i * step
 
+    def _uniform_range(self) -> Tuple[float, float]:
+        return float(self.order - 1), float(self.count)
+
     def t_array(self) -> List[float]:
         raise NotImplemented
 
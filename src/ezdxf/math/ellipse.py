@@ -3,10 +3,10 @@
 from typing import TYPE_CHECKING, Iterable, Dict, Tuple
 import math
 from .vector import Vector, NULLVEC, X_AXIS, Z_AXIS
-from .construct3d import distance_point_line_3d
 from .matrix44 import Matrix44
 from .ucs import OCS
 from .construct2d import enclosing_angles, linspace
+from .flattening import adaptive_flattening
 
 pi2 = math.pi / 2
 
@@ -244,41 +244,54 @@ class ConstructionEllipse:
             yield center + x + y
 
     def flattening(self, distance: float, segments: int = 4) -> Iterable[Vector]:
-        """ Adaptive recursive flattening. The argument `segments` is the
-        minimum count of approximation segments, if the distance from the center
-        of the approximation segment to the curve is bigger than `distance` the
-        segment will be subdivided. Returns a closed polygon for a full ellipse:
-        start vertex == end vertex.
+        """ Adaptive flattening. The argument `segments` is the minimum count
+        of approximation segments, if the maximum distance from the curve to
+        an approximation segment is bigger than `distance` the segment will be
+        subdivided, see :func:`~ezdxf.math.adaptive_flattening`.
+        Returns a closed polygon for a full ellipse: start vertex == end vertex.
+
+        An elliptic arc is the affine image of a circular arc, the arc of a
+        segment lies inside the parallelogram of the segment chord and the
+        sagitta vector from the chord center to the curve center point, if the
+        segment spans not more than 180 degrees. The length of the sagitta
+        vector is an upper bound of the distance from the curve to the
+        approximation segment.
 
         Args:
-            distance: maximum distance from the projected curve point onto the
-                segment chord.
+            distance: maximum distance from the curve to the approximation
+                segment
             segments: minimum segment count
 
         .. versionadded:: 0.15
 
         """
 
-        def vertex_(p: float) -> Vector:
-            x = math.cos(p) * radius_x * x_axis
-            y = math.sin(p) * radius_y * y_axis
-            return self.center + x + y
-
-        def subdiv(s: Vector, e: Vector, s_param: float, e_param: float):
-            m_param = (s_param + e_param) * 0.5
-            m = vertex_(m_param)
-            if distance_point_line_3d(m, s, e) < distance:
-                yield e
-            else:
-                yield from subdiv(s, m, s_param, m_param)
-                yield from subdiv(m, e, m_param, e_param)
-
-        x_axis = self.major_axis.normalize()
-        y_axis = self.minor_axis.normalize()
-        radius_x = self.major_axis.magnitude
-        radius_y = radius_x * self.ratio
-
-        delta = self.param_span / segments
+        def vertices(params: Iterable[float]) -> Iterable[Vector]:
+            # Float arithmetic: creates only one Vector object per vertex
+            cos = math.cos
+            sin = math.sin
+            for p in params:
+                c = cos(p)
+                s = sin(p)
+                yield Vector(cx + xx * c + yx * s, cy + xy * c + yy * s,
+                             cz + xz * c + yz * s)
+
+        def sagitta(start: Vector, center: Vector, end: Vector) -> float:
+            return math.sqrt(
+                (center.x - (start.x + end.x) * 0.5) ** 2 +
+                (center.y - (start.y + end.y) * 0.5) ** 2 +
+                (center.z - (start.z + end.z) * 0.5) ** 2
+            )
+
+        cx, cy, cz = self.center.xyz
+        xx, xy, xz = self.major_axis.xyz
+        yx, yy, yz = self.major_axis.magnitude * self.ratio * \
+            self.minor_axis.normalize()
+
+        param_span = self.param_span
+        # the sagitta is an error bound for segments up to 180 degrees:
+        segments = max(segments, math.ceil(param_span / math.pi))
+        delta = param_span / segments
         param = self.start_param % math.tau
         if math.isclose(self.end_param, math.tau):
             end_param = math.tau
@@ -290,16 +303,14 @@ class ConstructionEllipse:
         elif param > end_param:
             end_param += math.tau
 
-        start_point = vertex_(param)
-        yield start_point
+        params = [param]
         while param < end_param:
-            next_end_param = param + delta
-            if math.isclose(next_end_param, end_param):
-                next_end_param = end_param
-            end_point = vertex_(next_end_param)
-            yield from subdiv(start_point, end_point, param, next_end_param)
-            param = next_end_param
-            start_point = end_point
+            param += delta
+            if math.isclose(param, end_param):
+                param = end_param
+            params.append(param)
+        yield from adaptive_flattening(vertices, params, distance,
+                                       error_bound=sagitta)
 
     def params_from_vertices(self, vertices: Iterable['Vertex']) -> Iterable[float]:
         """
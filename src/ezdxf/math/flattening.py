@@ -0,0 +1,263 @@
+# Copyright (c) 2020, Manfred Moitzi
+# License: MIT License
+from typing import Callable, Iterable, List, Tuple, Any, Sequence, Optional
+import math
+from .vector import Vector, Vec2
+
+__all__ = [
+    'adaptive_flattening', 'bezier_flattening', 'chord_error',
+    'MAX_FLATTENING_SEGMENTS',
+]
+
+# Default segment budget of the adaptive flattening:
+MAX_FLATTENING_SEGMENTS = 100_000
+
+# Evaluator type: returns the curve points for a list of parameters as
+# Vector or Vec2 objects.
+Evaluator = Callable[[List[float]], Iterable[Any]]
+
+# Error bound type: returns an upper bound of the chord error of a segment
+# for the segment start, center and end point.
+ErrorBound = Callable[[Any, Any, Any], float]
+
+
+def chord_error(samples: Iterable[Any], start: Any, end: Any) -> float:
+    """ Returns the maximum distance of the curve `samples` to the chord
+    (line segment) from `start` to `end`. All points as :class:`Vector` or
+    :class:`Vec2` objects.
+    """
+    return math.sqrt(_chord_error_sq(
+        [_xyz(p) for p in samples], _xyz(start), _xyz(end)))
+
+
+def _xyz(point: Any) -> Tuple[float, float, float]:
+    return point.x, point.y, getattr(point, 'z', 0.0)
+
+
+def _chord_error_sq(points: Iterable[Tuple[float, float, float]],
+                    start: Tuple[float, float, float],
+                    end: Tuple[float, float, float]) -> float:
+    # Float arithmetic, because this function is called for each segment
+    # and creating Vector objects is expensive:
+    sx, sy, sz = start
+    dx = end[0] - sx
+    dy = end[1] - sy
+    dz = end[2] - sz
+    length_sq = dx * dx + dy * dy + dz * dz
+    error = 0.0
+    for x, y, z in points:
+        vx = x - sx
+        vy = y - sy
+        vz = z - sz
+        if length_sq > 0.0:
+            t = (vx * dx + vy * dy + vz * dz) / length_sq
+            # clamp projection onto chord to the chord end points:
+            if t > 0.0:
+                if t > 1.0:
+                    t = 1.0
+                vx -= dx * t
+                vy -= dy * t
+                vz -= dz * t
+        d = vx * vx + vy * vy + vz * vz
+        if d > error:
+            error = d
+    return error
+
+
+def adaptive_flattening(points: Evaluator, params: Iterable[float],
+                        distance: float,
+                        max_segments: int = MAX_FLATTENING_SEGMENTS,
+                        error_bound: Optional[ErrorBound] = None
+                        ) -> Iterable[Any]:
+    """ Adaptive flattening of a parametric curve, yields the vertices of the
+    approximation polyline.
+
+    The initial segments given by the ascending parameters `params` are
+    subdivided at the parameter center until the chord error of each segment
+    is smaller than `distance`. The chord error is the result of the
+    callable `error_bound`, if given. Without `error_bound` the chord error is
+    a sampled estimate: the maximum distance of the curve points at 1/4, 1/2
+    and 3/4 of the segment parameter span to the segment chord, see
+    :func:`chord_error`. This is not an upper bound of the distance from the
+    curve to the chord, curve features between the sample points can exceed
+    `distance`. The curve points of the segment center are reused by the
+    subdivided segments.
+
+    Bézier curves and B-splines have a convex hull property and can use the
+    error bound of :func:`bezier_flattening`.
+
+    The subdivision is depth first by an explicit stack without recursion
+    and stops when the count of segments reaches `max_segments`, the initial
+    segments are not limited by this budget.
+
+    Args:
+        points: batch evaluator, a callable which returns the curve points
+            for a list of parameters as :class:`Vector` or :class:`Vec2`
+            objects
+        params: ascending curve parameters of the initial segments, at least
+            two parameters
+        distance: maximum chord error
+        max_segments: segment budget
+        error_bound: callable ``error_bound(start, center, end)``, which
+            returns an upper bound of the chord error of a segment for the
+            segment start, center and end point
+
+    """
+    params = list(params)
+    count = len(params)
+    if count < 2:
+        return
+    centers = [(t0 + t1) * 0.5 for t0, t1 in zip(params, params[1:])]
+    vertices = list(points(params + centers))
+    budget = max_segments - count + 1
+    yield vertices[0]
+
+    # Segment: start param, start point, end param, end point, center point
+    stack: List[Tuple[float, Any, float, Any, Any]] = []
+    for index in range(count - 1):
+        stack.append((
+            params[index], vertices[index],
+            params[index + 1], vertices[index + 1],
+            vertices[count + index],
+        ))
+        while stack:
+            t0, p0, t1, p1, pm = stack.pop()
+            if budget > 0:
+                tm = (t0 + t1) * 0.5
+                if error_bound is None:
+                    # The quarter points are the center points of the
+                    # subdivided segments:
+                    q1, q3 = points([(t0 + tm) * 0.5, (tm + t1) * 0.5])
+                    error = chord_error((q1, pm, q3), p0, p1)
+                else:
+                    error = error_bound(p0, pm, p1)
+                    q1 = None
+                if error >= distance:
+                    if q1 is None:
+                        q1, q3 = points([(t0 + tm) * 0.5, (tm + t1) * 0.5])
+                    budget -= 1
+                    stack.append((tm, pm, t1, p1, q3))
+                    stack.append((t0, p0, tm, pm, q1))
+                    continue
+            yield p1
+
+
+def bezier_flattening(control_points: Sequence[Any], distance: float,
+                      segments: int = 1,
+                      max_segments: int = MAX_FLATTENING_SEGMENTS,
+                      weights: Sequence[float] = None) -> Iterable[Any]:
+    """ Adaptive flattening of a Bézier curve of any degree, yields the
+    vertices of the approximation polyline.
+
+    The curve is split into `segments` initial segments of equal parameter
+    span and each segment is subdivided at the parameter center by the
+    algorithm of de Casteljau until the chord error of each segment is
+    smaller than `distance`. A Bézier segment lies inside the convex hull of
+    its control points, therefore the maximum distance of the control points
+    to the segment chord is an upper bound of the distance from the curve to
+    the chord. This is also true for a rational Bézier curve with positive
+    `weights`, which is subdivided in homogeneous coordinates.
+
+    The subdivision is depth first by an explicit stack without recursion
+    and stops when the count of segments reaches `max_segments`, the initial
+    segments are not limited by this budget.
+
+    Args:
+        control_points: control points as :class:`Vector` or :class:`Vec2`
+            objects, the vertices have the type of the first control point
+        distance: maximum distance from the curve to the approximation
+            segment
+        segments: count of initial segments
+        max_segments: segment budget
+        weights: positive weights of a rational Bézier curve, one weight for
+            each control point or ``None``
+
+    """
+    if len(control_points) < 2:
+        return
+    if type(control_points[0]) is Vec2:
+        def vertex(p):
+            return Vec2(p[0], p[1])
+    else:
+        def vertex(p):
+            return Vector(p)
+    distance_sq = distance * distance
+    budget = max_segments - segments
+    yield control_points[0]
+
+    if weights:
+        # Homogeneous coordinates, the convex hull is build by the
+        # projected control points:
+        curve = [
+            (x * w, y * w, z * w, w)
+            for (x, y, z), w in zip((_xyz(p) for p in control_points),
+                                    weights)
+        ]
+        split = _split_rational
+    else:
+        curve = [_xyz(p) for p in control_points]
+        split = _split
+
+    stack: List[List[Tuple[float, ...]]] = []
+    for index in range(segments, 0, -1):
+        if index > 1:
+            segment, curve = split(curve, 1.0 / index)
+        else:
+            segment = curve
+        stack.append(segment)
+        while stack:
+            segment = stack.pop()
+            points = _project(segment) if weights else segment
+            if budget > 0 and _chord_error_sq(
+                    points[1:-1], points[0], points[-1]) >= distance_sq:
+                budget -= 1
+                left, right = split(segment, 0.5)
+                stack.append(right)
+                stack.append(left)
+                continue
+            if index == 1 and not stack:
+                # exact end point of the curve
+                yield control_points[-1]
+            else:
+                yield vertex(points[-1])
+
+
+def _split(points: List[Tuple[float, float, float]], t: float
+           ) -> Tuple[List[Tuple[float, float, float]],
+                      List[Tuple[float, float, float]]]:
+    # Algorithm of de Casteljau, returns the control points of the curve
+    # segments [0, t] and [t, 1].
+    left = [points[0]]
+    right = [points[-1]]
+    while len(points) > 1:
+        points = [
+            (x0 + (x1 - x0) * t, y0 + (y1 - y0) * t, z0 + (z1 - z0) * t)
+            for (x0, y0, z0), (x1, y1, z1) in zip(points, points[1:])
+        ]
+        left.append(points[0])
+        right.append(points[-1])
+    right.reverse()
+    return left, right
+
+
+def _split_rational(points: List[Tuple[float, float, float, float]], t: float
+                    ) -> Tuple[List[Tuple[float, float, float, float]],
+                               List[Tuple[float, float, float, float]]]:
+    # Algorithm of de Casteljau for homogeneous coordinates.
+    left = [points[0]]
+    right = [points[-1]]
+    while len(points) > 1:
+        points = [
+            (x0 + (x1 - x0) * t, y0 + (y1 - y0) * t, z0 + (z1 - z0) * t,
+             w0 + (w1 - w0) * t)
+            for (x0, y0, z0, w0), (x1, y1, z1, w1) in zip(points, points[1:])
+        ]
+        left.append(points[0])
+        right.append(points[-1])
+    right.reverse()
+    return left, right
+
+
+def _project(points: List[Tuple[float, float, float, float]]
+             ) -> List[Tuple[float, float, float]]:
+    return [(x / w, y / w, z / w) for x, y, z, w in points]
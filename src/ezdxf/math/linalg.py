@@ -9,7 +9,8 @@ import reprlib
 __all__ = [
     'Matrix', 'gauss_vector_solver', 'gauss_matrix_solver', 'gauss_jordan_solver', 'gauss_jordan_inverse',
     'LUDecomposition', 'freeze_matrix', 'tridiagonal_vector_solver', 'tridiagonal_matrix_solver',
-    'detect_banded_matrix', 'compact_banded_matrix', 'BandedMatrixLU', 'banded_matrix', 'quadratic_equation',
+    'detect_banded_matrix', 'compact_banded_matrix', 'BandedMatrixLU', 'banded_matrix', 'banded_matrix_from_rows',
+    'quadratic_equation',
     'binomial_coefficient',
 ]
 
@@ -870,6 +871,42 @@ def banded_matrix(A: Matrix, check_all=True) -> Tuple[Matrix, int, int]:
     return m, m1, m2
 
 
+def banded_matrix_from_rows(rows: Iterable[Tuple[int, Sequence[float]]]) -> Tuple[Matrix, int, int]:
+    """
+    Returns the compact banded matrix representation as :class:`Matrix`
+    object and the lower- and upper band count m1 and m2 of a square matrix
+    given by sparse rows, without building the full matrix.
+
+    Each row is a tuple ``(start, values)``, where `start` is the column index
+    of the first value and `values` are the consecutive values of the row
+    starting at this column, all other values of the row are 0.
+    The count of rows is the matrix size.
+
+    Args:
+        rows: sparse rows as iterable of ``(start, values)`` tuples
+
+    """
+    rows = list(rows)
+    m1 = 0
+    m2 = 0
+    for index, (start, values) in enumerate(rows):
+        # leading and trailing zeros do not extend the band:
+        columns = [col for col, value in enumerate(values, start) if value]
+        if columns:
+            m1 = max(m1, index - columns[0])
+            m2 = max(m2, columns[-1] - index)
+
+    size = m1 + m2 + 1
+    matrix = []
+    for index, (start, values) in enumerate(rows):
+        row = [0.0] * size
+        for col, value in enumerate(values, start - index + m1):
+            if value:
+                row[col] = float(value)
+        matrix.append(row)
+    return Matrix(matrix=matrix), m1, m2
+
+
 def detect_banded_matrix(A: Matrix, check_all=True) -> Tuple[int, int]:
     """
     Returns lower- and upper band count m1 and m2.
@@ -1048,7 +1085,42 @@ class BandedMatrixLU:
         if B.nrows != self.nrows:
             raise ValueError('Row count of self and matrix B has to match.')
 
-        return Matrix(matrix=[self.solve_vector(col) for col in B.cols()]).transpose()
+        # Solve all columns of B in one pass:
+        cols = B.cols()
+        n = self.nrows
+        m1 = self.m1
+        m2 = self.m2
+        index = self.index
+        al = self.lower
+        au = self.upper
+
+        mm = m1 + m2 + 1
+        l = m1
+        for k in range(n):
+            j = index[k] - 1
+            if j != k:
+                for x in cols:
+                    x[k], x[j] = x[j], x[k]
+            if l < n:
+                l += 1
+            lower = al[k]
+            for j in range(k + 1, l):
+                dum = lower[j - k - 1]
+                for x in cols:
+                    x[j] -= dum * x[k]
+
+        l = 1
+        for i in range(n - 1, -1, -1):
+            upper = au[i]
+            for x in cols:
+                dum = x[i]
+                for k in range(1, l):
+                    dum -= upper[k] * x[k + i]
+                x[i] = dum / upper[0]
+            if l < mm:
+                l += 1
+
+        return Matrix(matrix=cols).transpose()
 
     def determinant(self) -> float:
         """ Returns the determinant of matrix. """
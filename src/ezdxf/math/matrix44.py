@@ -8,8 +8,10 @@
 from typing import Sequence, Iterable, List, Tuple, TYPE_CHECKING
 import math
 from math import sin, cos, tan
-from itertools import chain
+from itertools import chain, repeat
+from operator import add, mul
 from .vector import Vector, X_AXIS, Y_AXIS, Z_AXIS, NULLVEC
+from .vectorarray import VectorArray
 
 if TYPE_CHECKING:
     from ezdxf.eztypes import Vertex
@@ -23,6 +25,17 @@ def floats(items: Iterable) -> List[float]:
     return [float(v) for v in items]
 
 
+def _combine(x: Iterable[float], y: Iterable[float], z: Iterable[float],
+             a: float, b: float, c: float, d: float = 0.) -> Iterable[float]:
+    # Returns x * a + y * b + z * c + d for all values as chained map()
+    # iterators of C functions, without a Python function call per value:
+    values = map(add, map(add, map(mul, x, repeat(a)), map(mul, y, repeat(b))),
+                 map(mul, z, repeat(c)))
+    if d:
+        values = map(add, values, repeat(d))
+    return values
+
+
 class Matrix44:
     """
     This is a pure Python implementation for 4x4 transformation matrices, to avoid dependency to big numerical packages
@@ -518,6 +531,8 @@ class Matrix44:
     def transform_vertices(self, vectors: Iterable['Vertex']) -> Iterable[Vector]:
         """ Returns an iterable of transformed vertices. """
         m0, m1, m2, m3, m4, m5, m6, m7, m8, m9, m10, m11, m12, m13, m14, m15 = self.matrix
+        if isinstance(vectors, VectorArray):
+            vectors = vectors.xyz()
         for vector in vectors:
             x, y, z = vector
             yield Vector(
@@ -532,6 +547,8 @@ class Matrix44:
 
         """
         m0, m1, m2, m3, m4, m5, m6, m7, m8, m9, m10, *_ = self.matrix
+        if isinstance(vectors, VectorArray):
+            vectors = vectors.xyz()
         for vector in vectors:
             x, y, z = vector
             v = Vector(
@@ -541,6 +558,37 @@ class Matrix44:
             )
             yield v.normalize() if normalize else v
 
+    def transform_array(self, vectors: VectorArray) -> VectorArray:
+        """ Returns a new :class:`VectorArray` of transformed `vectors`, all
+        vertices are transformed at once without creating a :class:`Vector`
+        object for each vertex.
+
+        """
+        m = self.matrix
+        x, y, z = vectors.columns()
+        return VectorArray.from_xyz(
+            _combine(x, y, z, m[0], m[4], m[8], m[12]),
+            _combine(x, y, z, m[1], m[5], m[9], m[13]),
+            _combine(x, y, z, m[2], m[6], m[10], m[14]),
+        )
+
+    def transform_direction_array(self, vectors: VectorArray,
+                                  normalize=False) -> VectorArray:
+        """ Returns a new :class:`VectorArray` of transformed direction
+        `vectors` without translation, all vectors are transformed at once.
+
+        """
+        m = self.matrix
+        x, y, z = vectors.columns()
+        directions = VectorArray.from_xyz(
+            _combine(x, y, z, m[0], m[4], m[8]),
+            _combine(x, y, z, m[1], m[5], m[9]),
+            _combine(x, y, z, m[2], m[6], m[10]),
+        )
+        return directions.normalize() if normalize else directions
+
+    ocs_to_wcs_array = transform_direction_array
+
     def ucs_vertex_from_wcs(self, wcs: Vector) -> Vector:
         """
         Returns an UCS vector from WCS vertex.
@@ -571,6 +619,37 @@ class Matrix44:
 
     ocs_from_wcs = ucs_direction_from_wcs
 
+    def ucs_vertex_from_wcs_array(self, vectors: VectorArray) -> VectorArray:
+        """ Returns a new :class:`VectorArray` of UCS vertices from WCS
+        `vectors`, all vertices are transformed at once.
+
+        Works only if matrix is used as cartesian UCS without scaling.
+
+        (internal API)
+
+        """
+        return self.ucs_direction_from_wcs_array(vectors - self.origin)
+
+    def ucs_direction_from_wcs_array(self, vectors: VectorArray
+                                     ) -> VectorArray:
+        """ Returns a new :class:`VectorArray` of UCS directions from WCS
+        direction `vectors`, all vectors are transformed at once.
+
+        Works only if matrix is used as cartesian UCS without scaling.
+
+        (internal API)
+
+        """
+        m = self.matrix
+        x, y, z = vectors.columns()
+        return VectorArray.from_xyz(
+            _combine(x, y, z, m[0], m[1], m[2]),
+            _combine(x, y, z, m[4], m[5], m[6]),
+            _combine(x, y, z, m[8], m[9], m[10]),
+        )
+
+    ocs_from_wcs_array = ucs_direction_from_wcs_array
+
     def transpose(self) -> None:
         """ Swaps the rows for columns inplace. """
         m00, m01, m02, m03, \
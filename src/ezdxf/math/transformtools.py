@@ -6,6 +6,7 @@ import math
 from .matrix44 import Matrix44
 from .construct2d import sign
 from .vector import Vector, X_AXIS, Y_AXIS, Vec2
+from .vectorarray import VectorArray
 from .ucs import OCS
 
 if TYPE_CHECKING:
@@ -102,6 +103,21 @@ class OCSTransform:
         """ Returns vertex transformed from old OCS into new OCS. """
         return self.new_ocs.from_wcs(self.m.transform(self.old_ocs.to_wcs(vertex)))
 
+    def transform_array(self, vertices: VectorArray) -> VectorArray:
+        """ Returns :class:`VectorArray` of `vertices` transformed from old OCS
+        into new OCS, transforms all vertices at once.
+        """
+        # Chain all transformations into a single matrix, to transform the
+        # vertices in one pass:
+        matrices = [self.m]
+        if self.old_ocs.transform:
+            matrices.insert(0, self.old_ocs.matrix)
+        if self.new_ocs.transform:
+            from_wcs = self.new_ocs.matrix.copy()
+            from_wcs.transpose()  # inverse of the OCS rotation matrix
+            matrices.append(from_wcs)
+        return Matrix44.chain(*matrices).transform_array(vertices)
+
     def transform_2d_vertex(self, vertex: 'Vertex', elevation: float) -> Vec2:
         """ Returns 2D vertex transformed from old OCS into new OCS. """
         v = Vector(vertex).replace(z=elevation)
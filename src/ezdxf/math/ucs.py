@@ -2,6 +2,7 @@
 # License: MIT License
 from typing import TYPE_CHECKING, Tuple, Sequence, Iterable
 from .vector import Vector, X_AXIS, Y_AXIS, Z_AXIS
+from .vectorarray import VectorArray
 from .matrix44 import Matrix44
 
 if TYPE_CHECKING:
@@ -68,6 +69,15 @@ class OCS:
         else:
             yield from points
 
+    def array_from_wcs(self, points: VectorArray) -> VectorArray:
+        """ Returns :class:`VectorArray` of OCS vectors from WCS `points`,
+        transforms all points at once. Returns `points` unchanged if the OCS
+        is the WCS.
+        """
+        if self.transform:
+            return self.matrix.ocs_from_wcs_array(points)
+        return points
+
     def to_wcs(self, point: 'Vertex') -> 'Vertex':
         """ Returns WCS vector for OCS `point`. """
         if self.transform:
@@ -84,6 +94,15 @@ class OCS:
         else:
             yield from points
 
+    def array_to_wcs(self, points: VectorArray) -> VectorArray:
+        """ Returns :class:`VectorArray` of WCS vectors for OCS `points`,
+        transforms all points at once. Returns `points` unchanged if the OCS
+        is the WCS.
+        """
+        if self.transform:
+            return self.matrix.ocs_to_wcs_array(points)
+        return points
+
     def render_axis(self, layout: 'BaseLayout', length: float = 1, colors: Tuple[int, int, int] = (1, 3, 5)):
         """ Render axis as 3D lines into a `layout`. """
         render_axis(
@@ -177,6 +196,12 @@ class UCS:
         """ Returns iterable of WCS vectors for UCS `points`. """
         return self.matrix.transform_vertices(points)
 
+    def array_to_wcs(self, points: VectorArray) -> VectorArray:
+        """ Returns :class:`VectorArray` of WCS vectors for UCS `points`,
+        transforms all points at once.
+        """
+        return self.matrix.transform_array(points)
+
     def direction_to_wcs(self, vector: 'Vertex') -> 'Vector':
         """ Returns WCS direction for UCS `vector` without origin adjustment. """
         return self.matrix.transform_direction(vector)
@@ -191,6 +216,12 @@ class UCS:
         for point in points:
             yield from_wcs(point)
 
+    def array_from_wcs(self, points: VectorArray) -> VectorArray:
+        """ Returns :class:`VectorArray` of UCS vectors from WCS `points`,
+        transforms all points at once.
+        """
+        return self.matrix.ucs_vertex_from_wcs_array(points)
+
     def direction_from_wcs(self, vector: 'Vertex') -> 'Vector':
         """ Returns UCS vector for WCS `vector` without origin adjustment. """
         return self.matrix.ucs_direction_from_wcs(vector)
@@ -454,6 +485,9 @@ class PassTroughUCS(UCS):
         for point in points:
             yield Vector(point)
 
+    def array_to_wcs(self, points: VectorArray) -> VectorArray:
+        return points
+
     def to_ocs(self, point: 'Vertex') -> 'Vertex':
         return Vector(point)
 
@@ -473,3 +507,6 @@ class PassTroughUCS(UCS):
     def points_from_wcs(self, points: Iterable['Vertex']) -> Iterable[Vector]:
         for point in points:
             yield Vector(point)
+
+    def array_from_wcs(self, points: VectorArray) -> VectorArray:
+        return points
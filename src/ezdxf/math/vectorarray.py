@@ -0,0 +1,257 @@
+# Copyright (c) 2020, Manfred Moitzi
+# License: MIT License
+from typing import Iterable, List, Any, Union, Tuple, TYPE_CHECKING
+from array import array
+from functools import partial
+from itertools import repeat, chain
+from operator import add, sub, mul, neg
+import math
+from .vector import Vector
+
+if TYPE_CHECKING:
+    from ezdxf.eztypes import Vertex
+
+__all__ = ['VectorArray']
+
+
+class VectorArray:
+    """ Packed array of 3D vectors, all vectors are stored as interleaved
+    ``(x, y, z)`` coordinates in a single ``array.array('d')``.
+
+    The :class:`Vector` class is optimized for universality not for speed,
+    the operations of the :class:`VectorArray` class process all vectors at
+    once without creating a :class:`Vector` object for each vertex.
+
+    :class:`VectorArray` initialization:
+
+        - ``VectorArray()``, returns an empty array
+        - ``VectorArray(vertices)``, from an iterable of :class:`Vector`
+          compatible objects, 2D vertices get a z-axis of 0
+
+    Addition and subtraction of vector arrays of the same length or of a
+    single vector and multiplication and division by a scalar are supported
+    left and right handed, the results are new :class:`VectorArray`
+    objects::
+
+        a = VectorArray([(1, 2, 3), (4, 5, 6)])
+        a + (1, 1, 1) == VectorArray([(2, 3, 4), (5, 6, 7)])
+        a - a == VectorArray([(0, 0, 0), (0, 0, 0)])
+        2 * a == VectorArray([(2, 4, 6), (8, 10, 12)])
+
+    The :attr:`values` attribute supports the buffer protocol and can be
+    shared with NumPy without copying::
+
+        ndarray = numpy.frombuffer(a.values).reshape(-1, 3)
+
+    """
+    __slots__ = ('values',)
+
+    def __init__(self, vertices: Iterable['Vertex'] = None):
+        #: Interleaved ``(x, y, z)`` coordinates as ``array.array('d')``
+        self.values = array('d')
+        if isinstance(vertices, VectorArray):
+            self.values.extend(vertices.values)
+        elif vertices is not None:
+            extend = self.values.extend
+            for vertex in vertices:
+                if type(vertex) is not Vector:
+                    vertex = Vector(vertex)
+                extend(vertex.xyz)
+
+    @classmethod
+    def from_array(cls, values: array) -> 'VectorArray':
+        """ Returns a new object, which adopts the ``array('d')`` `values`
+        of interleaved ``(x, y, z)`` coordinates without copying.
+        """
+        if len(values) % 3:
+            raise ValueError('count of values has to be a multiple of 3')
+        obj = cls()
+        obj.values = values
+        return obj
+
+    @classmethod
+    def from_xyz(cls, x: Iterable[float], y: Iterable[float],
+                 z: Iterable[float] = None) -> 'VectorArray':
+        """ Returns a new object from separated x-, y- and z-coordinates, the
+        z-axis is 0 if `z` is ``None``.
+        """
+        x = array('d', x)
+        y = array('d', y)
+        count = len(x)
+        z = array('d', repeat(0., count) if z is None else z)
+        if len(y) != count or len(z) != count:
+            raise ValueError('all axis require the same count of values')
+        values = array('d', bytes(24 * count))
+        values[0::3] = x
+        values[1::3] = y
+        values[2::3] = z
+        return cls.from_array(values)
+
+    def __len__(self) -> int:
+        """ Count of vectors. """
+        return len(self.values) // 3
+
+    def __getitem__(self, index: Union[int, slice]):
+        """ Returns the vector at `index` as :class:`Vector` or a new
+        :class:`VectorArray` for slices.
+        """
+        if isinstance(index, slice):
+            start, stop, step = index.indices(len(self))
+            if step == 1:
+                return self.from_array(self.values[start * 3:stop * 3])
+            x, y, z = self.columns()
+            return self.from_xyz(x[index], y[index], z[index])
+        count = len(self)
+        if index < 0:
+            index += count
+        if not 0 <= index < count:
+            raise IndexError('index out of range')
+        index *= 3
+        return Vector(self.values[index:index + 3])
+
+    def __iter__(self) -> Iterable[Vector]:
+        """ Returns iterable of :class:`Vector` objects. """
+        return map(Vector, self.xyz())
+
+    def __eq__(self, other: Any) -> bool:
+        """ Returns ``True`` if `other` is a :class:`VectorArray` with the
+        same coordinates.
+        """
+        if not isinstance(other, VectorArray):
+            return NotImplemented
+        return self.values == other.values
+
+    def __repr__(self) -> str:
+        return f'VectorArray({[v.xyz for v in self]})'
+
+    def copy(self) -> 'VectorArray':
+        """ Returns a copy. """
+        return self.from_array(array('d', self.values))
+
+    __copy__ = copy
+
+    @property
+    def x(self) -> array:
+        """ x-coordinates as ``array.array('d')``. """
+        return self.values[0::3]
+
+    @property
+    def y(self) -> array:
+        """ y-coordinates as ``array.array('d')``. """
+        return self.values[1::3]
+
+    @property
+    def z(self) -> array:
+        """ z-coordinates as ``array.array('d')``. """
+        return self.values[2::3]
+
+    def columns(self) -> Tuple[array, array, array]:
+        """ Returns the x-, y- and z-coordinates as three
+        ``array.array('d')``.
+        """
+        values = self.values
+        return values[0::3], values[1::3], values[2::3]
+
+    def xyz(self) -> Iterable[Tuple[float, float, float]]:
+        """ Returns iterable of ``(x, y, z)`` tuples. """
+        return zip(*self.columns())
+
+    def _operand(self, other: Any) -> Iterable[float]:
+        # Returns the interleaved coordinates of `other` as iterable, a
+        # single vector is repeated for all vectors of `self`.
+        if isinstance(other, VectorArray):
+            if len(other.values) != len(self.values):
+                raise ValueError('vector arrays of different length')
+            return other.values
+        return chain.from_iterable(repeat(Vector(other).xyz, len(self)))
+
+    def __add__(self, other: Any) -> 'VectorArray':
+        """ Add vector array or single vector `other`. """
+        return self.from_array(
+            array('d', map(add, self.values, self._operand(other))))
+
+    __radd__ = __add__
+
+    def __sub__(self, other: Any) -> 'VectorArray':
+        """ Subtract vector array or single vector `other`. """
+        return self.from_array(
+            array('d', map(sub, self.values, self._operand(other))))
+
+    def __rsub__(self, other: Any) -> 'VectorArray':
+        return self.from_array(
+            array('d', map(sub, self._operand(other), self.values)))
+
+    def __mul__(self, other: float) -> 'VectorArray':
+        """ Scale all vectors by scalar `other`. """
+        return self.from_array(
+            array('d', map(mul, self.values, repeat(float(other)))))
+
+    __rmul__ = __mul__
+
+    def __truediv__(self, other: float) -> 'VectorArray':
+        """ Divide all vectors by scalar `other`. """
+        return self.__mul__(1.0 / other)
+
+    def __neg__(self) -> 'VectorArray':
+        """ Returns negated vectors. """
+        return self.from_array(array('d', map(neg, self.values)))
+
+    def dot(self, other: Any) -> array:
+        """ Returns the dot products of all vectors and the vector array or
+        single vector `other` as ``array.array('d')``.
+        """
+        p = array('d', map(mul, self.values, self._operand(other)))
+        return array('d', map(add, map(add, p[0::3], p[1::3]), p[2::3]))
+
+    def cross(self, other: Any) -> 'VectorArray':
+        """ Returns the cross products of all vectors and the vector array or
+        single vector `other`.
+        """
+        ax, ay, az = self.columns()
+        if not isinstance(other, VectorArray):
+            other = self.from_array(array('d', self._operand(other)))
+        elif len(other.values) != len(self.values):
+            raise ValueError('vector arrays of different length')
+        bx, by, bz = other.columns()
+        return self.from_xyz(
+            map(sub, map(mul, ay, bz), map(mul, az, by)),
+            map(sub, map(mul, az, bx), map(mul, ax, bz)),
+            map(sub, map(mul, ax, by), map(mul, ay, bx)),
+        )
+
+    def magnitudes(self) -> array:
+        """ Returns the lengths of all vectors as ``array.array('d')``. """
+        return array('d', map(math.sqrt, self.dot(self)))
+
+    def normalize(self, length: float = 1.) -> 'VectorArray':
+        """ Returns normalized vectors, optional scaled by `length`.
+
+        Raises:
+            ZeroDivisionError: array contains null vectors
+
+        """
+        factors = array(
+            'd', map(float(length).__truediv__, self.magnitudes()))
+        x, y, z = self.columns()
+        return self.from_xyz(
+            map(mul, x, factors), map(mul, y, factors), map(mul, z, factors))
+
+    def distance(self, other: Any) -> array:
+        """ Returns the distances of all vectors to the vector array or
+        single vector `other` as ``array.array('d')``.
+        """
+        return self.__sub__(other).magnitudes()
+
+    def isclose(self, other: Any, abs_tol: float = 1e-12) -> List[bool]:
+        """ Returns a list of booleans, ``True`` if a vector is close to the
+        vector of the vector array or to the single vector `other`. Uses
+        :func:`math.isclose` to compare all axis.
+        """
+        flags = iter(map(
+            partial(math.isclose, abs_tol=abs_tol),
+            self.values, self._operand(other)))
+        return list(map(all, zip(flags, flags, flags)))
+
+    def sum(self) -> Vector:
+        """ Returns the sum of all vectors. """
+        return Vector(map(math.fsum, self.columns()))
@@ -17,6 +17,20 @@ class Options:
         # Set 'store_proxy_graphics' to True for exporting proxy graphics
         self.store_proxy_graphics = False
 
+        # Lazy loading mode: load the graphical entities of the ENTITIES and
+        # BLOCKS section at the first access by a layout, an entity query or a
+        # handle lookup in the entity database.
+        self.lazy_loading = False
+
+        # Compact storage of DXF attributes: store the DXF attributes of new
+        # and loaded entities in slotted namespaces to reduce the memory
+        # usage of large documents.
+        self.compact_namespace = False
+
+        # Round float values at exporting to this count of decimal places,
+        # None for the full float precision.
+        self.float_precision = None
+
         # Enable this option to always create same meta data for testing
         # scenarios, e.g. to use a diff like tool to compare DXF documents.
         self.write_fixed_meta_data_for_testing = False
@@ -2,16 +2,22 @@
 # Created: 27.04.13
 # Copyright (C) 2013, Manfred Moitzi
 # License: MIT License
-from typing import TYPE_CHECKING, Iterable, Callable, Hashable, Dict, List, Any, Sequence, Union
+from typing import (
+    TYPE_CHECKING, Iterable, Callable, Hashable, Dict, List, Any, Sequence, Union, Optional, Tuple, Set,
+)
 import re
 import operator
+from functools import lru_cache
 
 from collections import abc
 from ezdxf.queryparser import EntityQueryParser
 from ezdxf.groupby import groupby
+from ezdxf.columns import Columns
+from ezdxf.entitydb import EntitySpace
 
 if TYPE_CHECKING:  # import forward references
     from ezdxf.eztypes import DXFEntity
+    from ezdxf.entitydb import EntityDB
 
 
 class EntityQuery(abc.Sequence):
@@ -72,13 +78,16 @@ class EntityQuery(abc.Sequence):
 
     """
 
-    def __init__(self, entities: Iterable['DXFEntity'] = None, query: str = '*'):
+    def __init__(self, entities: Iterable['DXFEntity'] = None, query: Union[str, 'CompiledQuery'] = '*',
+                 entitydb: 'EntityDB' = None):
         """
         Setup container with entities matching the initial query.
 
         Args:
             entities: sequence of wrapped DXF entities (at least GraphicEntity class)
-            query: query string, see class documentation
+            query: query string, see class documentation, or a :class:`CompiledQuery`
+            entitydb: entity database of `entities`, the query planner uses the secondary indexes of the database
+                      if available
 
         """
         if entities is None:
@@ -86,8 +95,7 @@ class EntityQuery(abc.Sequence):
         elif query == '*':
             self.entities = list(entities)
         else:
-            match = entity_matcher(query)
-            self.entities = [entity for entity in entities if match(entity)]
+            self.entities = plan_query(query, entitydb).execute(entities)
 
     def __len__(self) -> int:
         """ Returns count of DXF entities. """
@@ -151,16 +159,21 @@ class EntityQuery(abc.Sequence):
         """
         return groupby(self.entities, dxfattrib, key)
 
+    def columns(self, names: Iterable[str]) -> 'Columns':
+        """
+        Returns a columnar view of the DXF attributes `names` of all queried
+        entities as :class:`~ezdxf.columns.Columns` object.
 
-def entity_matcher(query: str) -> Callable[['DXFEntity'], bool]:
-    query_args = EntityQueryParser.parseString(query, parseAll=True)
-    entity_matcher_ = build_entity_name_matcher(query_args.EntityQuery)
-    attrib_matcher = build_entity_attributes_matcher(query_args.AttribQuery, query_args.AttribQueryOptions)
+        Args:
+            names: DXF attribute names like ``'start'``, ``'layer'`` or
+                ``'color'``
 
-    def matcher(entity: 'DXFEntity') -> bool:
-        return entity_matcher_(entity) and attrib_matcher(entity)
+        """
+        return Columns(self.entities, names)
 
-    return matcher
+
+def entity_matcher(query: str) -> Callable[['DXFEntity'], bool]:
+    return compile_query(query).match
 
 
 def build_entity_name_matcher(names: Sequence[str]) -> Callable[['DXFEntity'], bool]:
@@ -187,6 +200,7 @@ class Relation:
     def __init__(self, relation: Sequence, ignore_case: bool):
         name, op, value = relation
         self.dxf_attrib = name
+        self.operator = op
         self.compare = Relation.CMP_OPERATORS[op]
         self.convert_case = to_lower if ignore_case else lambda x: x
 
@@ -269,6 +283,258 @@ def build_entity_attributes_matcher(tokens: Sequence, options: str) -> Callable[
     return match_bool_expr
 
 
+QUERY_CACHE_SIZE = 256
+
+
+class CompiledQuery:
+    """
+    Compiled entity query, created by :func:`compile_query`. A :class:`CompiledQuery` is a reusable matcher and
+    can be used instead of the query string for all :meth:`query` methods.
+
+    Attributes:
+        query: query string
+        ignore_case: ``True`` for case insensitive string comparison
+        take_all: ``True`` if the entity query contains ``'*'``
+        include: set of included DXF types
+        exclude: set of excluded DXF types
+
+    """
+    __slots__ = ('query', 'ignore_case', 'take_all', 'include', 'exclude', 'expr', 'name_match', '_match')
+
+    def __init__(self, query: str):
+        query_args = EntityQueryParser.parseString(query, parseAll=True)
+        tokens = query_args.AttribQuery
+        self.query = query
+        self.ignore_case = 'i' == query_args.AttribQueryOptions
+        self.take_all, self.include, self.exclude = _parse_names(' '.join(query_args.EntityQuery))
+        self.expr: Union[None, Relation, BoolExpression] = \
+            _compile_tokens(tokens, self.ignore_case) if len(tokens) else None
+        self.name_match = build_entity_name_matcher(query_args.EntityQuery)
+        self._match = _build_matcher(self.name_match, self.expr)
+
+    def __str__(self):
+        return self.query
+
+    def __call__(self, entity: 'DXFEntity') -> bool:
+        """ Returns ``True`` if `entity` matches the query. """
+        return self._match(entity)
+
+    @property
+    def match(self) -> Callable[['DXFEntity'], bool]:
+        """ Matcher function of the query. """
+        return self._match
+
+    def filter(self, entities: Iterable['DXFEntity']) -> List['DXFEntity']:
+        """ Returns all entities of `entities` matching the query. """
+        match = self._match
+        return [entity for entity in entities if match(entity)]
+
+
+@lru_cache(maxsize=QUERY_CACHE_SIZE)
+def compile_query(query: str) -> CompiledQuery:
+    """
+    Returns the :class:`CompiledQuery` for the entity `query` string. The compiled queries are stored in a bounded
+    LRU cache of :data:`QUERY_CACHE_SIZE` entries, use :code:`compile_query.cache_clear()` to clear the cache and
+    :code:`compile_query.cache_info()` to get the cache statistics.
+
+    raises: ParseException (pyparsing.py)
+
+    """
+    return CompiledQuery(query)
+
+
+class QueryPlan:
+    """
+    Execution plan of an entity query, created by :func:`plan_query`.
+
+    Without index access the plan tests all source entities by the whole query. With index access the plan
+    collects the candidates from the secondary indexes of the :class:`~ezdxf.entitydb.EntityDB` and tests only the
+    candidates by the remaining (residual) terms of the query, the order of the source entities is preserved.
+
+    Attributes:
+        query: query string
+        index: name of the used index ``'dxftype'`` or ``'layer'``, or ``''`` for a full scan
+        keys: used index keys
+        estimates: list of all considered index accesses as (index, keys, count of candidates) tuples
+
+    """
+
+    def __init__(self, compiled: 'CompiledQuery'):
+        self.query = compiled.query
+        self.index = ''
+        self.keys: Tuple[str, ...] = tuple()
+        self.estimates: List[Tuple[str, Tuple[str, ...], int]] = []
+        self._entitydb: Optional['EntityDB'] = None
+        self._compiled = compiled
+        self._name_match = compiled.name_match
+        self._expr = compiled.expr
+        self._check_names = True
+        self._residual_expr = compiled.expr
+
+    @property
+    def uses_index(self) -> bool:
+        """ ``True`` if the plan collects the candidates from an index. """
+        return bool(self.index)
+
+    def set_index_access(self, entitydb: 'EntityDB', index: str, keys: Iterable[str], check_names: bool,
+                         residual_expr: Union[None, 'Relation', 'BoolExpression']) -> None:
+        """ Set index access, internal API of :func:`plan_query`. """
+        self._entitydb = entitydb
+        self.index = index
+        self.keys = tuple(keys)
+        self._check_names = check_names
+        self._residual_expr = residual_expr
+
+    def candidates(self) -> List['DXFEntity']:
+        """ Returns the candidates of the index access. """
+        lookup = self._entitydb.by_dxftype if self.index == 'dxftype' else self._entitydb.by_layer
+        entities = []
+        for key in self.keys:
+            entities.extend(lookup(key))
+        return entities
+
+    def matcher(self) -> Callable[['DXFEntity'], bool]:
+        """ Returns the matcher function of the whole query. """
+        return self._compiled.match
+
+    def execute(self, entities: Iterable['DXFEntity']) -> List['DXFEntity']:
+        """
+        Returns all entities of `entities` matching the query. With index access only the candidates are loaded, if
+        `entities` is an :class:`~ezdxf.entitydb.EntitySpace` of a layout in lazy loading mode.
+
+        """
+        if not self.index:
+            match = self._compiled.match
+            return [entity for entity in entities if match(entity)]
+
+        candidates = self.candidates()
+        if not candidates:
+            return []
+        match = _build_matcher(self._name_match if self._check_names else None, self._residual_expr)
+        if isinstance(entities, EntitySpace):
+            selection = entities.select(candidates)
+            if selection is not None:
+                return [entity for entity in selection if match(entity)]
+        keys = set(id(entity) for entity in candidates)
+        return [entity for entity in entities if id(entity) in keys and match(entity)]
+
+    def explain(self) -> str:
+        """ Returns a description of the query plan as text. """
+        lines = [f'query: {self.query}']
+        if self.index:
+            count = _estimated_count(self.estimates, self.index)
+            lines.append(f'access: index {self.index} {list(self.keys)} -> {count} candidates')
+        else:
+            lines.append('access: full scan')
+        for index, keys, count in self.estimates:
+            if index != self.index:
+                lines.append(f'rejected: index {index} {list(keys)} -> {count} candidates')
+        filters = []
+        if self._check_names:
+            filters.append('entity names')
+        if self._residual_expr is not None:
+            filters.append('attributes')
+        lines.append('filter: ' + (', '.join(filters) if filters else 'none'))
+        return '\n'.join(lines)
+
+
+def _estimated_count(estimates: List[Tuple[str, Tuple[str, ...], int]], index: str) -> int:
+    for name, keys, count in estimates:
+        if name == index:
+            return count
+    return 0
+
+
+def _build_matcher(name_match: Optional[Callable[['DXFEntity'], bool]],
+                   expr: Union[None, 'Relation', 'BoolExpression']) -> Callable[['DXFEntity'], bool]:
+    if expr is None:
+        return name_match or (lambda entity: True)
+    if name_match is None:
+        return expr.evaluate
+    evaluate = expr.evaluate
+
+    def matcher(entity: 'DXFEntity') -> bool:
+        return name_match(entity) and evaluate(entity)
+
+    return matcher
+
+
+def plan_query(query: Union[str, 'CompiledQuery'], entitydb: 'EntityDB' = None) -> QueryPlan:
+    """
+    Returns the :class:`QueryPlan` for the entity `query` string or :class:`CompiledQuery`.
+
+    The planner uses the secondary indexes of the `entitydb`, if the indexes exist (see
+    :meth:`~ezdxf.entitydb.EntityDB.create_index`). Considered index accesses are the DXF type index for an entity
+    query without ``'*'`` and the layer index for a ``layer == "name"`` term of the attribute query, which has to be
+    a top level term of an AND-chain. The index access with the lowest count of candidates wins. In lazy loading mode
+    the planner does not load the not loaded entities, the index access loads only the candidates.
+
+    raises: ParseException (pyparsing.py)
+
+    """
+    compiled = compile_query(query) if isinstance(query, str) else query
+    plan = QueryPlan(compiled)
+    if entitydb is None or not entitydb.has_index:
+        return plan
+
+    expr = compiled.expr
+    ignore_case = compiled.ignore_case
+    accesses = []  # (count, index, keys, check_names, residual expression)
+    if not compiled.take_all:
+        keys = tuple(sorted(compiled.include))
+        count = sum(entitydb.index_size('dxftype', key) for key in keys)
+        accesses.append((count, 'dxftype', keys, False, expr))
+
+    terms = _and_chain(expr)
+    for term in terms:
+        if _is_layer_equation(term):
+            if ignore_case:
+                keys = tuple(sorted(layer for layer in entitydb.layers_in_use() if layer.lower() == term.value))
+            else:
+                keys = (term.value,)
+            count = sum(entitydb.index_size('layer', key) for key in keys)
+            residual = _build_and_chain([t for t in terms if t is not term])
+            accesses.append((count, 'layer', keys, True, residual))
+            break
+
+    if accesses:
+        plan.estimates = [(index, keys, count) for count, index, keys, _, _ in accesses]
+        count, index, keys, check_names, residual = min(accesses, key=lambda a: a[0])
+        plan.set_index_access(entitydb, index, keys, check_names, residual)
+    return plan
+
+
+def _and_chain(expr: Union[None, 'Relation', 'BoolExpression']) -> List[Union['Relation', 'BoolExpression']]:
+    """ Returns the terms of `expr` if `expr` is a single term or a top level AND-chain, else an empty list. """
+    if isinstance(expr, Relation):
+        return [expr]
+    if isinstance(expr, BoolExpression):
+        tokens = expr.tokens
+        if len(tokens) == 1:
+            return _and_chain(tokens[0])
+        if len(tokens) % 2 == 1 and all(op == '&' for op in tokens[1::2]):
+            return list(tokens[0::2])
+    return []
+
+
+def _build_and_chain(terms: List[Union['Relation', 'BoolExpression']]) -> Union[None, 'Relation', 'BoolExpression']:
+    if not terms:
+        return None
+    if len(terms) == 1:
+        return terms[0]
+    tokens = []
+    for term in terms:
+        tokens.append(term)
+        tokens.append('&')
+    tokens.pop()
+    return BoolExpression(tokens)
+
+
+def _is_layer_equation(term: Union['Relation', 'BoolExpression']) -> bool:
+    return isinstance(term, Relation) and term.dxf_attrib == 'layer' and term.operator == '==' and \
+           isinstance(term.value, str)
+
+
 def unique_entities(entities: Iterable['DXFEntity']) -> Iterable['DXFEntity']:
     """
     Yield all unique entities, order of all entities will be preserved.
@@ -306,19 +572,23 @@ def name_matcher(query: str = "*") -> Callable[[str], bool]:
         else:
             return e in include
 
-    match_strings = set(query.upper().split())
+    take_all, include, exclude = _parse_names(query)
+    return match
+
+
+def _parse_names(query: str) -> Tuple[bool, Set[str], Set[str]]:
+    """ Returns the tuple (take_all, include, exclude) for the entity names `query` string. """
     take_all = False
     exclude = set()
     include = set()
-    for name in match_strings:
+    for name in set(query.upper().split()):
         if name == '*':
             take_all = True
         elif name.startswith('!'):
             exclude.add(name[1:])
         else:
             include.add(name)
-
-    return match
+    return take_all, include, exclude
 
 
 def new(entities: Iterable['DXFEntity'] = None, query: str = '*') -> EntityQuery:
@@ -122,7 +122,8 @@ def _load_and_audit_document(recover_tool) -> Tuple['Drawing', 'Auditor']:
         auditor.add_error(code, msg)
     for code, msg in recover_tool.fixes:
         auditor.fixed_error(code, msg)
-    auditor.run()
+    with doc.stats.timer('audit') as stage:
+        auditor.run(stage)
     return doc, auditor
 
 
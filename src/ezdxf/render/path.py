@@ -554,17 +554,16 @@ class Path(abc.Sequence):
 
     def flattening(self, distance: float,
                    segments: int = 16) -> Iterable[Vector]:
-        """ Approximate path by vertices and use adaptive recursive flattening
+        """ Approximate path by vertices and use adaptive flattening
         to approximate cubic Bèzier curves. The argument `segments` is the
-        minimum count of approximation segments for each curve, if the distance
-        from the center of the approximation segment to the curve is bigger than
-        `distance` the segment will be subdivided.
+        minimum count of approximation segments for each curve, if the maximum
+        distance from the curve to an approximation segment is bigger than
+        `distance` the segment will be subdivided, see
+        :func:`~ezdxf.math.bezier_flattening`.
 
         Args:
-            distance: maximum distance from the center of the cubic (C3)
-                curve to the center of the linear (C1) curve between two
-                approximation points to determine if a segment should be
-                subdivided.
+            distance: maximum distance from the cubic (C3) curve to the
+                linear (C1) approximation segment
             segments: minimum segment count
 
         """
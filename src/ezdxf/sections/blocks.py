@@ -6,6 +6,7 @@ from ezdxf.lldxf.const import (
 )
 from ezdxf.lldxf import const
 from ezdxf.entities import factory, entity_linker
+from ezdxf.lldxf.loader import LazyEntity
 from ezdxf.layouts.blocklayout import BlockLayout
 from ezdxf.render.arrows import ARROWS
 from .table import table_key
@@ -109,17 +110,25 @@ class BlocksSection:
             # information about a BLOCK and also owns all the entities of
             # this block definition.
             block_record.set_block(block, endblk)
+            lazy_entities = []
             for entity in block_entities[1:-1]:
-                block_record.add_entity(entity)
+                if isinstance(entity, LazyEntity):
+                    lazy_entities.append(entity)
+                else:
+                    block_record.add_entity(entity)
+            block_record.add_lazy_entities(lazy_entities)
             return block_record
 
         def link_entities() -> Iterable['DXFEntity']:
             linked = entity_linker()
             for entity in entities:
+                # Not loaded entities are linked at loading:
+                if isinstance(entity, LazyEntity):
+                    yield entity
                 # Do not store linked entities (VERTEX, ATTRIB, SEQEND) in
                 # the block layout, linked entities ares stored in their
                 # parent entity e.g. VERTEX -> POLYLINE:
-                if not linked(entity):
+                elif not linked(entity):
                     yield entity
 
         block_records = self.block_records
@@ -134,6 +143,8 @@ class BlocksSection:
         block_entities = []
         for entity in link_entities():
             block_entities.append(entity)
+            if isinstance(entity, LazyEntity):
+                continue
             if entity.dxftype() == 'ENDBLK':
                 block_record = load_block_record(block_entities)
                 self.add(block_record)
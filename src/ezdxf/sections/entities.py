@@ -5,6 +5,7 @@ from typing import TYPE_CHECKING, Iterable, List, Iterator
 from itertools import chain
 
 from ezdxf.lldxf.tags import DXFStructureError
+from ezdxf.lldxf.loader import LazyEntity
 from ezdxf.entities import entity_linker
 
 if TYPE_CHECKING:
@@ -58,17 +59,17 @@ class EntitySection:
             raise DXFStructureError(
                 "Critical structure error in ENTITIES section.")
 
-        def add(entity: 'DXFGraphic'):
-            handle = entity.dxf.owner
+        def is_paperspace(handle: str, paperspace_flag: int) -> bool:
             # higher priority for owner handle
             if handle == msp_layout_key:
-                paperspace = 0
+                return False
             elif handle == psp_layout_key:
-                paperspace = 1
+                return True
             else:  # paperspace flag as fallback
-                paperspace = entity.dxf.paperspace
+                return bool(paperspace_flag)
 
-            if paperspace:
+        def add(entity: 'DXFGraphic'):
+            if is_paperspace(entity.dxf.owner, entity.dxf.paperspace):
                 psp.add_entity(entity)
             else:
                 msp.add_entity(entity)
@@ -78,10 +79,20 @@ class EntitySection:
         msp_layout_key = msp.dxf.handle
         psp_layout_key = psp.dxf.handle
         linked_entities = entity_linker()
+        lazy_msp_entities: List[LazyEntity] = []
+        lazy_psp_entities: List[LazyEntity] = []
         # Don't store linked entities (VERTEX, ATTRIB, SEQEND) in entity space
         for entity in entities:
-            if not linked_entities(entity):
+            if isinstance(entity, LazyEntity):
+                # Not loaded entity including the linked entities:
+                if is_paperspace(entity.owner, entity.paperspace):
+                    lazy_psp_entities.append(entity)
+                else:
+                    lazy_msp_entities.append(entity)
+            elif not linked_entities(entity):
                 add(entity)
+        msp.add_lazy_entities(lazy_msp_entities)
+        psp.add_lazy_entities(lazy_psp_entities)
 
     def export_dxf(self, tagwriter: 'TagWriter') -> None:
         layouts = self.doc.layouts
@@ -169,7 +169,7 @@ class ObjectsSection:
         Get all DXF objects matching the :ref:`entity query string`.
 
         """
-        return EntityQuery(iter(self), query)
+        return EntityQuery(iter(self), query, entitydb=self.entitydb)
 
     def add_dictionary(self, owner: str = '0', hard_owned: bool = False) -> Dictionary:
         """ Add new :class:`~ezdxf.entities.Dictionary` object.
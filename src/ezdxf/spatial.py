@@ -0,0 +1,379 @@
+# Copyright (c) 2020, Manfred Moitzi
+# License: MIT License
+"""
+Spatial index of DXF graphical entities, an R-tree of the 2D WCS bounding
+boxes (xy-plane) of the entities.
+
+The R-tree is created by Sort-Tile-Recursive (STR) bulk loading and updated
+incrementally by adding, removing and transforming entities.
+
+"""
+from typing import TYPE_CHECKING, Iterable, List, Tuple, Dict, Optional, Any
+import math
+import heapq
+from ezdxf.math import Vec2
+from ezdxf.bbox import extents
+
+if TYPE_CHECKING:
+    from ezdxf.eztypes import DXFGraphic, Vertex
+
+__all__ = ['SpatialIndex', 'RTree']
+
+Box = Tuple[float, float, float, float]  # (xmin, ymin, xmax, ymax)
+MAX_NODE_ENTRIES = 16
+
+
+class _Node:
+    """ R-tree node, the entries of leaf nodes are (box, item) tuples, the
+    entries of inner nodes are child nodes.
+    """
+    __slots__ = ('leaf', 'entries', 'box', 'parent')
+
+    def __init__(self, leaf: bool, entries: List = None):
+        self.leaf = leaf
+        self.entries: List = entries or []
+        self.parent: Optional[_Node] = None
+        self.box: Optional[Box] = None
+        if not leaf:
+            for child in self.entries:
+                child.parent = self
+        self.update_box()
+
+    def entry_boxes(self) -> Iterable[Box]:
+        if self.leaf:
+            return (entry[0] for entry in self.entries)
+        return (child.box for child in self.entries)
+
+    def update_box(self) -> None:
+        boxes = list(self.entry_boxes())
+        if boxes:
+            self.box = (
+                min(b[0] for b in boxes), min(b[1] for b in boxes),
+                max(b[2] for b in boxes), max(b[3] for b in boxes),
+            )
+        else:
+            self.box = None
+
+
+def _union(a: Box, b: Box) -> Box:
+    return min(a[0], b[0]), min(a[1], b[1]), max(a[2], b[2]), max(a[3], b[3])
+
+
+def _area(b: Box) -> float:
+    return (b[2] - b[0]) * (b[3] - b[1])
+
+
+def _intersects(a: Box, b: Box) -> bool:
+    return a[0] <= b[2] and b[0] <= a[2] and a[1] <= b[3] and b[1] <= a[3]
+
+
+def _contains(outer: Box, inner: Box) -> bool:
+    return outer[0] <= inner[0] and outer[1] <= inner[1] and \
+           inner[2] <= outer[2] and inner[3] <= outer[3]
+
+
+def _distance2(b: Box, x: float, y: float) -> float:
+    dx = max(b[0] - x, 0.0, x - b[2])
+    dy = max(b[1] - y, 0.0, y - b[3])
+    return dx * dx + dy * dy
+
+
+def _center(b: Box) -> Tuple[float, float]:
+    return (b[0] + b[2]) * 0.5, (b[1] + b[3]) * 0.5
+
+
+class RTree:
+    """ R-tree of 2D boxes, the boxes are ``(xmin, ymin, xmax, ymax)`` tuples
+    and the items are arbitrary objects, the items are identified by the
+    object id.
+
+    Args:
+        entries: iterable of (box, item) tuples for STR bulk loading
+        max_entries: max. count of entries per node
+
+    """
+
+    def __init__(self, entries: Iterable[Tuple[Box, Any]] = None,
+                 max_entries: int = MAX_NODE_ENTRIES):
+        self.max_entries = max(int(max_entries), 4)
+        self._leaves: Dict[int, _Node] = dict()
+        self._root = _Node(leaf=True)
+        if entries is not None:
+            self._bulk_load(list(entries))
+
+    def __len__(self) -> int:
+        return len(self._leaves)
+
+    def __contains__(self, item: Any) -> bool:
+        return id(item) in self._leaves
+
+    def _bulk_load(self, entries: List[Tuple[Box, Any]]) -> None:
+        if not entries:
+            return
+        nodes = [
+            _Node(leaf=True, entries=chunk)
+            for chunk in self._str_tiles(entries, lambda e: e[0])
+        ]
+        for node in nodes:
+            for box, item in node.entries:
+                self._leaves[id(item)] = node
+        while len(nodes) > 1:
+            nodes = [
+                _Node(leaf=False, entries=chunk)
+                for chunk in self._str_tiles(nodes, lambda n: n.box)
+            ]
+        self._root = nodes[0]
+
+    def _str_tiles(self, entries: List, get_box) -> Iterable[List]:
+        # Sort-Tile-Recursive: sort by the x-center into vertical slices and
+        # each slice by the y-center into tiles of max_entries
+        size = self.max_entries
+        count = len(entries)
+        node_count = math.ceil(count / size)
+        slice_count = math.ceil(math.sqrt(node_count))
+        slice_size = slice_count * size
+        entries = sorted(entries, key=lambda e: _center(get_box(e))[0])
+        for start in range(0, count, slice_size):
+            vertical_slice = sorted(
+                entries[start:start + slice_size],
+                key=lambda e: _center(get_box(e))[1])
+            for index in range(0, len(vertical_slice), size):
+                yield vertical_slice[index:index + size]
+
+    def insert(self, box: Box, item: Any) -> None:
+        """ Insert `item` with bounding `box`. """
+        if id(item) in self._leaves:
+            self.remove(item)
+        node = self._root
+        while not node.leaf:
+            node = min(
+                node.entries,
+                key=lambda child: (
+                    _area(_union(child.box, box)) - _area(child.box),
+                    _area(child.box)
+                )
+            )
+        node.entries.append((box, item))
+        self._leaves[id(item)] = node
+        self._extend_boxes(node, box)
+        if len(node.entries) > self.max_entries:
+            self._split(node)
+
+    def remove(self, item: Any) -> bool:
+        """ Remove `item`, returns ``False`` if `item` does not exist. """
+        node = self._leaves.pop(id(item), None)
+        if node is None:
+            return False
+        node.entries = [entry for entry in node.entries if entry[1] is not item]
+        while node is not self._root and not node.entries:
+            parent = node.parent
+            parent.entries.remove(node)
+            node = parent
+        self._update_boxes(node)
+        root = self._root
+        while not root.leaf and len(root.entries) == 1:
+            root = root.entries[0]
+            root.parent = None
+        if not root.entries:
+            root = _Node(leaf=True)
+        self._root = root
+        return True
+
+    def _extend_boxes(self, node: _Node, box: Box) -> None:
+        while node is not None:
+            node.box = box if node.box is None else _union(node.box, box)
+            node = node.parent
+
+    def _update_boxes(self, node: _Node) -> None:
+        while node is not None:
+            node.update_box()
+            node = node.parent
+
+    def _split(self, node: _Node) -> None:
+        boxes = list(node.entry_boxes())
+        spread_x = max(b[2] for b in boxes) - min(b[0] for b in boxes)
+        spread_y = max(b[3] for b in boxes) - min(b[1] for b in boxes)
+        axis = 0 if spread_x >= spread_y else 1
+        if node.leaf:
+            def key(entry):
+                return _center(entry[0])[axis]
+        else:
+            def key(child):
+                return _center(child.box)[axis]
+
+        entries = sorted(node.entries, key=key)
+        half = len(entries) // 2
+        node.entries = entries[:half]
+        sibling = _Node(leaf=node.leaf, entries=entries[half:])
+        if node.leaf:
+            for box, item in sibling.entries:
+                self._leaves[id(item)] = sibling
+        node.update_box()
+        parent = node.parent
+        if parent is None:
+            self._root = _Node(leaf=False, entries=[node, sibling])
+        else:
+            parent.entries.append(sibling)
+            sibling.parent = parent
+            if len(parent.entries) > self.max_entries:
+                self._split(parent)
+
+    def crossing(self, box: Box) -> List[Any]:
+        """ Returns all items with a bounding box which intersects `box`. """
+        result = []
+        root = self._root
+        if root.box is None:
+            return result
+        stack = [root]
+        while stack:
+            node = stack.pop()
+            if not _intersects(node.box, box):
+                continue
+            if node.leaf:
+                result.extend(
+                    item for b, item in node.entries if _intersects(b, box))
+            else:
+                stack.extend(node.entries)
+        return result
+
+    def window(self, box: Box) -> List[Any]:
+        """ Returns all items with a bounding box inside of `box`. """
+        result = []
+        root = self._root
+        if root.box is None:
+            return result
+        stack = [root]
+        while stack:
+            node = stack.pop()
+            if not _intersects(node.box, box):
+                continue
+            if node.leaf:
+                result.extend(
+                    item for b, item in node.entries if _contains(box, b))
+            else:
+                stack.extend(node.entries)
+        return result
+
+    def nearest(self, x: float, y: float, count: int = 1) -> List[Any]:
+        """ Returns the `count` items with the nearest bounding boxes to the
+        location (`x`, `y`), sorted by distance.
+        """
+        result = []
+        root = self._root
+        if root.box is None or count < 1:
+            return result
+        counter = 0  # tie breaker, nodes and items are not comparable
+        heap = [(_distance2(root.box, x, y), counter, root, False)]
+        while heap and len(result) < count:
+            distance, _, obj, is_item = heapq.heappop(heap)
+            if is_item:
+                result.append(obj)
+            elif obj.leaf:
+                for box, item in obj.entries:
+                    counter += 1
+                    heapq.heappush(
+                        heap, (_distance2(box, x, y), counter, item, True))
+            else:
+                for child in obj.entries:
+                    counter += 1
+                    heapq.heappush(
+                        heap, (_distance2(child.box, x, y), counter, child,
+                               False))
+        return result
+
+
+def _box2d(entity: 'DXFGraphic') -> Optional[Box]:
+    box = extents(entity)
+    if not box.has_data:
+        return None
+    (x1, y1, _), (x2, y2, _) = box.extmin, box.extmax
+    return x1, y1, x2, y2
+
+
+def _query_box(p1: 'Vertex', p2: 'Vertex') -> Box:
+    x1, y1 = Vec2(p1)
+    x2, y2 = Vec2(p2)
+    return min(x1, x2), min(y1, y2), max(x1, x2), max(y1, y2)
+
+
+class SpatialIndex:
+    """ Spatial index of DXF graphical entities based on the 2D WCS bounding
+    boxes in the xy-plane. Entities without a bounding box, like XLINE or
+    RAY, are stored in the index but never returned by any spatial query.
+
+    A :class:`SpatialIndex` assigned to a layout by
+    :meth:`~ezdxf.layouts.BaseLayout.create_spatial_index` is updated
+    automatically by adding, removing and transforming entities of this
+    layout, for all other modifications call :meth:`update`.
+
+    All queries are based on the bounding boxes of the entities, the results
+    are returned in arbitrary order.
+
+    Args:
+        entities: iterable of DXF graphical entities
+        max_entries: max. count of entries per R-tree node
+
+    """
+
+    def __init__(self, entities: Iterable['DXFGraphic'] = None,
+                 max_entries: int = MAX_NODE_ENTRIES):
+        self._unbounded: Dict[int, 'DXFGraphic'] = dict()
+        entries = []
+        if entities is not None:
+            for entity in entities:
+                box = _box2d(entity)
+                if box is None:
+                    self._unbounded[id(entity)] = entity
+                else:
+                    entries.append((box, entity))
+        self._tree = RTree(entries, max_entries)
+
+    def __len__(self) -> int:
+        """ Returns count of indexed entities. """
+        return len(self._tree) + len(self._unbounded)
+
+    def __contains__(self, entity: 'DXFGraphic') -> bool:
+        """ Returns ``True`` if `entity` is indexed. """
+        return entity in self._tree or id(entity) in self._unbounded
+
+    def add(self, entity: 'DXFGraphic') -> None:
+        """ Add `entity` to the index or update the index entry of an already
+        indexed `entity`.
+        """
+        self.remove(entity)
+        box = _box2d(entity)
+        if box is None:
+            self._unbounded[id(entity)] = entity
+        else:
+            self._tree.insert(box, entity)
+
+    def remove(self, entity: 'DXFGraphic') -> None:
+        """ Remove `entity` from the index, ignores not indexed entities. """
+        if not self._tree.remove(entity):
+            self._unbounded.pop(id(entity), None)
+
+    def update(self, entity: 'DXFGraphic') -> None:
+        """ Update the bounding box of an indexed `entity` after a
+        modification of its geometry, ignores not indexed entities.
+        """
+        if entity in self:
+            self.add(entity)
+
+    def window(self, p1: 'Vertex', p2: 'Vertex') -> List['DXFGraphic']:
+        """ Returns all entities which are completely inside of the window
+        defined by the two corner points `p1` and `p2`.
+        """
+        return self._tree.window(_query_box(p1, p2))
+
+    def crossing(self, p1: 'Vertex', p2: 'Vertex') -> List['DXFGraphic']:
+        """ Returns all entities which are inside of or crossing the window
+        defined by the two corner points `p1` and `p2`.
+        """
+        return self._tree.crossing(_query_box(p1, p2))
+
+    def nearest(self, point: 'Vertex', count: int = 1) -> List['DXFGraphic']:
+        """ Returns the `count` entities nearest to `point` sorted by the
+        distance of their bounding boxes to `point`.
+        """
+        x, y = Vec2(point)
+        return self._tree.nearest(x, y, count)
@@ -0,0 +1,204 @@
+# Copyright (c) 2020, Manfred Moitzi
+# License: MIT License
+"""
+Timing statistics of the loading, auditing and export stages of a DXF
+document.
+
+The statistics are collected all the time, therefore the instrumentation is
+limited to a few timer calls per stage and per DXF entity.
+
+"""
+from typing import Dict, List, Iterator, Iterable
+import time
+from itertools import islice
+from contextlib import contextmanager
+
+__all__ = ['Stats', 'Stage', 'DXFTypeTimer']
+
+
+class Stage:
+    """ Statistics of a single processing stage.
+
+    Attributes:
+        name: stage name
+        time: accumulated wall time in seconds, without the time of nested
+            stages
+        tags: count of processed DXF tags, if available
+        entities: count of processed DXF entities
+        dxftypes: per DXF type statistics as dict, key is the DXF type,
+            value is a list of [count, time in seconds], not all stages
+            collect per DXF type statistics
+
+    """
+    __slots__ = ('name', 'time', 'tags', 'entities', 'dxftypes')
+
+    def __init__(self, name: str):
+        self.name = name
+        self.time = 0.0
+        self.tags = 0
+        self.entities = 0
+        self.dxftypes: Dict[str, List] = dict()
+
+    def add_dxftype(self, dxftype: str, seconds: float,
+                    count: int = 1) -> None:
+        """ Add `count` processed entities of type `dxftype`. """
+        self.entities += count
+        entry = self.dxftypes.get(dxftype)
+        if entry is None:
+            self.dxftypes[dxftype] = [count, seconds]
+        else:
+            entry[0] += count
+            entry[1] += seconds
+
+
+class DXFTypeTimer:
+    """ Collects the processing time per DXF type for a sequence of entities
+    by timing runs of entities of the same DXF type, which requires only one
+    timer call per change of the DXF type.
+    """
+    __slots__ = ('stage', 'dxftype', 'count', 't0')
+
+    def __init__(self, stage: Stage):
+        self.stage = stage
+        self.dxftype = ''
+        self.count = 0
+        self.t0 = time.perf_counter()
+
+    def next(self, dxftype: str) -> None:
+        """ Start processing of the next entity of type `dxftype`. """
+        if dxftype != self.dxftype:
+            self.flush()
+            self.dxftype = dxftype
+        self.count += 1
+
+    def flush(self) -> None:
+        """ Add the current run of entities to the stage. """
+        t1 = time.perf_counter()
+        if self.count:
+            self.stage.add_dxftype(self.dxftype, t1 - self.t0, self.count)
+        self.count = 0
+        self.t0 = t1
+
+
+class Stats:
+    """ Collection of :class:`Stage` statistics in processing order.
+
+    The time of a stage does not include the time of nested stages, e.g. the
+    time of the "load.structure" stage does not include the time of the
+    "load.tagging" and "load.compiling" stages, which run as a pipeline.
+
+    Stage names:
+
+        - "load.tagging": reading the DXF tags from the file or stream, binary
+          DXF files are tagged and compiled in one step
+        - "load.compiling": tag compiling
+        - "load.structure": loading of the DXF structure, includes tagging
+          and tag compiling of the multi-process loading
+        - "load.filter": load-time entity filtering
+        - "load.cache": restoring a document from the
+          :class:`~ezdxf.doccache.DocumentCache`, replaces all other loading
+          stages
+        - "load.factory": loading of DXF entities from tags, with per DXF type
+          statistics
+        - "load.bind": binding of the DXF entities to the document, with per
+          DXF type statistics
+        - "load.tables", "load.blocks", "load.entities", "load.objects":
+          section setup, counts the entities of the section
+        - "load.2nd_stage": 2nd loading stage, resolving of handles, counts
+          the processed entities
+        - "load.layouts": layout setup, counts the layouts
+        - "audit": auditing, with per DXF type statistics
+        - "export.header", "export.classes", "export.tables",
+          "export.blocks", "export.entities", "export.objects": DXF export of
+          sections
+
+    """
+
+    def __init__(self):
+        self.stages: Dict[str, Stage] = dict()
+        # Accumulated time of all stages, to exclude the time of nested
+        # stages:
+        self._total = 0.0
+
+    def __getitem__(self, name: str) -> Stage:
+        return self.stages[name]
+
+    def __contains__(self, name: str) -> bool:
+        return name in self.stages
+
+    def __iter__(self) -> Iterator[Stage]:
+        return iter(self.stages.values())
+
+    def stage(self, name: str) -> Stage:
+        """ Returns stage `name`, creates a new stage if not exist. """
+        stage = self.stages.get(name)
+        if stage is None:
+            stage = Stage(name)
+            self.stages[name] = stage
+        return stage
+
+    @contextmanager
+    def timer(self, name: str) -> Iterator[Stage]:
+        """ Context manager to accumulate the wall time of stage `name`. """
+        stage = self.stage(name)
+        nested = self._total
+        t0 = time.perf_counter()
+        try:
+            yield stage
+        finally:
+            self._add_time(stage, time.perf_counter() - t0, nested)
+
+    def timed(self, name: str, iterable: Iterable,
+              batch_size: int = 1024) -> Iterator:
+        """ Yields the items of `iterable` and accumulates the time spent in
+        `iterable` and the count of items as tags of stage `name`. The items
+        are fetched in batches of `batch_size` items, which requires only one
+        timer call per batch.
+        """
+        stage = self.stage(name)
+        iterator = iter(iterable)
+        perf_counter = time.perf_counter
+        while True:
+            nested = self._total
+            t0 = perf_counter()
+            batch = list(islice(iterator, batch_size))
+            self._add_time(stage, perf_counter() - t0, nested)
+            if not batch:
+                return
+            stage.tags += len(batch)
+            yield from batch
+
+    def _add_time(self, stage: Stage, seconds: float, nested: float) -> None:
+        # Add the wall time `seconds` to `stage` without the time of the nested
+        # stages, `nested` is the accumulated time of all stages at the start
+        # of the timed period:
+        stage.time += seconds - (self._total - nested)
+        self._total = nested + seconds
+
+    def reset(self) -> None:
+        """ Remove all stages. """
+        self.stages.clear()
+
+    def report(self, dxftypes: bool = True) -> str:
+        """ Returns a text report of all stages, set `dxftypes` to ``False`` to
+        exclude the per DXF type statistics.
+        """
+        lines = []
+        for stage in self.stages.values():
+            # Not all stages count entities or tags:
+            entities = f'{stage.entities:10d} entities' \
+                if stage.entities else ' ' * 19
+            tags = f'{stage.tags:12d} tags' if stage.tags else ''
+            lines.append(
+                f'{stage.name:<24} {stage.time:10.4f}s {entities} {tags}'
+                .rstrip())
+            if dxftypes and stage.dxftypes:
+                entries = sorted(stage.dxftypes.items(),
+                                 key=lambda e: e[1][1], reverse=True)
+                for dxftype, (count, seconds) in entries:
+                    lines.append(
+                        f'    {dxftype:<20} {seconds:10.4f}s {count:10d}')
+        return '\n'.join(lines)
+
+    def __str__(self):
+        return self.report()
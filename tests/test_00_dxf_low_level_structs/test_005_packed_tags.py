@@ -1,8 +1,11 @@
 # Copyright (c) 2018 Manfred Moitzi
 # License: MIT License
 import pytest
+import copy
+from array import array
 from ezdxf.lldxf.packedtags import TagArray, VertexArray
 from ezdxf.lldxf.extendedtags import ExtendedTags
+from ezdxf.lldxf.types import DXFVertex
 from ezdxf.lldxf.tagwriter import TagCollector
 from ezdxf.math import UCS, Matrix44
 
@@ -51,6 +54,19 @@ def test_vertex_array_basics():
         _ = vertices[8]
 
 
+def test_vertex_array_adopts_array():
+    values = array('d', [1, 2, 3])
+    vertices = VertexArray.from_array(values)
+    assert vertices.values is values
+    assert vertices[0] == (1, 2, 3)
+
+
+def test_vertex_array_from_2d_points():
+    tags = [DXFVertex(10, (1, 2)), DXFVertex(10, (3, 4, 5))]
+    vertices = VertexArray.from_tags(tags)
+    assert list(vertices) == [(1, 2, 0), (3, 4, 5)]
+
+
 def test_vertex_array_advanced():
     tags = ExtendedTags.from_text(SPLINE)
     vertices = VertexArray.from_tags(tags.get_subclass('AcDbSpline'))
@@ -147,6 +163,28 @@ def test_vertext_transform():
     assert vertices[2] == (1, 1, 1)
 
 
+def test_vertex_array_copy_on_write():
+    vertices = VertexArray([0, 0, 0, 1, 0, 0])
+    vertices2 = copy.deepcopy(vertices)
+    assert vertices2._values is vertices._values
+    assert list(vertices2) == [(0, 0, 0), (1, 0, 0)]
+    vertices2[0] = (7, 7, 7)
+    assert vertices2._values is not vertices._values
+    assert vertices[0] == (0, 0, 0)
+    vertices.append((2, 0, 0))
+    assert len(vertices) == 3
+    assert len(vertices2) == 2
+
+
+def test_vertex_array_values_attribute_is_private():
+    vertices = VertexArray([0, 0, 0])
+    vertices2 = vertices.clone()
+    vertices2.values[0] = 1
+    assert vertices[0] == (0, 0, 0)
+    vertices.values[0] = 2
+    assert vertices2[0] == (1, 0, 0)
+
+
 ROOTDICT = """0
 DICTIONARY
 5
@@ -1,9 +1,12 @@
 # Copyright (c) 2010-2019 Manfred Moitzi
 # License: MIT License
 import pytest
-from io import StringIO
+from io import StringIO, BytesIO
 
-from ezdxf.lldxf.tagger import internal_tag_compiler, ascii_tags_loader, tag_compiler, DXFStructureError
+from ezdxf.lldxf.tagger import (
+    internal_tag_compiler, ascii_tags_loader, ascii_bytes_tags_loader,
+    tag_compiler, DXFStructureError,
+)
 from ezdxf.lldxf.types import strtag, DXFTag, DXFVertex
 from ezdxf.math.vector import Vector
 
@@ -437,3 +440,141 @@ AVE_ENTITY_MATERIAL
 1002
 }
 """
+
+
+
+def test_compile_consecutive_points():
+    tags = list(bytes_tag_compiler(CONSECUTIVE_POINTS))
+    assert tags == [
+        (0, 'MESH'),
+        (10, (1, 2, 3)), (10, (4, 5)), (11, (6, 7, 8)), (1011, (9, 10, 11)),
+        (1, 'check mark'),
+        (10, (1, 2)),
+    ]
+    assert all(isinstance(tag, DXFVertex) for tag in tags[1:5])
+
+
+def test_compile_consecutive_points_error():
+    text = CONSECUTIVE_POINTS.replace('\n31\n8\n', '\n31\nx\n')
+    with pytest.raises(DXFStructureError):
+        list(bytes_tag_compiler(text))
+
+
+def test_compile_points_missing_y_coordinate():
+    text = CONSECUTIVE_POINTS.replace('\n21\n7\n', '\n22\n7\n')
+    with pytest.raises(DXFStructureError):
+        list(bytes_tag_compiler(text))
+
+
+def test_compile_points_incomplete_point_at_eof():
+    text = CONSECUTIVE_POINTS.replace('1\ncheck mark\n', '')
+    text = text.rstrip() + '\n11\n3\n'
+    tags = list(bytes_tag_compiler(text))
+    # the complete points of the batch are not lost:
+    assert tags[-2:] == [(1011, (9, 10, 11)), (10, (1, 2))]
+
+
+def test_compiled_points_support_deep_copy():
+    import copy
+    import pickle
+    tags = list(bytes_tag_compiler(CONSECUTIVE_POINTS))
+    vertex = tags[1]
+    assert copy.deepcopy(vertex) == (10, (1, 2, 3))
+    assert pickle.loads(pickle.dumps(vertex)) == (10, (1, 2, 3))
+    assert vertex.packed_value.tolist() == [1, 2, 3]
+
+
+def test_compiled_points_are_read_only():
+    tags = list(bytes_tag_compiler(CONSECUTIVE_POINTS))
+    for vertex in (tags[1], DXFVertex(10, (1, 2, 3))):
+        assert vertex.packed_value.readonly is True
+        with pytest.raises(TypeError):
+            vertex.packed_value[0] = 7
+
+
+CONSECUTIVE_POINTS = """0
+MESH
+10
+1
+20
+2
+30
+3
+10
+4
+20
+5
+11
+6
+21
+7
+31
+8
+1011
+9
+1021
+10
+1031
+11
+1
+check mark
+10
+1
+20
+2
+"""
+
+
+def bytes_tag_compiler(text, encoding='utf8'):
+    return tag_compiler(ascii_bytes_tags_loader(
+        BytesIO(text.encode(encoding)), encoding=encoding))
+
+
+def test_bytes_tagger_skip_comments():
+    tags = list(ascii_bytes_tags_loader(BytesIO(b'999\ncomment\n0\nEOF\n')))
+    assert (0, 'EOF') == tags[0]
+    assert len(tags) == 1
+
+
+def test_bytes_tagger_not_skip_comments():
+    tags = list(ascii_bytes_tags_loader(
+        BytesIO(b'999\ncomment\n0\nEOF\n'), skip_comments=False))
+    assert (999, 'comment') == tags[0]
+    assert (0, 'EOF') == tags[1]
+
+
+def test_bytes_tagger_does_not_decode_numeric_values():
+    tags = list(ascii_bytes_tags_loader(BytesIO(b'10\n1.5\r\n1\ntext\r\n')))
+    assert tags[0] == (10, b'1.5')
+    assert tags[1] == (1, 'text')
+
+
+def test_bytes_tagger_decodes_string_values():
+    tags = list(ascii_bytes_tags_loader(
+        BytesIO('1\näöü\n'.encode('cp1252')), encoding='cp1252'))
+    assert tags[0] == (1, 'äöü')
+
+
+def test_bytes_tagger_invalid_group_code():
+    with pytest.raises(DXFStructureError):
+        list(ascii_bytes_tags_loader(BytesIO(b'XX\nvalue\n')))
+
+
+@pytest.mark.parametrize('text', [
+    TEST_TAGREADER, POINT_TAGS, XDATA_COORDS, TAGS_WITH_ERROR,
+    FLOAT_FOR_INT_TAGS, POLYLINE_WITH_XDATA,
+])
+def test_bytes_tagger_compiles_same_as_text_tagger(text):
+    assert list(bytes_tag_compiler(text)) == list(external_tag_compiler(text))
+
+
+@pytest.mark.parametrize('line_ending', ['\r', '\r\n'])
+def test_bytes_tagger_line_endings(line_ending):
+    text = POLYLINE_WITH_XDATA.replace('\n', line_ending)
+    assert list(bytes_tag_compiler(text)) == \
+        list(external_tag_compiler(POLYLINE_WITH_XDATA))
+
+
+def test_bytes_tagger_coord_error_tag():
+    with pytest.raises(DXFStructureError):
+        list(bytes_tag_compiler(TAGS_WITH_COORD_ERROR))
@@ -1,8 +1,9 @@
 # Copyright (c) 2010-2020 Manfred Moitzi
 # License: MIT License
 import pytest
-from io import StringIO
-from ezdxf.lldxf.tagwriter import TagWriter, TagCollector
+import struct
+from io import StringIO, BytesIO
+from ezdxf.lldxf.tagwriter import TagWriter, BinaryTagWriter, TagCollector
 from ezdxf.lldxf.types import DXFTag, DXFVertex
 
 
@@ -47,6 +48,91 @@ def test_write_anything():
     assert result == '... writes just any nonsense ...'
 
 
+def test_buffered_output_requires_flush():
+    s = StringIO()
+    t = TagWriter(s, buffer_size=1000)
+    t.write_tag2(0, 'SECTION')
+    assert s.getvalue() == ''
+    t.flush()
+    assert s.getvalue() == '  0\nSECTION\n'
+
+
+def test_buffered_output_writes_large_chunks():
+    s = StringIO()
+    t = TagWriter(s, buffer_size=20)
+    t.write_tag2(0, 'SECTION')
+    t.write_tag2(2, 'ENTITIES')
+    assert s.getvalue() == '  0\nSECTION\n  2\nENTITIES\n'
+    t.write_tag2(0, 'ENDSEC')
+    assert s.getvalue() == '  0\nSECTION\n  2\nENTITIES\n'
+    t.flush()
+    assert s.getvalue().endswith('  0\nENDSEC\n')
+
+
+def test_float_precision():
+    s = StringIO()
+    t = TagWriter(s, precision=3)
+    t.write_tag2(40, 1.23456)
+    t.write_tag2(70, 7)
+    t.write_tag(DXFTag(41, 0.1 + 0.2))
+    t.write_tag(DXFVertex(10, (1.00001, 2.0, 3)))
+    assert s.getvalue() == ' 40\n1.235\n 70\n7\n 41\n0.3\n' \
+                           ' 10\n1.0\n 20\n2.0\n 30\n3.0\n'
+
+
+def test_float_precision_only_for_geometry_codes():
+    s = StringIO()
+    t = TagWriter(s, precision=3)
+    t.write_tag2(140, 1.23456)
+    t.write_tag2(1040, 1.23456)
+    t.write_tag(DXFTag(460, 1.23456))
+    t.write_tag(DXFVertex(1010, (1.00001, 2.0, 3)))
+    assert s.getvalue() == '140\n1.235\n1040\n1.235\n460\n1.23456\n' \
+                           '1010\n1.0\n1020\n2.0\n1030\n3.0\n'
+
+
+def test_float_precision_does_not_round_header_vars():
+    import ezdxf
+    doc = ezdxf.new()
+    doc.header['$TDCREATE'] = 2458532.123456789
+    s = StringIO()
+    doc.header.export_dxf(TagWriter(s, dxfversion=doc.dxfversion,
+                                    precision=3))
+    assert '\n2458532.123456789\n' in s.getvalue()
+
+    b = BytesIO()
+    doc.header.export_dxf(BinaryTagWriter(b, dxfversion=doc.dxfversion,
+                                          precision=3))
+    assert struct.pack('<d', 2458532.123456789) in b.getvalue()
+
+
+def test_binary_float_precision():
+    s = BytesIO()
+    t = BinaryTagWriter(s, precision=3)
+    t.write_tag2(40, 1.23456)
+    t.write_tag2(460, 1.23456)
+    t.write_tag(DXFVertex(10, (1.00001, 2.0, 3)))
+    data = s.getvalue()
+    assert struct.pack('<d', 1.235) in data
+    assert struct.pack('<d', 1.23456) in data
+    assert struct.pack('<d', 1.00001) not in data
+
+
+def test_buffered_binary_output_is_equal_to_unbuffered_output():
+    def write(buffer_size):
+        s = BytesIO()
+        t = BinaryTagWriter(s, buffer_size=buffer_size)
+        t.write_signature()
+        t.write_tag2(0, 'SECTION')
+        t.write_tag(DXFVertex(10, (7., 8., 9.)))
+        t.write_tag2(70, 7)
+        t.write_tag2(310, b'\xfe' * 300)
+        t.flush()
+        return s.getvalue()
+
+    assert write(64) == write(0)
+
+
 class TestTagCollector:
 
     @pytest.fixture
@@ -0,0 +1,86 @@
+# Copyright (c) 2020, Manfred Moitzi
+# License: MIT License
+import pytest
+import struct
+from io import BytesIO
+import ezdxf
+from ezdxf.lldxf.const import DXFStructureError
+from ezdxf.lldxf.types import DXFVertex
+from ezdxf.lldxf.tagger import (
+    binary_tag_compiler, binary_tags_loader, tag_compiler,
+    BINARY_DXF_SENTINEL,
+)
+
+
+@pytest.fixture(scope='module', params=['R12', 'R2000'])
+def data(request):
+    doc = ezdxf.new(request.param)
+    msp = doc.modelspace()
+    msp.add_line((1, 2, 3), (4, 5, 6))
+    msp.add_polyline2d([(0, 0), (1, 0), (1, 1)])
+    msp.add_text('Binary DXF', dxfattribs={'height': 2.5})
+    if doc.dxfversion > 'AC1009':
+        msp.add_lwpolyline([(0, 0), (1, 0, 0, 0, 0.5), (1, 1)])
+        msp.add_spline([(0, 0, 0), (1, 2, 3), (4, 5, 6), (7, 8, 9)])
+    stream = BytesIO()
+    doc.write(stream, fmt='bin')
+    return stream.getvalue()
+
+
+def test_same_tags_as_binary_tags_loader(data):
+    expected = list(tag_compiler(binary_tags_loader(data)))
+    tags = list(binary_tag_compiler(data))
+    assert tags == expected
+    assert [type(tag) for tag in tags] == [type(tag) for tag in expected]
+
+
+def test_compiles_points(data):
+    tags = list(binary_tag_compiler(data))
+    index = tags.index((0, 'LINE'))
+    points = [tag for tag in tags[index:] if isinstance(tag, DXFVertex)]
+    assert points[0] == (10, (1, 2, 3))
+    assert points[1] == (11, (4, 5, 6))
+
+
+def test_not_a_binary_dxf():
+    with pytest.raises(DXFStructureError):
+        list(binary_tag_compiler(b'  0\nSECTION\n'))
+
+
+def binary_dxf(*tags) -> bytes:
+    data = [BINARY_DXF_SENTINEL]
+    for code, value in [(9, '$ACADVER'), (1, 'AC1015')] + list(tags):
+        data.append(struct.pack('<H', code))
+        if isinstance(value, float):
+            data.append(struct.pack('<d', value))
+        else:
+            data.append(value.encode() + b'\x00')
+    return b''.join(data)
+
+
+def test_2d_and_3d_points():
+    data = binary_dxf((10, 1.), (20, 2.), (11, 3.), (21, 4.), (31, 5.),
+                      (0, 'EOF'))
+    tags = list(binary_tag_compiler(data))
+    assert tags[2:] == [(10, (1, 2)), (11, (3, 4, 5)), (0, 'EOF')]
+
+
+def test_missing_y_coordinate():
+    data = binary_dxf((10, 1.), (30, 2.), (0, 'EOF'))
+    with pytest.raises(DXFStructureError):
+        list(binary_tag_compiler(data))
+
+
+def test_truncated_data():
+    data = binary_dxf((10, 1.), (20, 2.))
+    with pytest.raises(DXFStructureError):
+        list(binary_tag_compiler(data[:-4]))
+
+
+def test_readfile_binary_dxf(data, tmpdir):
+    filename = tmpdir.join('binary.dxf')
+    filename.write_binary(data)
+    doc = ezdxf.readfile(str(filename))
+    assert doc.filename == str(filename)
+    line = doc.modelspace().query('LINE').first
+    assert line.dxf.end == (4, 5, 6)
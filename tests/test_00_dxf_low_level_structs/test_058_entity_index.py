@@ -0,0 +1,139 @@
+# Copyright (c) 2020, Manfred Moitzi
+# License: MIT License
+import os
+import json
+import pytest
+import ezdxf
+from ezdxf.lldxf import fileindex
+from ezdxf.lldxf.const import DXFStructureError
+
+
+@pytest.fixture(scope='module')
+def dxf(tmpdir_factory):
+    filename = str(tmpdir_factory.mktemp('index').join('index.dxf'))
+    doc = ezdxf.new('R2000')
+    msp = doc.modelspace()
+    doc.layers.new('Walls')
+    msp.add_line((0, 0), (1, 1), dxfattribs={'layer': 'Walls'})
+    msp.add_polyline2d([(0, 0), (1, 0), (2, 2)])
+    blk = doc.blocks.new('B')
+    blk.add_attdef('TAG', (0, 0))
+    insert = msp.add_blockref('B', (1, 1))
+    insert.add_auto_attribs({'TAG': 'value'})
+    msp.add_circle((0, 0), 3, dxfattribs={'layer': 'Walls'})
+    doc.saveas(filename)
+    return filename
+
+
+@pytest.fixture(scope='module')
+def index(dxf):
+    return fileindex.build_entity_index(dxf)
+
+
+def test_index_params(index):
+    assert index.version == 'AC1015'
+    assert index.encoding == 'cp1252'
+
+
+def test_entity_locations(index, dxf):
+    handle = index.handles('LINE')[0]
+    location = index.get(handle)
+    assert location.dxftype == 'LINE'
+    assert location.layer == 'Walls'
+    with open(dxf, 'rb') as fp:
+        fp.seek(location.offset)
+        data = fp.read(location.length)
+    assert data.startswith(b'  0\r\nLINE\r\n') or \
+           data.startswith(b'  0\nLINE\n')
+
+
+def test_query_handles(index):
+    assert len(index.handles(layer='WALLS')) == 2
+    assert len(index.handles('CIRCLE', layer='walls')) == 1
+    assert len(index.handles('CIRCLE', layer='0')) == 0
+    assert len(index.handles('VERTEX')) == 3
+
+
+def test_read_tags(index):
+    handle = index.handles('CIRCLE')[0]
+    tags = index.read_tags(handle)
+    assert tags.dxftype() == 'CIRCLE'
+    assert tags.get_handle() == handle
+
+
+def test_load_entity(index):
+    circle = index.load_entity(index.handles('CIRCLE')[0])
+    assert circle.dxftype() == 'CIRCLE'
+    assert circle.dxf.radius == 3
+    assert circle.doc is None
+
+
+def test_load_entity_with_linked_entities(index):
+    polyline = index.load_entity(index.handles('POLYLINE')[0])
+    assert len(polyline.vertices) == 3
+    assert polyline.seqend is not None
+
+    insert = index.load_entity(index.handles('INSERT')[0])
+    assert insert.attribs[0].dxf.text == 'value'
+
+
+def test_load_entities(index):
+    handles = index.handles('LINE') + index.handles('POLYLINE')
+    entities = list(index.load_entities(handles))
+    assert [e.dxftype() for e in entities] == ['LINE', 'POLYLINE']
+    assert [e.dxf.handle for e in entities] == handles
+
+
+def test_sidecar_file(dxf, index, tmpdir):
+    sidecar = str(tmpdir.join('index.idx'))
+    index1 = fileindex.load_entity_index(dxf, sidecar)
+    assert os.path.exists(sidecar)
+    assert index1.locations == index.locations
+
+    index2 = fileindex.load_entity_index(dxf, sidecar)
+    assert index2.locations == index.locations
+    assert index2.version == index.version
+
+
+def test_ignore_outdated_sidecar_file(dxf, index, tmpdir):
+    sidecar = str(tmpdir.join('outdated.idx'))
+    with open(sidecar, 'wt') as fp:
+        json.dump({'sidecar_version': 1, 'size': 0, 'mtime': 0}, fp)
+    assert fileindex.load_entity_index(dxf, sidecar).locations == \
+           index.locations
+
+
+def test_read_tags_like_readfile(tmpdir):
+    # comment tag, CR-only line endings and float values with spaces:
+    data = '  0\rSECTION\r  2\rENTITIES\r  0\rCIRCLE\r  5\rA\r' \
+           '999\rcomment\r  8\rWalls\r 10\r 1.0 \r 20\r2.0\r' \
+           ' 40\r 3 \r  0\rENDSEC\r  0\rEOF\r'
+    filename = str(tmpdir.join('cr_only.dxf'))
+    with open(filename, 'wb') as fp:
+        fp.write(data.encode())
+    index = fileindex.build_entity_index(filename)
+    assert index.handles('CIRCLE', layer='walls') == ['A']
+    tags = index.read_tags('A')
+    assert 999 not in (tag.code for tag in tags.noclass)
+    circle = index.load_entity('A')
+    assert circle.dxf.center == (1, 2)
+    assert circle.dxf.radius == 3
+    assert circle.dxf.layer == 'Walls'
+
+
+def test_invalid_float_raises_structure_error(tmpdir):
+    data = '  0\nSECTION\n  2\nENTITIES\n  0\nCIRCLE\n  5\nA\n' \
+           ' 10\n1,5\n 20\n2.0\n  0\nENDSEC\n  0\nEOF\n'
+    filename = str(tmpdir.join('invalid.dxf'))
+    with open(filename, 'wt') as fp:
+        fp.write(data)
+    index = fileindex.build_entity_index(filename)
+    with pytest.raises(DXFStructureError):
+        index.read_tags('A')
+
+
+def test_binary_dxf_is_not_supported(tmpdir):
+    filename = str(tmpdir.join('binary.dxf'))
+    ezdxf.new().saveas(filename, fmt='bin')
+    with pytest.raises(DXFStructureError):
+        fileindex.build_entity_index(filename)
@@ -204,6 +204,24 @@ def test_load_doublettes():
     assert ns.test3 == '3'
 
 
+def test_loading_does_not_call_update_hooks(monkeypatch):
+    from ezdxf.lldxf.tags import Tags, DXFTag
+    calls = []
+    monkeypatch.setattr(DXFNamespace, '_update_index',
+                        lambda self: calls.append('index'))
+    monkeypatch.setattr(DXFNamespace, '_invalidate_bbox',
+                        lambda self: calls.append('bbox'))
+    ns = DXFNamespace(entity=DXFEntity())
+    data = Tags([DXFTag(8, 'LAYER'), DXFTag(10, (1, 2, 3))])
+    unprocessed = SubclassProcessor.load_tags_into_namespace(
+        ns, data, acdb_entity)
+    assert ns.layer == 'LAYER'
+    assert len(unprocessed) == 1
+    assert calls == []
+    ns.layer = 'OTHER'
+    assert calls == ['index', 'bbox']
+
+
 TEST_1 = """0
 DXFENTITY
 5
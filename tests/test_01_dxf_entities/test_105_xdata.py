@@ -103,6 +103,15 @@ def test_cloning(xdata):
     assert 'MOZMAN' not in xdata2
 
 
+def test_copy_on_write(xdata):
+    xdata2 = copy.deepcopy(xdata)
+    assert xdata2._data is xdata._data
+    xdata2.get('MOZMAN').append((1000, 'NewData'))
+    assert xdata2._data is not xdata._data
+    assert len(xdata2.get('MOZMAN')) == 5
+    assert len(xdata.get('MOZMAN')) == 4
+
+
 def test_dxf_export(xdata):
     tagwriter = TagWriter()
     xdata.export_dxf(tagwriter)
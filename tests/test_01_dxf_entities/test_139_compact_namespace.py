@@ -0,0 +1,124 @@
+# Copyright (c) 2020, Manfred Moitzi
+# License: MIT License
+import pickle
+import pytest
+import ezdxf
+from ezdxf.entities import Line, Point
+from ezdxf.entities.dxfns import (
+    DXFNamespace, CompactDXFNamespace, compact_namespace_class,
+)
+from ezdxf.lldxf.const import DXFAttributeError
+from ezdxf.lldxf.tagwriter import TagCollector
+
+
+@pytest.fixture
+def compact():
+    state = ezdxf.options.compact_namespace
+    ezdxf.options.compact_namespace = True
+    yield
+    ezdxf.options.compact_namespace = state
+
+
+def test_default_namespace_is_not_compact():
+    state = ezdxf.options.compact_namespace
+    ezdxf.options.compact_namespace = False
+    try:
+        line = Line.new(dxfattribs={'layer': 'L'})
+    finally:
+        ezdxf.options.compact_namespace = state
+    assert type(line.dxf) is DXFNamespace
+
+
+def test_namespace_class_is_cached():
+    cls = compact_namespace_class(Line)
+    assert compact_namespace_class(Line) is cls
+    assert issubclass(cls, CompactDXFNamespace)
+    assert compact_namespace_class(Point) is not cls
+
+
+def test_compact_namespace_has_no_dict(compact):
+    line = Line.new(dxfattribs={'start': (1, 2), 'layer': 'L'})
+    assert isinstance(line.dxf, CompactDXFNamespace)
+    assert not hasattr(line.dxf, '__dict__')
+
+
+def test_get_set_and_discard(compact):
+    line = Line.new(dxfattribs={'start': (1, 2)})
+    assert line.dxf.start == (1, 2, 0)
+    assert line.dxf.hasattr('start') is True
+    assert line.dxf.hasattr('color') is False
+    assert line.dxf.color == 256  # default value
+    assert line.dxf.get('color') is None
+    line.dxf.color = 1
+    assert line.dxf.get('color') == 1
+    line.dxf.discard('color')
+    assert line.dxf.hasattr('color') is False
+    del line.dxf.start
+    assert line.dxf.hasattr('start') is False
+
+
+def test_invalid_attribute_raises_exception(compact):
+    line = Line.new()
+    with pytest.raises(DXFAttributeError):
+        line.dxf.invalid = 1
+    with pytest.raises(DXFAttributeError):
+        _ = line.dxf.invalid
+
+
+def test_all_existing_dxf_attribs(compact):
+    line = Line.new(dxfattribs={'start': (1, 2), 'color': 3})
+    attribs = line.dxf.all_existing_dxf_attribs()
+    assert attribs['start'] == (1, 2, 0)
+    assert attribs['color'] == 3
+    assert 'end' not in attribs
+
+
+def test_copy_entity(compact):
+    line = Line.new(dxfattribs={'start': (1, 2), 'color': 3})
+    copy = line.copy()
+    assert type(copy.dxf) is type(line.dxf)
+    assert copy.dxf.start == (1, 2, 0)
+    copy.dxf.color = 4
+    assert line.dxf.color == 3
+
+
+def test_pickle_round_trip(compact):
+    line = Line.new(dxfattribs={'start': (1, 2), 'layer': 'L'})
+    namespace = pickle.loads(pickle.dumps(line.dxf))
+    assert type(namespace) is type(line.dxf)
+    assert namespace.start == (1, 2, 0)
+    assert namespace.layer == 'L'
+
+
+def test_layer_names_are_interned(compact):
+    layer1 = ''.join(['LAY', 'ER'])
+    layer2 = ''.join(['LA', 'YER'])
+    assert layer1 is not layer2
+    line1 = Line.new(dxfattribs={'layer': layer1})
+    line2 = Line.new(dxfattribs={'layer': layer2})
+    assert line1.dxf.layer is line2.dxf.layer
+
+
+def test_dxf_export_is_independent_of_storage():
+    def export(compact_mode):
+        state = ezdxf.options.compact_namespace
+        ezdxf.options.compact_namespace = compact_mode
+        try:
+            line = Line.new(handle='FF', owner='0', dxfattribs={
+                'start': (1, 2), 'end': (3, 4), 'color': 1,
+            })
+        finally:
+            ezdxf.options.compact_namespace = state
+        collector = TagCollector(dxfversion=ezdxf.DXF2000)
+        line.export_dxf(collector)
+        return collector.tags
+
+    assert export(True) == export(False)
+
+
+def test_load_document(compact):
+    doc = ezdxf.new()
+    doc.modelspace().add_line((0, 0), (1, 0), dxfattribs={'layer': 'L'})
+    line = doc.modelspace()[0]
+    assert isinstance(line.dxf, CompactDXFNamespace)
+    assert line.dxf.owner == doc.modelspace().layout_key
@@ -95,6 +95,15 @@ def test_add_polyline_path(hatch):
     assert path.is_closed == 1
 
 
+def test_copy_shares_boundary_paths(hatch):
+    hatch.paths.add_polyline_path([(0, 0), (0, 1), (1, 1)])
+    copy = hatch.copy()
+    assert copy.paths._paths is hatch.paths._paths
+    copy.paths[0].vertices.append((1, 0, 0))
+    assert len(copy.paths[0].vertices) == 4
+    assert len(hatch.paths[0].vertices) == 3
+
+
 def test_polyline_path_attribs(path_hatch):
     path = path_hatch.paths[0]  # test first boundary path
     assert 'PolylinePath' == path.PATH_TYPE, "invalid path type"
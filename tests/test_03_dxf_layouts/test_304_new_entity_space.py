@@ -44,3 +44,92 @@ def test_remove(space):
 
     space.clear()
     assert len(space) == 0
+
+
+def test_remove_preserves_order(space):
+    e = space[1]
+    space.remove(e)
+    assert [e.value for e in space] == [1, 5, 6, 76, -4, 7]
+    assert space[1].value == 5
+    assert space[-1].value == 7
+    with pytest.raises(ValueError):
+        space.remove(e)
+
+
+def test_indexed_access_while_removing_entities():
+    import random
+    from ezdxf.entities import DXFEntity
+    random.seed(7)
+    entities = [DXFEntity() for _ in range(200)]
+    space = EntitySpace(entities)
+    expected = list(entities)
+    while expected:
+        index = random.choice([0, -1, random.randrange(len(expected))])
+        e = space[index]
+        assert e is expected[index]
+        space.remove(e)
+        expected.remove(e)
+        if random.random() < 0.2:
+            new = DXFEntity()
+            space.add(new)
+            expected.append(new)
+        assert len(space) == len(expected)
+        if expected:
+            assert space[-len(expected)] is expected[0]
+        with pytest.raises(IndexError):
+            _ = space[len(expected)]
+        with pytest.raises(IndexError):
+            _ = space[-len(expected) - 1]
+    assert list(space) == []
+
+
+def test_removed_entities_do_not_rebuild_the_list(space):
+    entities = space.entities
+    space.remove(space[0])
+    space.remove(space[-1])
+    assert space[0].value == 4
+    assert space[-1].value == -4
+    assert space._list is entities, 'expected tombstones'
+
+
+def test_indexed_access_after_add():
+    import ezdxf
+    msp = ezdxf.new().modelspace()
+    msp.add_point((0, 0))
+    assert msp[-1].dxftype() == 'POINT'
+    msp.add_line((0, 0), (1, 0))
+    assert msp[-1].dxftype() == 'LINE'
+    assert len(msp) == 2
+
+
+def test_iteration_removes_destroyed_entities(space):
+    space[0].is_alive = False
+    space[1].is_alive = False
+    assert len(space) == 7, 'not removed before iteration'
+    assert [e.value for e in space] == [5, 6, 76, -4, 7]
+    assert len(space) == 5, 'removed by a complete iteration'
+    assert space[0].value == 5
+
+
+def test_lazy_loading():
+    space = EntitySpace([Entity(1)])
+    space.set_loader(lambda: [Entity(2), Entity(3)])
+    assert len(space) == 3
+    assert [e.value for e in space] == [1, 2, 3]
+
+
+def test_has_handle():
+    import ezdxf
+    doc = ezdxf.new()
+    msp = doc.modelspace()
+    space = msp.entity_space
+    line = msp.add_line((0, 0), (1, 0))
+    assert space.has_handle(line.dxf.handle) is True
+    circle = msp.add_circle((0, 0), 1)
+    assert space.has_handle(circle.dxf.handle) is True
+    msp.unlink_entity(line)
+    assert space.has_handle(line.dxf.handle) is False
+    handle = circle.dxf.handle
+    msp.delete_entity(circle)
+    assert space.has_handle(handle) is False
+    assert len(list(space)) == 0
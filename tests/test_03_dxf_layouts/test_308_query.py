@@ -3,7 +3,8 @@
 import pytest
 import ezdxf
 
-from ezdxf.query import EntityQuery, name_query
+from pyparsing import ParseException
+from ezdxf.query import EntityQuery, name_query, compile_query
 
 
 class TestNameQuery:
@@ -182,3 +183,23 @@ def test_match_full_string():
     names = "ONEONE TWO THREE"
     result = list(name_query(names.split(), 'ONE'))
     assert len(result) == 0
+
+
+class TestCompiledQuery:
+    def test_compile_query_is_cached(self):
+        compiled = compile_query('LINE[layer=="lay_lines"]')
+        assert compile_query('LINE[layer=="lay_lines"]') is compiled
+        assert compile_query.cache_info().hits > 0
+
+    def test_compiled_query_as_matcher(self, modelspace):
+        match = compile_query('*[layer=="lay_lines"]')
+        assert sum(1 for e in modelspace if match(e)) == 2
+        assert len(match.filter(modelspace)) == 2
+
+    def test_compiled_query_as_query_argument(self, modelspace):
+        query = compile_query('CIRCLE TEXT')
+        assert len(modelspace.query(query)) == len(modelspace.query('CIRCLE TEXT'))
+
+    def test_invalid_query_raises_exception(self):
+        with pytest.raises(ParseException):
+            compile_query('LINE[layer=]')
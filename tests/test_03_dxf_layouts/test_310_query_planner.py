@@ -0,0 +1,136 @@
+# Copyright (c) 2020, Manfred Moitzi
+# License: MIT License
+import pytest
+import ezdxf
+from ezdxf.query import plan_query, EntityQuery
+
+
+@pytest.fixture(scope='module')
+def doc():
+    doc = ezdxf.new()
+    msp = doc.modelspace()
+    for i in range(20):
+        msp.add_line((0, 0), (i, 0), dxfattribs={'layer': 'Lines', 'color': i % 8})
+    msp.add_line((0, 0), (1, 1), dxfattribs={'layer': 'Walls', 'color': 1})
+    msp.add_circle((0, 0), 1, dxfattribs={'layer': 'Walls', 'color': 2})
+    msp.add_circle((0, 0), 2, dxfattribs={'layer': 'walls', 'color': 3})
+    msp.add_text('TEXT', dxfattribs={'layer': 'Lines'})
+    doc.entitydb.create_index()
+    return doc
+
+
+QUERIES = [
+    'LINE',
+    'LINE CIRCLE',
+    '*[layer=="Walls"]',
+    '*[layer=="walls"]i',
+    'LINE[layer=="Walls"]',
+    'LINE[layer=="Lines" & color<3]',
+    'LINE CIRCLE[color==2 & layer=="Walls"]',
+    '* !LINE[layer=="Walls"]',
+    '*[layer=="Walls" | color==3]',
+    '*[!layer=="Walls"]',
+    'LINE[layer=="XXX"]',
+    'POINT',
+]
+
+
+@pytest.mark.parametrize('query', QUERIES)
+def test_index_plan_matches_full_scan(doc, query):
+    msp = doc.modelspace()
+    scan = EntityQuery(msp, query)
+    result = msp.query(query)
+    assert list(result) == list(scan)
+    assert list(doc.query(query)) == list(EntityQuery(doc.chain_layouts_and_blocks(), query))
+
+
+def test_full_scan_without_index():
+    doc = ezdxf.new()
+    plan = plan_query('LINE', doc.entitydb)
+    assert plan.uses_index is False
+    assert 'full scan' in plan.explain()
+
+
+def test_dxftype_index_access(doc):
+    plan = plan_query('CIRCLE[color==2]', doc.entitydb)
+    assert plan.index == 'dxftype'
+    assert plan.keys == ('CIRCLE',)
+
+
+def test_layer_index_is_more_selective(doc):
+    plan = plan_query('LINE[layer=="Walls" & color==1]', doc.entitydb)
+    assert plan.index == 'layer'
+    assert plan.keys == ('Walls',)
+    assert len(plan.estimates) == 2
+    assert 'rejected: index dxftype' in plan.explain()
+
+
+def test_ignore_case_layer_keys(doc):
+    plan = plan_query('*[layer=="WALLS"]i', doc.entitydb)
+    assert plan.index == 'layer'
+    assert plan.keys == ('Walls', 'walls')
+
+
+def test_no_index_for_or_expressions(doc):
+    plan = plan_query('*[layer=="Walls" | color==3]', doc.entitydb)
+    assert plan.uses_index is False
+
+
+def test_index_follows_attribute_changes():
+    doc = ezdxf.new()
+    msp = doc.modelspace()
+    doc.entitydb.create_index()
+    line = msp.add_line((0, 0), (1, 0))
+    assert len(msp.query('*[layer=="Walls"]')) == 0
+    line.dxf.layer = 'Walls'
+    assert msp.query('*[layer=="Walls"]').first is line
+
+
+R12_WITHOUT_HANDLES = """  0
+SECTION
+  2
+ENTITIES
+  0
+POINT
+  8
+0
+ 10
+0.0
+ 20
+0.0
+ 30
+0.0
+  0
+LINE
+  8
+Walls
+ 10
+0.0
+ 20
+0.0
+ 30
+0.0
+ 11
+1.0
+ 21
+1.0
+ 31
+0.0
+  0
+ENDSEC
+  0
+EOF
+"""
+
+
+def test_lazy_loaded_entities_without_handles(tmpdir, monkeypatch):
+    filename = str(tmpdir.join('r12.dxf'))
+    with open(filename, 'wt') as fp:
+        fp.write(R12_WITHOUT_HANDLES)
+    monkeypatch.setattr(ezdxf.options, 'lazy_loading', True)
+    doc = ezdxf.readfile(filename)
+    doc.entitydb.create_index()
+    msp = doc.modelspace()
+    assert len(msp.query('LINE')) == 1
+    assert len(msp.query('*[layer=="Walls"]')) == 1
+    assert [e.dxftype() for e in msp] == ['POINT', 'LINE']
@@ -0,0 +1,141 @@
+# Copyright (c) 2020, Manfred Moitzi
+# License: MIT License
+import math
+import random
+import pytest
+import ezdxf
+from ezdxf.spatial import RTree, SpatialIndex
+from ezdxf.bbox import extents
+from ezdxf.math import Matrix44
+
+
+def brute_force_crossing(entries, box):
+    x1, y1, x2, y2 = box
+    return set(
+        item for (bx1, by1, bx2, by2), item in entries
+        if bx1 <= x2 and x1 <= bx2 and by1 <= y2 and y1 <= by2
+    )
+
+
+@pytest.fixture
+def entries():
+    random.seed(42)
+    result = []
+    for item in range(500):
+        x, y = random.uniform(0, 100), random.uniform(0, 100)
+        result.append(((x, y, x + random.uniform(0, 3),
+                        y + random.uniform(0, 3)), item))
+    return result
+
+
+class TestRTree:
+    def test_empty_tree(self):
+        tree = RTree()
+        assert len(tree) == 0
+        assert tree.crossing((0, 0, 1, 1)) == []
+        assert tree.nearest(0, 0) == []
+
+    def test_bulk_loaded_crossing(self, entries):
+        tree = RTree(entries)
+        assert len(tree) == 500
+        box = (20, 20, 40, 30)
+        assert set(tree.crossing(box)) == brute_force_crossing(entries, box)
+
+    def test_incremental_insert_and_remove(self, entries):
+        tree = RTree(max_entries=4)
+        items = [str(item) for _, item in entries]
+        for (box, _), item in zip(entries, items):
+            tree.insert(box, item)
+        for item in items[:250]:
+            assert tree.remove(item) is True
+        assert tree.remove('xxx') is False
+        assert len(tree) == 250
+        remaining = list(zip((box for box, _ in entries[250:]), items[250:]))
+        box = (0, 0, 50, 50)
+        assert set(tree.crossing(box)) == brute_force_crossing(remaining, box)
+
+    def test_window(self):
+        tree = RTree([((0, 0, 2, 2), 'a'), ((1, 1, 5, 5), 'b')])
+        assert tree.window((-1, -1, 3, 3)) == ['a']
+        assert set(tree.crossing((-1, -1, 3, 3))) == {'a', 'b'}
+
+    def test_nearest(self):
+        tree = RTree([((x, 0, x + 1, 1), x) for x in range(0, 100, 2)])
+        assert tree.nearest(10.5, 5, count=3)[0] == 10
+        assert set(tree.nearest(10.5, 5, count=3)) == {8, 10, 12}
+
+
+def test_extents():
+    doc = ezdxf.new()
+    msp = doc.modelspace()
+    box = extents(msp.add_circle((1, 1), 2))
+    assert box.extmin.isclose((-1, -1, 0))
+    assert box.extmax.isclose((3, 3, 0))
+    box = extents(msp.add_arc((0, 0), 1, 0, 90))
+    assert box.extmin.isclose((0, 0, 0))
+    assert box.extmax.isclose((1, 1, 0))
+    assert extents(msp.add_xline((0, 0), (1, 0))).has_data is False
+
+
+@pytest.fixture
+def msp():
+    doc = ezdxf.new()
+    msp = doc.modelspace()
+    for x in range(10):
+        msp.add_line((x, 0), (x + 0.5, 1))
+    msp.add_xline((0, 0), (1, 0))
+    return msp
+
+
+def test_spatial_index_of_layout(msp):
+    spatial_index = msp.create_spatial_index()
+    assert msp.spatial_index is spatial_index
+    assert len(spatial_index) == 11
+    assert len(spatial_index.window((0, 0), (5, 1))) == 5
+    assert len(spatial_index.crossing((0.2, 0), (5.2, 1))) == 6
+    assert spatial_index.nearest((9.9, 0))[0].dxf.start == (9, 0, 0)
+    msp.drop_spatial_index()
+    assert msp.spatial_index is None
+
+
+def test_spatial_index_follows_layout_changes(msp):
+    spatial_index = msp.create_spatial_index()
+    line = msp.add_line((100, 100), (101, 101))
+    assert spatial_index.crossing((99, 99), (102, 102)) == [line]
+
+    line.translate(100, 0, 0)
+    assert spatial_index.crossing((99, 99), (102, 102)) == []
+    assert spatial_index.crossing((199, 99), (202, 102)) == [line]
+
+    msp.delete_entity(line)
+    assert line not in spatial_index
+    assert spatial_index.crossing((199, 99), (202, 102)) == []
+
+
+@pytest.mark.parametrize('dxftype', ['ARC', 'HELIX'])
+def test_transform_calls_post_transform_once(dxftype, monkeypatch):
+    doc = ezdxf.new('R2007')
+    entity = doc.modelspace().new_entity(dxftype, {})
+    calls = []
+    monkeypatch.setattr(entity, 'post_transform', calls.append)
+    entity.transform(Matrix44.translate(1, 0, 0))
+    assert len(calls) == 1
+
+
+def test_spatial_index_follows_arc_transformation(msp):
+    spatial_index = msp.create_spatial_index()
+    arc = msp.add_arc((100, 100), 1, 0, 90)
+    arc.transform(Matrix44.z_rotate(math.pi))
+    assert spatial_index.crossing((99, 99), (102, 102)) == []
+    assert spatial_index.crossing((-102, -102), (-99, -99)) == [arc]
+
+
+def test_spatial_index_without_layout():
+    doc = ezdxf.new()
+    msp = doc.modelspace()
+    circle = msp.add_circle((0, 0), 1)
+    spatial_index = SpatialIndex([circle])
+    assert spatial_index.window((-1, -1), (1, 1)) == [circle]
+    circle.dxf.center = (10, 0)
+    spatial_index.update(circle)
+    assert spatial_index.window((-1, -1), (1, 1)) == []
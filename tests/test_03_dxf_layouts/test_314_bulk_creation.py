@@ -0,0 +1,88 @@
+# Copyright (c) 2020, Manfred Moitzi
+# License: MIT License
+import pytest
+import ezdxf
+from ezdxf.layouts import VirtualLayout
+from ezdxf.lldxf.const import DXFValueError, DXFInvalidLineType
+
+
+@pytest.fixture
+def doc():
+    return ezdxf.new()
+
+
+def test_add_points(doc):
+    msp = doc.modelspace()
+    points = msp.add_points(
+        [(0, 0), (1, 2, 3), (4, 5)], dxfattribs={'layer': 'P', 'color': 1})
+    assert len(points) == 3
+    assert list(msp) == points
+    assert points[1].dxf.location == (1, 2, 3)
+    handles = set(p.dxf.handle for p in points)
+    assert len(handles) == 3
+    for point in points:
+        assert point.dxf.handle in doc.entitydb
+        assert point.dxf.owner == msp.layout_key
+        assert point.dxf.layer == 'P'
+        assert point.dxf.color == 1
+
+
+def test_entities_have_independent_attributes(doc):
+    msp = doc.modelspace()
+    p1, p2 = msp.add_points([(0, 0), (1, 0)], dxfattribs={'color': 1})
+    p1.dxf.color = 2
+    assert p2.dxf.color == 1
+
+
+def test_add_points_to_paperspace(doc):
+    psp = doc.layout()
+    points = psp.add_points([(0, 0), (1, 0)])
+    assert points[0].dxf.paperspace == 1
+    assert points[0].dxf.owner == psp.layout_key
+
+
+def test_add_lines(doc):
+    msp = doc.modelspace()
+    lines = msp.add_lines([(0, 0), (1, 1)], [(1, 0), (2, 1)])
+    assert len(msp) == 2
+    assert lines[1].dxf.start == (1, 1, 0)
+    assert lines[1].dxf.end == (2, 1, 0)
+
+
+def test_add_lines_requires_matching_point_count(doc):
+    with pytest.raises(DXFValueError):
+        doc.modelspace().add_lines([(0, 0), (1, 1)], [(1, 0)])
+
+
+def test_shared_attributes_are_validated(doc):
+    msp = doc.modelspace()
+    with pytest.raises(DXFInvalidLineType):
+        msp.add_points([(0, 0)], dxfattribs={'linetype': 'XXX'})
+    with pytest.raises(DXFValueError):
+        msp.add_points([(0, 0)], dxfattribs={'layer': 'invalid*name'})
+    assert len(msp) == 0
+
+
+def test_add_lwpolylines(doc):
+    msp = doc.modelspace()
+    polylines = msp.add_lwpolylines(
+        [[(0, 0), (1, 0), (1, 1)], [(5, 5), (6, 6)]],
+        format='xy', dxfattribs={'closed': True, 'layer': 'L'})
+    assert len(polylines) == 2
+    assert polylines[0].closed is True
+    assert polylines[0].dxf.layer == 'L'
+    assert list(polylines[1].vertices()) == [(5, 5), (6, 6)]
+
+
+def test_spatial_index_includes_new_entities(doc):
+    msp = doc.modelspace()
+    spatial_index = msp.create_spatial_index()
+    msp.add_points([(0, 0), (10, 10)])
+    assert len(spatial_index.crossing((5, 5), (15, 15))) == 1
+
+
+def test_virtual_layout():
+    layout = VirtualLayout()
+    points = layout.add_points([(0, 0), (1, 0)])
+    assert len(layout) == 2
+    assert points[0].dxf.handle is None
@@ -0,0 +1,86 @@
+# Copyright (c) 2020, Manfred Moitzi
+# License: MIT License
+import pytest
+import ezdxf
+from ezdxf.columns import Columns
+from ezdxf.lldxf.const import DXFAttributeError, DXFValueError
+
+
+@pytest.fixture
+def msp():
+    doc = ezdxf.new()
+    msp = doc.modelspace()
+    msp.add_line((0, 0), (1, 0), dxfattribs={'layer': 'A', 'color': 1})
+    msp.add_line((1, 0), (2, 1), dxfattribs={'layer': 'B'})
+    msp.add_line((2, 1), (3, 3), dxfattribs={'layer': 'A', 'color': 3})
+    msp.add_circle((0, 0), 1, dxfattribs={'layer': 'C'})
+    return msp
+
+
+def test_column_types(msp):
+    columns = msp.query('LINE').columns(['start', 'layer', 'color'])
+    assert len(columns) == 3
+    assert columns.types == {
+        'start': 'point', 'layer': 'category', 'color': 'int'}
+    assert columns['start'].typecode == 'd'
+    assert columns['layer'].typecode == 'i'
+    assert columns['color'].typecode == 'i'
+
+
+def test_extracted_values(msp):
+    columns = msp.query('LINE').columns(['start', 'end', 'layer', 'color'])
+    assert list(columns['end']) == [1, 0, 0, 2, 1, 0, 3, 3, 0]
+    assert list(columns['layer']) == [0, 1, 0]
+    assert columns.categories['layer'] == ['A', 'B']
+    assert columns.values('layer') == ['A', 'B', 'A']
+    assert columns.values('start')[1] == (1, 0, 0)
+    assert list(columns['color']) == [1, 256, 3], 'expected default value'
+
+
+def test_unset_attribute_without_default(msp):
+    columns = msp.query('CIRCLE').columns(['radius', 'thickness'])
+    assert list(columns['radius']) == [1.0]
+    assert columns['thickness'][0] == 0.0
+
+
+def test_layout_columns(msp):
+    columns = msp.columns(['layer'])
+    assert columns.values('layer') == ['A', 'B', 'A', 'C']
+
+
+def test_unsupported_attribute(msp):
+    with pytest.raises(DXFAttributeError):
+        msp.columns(['start'])
+
+
+def test_empty_columns():
+    columns = Columns([], ['start'])
+    assert len(columns) == 0
+
+
+def test_write_back(msp):
+    columns = msp.query('LINE').columns(['start', 'layer', 'color'])
+    columns['start'][3] = 7  # x-axis of the 2nd line
+    columns['color'][2] = 5
+    columns['layer'][0] = columns.category_code('layer', 'D')
+    assert columns.write_back() == 3
+    assert msp[1].dxf.start == (7, 0, 0)
+    assert msp[2].dxf.color == 5
+    assert msp[0].dxf.layer == 'D'
+    assert columns.write_back() == 0, 'nothing changed'
+
+
+def test_write_back_validates_values(msp):
+    columns = msp.query('LINE').columns(['layer'])
+    columns['layer'][0] = 99
+    with pytest.raises(DXFValueError):
+        columns.write_back()
+
+
+def test_write_back_updates_query_index(msp):
+    msp.doc.entitydb.create_index()
+    columns = msp.query('LINE').columns(['layer'])
+    columns['layer'][1] = columns.category_code('layer', 'A')
+    columns.write_back()
+    assert len(msp.query('*[layer=="A"]')) == 3
+
@@ -27,3 +27,13 @@ def test_load_dxf(dxf):
     psp = doc.layout()
     assert len(psp) == 1
     assert psp[0].dxftype() == 'CIRCLE'
+
+
+def test_load_dxf_with_cr_line_endings(dxf, tmpdir):
+    data = open(dxf, 'rb').read().replace(b'\r\n', b'\n')
+    filename = tmpdir.join('cr.dxf')
+    with open(filename, 'wb') as fp:
+        fp.write(data.replace(b'\n', b'\r'))
+    doc = ezdxf.readfile(filename)
+    assert doc.modelspace()[0].dxftype() == 'LINE'
+    assert doc.layout()[0].dxftype() == 'CIRCLE'
@@ -23,20 +23,20 @@ def entity(doc):
 
 
 def test_color_index(entity, auditor):
-    entity.dxf.__dict__['color'] = -1  # by pass 'set' validator
+    entity.dxf.unprotected_update({'color': -1})  # by pass 'set' validator
     auditor.check_entity_color_index(entity)
     assert len(auditor.fixes) == 1
     assert auditor.fixes[0].code == AuditError.INVALID_COLOR_INDEX
 
     auditor.reset()
-    entity.dxf.__dict__['color'] = 258  # by pass 'set' validator
+    entity.dxf.unprotected_update({'color': 258})  # by pass 'set' validator
     auditor.check_entity_color_index(entity)
     assert len(auditor.fixes) == 1
     assert auditor.fixes[0].code == AuditError.INVALID_COLOR_INDEX
 
 
 def test_lineweight_too_small(entity, auditor):
-    entity.dxf.__dict__['lineweight'] = -5  # by pass 'set' validator
+    entity.dxf.unprotected_update({'lineweight': -5})  # by pass 'set' validator
     auditor.check_entity_lineweight(entity)
     assert len(auditor.fixes) == 1
     assert auditor.fixes[0].code == AuditError.INVALID_LINEWEIGHT
@@ -44,7 +44,7 @@ def test_lineweight_too_small(entity, auditor):
 
 
 def test_lineweight_too_big(entity, auditor):
-    entity.dxf.__dict__['lineweight'] = 212  # by pass 'set' validator
+    entity.dxf.unprotected_update({'lineweight': 212})  # by pass 'set' validator
     auditor.check_entity_lineweight(entity)
     assert len(auditor.fixes) == 1
     assert auditor.fixes[0].code == AuditError.INVALID_LINEWEIGHT
@@ -52,7 +52,7 @@ def test_lineweight_too_big(entity, auditor):
 
 
 def test_invalid_lineweight(entity, auditor):
-    entity.dxf.__dict__['lineweight'] = 10  # by pass 'set' validator
+    entity.dxf.unprotected_update({'lineweight': 10})  # by pass 'set' validator
     auditor.check_entity_lineweight(entity)
     assert len(auditor.fixes) == 1
     assert auditor.fixes[0].code == AuditError.INVALID_LINEWEIGHT
@@ -60,7 +60,7 @@ def test_invalid_lineweight(entity, auditor):
 
 
 def test_for_valid_layer_name(entity, auditor):
-    entity.dxf.__dict__['layer'] = 'Invalid/'  # by pass 'set' validator
+    entity.dxf.unprotected_update({'layer': 'Invalid/'})  # by pass 'set' validator
     auditor.check_for_valid_layer_name(entity)
     assert len(auditor) == 1
     assert auditor.errors[0].code == AuditError.INVALID_LAYER_NAME
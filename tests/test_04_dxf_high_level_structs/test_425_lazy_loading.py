@@ -0,0 +1,100 @@
+# Copyright (c) 2020, Manfred Moitzi
+# License: MIT License
+import pytest
+import ezdxf
+from ezdxf import options
+
+
+@pytest.fixture(scope='module', params=['R12', 'R2000'])
+def dxf(request, tmpdir_factory):
+    doc = ezdxf.new()
+    msp = doc.modelspace()
+    msp.add_line((0, 0), (1, 0), dxfattribs={'layer': 'LINES'})
+    msp.add_polyline2d([(0, 0), (1, 0), (1, 1)])
+    blk = doc.blocks.new('BLK')
+    blk.add_attdef('TAG', (0, 0))
+    blk.add_circle((0, 0), 2)
+    insert = msp.add_blockref('BLK', (0, 0))
+    insert.add_auto_attribs({'TAG': 'VALUE'})
+    psp = doc.layout()
+    psp.add_circle((0, 0), 1)
+    filename = tmpdir_factory.mktemp(request.param).join("lazy.dxf")
+    doc.dxfversion = request.param
+    doc.saveas(filename)
+    return filename
+
+
+@pytest.fixture
+def lazy_doc(dxf):
+    options.lazy_loading = True
+    try:
+        yield ezdxf.readfile(dxf)
+    finally:
+        options.lazy_loading = False
+
+
+def test_entities_are_not_loaded(lazy_doc):
+    db = lazy_doc.entitydb
+    assert len(db._lazy_entities) > 0
+    assert any(e.dxftype() == 'CIRCLE' for e in db.loaded_entities()) is False
+
+
+def test_load_by_layout(lazy_doc):
+    msp = lazy_doc.modelspace()
+    assert [e.dxftype() for e in msp] == ['LINE', 'POLYLINE', 'INSERT']
+    line = msp[0]
+    assert line.dxf.layer == 'LINES'
+    assert line.dxf.owner == msp.layout_key
+    assert line.dxf.handle in lazy_doc.entitydb
+
+    psp = lazy_doc.layout()
+    assert len(psp) == 1
+    assert psp[0].dxftype() == 'CIRCLE'
+
+
+def test_load_linked_entities(lazy_doc):
+    msp = lazy_doc.modelspace()
+    polyline = msp.query('POLYLINE')[0]
+    assert len(polyline) == 3
+    assert polyline.vertices[0].dxf.owner == polyline.dxf.owner
+    insert = msp.query('INSERT')[0]
+    assert insert.get_attrib_text('TAG') == 'VALUE'
+
+
+def test_load_block_content(lazy_doc):
+    blk = lazy_doc.blocks.get('BLK')
+    assert [e.dxftype() for e in blk] == ['ATTDEF', 'CIRCLE']
+
+
+def test_load_by_handle(lazy_doc):
+    db = lazy_doc.entitydb
+    lazy_entity = next(iter(db._lazy_entities.values()))
+    handle = lazy_entity.handle
+    assert handle in db
+    entity = db[handle]
+    assert entity.dxf.handle == handle
+    assert lazy_entity.is_loaded is True
+    assert handle not in db._lazy_entities
+    # loaded entity is also stored in the layout:
+    layout = lazy_doc.layouts.get_layout_for_entity(entity)
+    assert entity in list(layout)
+
+
+def test_iterating_database_loads_all_entities(lazy_doc):
+    db = lazy_doc.entitydb
+    not_loaded = set(db._lazy_entities)
+    handles = set(e.dxf.handle for e in db.values())
+    assert len(db._lazy_entities) == 0
+    assert not_loaded.issubset(handles)
+
+
+def test_same_content_as_regular_loading(dxf, lazy_doc):
+    doc = ezdxf.readfile(dxf)
+    expected = [(e.dxftype(), e.dxf.handle) for e in doc.query('*')]
+    assert [(e.dxftype(), e.dxf.handle) for e in lazy_doc.query('*')] == expected
+
+
+def test_new_handles_do_not_collide_with_not_loaded_entities(lazy_doc):
+    not_loaded = set(lazy_doc.entitydb._lazy_entities)
+    line = lazy_doc.modelspace().add_line((0, 0), (1, 1))
+    assert line.dxf.handle not in not_loaded
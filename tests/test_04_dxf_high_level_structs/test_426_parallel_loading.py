@@ -0,0 +1,81 @@
+# Copyright (c) 2020, Manfred Moitzi
+# License: MIT License
+import pytest
+import ezdxf
+from ezdxf.lldxf import parallel
+from ezdxf.lldxf.parallel import find_section_content, split_content
+
+
+@pytest.fixture(scope='module', params=['R12', 'R2000'])
+def dxf(request, tmpdir_factory):
+    doc = ezdxf.new()
+    msp = doc.modelspace()
+    for x in range(20):
+        msp.add_line((x, 0), (x, 1), dxfattribs={'layer': 'LINES'})
+        # text value which looks like a structure tag:
+        msp.add_text('  0')
+    msp.add_polyline2d([(0, 0), (1, 0), (1, 1)])
+    blk = doc.blocks.new('BLK')
+    blk.add_attdef('TAG', (0, 0))
+    blk.add_circle((0, 0), 2)
+    insert = msp.add_blockref('BLK', (0, 0))
+    insert.add_auto_attribs({'TAG': 'VALUE'})
+    psp = doc.layout()
+    psp.add_circle((0, 0), 1)
+    filename = tmpdir_factory.mktemp(request.param).join("parallel.dxf")
+    doc.dxfversion = request.param
+    doc.saveas(filename)
+    return str(filename)
+
+
+@pytest.fixture
+def parallel_doc(dxf, monkeypatch):
+    # split the tiny sections into multiple chunks:
+    monkeypatch.setattr(parallel, 'MIN_CHUNK_SIZE', 100)
+    return ezdxf.readfile(dxf, workers=2)
+
+
+def test_same_content_as_regular_loading(dxf, parallel_doc):
+    doc = ezdxf.readfile(dxf)
+    expected = [(e.dxftype(), e.dxf.handle) for e in doc.entitydb.values()]
+    assert [(e.dxftype(), e.dxf.handle) for e in
+            parallel_doc.entitydb.values()] == expected
+
+
+def test_layouts_and_blocks(parallel_doc):
+    msp = parallel_doc.modelspace()
+    assert len(msp) == 42
+    assert msp.query('POLYLINE')[0].dxf.owner == msp.layout_key
+    assert msp.query('INSERT')[0].get_attrib_text('TAG') == 'VALUE'
+    assert len(parallel_doc.layout()) == 1
+    blk = parallel_doc.blocks.get('BLK')
+    assert [e.dxftype() for e in blk] == ['ATTDEF', 'CIRCLE']
+    assert all(e.doc is parallel_doc for e in msp)
+
+
+def test_split_content_at_structure_tags(dxf):
+    with open(dxf, 'rb') as fp:
+        data = fp.read()
+    start, end = find_section_content(data, 'ENTITIES')
+    assert data[end:].startswith(b'  0\nENDSEC')
+    chunks = split_content(data, start, end, 17)
+    assert len(chunks) > 1
+    assert chunks[0][0] == start
+    assert chunks[-1][1] == end
+    for (_, end1), (start2, _) in zip(chunks, chunks[1:]):
+        assert end1 == start2
+    for chunk_start, _ in chunks:
+        code, dxftype = data[chunk_start:].split(b'\n', maxsplit=2)[:2]
+        assert code == b'  0'
+        # not the value line of the TEXT entity:
+        assert dxftype in {b'LINE', b'TEXT', b'POLYLINE', b'VERTEX', b'SEQEND',
+                           b'INSERT', b'ATTRIB', b'CIRCLE'}
+
+
+def test_split_content_into_one_chunk():
+    assert split_content(b'  0\nLINE\n', 0, 9, 1) == [(0, 9)]
+
+
+def test_find_not_existing_section():
+    assert find_section_content(b'  0\nSECTION\n  2\nHEADER\n', 'ENTITIES') \
+           is None
@@ -0,0 +1,83 @@
+# Copyright (c) 2020, Manfred Moitzi
+# License: MIT License
+import pytest
+import ezdxf
+
+
+@pytest.fixture(scope='module', params=['R12', 'R2000'])
+def dxf(request, tmpdir_factory):
+    doc = ezdxf.new(request.param)
+    doc.layers.new('WALLS')
+    doc.layers.new('TEXT')
+    msp = doc.modelspace()
+    msp.add_line((0, 0), (1, 0), dxfattribs={'layer': 'WALLS'})
+    msp.add_line((0, 0), (1, 0), dxfattribs={'layer': 'TEXT'})
+    msp.add_circle((0, 0), 1, dxfattribs={'layer': 'WALLS'})
+    msp.add_polyline2d([(0, 0), (1, 0), (1, 1)],
+                       dxfattribs={'layer': 'WALLS'})
+    inner = doc.blocks.new('INNER')
+    inner.add_circle((0, 0), 2)
+    outer = doc.blocks.new('OUTER')
+    outer.add_blockref('INNER', (0, 0))
+    unused = doc.blocks.new('UNUSED')
+    unused.add_line((0, 0), (1, 0))
+    insert = msp.add_blockref('OUTER', (0, 0), dxfattribs={'layer': 'WALLS'})
+    insert.add_attrib('TAG', 'VALUE')
+    psp = doc.layout()
+    psp.add_line((0, 0), (1, 0), dxfattribs={'layer': 'WALLS'})
+    filename = tmpdir_factory.mktemp(request.param).join("filter.dxf")
+    doc.saveas(filename)
+    return str(filename)
+
+
+def dxftypes(layout):
+    return [e.dxftype() for e in layout if e.dxftype() != 'VIEWPORT']
+
+
+def test_filter_by_types(dxf):
+    doc = ezdxf.readfile(dxf, types=['line', 'CIRCLE'])
+    assert dxftypes(doc.modelspace()) == ['LINE', 'LINE', 'CIRCLE']
+    assert dxftypes(doc.layout()) == ['LINE']
+    assert len(doc.blocks.get('OUTER')) == 0
+    assert len(doc.blocks.get('INNER')) == 0
+    assert len(doc.blocks.get('UNUSED')) == 0
+
+
+def test_filter_by_layers(dxf):
+    doc = ezdxf.readfile(dxf, layers=['walls'])
+    assert dxftypes(doc.modelspace()) == \
+           ['LINE', 'CIRCLE', 'POLYLINE', 'INSERT']
+    polyline = doc.modelspace().query('POLYLINE').first
+    assert len(polyline) == 3
+    insert = doc.modelspace().query('INSERT').first
+    assert insert.get_attrib_text('TAG') == 'VALUE'
+    # Resources are loaded:
+    assert 'TEXT' in doc.layers
+
+
+def test_load_referenced_blocks(dxf):
+    doc = ezdxf.readfile(dxf, types=['INSERT'])
+    assert dxftypes(doc.modelspace()) == ['INSERT']
+    assert dxftypes(doc.blocks.get('OUTER')) == ['INSERT']
+    assert dxftypes(doc.blocks.get('INNER')) == ['CIRCLE']
+    assert len(doc.blocks.get('UNUSED')) == 0
+
+
+def test_filter_by_layouts(dxf):
+    doc = ezdxf.readfile(dxf, layouts=['model'])
+    assert len(dxftypes(doc.modelspace())) == 5
+    assert len(dxftypes(doc.layout())) == 0
+
+    doc = ezdxf.readfile(dxf, layouts=['Layout1'])
+    assert len(doc.modelspace()) == 0
+    assert dxftypes(doc.layout()) == ['LINE']
+
+
+def test_filtered_document_is_valid(dxf, tmpdir):
+    doc = ezdxf.readfile(dxf, types=['LINE'], layers=['WALLS'])
+    auditor = doc.audit()
+    assert len(auditor.errors) == 0
+    filename = str(tmpdir.join('filtered.dxf'))
+    doc.saveas(filename)
+    doc = ezdxf.readfile(filename)
+    assert dxftypes(doc.modelspace()) == ['LINE']
@@ -0,0 +1,113 @@
+# Copyright (c) 2020, Manfred Moitzi
+# License: MIT License
+import os
+import pytest
+import ezdxf
+from ezdxf.doccache import DocumentCache
+
+
+def create_dxf(filename, count=1):
+    doc = ezdxf.new()
+    msp = doc.modelspace()
+    for x in range(count):
+        msp.add_line((x, 0), (x, 1))
+    msp.add_circle((0, 0), 1)
+    doc.saveas(filename)
+
+
+@pytest.fixture
+def dxf(tmpdir):
+    filename = str(tmpdir.join('cached.dxf'))
+    create_dxf(filename)
+    return filename
+
+
+@pytest.fixture
+def cache(tmpdir):
+    return DocumentCache(str(tmpdir.join('cache')))
+
+
+def test_cache_hit(dxf, cache):
+    doc1 = ezdxf.readfile(dxf, cache=cache)
+    assert (cache.hits, cache.misses) == (0, 1)
+    doc2 = ezdxf.readfile(dxf, cache=cache)
+    assert (cache.hits, cache.misses) == (1, 1)
+    assert doc2 is not doc1
+    assert doc2.filename == dxf
+    assert [e.dxftype() for e in doc2.modelspace()] == ['LINE', 'CIRCLE']
+    line = doc2.modelspace()[0]
+    assert line.doc is doc2
+    assert line.dxf.handle in doc2.entitydb
+
+
+def test_cache_with_lazy_loading(dxf, cache, monkeypatch):
+    monkeypatch.setattr(ezdxf.options, 'lazy_loading', True)
+    ezdxf.readfile(dxf, cache=cache)
+    doc = ezdxf.readfile(dxf, cache=cache)
+    assert (cache.hits, cache.misses) == (1, 1)
+    msp = doc.modelspace()
+    assert [e.dxftype() for e in msp] == ['LINE', 'CIRCLE']
+    assert msp[0].doc is doc
+    assert msp[0].dxf.handle in doc.entitydb
+
+
+def test_changed_file_is_a_cache_miss(dxf, cache):
+    ezdxf.readfile(dxf, cache=cache)
+    create_dxf(dxf, count=2)
+    doc = ezdxf.readfile(dxf, cache=cache)
+    assert (cache.hits, cache.misses) == (0, 2)
+    assert len(doc.modelspace()) == 3
+
+
+def test_same_content_is_a_cache_hit(dxf, cache):
+    ezdxf.readfile(dxf, cache=cache)
+    stat = os.stat(dxf)
+    os.utime(dxf, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10 ** 9))
+    ezdxf.readfile(dxf, cache=cache)
+    assert (cache.hits, cache.misses) == (1, 1)
+
+
+def test_loading_arguments_are_part_of_the_key(dxf, cache):
+    ezdxf.readfile(dxf, cache=cache)
+    doc = ezdxf.readfile(dxf, cache=cache, types=['CIRCLE'])
+    assert (cache.hits, cache.misses) == (0, 2)
+    assert [e.dxftype() for e in doc.modelspace()] == ['CIRCLE']
+
+
+def test_filter_names_are_case_insensitive_keys(dxf, cache):
+    ezdxf.readfile(dxf, cache=cache, types=['circle'], layers=['Walls'],
+                   layouts=['model'])
+    ezdxf.readfile(dxf, cache=cache, types=['CIRCLE', 'Circle'],
+                   layers=['WALLS', 'walls'], layouts=['Model'])
+    assert (cache.hits, cache.misses) == (1, 1)
+
+
+def test_evict_least_recently_used_entries(tmpdir):
+    cache = DocumentCache(str(tmpdir.join('cache')))
+    filenames = [str(tmpdir.join(f'doc{i}.dxf')) for i in range(3)]
+    for filename in filenames:
+        create_dxf(filename)
+        ezdxf.readfile(filename, cache=cache)
+    size = cache.size
+    assert cache.misses == 3
+
+    # Max. size for three entries, the first document is the least recently
+    # used entry:
+    cache = DocumentCache(cache.directory, max_size=size + size // 6)
+    filename = str(tmpdir.join('doc3.dxf'))
+    create_dxf(filename)
+    ezdxf.readfile(filename, cache=cache)
+    assert cache.size <= cache.max_size
+    ezdxf.readfile(filenames[2], cache=cache)
+    assert cache.hits == 1
+    ezdxf.readfile(filenames[0], cache=cache)
+    assert cache.misses == 2
+
+
+def test_clear(dxf, cache):
+    ezdxf.readfile(dxf, cache=cache)
+    assert cache.size > 0
+    cache.clear()
+    assert cache.size == 0
+    ezdxf.readfile(dxf, cache=cache)
+    assert cache.misses == 2
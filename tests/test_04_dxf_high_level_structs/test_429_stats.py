@@ -0,0 +1,123 @@
+# Copyright (c) 2020, Manfred Moitzi
+# License: MIT License
+from io import StringIO
+import time
+import pytest
+import ezdxf
+from ezdxf.stats import Stats, Stage, DXFTypeTimer
+
+
+@pytest.fixture(scope='module')
+def dxf(tmpdir_factory):
+    filename = str(tmpdir_factory.mktemp('stats').join('stats.dxf'))
+    doc = ezdxf.new()
+    msp = doc.modelspace()
+    for x in range(10):
+        msp.add_line((x, 0), (x, 1))
+    msp.add_circle((0, 0), 1)
+    doc.saveas(filename)
+    return filename
+
+
+def test_stage_timer():
+    stats = Stats()
+    with stats.timer('test') as stage:
+        stage.tags += 3
+    with stats.timer('test'):
+        pass
+    assert 'test' in stats
+    assert stats['test'].tags == 3
+    assert stats['test'].time > 0
+    assert [stage.name for stage in stats] == ['test']
+
+
+def test_nested_stage_time_is_excluded():
+    stats = Stats()
+    with stats.timer('outer'):
+        with stats.timer('inner'):
+            time.sleep(0.02)
+    assert stats['inner'].time >= 0.02
+    assert stats['outer'].time < 0.02
+
+
+def test_timed_iterable():
+    stats = Stats()
+
+    def items():
+        for item in range(10):
+            time.sleep(0.002)
+            yield item
+
+    with stats.timer('outer'):
+        result = list(stats.timed('inner', items(), batch_size=3))
+    assert result == list(range(10))
+    assert stats['inner'].tags == 10
+    assert stats['inner'].time >= 0.02
+    assert stats['outer'].time < 0.02
+
+
+def test_dxftype_timer():
+    stage = Stage('test')
+    timer = DXFTypeTimer(stage)
+    for dxftype in ['LINE', 'LINE', 'CIRCLE', 'LINE']:
+        timer.next(dxftype)
+    timer.flush()
+    assert stage.entities == 4
+    assert stage.dxftypes['LINE'][0] == 3
+    assert stage.dxftypes['CIRCLE'][0] == 1
+
+
+def test_readfile_stats(dxf):
+    doc = ezdxf.readfile(dxf)
+    stats = doc.stats
+    structure = stats['load.structure']
+    assert structure.entities > 11
+    assert structure.tags > structure.entities
+    factory = stats['load.factory']
+    assert factory.dxftypes['LINE'][0] == 10
+    assert factory.dxftypes['CIRCLE'][0] == 1
+    bind = stats['load.bind']
+    assert bind.dxftypes['LINE'][0] == 10
+    assert stats['load.tagging'].tags >= stats['load.compiling'].tags
+    assert stats['load.compiling'].tags > structure.entities
+    for name in ('load.tables', 'load.blocks', 'load.entities',
+                 'load.objects', 'load.2nd_stage', 'load.layouts'):
+        assert stats[name].entities > 0
+    # SECTION, 10 LINE and one CIRCLE entities:
+    assert stats['load.entities'].entities == 12
+
+
+def test_read_stream_stats(dxf):
+    with open(dxf, 'rt') as fp:
+        doc = ezdxf.read(fp)
+    assert doc.stats['load.factory'].dxftypes['LINE'][0] == 10
+    assert doc.stats['load.tagging'].tags > 0
+
+
+def test_audit_stats(dxf):
+    doc = ezdxf.readfile(dxf)
+    doc.audit()
+    assert doc.stats['audit'].dxftypes['LINE'][0] == 10
+
+
+def test_export_stats():
+    doc = ezdxf.new()
+    doc.write(StringIO())
+    assert 'export.entities' in doc.stats
+    assert 'export.header' in doc.stats
+
+
+def test_report(dxf):
+    doc = ezdxf.readfile(dxf)
+    report = doc.stats.report()
+    assert 'load.factory' in report
+    assert 'LINE' in report
+    assert 'LINE' not in doc.stats.report(dxftypes=False)
+
+
+def test_report_only_collected_counters():
+    stats = Stats()
+    with stats.timer('test') as stage:
+        stage.entities = 7
+    assert 'entities' in stats.report()
+    assert 'tags' not in stats.report()
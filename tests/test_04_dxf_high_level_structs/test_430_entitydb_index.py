@@ -0,0 +1,181 @@
+# Copyright (c) 2020, Manfred Moitzi
+# License: MIT License
+import pytest
+import ezdxf
+
+
+@pytest.fixture
+def doc():
+    doc = ezdxf.new()
+    msp = doc.modelspace()
+    msp.add_line((0, 0), (1, 0), dxfattribs={'layer': 'WALL'})
+    msp.add_line((0, 0), (0, 1), dxfattribs={'layer': 'DOOR'})
+    msp.add_circle((0, 0), 1, dxfattribs={'layer': 'WALL'})
+    doc.entitydb.create_index()
+    return doc
+
+
+def handles(entities):
+    return set(e.dxf.handle for e in entities)
+
+
+def test_create_index(doc):
+    db = doc.entitydb
+    assert db.has_index is True
+    assert len(db.by_dxftype('LINE')) == 2
+    assert len(db.by_layer('WALL')) == 2
+    assert len(db.by_layer('wall')) == 0, 'layer index is case sensitive'
+    msp = doc.modelspace()
+    # BLOCK and ENDBLK are also owned by the BLOCK_RECORD:
+    assert handles(msp) < handles(db.by_owner(msp.layout_key))
+    db.drop_index()
+    assert db.has_index is False
+
+
+def test_same_result_without_index(doc):
+    db = doc.entitydb
+    result = [
+        handles(db.by_dxftype('LINE')),
+        handles(db.by_layer('WALL')),
+        db.layers_in_use(),
+        db.dxf_types_in_use(),
+    ]
+    db.drop_index()
+    assert result == [
+        handles(db.by_dxftype('LINE')),
+        handles(db.by_layer('WALL')),
+        db.layers_in_use(),
+        db.dxf_types_in_use(),
+    ]
+
+
+def test_add_new_entity(doc):
+    doc.modelspace().add_point((0, 0), dxfattribs={'layer': 'WALL'})
+    assert len(doc.entitydb.by_dxftype('POINT')) == 1
+    assert len(doc.entitydb.by_layer('WALL')) == 3
+
+
+def test_change_layer(doc):
+    db = doc.entitydb
+    circle = db.by_dxftype('CIRCLE')[0]
+    circle.dxf.layer = 'DOOR'
+    assert len(db.by_layer('WALL')) == 1
+    assert circle in db.by_layer('DOOR')
+    del circle.dxf.layer
+    assert circle not in db.by_layer('DOOR')
+
+
+def test_move_entity_to_other_layout(doc):
+    db = doc.entitydb
+    msp = doc.modelspace()
+    psp = doc.layout()
+    circle = db.by_dxftype('CIRCLE')[0]
+    msp.move_to_layout(circle, psp)
+    assert circle in db.by_owner(psp.layout_key)
+    assert circle not in db.by_owner(msp.layout_key)
+
+
+def test_delete_entity(doc):
+    db = doc.entitydb
+    msp = doc.modelspace()
+    circle = db.by_dxftype('CIRCLE')[0]
+    msp.delete_entity(circle)
+    assert db.by_dxftype('CIRCLE') == []
+    assert 'CIRCLE' not in db.dxf_types_in_use()
+
+
+def test_trashcan_and_purge(doc):
+    db = doc.entitydb
+    line1, line2 = db.by_dxftype('LINE')
+    with db.trashcan() as trash:
+        trash.add(line1.dxf.handle)
+    assert db.by_dxftype('LINE') == [line2]
+    line2.destroy()
+    db.purge()
+    assert 'LINE' not in db.dxf_types_in_use()
+    assert 'DOOR' not in db.layers_in_use()
+
+
+def test_index_entries_are_removed_once(doc, monkeypatch):
+    from ezdxf.entitydb import EntityDBIndex
+    removed = []
+    remove = EntityDBIndex.remove
+
+    def counting_remove(self, handle):
+        removed.append(handle)
+        remove(self, handle)
+
+    monkeypatch.setattr(EntityDBIndex, 'remove', counting_remove)
+    db = doc.entitydb
+    msp = doc.modelspace()
+    line1, line2 = db.by_dxftype('LINE')
+    circle = db.by_dxftype('CIRCLE')[0]
+    handles = [e.dxf.handle for e in (line1, line2, circle)]
+    msp.delete_entity(line1)
+    with db.trashcan() as trash:
+        trash.add(line2.dxf.handle)
+        line2.destroy()
+    circle.destroy()
+    db.purge()
+    assert sorted(removed) == sorted(handles)
+
+
+def test_index_lazy_loaded_entities(tmpdir):
+    filename = str(tmpdir.join('lazy.dxf'))
+    doc = ezdxf.new()
+    doc.modelspace().add_line((0, 0), (1, 0), dxfattribs={'layer': 'WALL'})
+    doc.saveas(filename)
+    ezdxf.options.lazy_loading = True
+    try:
+        doc = ezdxf.readfile(filename)
+    finally:
+        ezdxf.options.lazy_loading = False
+    doc.entitydb.create_index()
+    assert len(doc.entitydb.by_layer('WALL')) == 1
+
+
+def test_index_lazy_loaded_entities_without_handles(tmpdir, monkeypatch):
+    filename = str(tmpdir.join('r12.dxf'))
+    doc = ezdxf.new('R12')
+    doc.header['$HANDLING'] = 0
+    msp = doc.modelspace()
+    msp.add_line((0, 0), (1, 0), dxfattribs={'layer': 'WALL'})
+    msp.add_polyline3d([(0, 0), (1, 0), (1, 1)], dxfattribs={'layer': 'WALL'})
+    doc.saveas(filename)
+    monkeypatch.setattr(ezdxf.options, 'lazy_loading', True)
+    doc = ezdxf.readfile(filename)
+    db = doc.entitydb
+    db.create_index()
+    assert len(db.by_dxftype('LINE')) == 1
+    assert len(db.by_dxftype('VERTEX')) == 3
+
+
+def test_query_loads_only_candidates(tmpdir):
+    filename = str(tmpdir.join('lazy.dxf'))
+    doc = ezdxf.new()
+    msp = doc.modelspace()
+    for x in range(10):
+        msp.add_line((x, 0), (x, 1), dxfattribs={'layer': 'LINES'})
+    msp.add_circle((0, 0), 1, dxfattribs={'layer': 'WALL'})
+    msp.add_polyline2d([(0, 0), (1, 0)], dxfattribs={'layer': 'WALL'})
+    doc.saveas(filename)
+    ezdxf.options.lazy_loading = True
+    try:
+        doc = ezdxf.readfile(filename)
+    finally:
+        ezdxf.options.lazy_loading = False
+    db = doc.entitydb
+    db.create_index()
+    assert 'WALL' in db.layers_in_use()
+    assert 'CIRCLE' in db.dxf_types_in_use()
+
+    msp = doc.modelspace()
+    result = msp.query('*[layer=="WALL"]')
+    assert [e.dxftype() for e in result] == ['CIRCLE', 'POLYLINE']
+    assert len(result[1]) == 2, 'expected loaded vertices'
+    assert not any(e.dxftype() == 'LINE' for e in db.loaded_entities())
+
+    # the layout loads all entities in the original order:
+    assert [e.dxftype() for e in msp] == ['LINE'] * 10 + ['CIRCLE', 'POLYLINE']
+    assert msp[10] is result[0]
+    assert len(msp.query('LINE[layer=="LINES"]')) == 10
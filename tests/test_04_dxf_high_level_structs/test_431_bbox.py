@@ -0,0 +1,135 @@
+# Copyright (c) 2020, Manfred Moitzi
+# License: MIT License
+import math
+import pytest
+import ezdxf
+from ezdxf import bbox
+
+
+@pytest.fixture
+def doc():
+    doc = ezdxf.new()
+    blk = doc.blocks.new('BLK')
+    blk.add_circle((0, 0), 1)
+    return doc
+
+
+def test_ellipse_tight_vs_fast(doc):
+    msp = doc.modelspace()
+    ellipse = msp.add_ellipse((0, 0), (2, 0), 0.25, 0, math.pi)
+    tight = bbox.extents(ellipse, fast=False)
+    assert tight.extmin.isclose((-2, 0, 0))
+    assert tight.extmax.isclose((2, 0.5, 0))
+    fast = bbox.extents(ellipse)
+    assert fast.inside(tight.extmin) and fast.inside(tight.extmax)
+
+
+def test_insert_extents(doc):
+    msp = doc.modelspace()
+    insert = msp.add_blockref('BLK', (10, 0))
+    box = bbox.extents(insert)
+    assert box.extmin.isclose((9, -1, 0))
+    assert box.extmax.isclose((11, 1, 0))
+    insert.dxf.xscale = 2
+    box = bbox.extents(insert)
+    assert box.extmin.isclose((8, -1, 0))
+    assert box.extmax.isclose((12, 1, 0))
+
+
+def test_tight_extents_of_rotated_insert(doc):
+    msp = doc.modelspace()
+    insert = msp.add_blockref('BLK', (0, 0), dxfattribs={'rotation': 45})
+    fast = bbox.extents(insert)
+    assert fast.extmax.isclose((math.sqrt(2), math.sqrt(2), 0))
+    tight = bbox.extents(insert, fast=False)
+    assert tight.extmin.isclose((-1, -1, 0))
+    assert tight.extmax.isclose((1, 1, 0))
+
+
+def test_cache_is_reused(doc):
+    msp = doc.modelspace()
+    circle = msp.add_circle((0, 0), 1)
+    bbox.extents(circle)
+    cache = circle._bbox_cache
+    assert cache is not None
+    bbox.extents(circle)
+    assert circle._bbox_cache is cache
+
+
+def test_attribute_change_invalidates_cache(doc):
+    msp = doc.modelspace()
+    circle = msp.add_circle((0, 0), 1)
+    bbox.extents(circle)
+    circle.dxf.center = (10, 0)
+    assert circle._bbox_cache is None
+    assert bbox.extents(circle).extmin.isclose((9, -1, 0))
+
+
+def test_attribute_change_invalidates_cache_of_virtual_entity():
+    from ezdxf.entities import Circle
+    circle = Circle.new(dxfattribs={'radius': 1})
+    assert bbox.extents(circle).extmax.isclose((1, 1, 0))
+    circle.dxf.radius = 2
+    assert circle._bbox_cache is None
+    assert bbox.extents(circle).extmax.isclose((2, 2, 0))
+
+
+def test_transformation_invalidates_cache(doc):
+    msp = doc.modelspace()
+    line = msp.add_line((0, 0), (1, 0))
+    assert bbox.layout_extents(msp).extmax.isclose((1, 0, 0))
+    line.translate(1, 1, 0)
+    assert bbox.layout_extents(msp).extmax.isclose((2, 1, 0))
+
+
+def test_layout_extents_follows_layout_changes(doc):
+    msp = doc.modelspace()
+    msp.add_line((0, 0), (1, 0))
+    assert bbox.layout_extents(msp).extmax.isclose((1, 0, 0))
+    line = msp.add_line((0, 0), (5, 0))
+    assert bbox.layout_extents(msp).extmax.isclose((5, 0, 0))
+    msp.delete_entity(line)
+    assert bbox.layout_extents(msp).extmax.isclose((1, 0, 0))
+
+
+def test_block_changes_invalidate_block_references(doc):
+    msp = doc.modelspace()
+    insert = msp.add_blockref('BLK', (0, 0))
+    assert bbox.layout_extents(msp).extmax.isclose((1, 1, 0))
+    blk = doc.blocks.get('BLK')
+    line = blk.add_line((0, 0), (5, 0))
+    assert bbox.extents(insert).extmax.isclose((5, 1, 0))
+    assert bbox.layout_extents(msp).extmax.isclose((5, 1, 0))
+    line.dxf.end = (7, 0)
+    assert bbox.layout_extents(msp).extmax.isclose((7, 1, 0))
+
+
+def test_vertex_change_invalidates_polyline(doc):
+    msp = doc.modelspace()
+    polyline = msp.add_polyline3d([(0, 0, 0), (1, 1, 1)])
+    assert bbox.layout_extents(msp).extmax.isclose((1, 1, 1))
+    polyline.vertices[1].dxf.location = (3, 1, 1)
+    assert bbox.extents(polyline).extmax.isclose((3, 1, 1))
+    assert bbox.layout_extents(msp).extmax.isclose((3, 1, 1))
+
+
+def test_explicit_invalidation(doc):
+    msp = doc.modelspace()
+    lwpolyline = msp.add_lwpolyline([(0, 0), (1, 0)])
+    assert bbox.extents(lwpolyline).extmax.isclose((1, 0, 0))
+    lwpolyline.append((4, 0))
+    bbox.invalidate(lwpolyline)
+    assert bbox.extents(lwpolyline).extmax.isclose((4, 0, 0))
+
+
+def test_multi_extents(doc):
+    msp = doc.modelspace()
+    entities = [
+        msp.add_point((-1, -2)),
+        msp.add_line((0, 0), (3, 4)),
+        msp.add_xline((0, 0), (1, 0)),
+    ]
+    box = bbox.multi_extents(entities)
+    assert box.extmin.isclose((-1, -2, 0))
+    assert box.extmax.isclose((3, 4, 0))
+    assert bbox.multi_extents([]).has_data is False
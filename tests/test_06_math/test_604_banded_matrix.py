@@ -4,7 +4,8 @@ from typing import Iterable
 import pytest
 import math
 from ezdxf.math.linalg import (
-    Matrix, detect_banded_matrix, compact_banded_matrix, BandedMatrixLU, gauss_vector_solver, banded_matrix
+    Matrix, detect_banded_matrix, compact_banded_matrix, BandedMatrixLU, gauss_vector_solver, banded_matrix,
+    banded_matrix_from_rows,
 )
 
 BANDED_MATRIX = Matrix(matrix=[
@@ -87,5 +88,34 @@ def test_solve_banded_matrix_matrix():
     assert math.isclose(lu.determinant(), BANDED_MATRIX.determinant())
 
 
+
+def sparse_rows(m: Matrix):
+    for row in m.rows():
+        start = next(index for index, value in enumerate(row) if value)
+        end = max(index for index, value in enumerate(row) if value) + 1
+        yield start, row[start:end]
+
+
+def test_banded_matrix_from_rows():
+    m, m1, m2 = banded_matrix_from_rows(sparse_rows(BANDED_MATRIX))
+    assert (m1, m2) == (2, 1)
+    assert m == compact_banded_matrix(BANDED_MATRIX, m1, m2)
+
+
+def test_banded_matrix_from_rows_ignores_zeros():
+    rows = [(0, [1, 0, 0]), (0, [0, 1, 0]), (0, [0, 0, 1])]
+    m, m1, m2 = banded_matrix_from_rows(rows)
+    assert (m1, m2) == (0, 0)
+    assert m.col(0) == [1, 1, 1]
+
+
+def test_solve_banded_matrix_from_rows():
+    m, m1, m2 = banded_matrix_from_rows(sparse_rows(BANDED_MATRIX))
+    r = BandedMatrixLU(m, m1, m2).solve_matrix(list(zip(B1, B2, B3)))
+    are_close_vectors(r.col(0), CHK1)
+    are_close_vectors(r.col(1), CHK2)
+    are_close_vectors(r.col(2), CHK3)
+
+
 if __name__ == '__main__':
     pytest.main([__file__])
@@ -4,6 +4,7 @@
 import pytest
 from math import radians, sin, cos, pi, isclose
 from ezdxf.math.matrix44 import Matrix44
+from ezdxf.math import VectorArray
 
 
 def diag(values):
@@ -221,3 +222,19 @@ class TestMatrix44:
         m = Matrix44([1] * 16)
         pytest.raises(ZeroDivisionError, m.inverse)
 
+    def test_transform_array(self):
+        m = Matrix44.chain(
+            Matrix44.z_rotate(radians(30)), Matrix44.translate(1, 2, 3))
+        vertices = VectorArray([(1, 2, 3), (4, 5, 6), (0, 0, 0)])
+        result = m.transform_array(vertices)
+        assert isinstance(result, VectorArray)
+        for v1, v2 in zip(result, m.transform_vertices(vertices)):
+            assert v1.isclose(v2)
+
+    def test_transform_direction_array(self):
+        m = Matrix44.chain(Matrix44.scale(2), Matrix44.translate(1, 2, 3))
+        vertices = VectorArray([(1, 0, 0), (0, 1, 0)])
+        result = m.transform_direction_array(vertices)
+        assert list(result) == [(2, 0, 0), (0, 2, 0)]
+        result = m.transform_direction_array(vertices, normalize=True)
+        assert list(result) == [(1, 0, 0), (0, 1, 0)]
@@ -1,7 +1,9 @@
 # Copyright (c) 2018 Manfred Moitzi
 # License: MIT License
 from math import isclose, radians, pi
-from ezdxf.math import UCS, Vector, X_AXIS, Y_AXIS, Z_AXIS, Matrix44
+from ezdxf.math import (
+    UCS, OCS, Vector, VectorArray, X_AXIS, Y_AXIS, Z_AXIS, Matrix44,
+)
 
 
 def test_ucs_init():
@@ -239,3 +241,22 @@ def test_moveto():
     assert ucs.origin == (1, 2, 3)
     ucs.moveto((3, 2, 1))
     assert ucs.origin == (3, 2, 1)
+
+
+def test_ucs_array_transformation():
+    ucs = UCS(origin=(1, 2, 3), ux=(0, 1, 0), uz=(0, 0, 1))
+    points = VectorArray([(1, 0, 0), (2, 3, 4)])
+    wcs = ucs.array_to_wcs(points)
+    assert list(wcs) == list(ucs.points_to_wcs(points))
+    assert list(ucs.array_from_wcs(wcs)) == list(points)
+
+
+def test_ocs_array_transformation():
+    ocs = OCS((1, 1, 1))
+    points = VectorArray([(1, 0, 0), (2, 3, 4)])
+    wcs = ocs.array_to_wcs(points)
+    for v1, v2 in zip(wcs, ocs.points_to_wcs(points)):
+        assert v1.isclose(v2)
+    for v1, v2 in zip(ocs.array_from_wcs(wcs), points):
+        assert v1.isclose(v2)
+    assert OCS().array_to_wcs(points) is points
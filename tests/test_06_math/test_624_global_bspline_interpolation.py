@@ -237,3 +237,19 @@ def test_check_values():
     for p1, p2 in zip(result, expected):
         assert isclose(p1[0], p2[0], abs_tol=1e-6)
         assert isclose(p1[1], p2[1], abs_tol=1e-6)
+
+
+@pytest.mark.parametrize('tangents', [False, True])
+def test_interpolate_many_fit_points(tangents):
+    # uses the banded matrix solver
+    count = 500
+    points = [
+        Vector(math.cos(a), math.sin(a), a / 10)
+        for a in (i * 4 * math.pi / count for i in range(count))
+    ]
+    spline = global_bspline_interpolation(
+        points, degree=3,
+        tangents=estimate_tangents(points) if tangents else None,
+    )
+    for point, t in zip(points, spline.t_array):
+        assert point.isclose(spline.point(t), abs_tol=1e-9)
@@ -80,6 +80,7 @@ def test_flattening():
     curve = Bezier([(0, 0), (1, 1), (2, -1), (3, 0)])
     assert len(list(curve.flattening(1.0, segments=4))) == 5
     assert len(list(curve.flattening(0.1, segments=4))) == 7
+    assert len(list(curve.flattening(0.01, segments=4))) == 15
 
 
 POINTS2D = [
@@ -2,7 +2,7 @@
 # License: MIT License
 import pytest
 import math
-from ezdxf.math import Matrix44, Vector
+from ezdxf.math import Matrix44, Vector, VectorArray
 from ezdxf.math.transformtools import OCSTransform
 
 
@@ -18,5 +18,16 @@ def test_transform_length_without_ocs():
     assert math.isclose(ocs.transform_length((0, 0, 2)), 2*4)
 
 
+@pytest.mark.parametrize('extrusion', [(0, 0, 1), (0, 0, -1), (1, 1, 1)])
+def test_transform_array(extrusion):
+    m = Matrix44.chain(
+        Matrix44.x_rotate(0.5), Matrix44.scale(2), Matrix44.translate(1, 2, 3))
+    ocs = OCSTransform(Vector(extrusion), m)
+    vertices = VectorArray([(1, 2, 3), (4, 5, 3)])
+    result = ocs.transform_array(vertices)
+    for v1, v2 in zip(result, vertices):
+        assert v1.isclose(ocs.transform_vertex(v2))
+
+
 if __name__ == '__main__':
     pytest.main([__file__])
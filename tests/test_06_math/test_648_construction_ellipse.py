@@ -256,5 +256,5 @@ def test_flattening(s, e, distance, count):
 def test_flattening_ellipse():
     # Visually checked in BricsCAD:
     e = ConstructionEllipse(major_axis=(3, 0), ratio=0.25)
-    assert len(list(e.flattening(0.1))) == 13
-    assert len(list(e.flattening(0.01))) == 37
+    assert len(list(e.flattening(0.1))) == 17
+    assert len(list(e.flattening(0.01))) == 49
@@ -0,0 +1,119 @@
+# Copyright (c) 2020, Manfred Moitzi
+# License: MIT License
+import math
+import pytest
+from array import array
+from ezdxf.math import (
+    Vector, VectorArray, Matrix44, OCS, UCS, BSpline, Bezier4P,
+)
+from ezdxf.render import MeshBuilder
+from ezdxf.render.path import Path
+
+
+@pytest.fixture
+def va():
+    return VectorArray([(1, 2, 3), (4, 5, 6), (7, 8)])
+
+
+def test_init(va):
+    assert len(va) == 3
+    assert va.values == array('d', [1, 2, 3, 4, 5, 6, 7, 8, 0])
+    assert len(VectorArray()) == 0
+    assert VectorArray(va) == va
+
+
+def test_from_array_adopts_array():
+    values = array('d', [1, 2, 3])
+    assert VectorArray.from_array(values).values is values
+    with pytest.raises(ValueError):
+        VectorArray.from_array(array('d', [1, 2]))
+
+
+def test_from_xyz():
+    va = VectorArray.from_xyz([1, 2], [3, 4])
+    assert list(va) == [(1, 3, 0), (2, 4, 0)]
+    with pytest.raises(ValueError):
+        VectorArray.from_xyz([1, 2], [3])
+
+
+def test_get_item(va):
+    assert va[0] == (1, 2, 3)
+    assert isinstance(va[-1], Vector)
+    assert va[-1] == (7, 8, 0)
+    assert list(va[1:]) == [(4, 5, 6), (7, 8, 0)]
+    assert list(va[::2]) == [(1, 2, 3), (7, 8, 0)]
+    with pytest.raises(IndexError):
+        _ = va[3]
+
+
+def test_columns(va):
+    assert va.x == array('d', [1, 4, 7])
+    assert va.y == array('d', [2, 5, 8])
+    assert va.z == array('d', [3, 6, 0])
+    assert list(va.xyz()) == [(1, 2, 3), (4, 5, 6), (7, 8, 0)]
+
+
+def test_add_and_subtract(va):
+    assert list(va + (1, 1, 1)) == [(2, 3, 4), (5, 6, 7), (8, 9, 1)]
+    assert list((1, 1, 1) + va) == [(2, 3, 4), (5, 6, 7), (8, 9, 1)]
+    assert list(va - va) == [(0, 0, 0)] * 3
+    assert list((1, 1, 1) - va) == [(0, -1, -2), (-3, -4, -5), (-6, -7, 1)]
+    with pytest.raises(ValueError):
+        _ = va + va[:2]
+
+
+def test_scaling(va):
+    assert list(2 * va) == [(2, 4, 6), (8, 10, 12), (14, 16, 0)]
+    assert list(va / 2) == [(.5, 1, 1.5), (2, 2.5, 3), (3.5, 4, 0)]
+    assert list(-va)[0] == (-1, -2, -3)
+
+
+def test_dot_and_cross_product(va):
+    assert va.dot((1, 0, 0)) == array('d', [1, 4, 7])
+    assert va.dot(va) == array('d', [14, 77, 113])
+    result = VectorArray([(1, 0, 0), (0, 1, 0)]).cross((0, 0, 1))
+    assert list(result) == [(0, -1, 0), (1, 0, 0)]
+    for a, b, c in zip(va, va[::-1], va.cross(va[::-1])):
+        assert a.cross(b) == c
+
+
+def test_magnitudes_and_normalize(va):
+    for v, m in zip(va, va.magnitudes()):
+        assert math.isclose(v.magnitude, m)
+    for v, n in zip(va, va.normalize(2)):
+        assert v.normalize(2).isclose(n)
+    with pytest.raises(ZeroDivisionError):
+        VectorArray([(0, 0, 0)]).normalize()
+
+
+def test_distance_and_isclose(va):
+    assert va.distance(va[0]) == array(
+        'd', [0, math.sqrt(27), math.sqrt(36 + 36 + 9)])
+    assert va.isclose((1, 2, 3)) == [True, False, False]
+    assert all(va.isclose(va + (1e-13, 0, 0)))
+
+
+def test_sum(va):
+    assert va.sum() == (12, 15, 9)
+
+
+def test_matrix_transformation(va):
+    m = Matrix44.chain(
+        Matrix44.z_rotate(math.pi / 3), Matrix44.translate(1, 2, 3))
+    assert list(m.transform_vertices(va)) == list(m.transform_vertices(list(va)))
+    assert list(m.transform_directions(va)) == \
+           list(m.transform_directions(list(va)))
+
+
+def test_consumers_accept_vector_arrays(va):
+    ucs = UCS(origin=(1, 2, 3))
+    assert list(ucs.points_to_wcs(va))[0] == (2, 4, 6)
+    ocs = OCS((0, 0, -1))
+    assert list(ocs.points_to_wcs(va)) == list(ocs.points_to_wcs(list(va)))
+    assert BSpline(va, order=3).control_points == list(va)
+    curve = Bezier4P(VectorArray([(0, 0), (1, 1), (2, 1), (3, 0)]))
+    assert curve.control_points[3] == (3, 0)
+    mesh = MeshBuilder()
+    mesh.add_vertices(va)
+    assert mesh.vertices == list(va)
+    assert Path.from_vertices(va).end == (7, 8, 0)
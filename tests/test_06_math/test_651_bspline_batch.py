@@ -0,0 +1,91 @@
+# Copyright (c) 2020, Manfred Moitzi
+# License: MIT License
+import pytest
+from ezdxf.math import BSpline, BSplineU, BSplineClosed
+from ezdxf.math.bspline import basis_matrix
+from ezdxf.math import bspline
+
+DEFPOINTS = [
+    (0, 0, 0), (10, 20, 20), (30, 10, 25), (40, 10, 25), (50, 0, 30),
+    (60, 5, 10), (70, 0, 0),
+]
+WEIGHTS = [1, 10, 10, 10, 1, 0.5, 1]
+
+
+@pytest.fixture(params=[
+    BSpline(DEFPOINTS, order=4),
+    BSpline(DEFPOINTS, order=4, weights=WEIGHTS),
+    BSplineU(DEFPOINTS, order=3),
+    BSplineU(DEFPOINTS, order=3, weights=WEIGHTS),
+    BSplineClosed(DEFPOINTS, order=4),
+], ids=['bspline', 'rbspline', 'bsplineu', 'rbsplineu', 'closed'])
+def spline(request):
+    return request.param
+
+
+def params(spline, count=40):
+    return list(spline.params(count))
+
+
+def test_batch_points_match_single_points(spline):
+    t = params(spline)
+    for batch, u in zip(spline.points(t), t):
+        assert batch.isclose(spline.point(u), abs_tol=1e-9)
+
+
+def test_batch_derivatives_match_single_derivatives(spline):
+    t = params(spline)
+    for batch, u in zip(spline.derivatives(t, n=2), t):
+        single = spline.derivative(u, n=2)
+        assert len(batch) == len(single) == 3
+        for v1, v2 in zip(batch, single):
+            assert v1.isclose(v2, abs_tol=1e-9)
+
+
+def test_approximate_uses_batch_points(spline):
+    points = list(spline.approximate(20))
+    assert len(points) == 21
+    for point, u in zip(points, spline.params(20)):
+        assert point.isclose(spline.point(u), abs_tol=1e-9)
+
+
+def test_basis_matrix_is_cached():
+    spline = BSpline(DEFPOINTS, order=4)
+    list(spline.approximate(33))
+    info = basis_matrix.cache_info()
+    # same knots, order and params for a spline with other control points:
+    other = BSpline([(x, y * 2, z) for x, y, z in DEFPOINTS], order=4)
+    points = list(other.approximate(33))
+    assert basis_matrix.cache_info().hits == info.hits + 1
+    assert points[3].isclose(other.point(other.max_t / 33 * 3))
+    assert points[-1].isclose(other.point(other.max_t))
+
+
+def test_arbitrary_params_are_not_cached(spline):
+    info = basis_matrix.cache_info()
+    list(spline.points(params(spline)))
+    list(spline.derivatives(params(spline)))
+    assert basis_matrix.cache_info() == info
+
+
+def test_large_segment_count_is_not_cached(monkeypatch):
+    monkeypatch.setattr(bspline, 'BASIS_MATRIX_CACHE_MAX_SEGMENTS', 10)
+    spline = BSpline(DEFPOINTS, order=4)
+    info = basis_matrix.cache_info()
+    points = list(spline.approximate(11))
+    assert basis_matrix.cache_info() == info
+    assert len(points) == 12
+    assert points[-1].isclose(DEFPOINTS[-1])
+
+
+def test_basis_matrix_rows():
+    spline = BSpline(DEFPOINTS, order=4)
+    basis = spline.basis
+    spans, rows = basis_matrix(
+        tuple(basis.knots), basis.order, basis.count, 0.0, 1.5, 1, 1)
+    assert len(spans) == len(rows) == 2
+    # one row of basis functions and one row of first derivatives:
+    assert len(rows[0]) == 2
+    assert len(rows[0][0]) == basis.order
+    # partition of unity:
+    assert sum(rows[1][0]) == pytest.approx(1.0)
@@ -0,0 +1,217 @@
+# Copyright (c) 2020, Manfred Moitzi
+# License: MIT License
+import math
+import random
+import pytest
+from ezdxf.math import (
+    Vector, Vec2, Bezier, Bezier4P, adaptive_flattening, bezier_flattening,
+    chord_error, linspace, BSpline, BSplineU, BSplineClosed,
+    ConstructionEllipse,
+)
+
+
+def circle(params):
+    return [Vector(math.cos(t), math.sin(t)) for t in params]
+
+
+def test_chord_error():
+    s, e = Vector(0, 0), Vector(2, 0)
+    assert chord_error([Vector(1, 1)], s, e) == 1
+    assert chord_error([Vector(1, 1), Vector(1, -2)], s, e) == 2
+    # distance to the nearest chord end point:
+    assert chord_error([Vector(3, 0)], s, e) == 1
+    assert chord_error([Vector(-1, 0)], s, e) == 1
+    # degenerated chord:
+    assert chord_error([Vector(0, 2)], Vector(1, 2), Vector(1, 2)) == 1
+    assert chord_error([Vec2(1, 1)], Vec2(0, 0), Vec2(2, 0)) == 1
+
+
+def test_circle_respects_chord_error():
+    distance = 0.001
+    vertices = list(adaptive_flattening(circle, [0, math.pi], distance))
+    assert vertices[0].isclose((1, 0))
+    assert vertices[-1].isclose((-1, 0))
+    for s, e in zip(vertices, vertices[1:]):
+        # max. chord error of a circular arc is the sagitta at the center:
+        center = s.lerp(e)
+        sagitta = 1.0 - center.magnitude
+        assert sagitta < distance
+
+
+def test_detect_error_if_center_point_is_on_chord():
+    # S-shaped curve: curve center point is the chord center point
+    curve = Bezier4P([(0, 0), (1, 1), (2, -1), (3, 0)])
+    assert curve.point(0.5).isclose(Vec2(1.5, 0))
+    assert len(list(curve.flattening(0.1, segments=1))) > 2
+
+
+def test_segment_budget():
+    vertices = list(adaptive_flattening(
+        circle, [0, math.pi / 2, math.pi], 1e-12, max_segments=100))
+    assert len(vertices) == 101
+    assert vertices[-1].isclose((-1, 0))
+
+
+def test_initial_segments_are_not_limited_by_budget():
+    params = list(linspace(0, math.pi, 11))
+    vertices = list(adaptive_flattening(
+        circle, params, 1e-12, max_segments=2))
+    assert len(vertices) == 11
+
+
+def test_zero_distance_is_limited_by_segment_budget():
+    vertices = list(adaptive_flattening(
+        circle, [0, math.pi], 0.0, max_segments=5000))
+    assert len(vertices) == 5001
+    assert vertices[-1].isclose((-1, 0))
+
+
+def test_batch_evaluator_calls():
+    calls = []
+
+    def points(params):
+        calls.append(len(params))
+        return circle(params)
+
+    list(adaptive_flattening(points, [0, math.pi], 0.1))
+    # all initial points at once, then the two quarter points of a segment:
+    assert calls[0] == 3
+    assert set(calls[1:]) == {2}
+
+
+@pytest.mark.parametrize('params', [[], [1]])
+def test_less_than_two_params_yield_nothing(params):
+    assert list(adaptive_flattening(circle, params, 0.1)) == []
+
+
+def test_error_bound():
+    def sagitta(start, center, end):
+        return center.distance(start.lerp(end))
+
+    calls = []
+
+    def points(params):
+        calls.append(len(params))
+        return circle(params)
+
+    distance = 0.001
+    vertices = list(adaptive_flattening(
+        points, [0, math.pi], distance, error_bound=sagitta))
+    # quarter points are evaluated only for subdivided segments:
+    assert len(calls) == len(vertices) - 1
+    for s, e in zip(vertices, vertices[1:]):
+        assert 1.0 - s.lerp(e).magnitude < distance
+
+
+def max_distance(curve, vertices, params=None):
+    # Distance of densely sampled curve points to the nearest approximation
+    # segment, valid for approximation segments of ascending parameters:
+    error = 0.0
+    segments = list(zip(vertices, vertices[1:]))
+    if params is None:
+        params = linspace(0, 1, 1001)
+    for t in params:
+        p = curve.point(t)
+        error = max(error, min(
+            chord_error([p], s, e) for s, e in segments))
+    return error
+
+
+@pytest.mark.parametrize('seed', range(5))
+def test_bezier_flattening_is_bound_by_distance(seed):
+    random.seed(seed)
+    distance = 0.01
+    for degree in (2, 3, 5):
+        points = [
+            Vector(random.uniform(-5, 5), random.uniform(-5, 5),
+                   random.uniform(-5, 5)) for _ in range(degree + 1)
+        ]
+        curve = Bezier(points)
+        vertices = list(bezier_flattening(points, distance))
+        assert vertices[0] is points[0]
+        assert vertices[-1] is points[-1]
+        assert max_distance(curve, vertices) < distance
+
+
+def test_bezier_flattening_detects_s_shaped_segments():
+    # S-shaped curve: curve center point is the chord center point
+    points = [Vec2(0, 0), Vec2(1, 1), Vec2(2, -1), Vec2(3, 0)]
+    curve = Bezier4P(points)
+    distance = 0.01
+    vertices = list(bezier_flattening(points, distance))
+    assert len(vertices) > 2
+    assert all(type(v) is Vec2 for v in vertices)
+    assert max_distance(curve, vertices) < distance
+
+
+def test_bezier_flattening_initial_segments():
+    points = [Vector(0, 0), Vector(1, 0), Vector(2, 0), Vector(3, 0)]
+    vertices = list(bezier_flattening(points, 0.1, segments=3))
+    assert len(vertices) == 4
+    assert vertices[1].isclose((1, 0))
+    assert vertices[2].isclose((2, 0))
+
+
+def test_bezier_flattening_segment_budget():
+    points = [Vector(0, 0), Vector(1, 1), Vector(2, -1), Vector(3, 0)]
+    vertices = list(bezier_flattening(points, 0.0, max_segments=100))
+    assert len(vertices) == 101
+    assert vertices[-1] is points[-1]
+
+
+def test_rational_bezier_flattening():
+    # quarter circle as rational quadratic Bézier curve:
+    points = [Vector(1, 0), Vector(1, 1), Vector(0, 1)]
+    weights = [1, math.sqrt(0.5), 1]
+    distance = 0.001
+    vertices = list(bezier_flattening(points, distance, weights=weights))
+    assert vertices[-1] is points[-1]
+    for s, e in zip(vertices, vertices[1:]):
+        assert s.isclose(s.normalize())  # vertices on the circle
+        assert 1.0 - s.lerp(e).magnitude < distance
+
+
+def random_points(count):
+    return [
+        Vector(random.uniform(-5, 5), random.uniform(-5, 5),
+               random.uniform(-5, 5)) for _ in range(count)
+    ]
+
+
+@pytest.mark.parametrize('cls', [BSpline, BSplineU, BSplineClosed])
+@pytest.mark.parametrize('rational', [False, True])
+def test_bspline_flattening_is_bound_by_distance(cls, rational):
+    random.seed(1)
+    distance = 0.01
+    for degree in (2, 3, 5):
+        points = random_points(9)
+        weights = [random.uniform(0.2, 3) for _ in points] \
+            if rational else None
+        curve = cls(points, order=degree + 1, weights=weights)
+        # valid parameter range of not clamped B-splines: knot[p] to knot[n+1]
+        knots = curve.knots()
+        params = list(linspace(knots[degree], knots[curve.count], 1001))
+        vertices = list(curve.flattening(distance, segments=1))
+        assert vertices[0].isclose(curve.point(params[0]))
+        assert vertices[-1].isclose(curve.point(params[-1]))
+        assert max_distance(curve, vertices, params) < distance
+
+
+def test_ellipse_flattening_is_bound_by_distance():
+    random.seed(1)
+    distance = 0.01
+    for _ in range(5):
+        ellipse = ConstructionEllipse(
+            major_axis=(random.uniform(1, 9), random.uniform(-3, 3)),
+            ratio=random.uniform(0.05, 1),
+            start_param=random.uniform(0, math.tau),
+            end_param=random.uniform(0, math.tau),
+        )
+        # a single initial segment spans more than 180 degrees:
+        vertices = list(ellipse.flattening(distance, segments=1))
+        samples = ellipse.vertices(ellipse.params(1001))
+        segments = list(zip(vertices, vertices[1:]))
+        assert max(
+            min(chord_error([p], s, e) for s, e in segments)
+            for p in samples
+        ) < distance